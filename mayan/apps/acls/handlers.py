@@ -0,0 +1,139 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+
+
+def _get_m2m_user_id_list(action, instance, queryset_function):
+    """
+    Collect the users affected by a many to many change in the pre_*
+    stage and store them in the instance until the post_* stage.
+    """
+    if action.startswith('pre_'):
+        instance._effective_access_user_id_list = list(
+            queryset_function().values_list('pk', flat=True)
+        )
+    else:
+        return instance.__dict__.pop('_effective_access_user_id_list', ())
+
+
+def handler_effective_access_update_acl(sender, instance, **kwargs):
+    EffectiveAccess = apps.get_model(
+        app_label='acls', model_name='EffectiveAccess'
+    )
+
+    EffectiveAccess.objects.update_for_object(
+        content_type_id=instance.content_type_id,
+        object_id=instance.object_id
+    )
+
+
+def handler_effective_access_update_acl_permissions(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+    EffectiveAccess = apps.get_model(
+        app_label='acls', model_name='EffectiveAccess'
+    )
+
+    if not reverse:
+        if action.startswith('post_'):
+            EffectiveAccess.objects.update_for_object(
+                content_type_id=instance.content_type_id,
+                object_id=instance.object_id
+            )
+    else:
+        # The change was done from the stored permission side.
+        if action == 'pre_clear':
+            instance._effective_access_acl_id_list = list(
+                instance.acls.values_list('pk', flat=True)
+            )
+        elif action.startswith('post_'):
+            if action == 'post_clear':
+                pk_set = instance.__dict__.pop(
+                    '_effective_access_acl_id_list', ()
+                )
+
+            object_keys = AccessControlList.objects.filter(
+                pk__in=pk_set
+            ).values_list('content_type_id', 'object_id').distinct()
+
+            for content_type_id, object_id in object_keys:
+                EffectiveAccess.objects.update_for_object(
+                    content_type_id=content_type_id, object_id=object_id
+                )
+
+
+def handler_effective_access_update_group_post_delete(
+    sender, instance, **kwargs
+):
+    EffectiveAccess = apps.get_model(
+        app_label='acls', model_name='EffectiveAccess'
+    )
+
+    EffectiveAccess.objects.update_for_users(
+        user_id_list=instance.__dict__.pop(
+            '_effective_access_user_id_list', ()
+        )
+    )
+
+
+def handler_effective_access_update_group_pre_delete(
+    sender, instance, **kwargs
+):
+    # Memberships are deleted without emitting m2m_changed signals. Collect
+    # the members while they still exist.
+    instance._effective_access_user_id_list = list(
+        instance.user_set.values_list('pk', flat=True)
+    )
+
+
+def handler_effective_access_update_role_groups(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    EffectiveAccess = apps.get_model(
+        app_label='acls', model_name='EffectiveAccess'
+    )
+    User = get_user_model()
+
+    def queryset_function():
+        if reverse:
+            # The change was done from the group side.
+            return instance.user_set.all()
+        elif action == 'pre_clear':
+            return User.objects.filter(groups__roles=instance)
+        else:
+            return User.objects.filter(groups__in=pk_set)
+
+    user_id_list = _get_m2m_user_id_list(
+        action=action, instance=instance,
+        queryset_function=queryset_function
+    )
+
+    if user_id_list is not None:
+        EffectiveAccess.objects.update_for_users(user_id_list=user_id_list)
+
+
+def handler_effective_access_update_user_groups(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    EffectiveAccess = apps.get_model(
+        app_label='acls', model_name='EffectiveAccess'
+    )
+    User = get_user_model()
+
+    def queryset_function():
+        if not reverse:
+            return User.objects.filter(pk=instance.pk)
+        elif action == 'pre_clear':
+            return instance.user_set.all()
+        else:
+            return User.objects.filter(pk__in=pk_set)
+
+    user_id_list = _get_m2m_user_id_list(
+        action=action, instance=instance,
+        queryset_function=queryset_function
+    )
+
+    if user_id_list is not None:
+        EffectiveAccess.objects.update_for_users(user_id_list=user_id_list)
@@ -0,0 +1 @@
+EFFECTIVE_ACCESS_BULK_BATCH_SIZE = 1000
@@ -2,12 +2,13 @@ from functools import reduce
 import logging
 import operator
 
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import models
-from django.db.models import CharField, Q, Value
-from django.db.models.functions import Cast, Concat
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.functions import Cast
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext
 
@@ -19,6 +20,7 @@ from mayan.apps.permissions.models import StoredPermission
 
 from .exceptions import PermissionNotValidForClass
 from .classes import ModelPermission
+from .literals import EFFECTIVE_ACCESS_BULK_BATCH_SIZE
 
 logger = logging.getLogger(name=__name__)
 
@@ -71,40 +73,41 @@ class AccessControlListManager(models.Manager):
                 if recursive_related_reference:
                     recursive_related_reference = '{}__'.format(recursive_related_reference)
 
-                content_type_object_id_queryset = queryset.annotate(
-                    ct_fk_combination=Concat(
-                        '{}{}'.format(
-                            recursive_related_reference, related_field.ct_field
-                        ), Value('-'),
-                        '{}{}'.format(
-                            recursive_related_reference, related_field.fk_field
-                        ), output_field=CharField()
-                    )
-                ).values('ct_fk_combination')
-
-                acl_filter = self.annotate(
-                    ct_fk_combination=Concat(
-                        'content_type', Value('-'), 'object_id',
-                        output_field=CharField()
-                    )
-                ).filter(
-                    permissions=stored_permission, role__groups__user=user,
-                    ct_fk_combination__in=content_type_object_id_queryset
+                effective_access_queryset = self._get_effective_access_queryset(
+                    stored_permission=stored_permission, user=user
                 )
 
                 if fk_field_cast:
-                    clean_acl_filter = acl_filter.annotate(
+                    effective_access_queryset = effective_access_queryset.annotate(
                         clean_object_id=Cast(
                             'object_id', output_field=fk_field_cast()
                         )
-                    ).values_list('clean_object_id')
+                    )
+                    object_id_field_name = 'clean_object_id'
                 else:
-                    clean_acl_filter = acl_filter.values('object_id')
-
-                field_lookup = '{}{}__in'.format(
-                    recursive_related_reference, related_field.fk_field
+                    object_id_field_name = 'object_id'
+
+                # Correlate each member of the queryset with its entry using
+                # the content type and object id pair of the generic foreign
+                # key, instead of comparing their string concatenation.
+                effective_access_queryset = effective_access_queryset.filter(
+                    **{
+                        'content_type': OuterRef(
+                            '{}{}'.format(
+                                recursive_related_reference,
+                                related_field.ct_field
+                            )
+                        ),
+                        object_id_field_name: OuterRef(
+                            '{}{}'.format(
+                                recursive_related_reference,
+                                related_field.fk_field
+                            )
+                        )
+                    }
                 )
-                result.append(Q(**{field_lookup: clean_acl_filter}))
+
+                result.append(Q(Exists(effective_access_queryset)))
             else:
                 # Case 2: Related field of a single type, single ContentType,
                 # multiple object id.
@@ -112,14 +115,13 @@ class AccessControlListManager(models.Manager):
                     model=related_field.related_model
                 )
                 field_lookup = '{}_id__in'.format(related_field_name)
-                acl_filter = self.filter(
-                    content_type=content_type, permissions=stored_permission,
-                    role__groups__user=user
-                ).values('object_id')
+                acl_filter = self._get_effective_access_queryset(
+                    stored_permission=stored_permission, user=user
+                ).filter(content_type=content_type).values('object_id')
                 # Don't add empty filters otherwise the default AND operator
                 # of the Q object will return an empty queryset when reduced
                 # and filter out objects that should be in the final queryset.
-                if acl_filter:
+                if acl_filter.exists():
                     result.append(Q(**{field_lookup: acl_filter}))
 
                 # Case 5: Related field, has an inherited related field itself
@@ -159,10 +161,9 @@ class AccessControlListManager(models.Manager):
                 model=queryset.model
             )
             field_lookup = 'id__in'
-            acl_filter = self.filter(
-                content_type=content_type, permissions=stored_permission,
-                role__groups__user=user
-            ).values('object_id')
+            acl_filter = self._get_effective_access_queryset(
+                stored_permission=stored_permission, user=user
+            ).filter(content_type=content_type).values('object_id')
             result.append(Q(**{field_lookup: acl_filter}))
 
             # Case 4: Original model, has an inherited related field.
@@ -207,10 +208,9 @@ class AccessControlListManager(models.Manager):
                 content_type = ContentType.objects.get_for_model(
                     model=queryset.model
                 )
-                acl_filter = self.filter(
-                    content_type=content_type, permissions=stored_permission,
-                    role__groups__user=user
-                ).values('object_id')
+                acl_filter = self._get_effective_access_queryset(
+                    stored_permission=stored_permission, user=user
+                ).filter(content_type=content_type).values('object_id')
 
                 # Obtain a queryset of filtered, authorized model instances.
                 acl_queryset = queryset.model._meta.default_manager.filter(
@@ -230,6 +230,15 @@ class AccessControlListManager(models.Manager):
 
         return result
 
+    def _get_effective_access_queryset(self, stored_permission, user):
+        EffectiveAccess = apps.get_model(
+            app_label='acls', model_name='EffectiveAccess'
+        )
+
+        return EffectiveAccess.objects.filter(
+            permission=stored_permission, user=user
+        )
+
     def check_access(self, obj, permissions, user):
         # Allow specific managers for models that have more than one
         # for example the Document model when checking for access for a trashed
@@ -247,24 +256,51 @@ class AccessControlListManager(models.Manager):
             return True
         else:
             manager = ModelPermission.get_manager(model=obj._meta.model)
-            source_queryset = manager.all()
+            source_queryset = manager.filter(pk=obj.pk)
 
-        restricted_queryset = manager.none()
         for permission in permissions:
-            # Default relationship betweens permissions is OR.
-            restricted_queryset = restricted_queryset | self.restrict_queryset(
+            # Default relationship betweens permissions is OR. Stop at the
+            # first permission that grants access.
+            if self.restrict_queryset(
                 permission=permission, queryset=source_queryset, user=user
+            ).exists():
+                return True
+
+        raise PermissionDenied(
+            ugettext(message='Insufficient access for: %s') % force_text(
+                s=obj
             )
+        )
 
-        if restricted_queryset.filter(pk=obj.pk).exists():
-            return True
-        else:
-            raise PermissionDenied(
-                ugettext(message='Insufficient access for: %s') % force_text(
-                    s=obj
-                )
+    def check_access_bulk(self, obj_list, permissions, user):
+        """
+        Return the primary keys of the objects in obj_list to which the
+        user has access with any of the permissions. All the objects must
+        be instances of the same model.
+        """
+        obj_list = list(obj_list)
+
+        if not obj_list:
+            return set()
+
+        manager = ModelPermission.get_manager(
+            model=obj_list[0]._meta.model
+        )
+        source_queryset = manager.filter(
+            pk__in=[obj.pk for obj in obj_list]
+        )
+
+        result = set()
+        for permission in permissions:
+            result.update(
+                self.restrict_queryset(
+                    permission=permission, queryset=source_queryset,
+                    user=user
+                ).values_list('pk', flat=True)
             )
 
+        return result
+
     def restrict_queryset(self, permission, queryset, user):
         if not user.is_authenticated:
             return queryset.none()
@@ -380,3 +416,68 @@ class AccessControlListManager(models.Manager):
 
         if acl.permissions.count() == 0:
             acl.delete()
+
+
+class EffectiveAccessManager(models.Manager):
+    def _get_entries(self, acl_queryset):
+        """
+        Expand the ACLs into one entry per user of the groups of their role
+        and per permission.
+        """
+        values_queryset = acl_queryset.values_list(
+            'content_type_id', 'object_id', 'permissions',
+            'role__groups__user'
+        ).distinct().order_by()
+
+        for content_type_id, object_id, permission_id, user_id in values_queryset.iterator():
+            if permission_id is not None and user_id is not None:
+                yield self.model(
+                    content_type_id=content_type_id, object_id=object_id,
+                    permission_id=permission_id, user_id=user_id
+                )
+
+    def _replace(self, acl_queryset, queryset):
+        with transaction.atomic():
+            queryset.delete()
+            self.bulk_create(
+                batch_size=EFFECTIVE_ACCESS_BULK_BATCH_SIZE,
+                ignore_conflicts=True,
+                objs=self._get_entries(acl_queryset=acl_queryset)
+            )
+
+    def rebuild(self):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        self._replace(
+            acl_queryset=AccessControlList.objects.all(),
+            queryset=self.all()
+        )
+
+    def update_for_object(self, content_type_id, object_id):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        self._replace(
+            acl_queryset=AccessControlList.objects.filter(
+                content_type_id=content_type_id, object_id=object_id
+            ), queryset=self.filter(
+                content_type_id=content_type_id, object_id=object_id
+            )
+        )
+
+    def update_for_users(self, user_id_list):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        user_id_list = list(user_id_list)
+
+        if user_id_list:
+            self._replace(
+                acl_queryset=AccessControlList.objects.filter(
+                    role__groups__user__in=user_id_list
+                ), queryset=self.filter(user__in=user_id_list)
+            )
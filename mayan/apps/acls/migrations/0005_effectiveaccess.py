@@ -0,0 +1,99 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def code_effective_access_populate(apps, schema_editor):
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+    EffectiveAccess = apps.get_model(
+        app_label='acls', model_name='EffectiveAccess'
+    )
+
+    values_queryset = AccessControlList.objects.using(
+        alias=schema_editor.connection.alias
+    ).values_list(
+        'content_type_id', 'object_id', 'permissions', 'role__groups__user'
+    ).distinct().order_by()
+
+    EffectiveAccess.objects.using(
+        alias=schema_editor.connection.alias
+    ).bulk_create(
+        batch_size=1000, ignore_conflicts=True, objs=(
+            EffectiveAccess(
+                content_type_id=content_type_id, object_id=object_id,
+                permission_id=permission_id, user_id=user_id
+            ) for content_type_id, object_id, permission_id, user_id in values_queryset.iterator()
+            if permission_id is not None and user_id is not None
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('acls', '0004_auto_20210130_0322'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('permissions', '0004_auto_20191213_0044'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EffectiveAccess',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'object_id', models.PositiveIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'content_type', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_accesses',
+                        to='contenttypes.contenttype',
+                        verbose_name='Content type'
+                    )
+                ),
+                (
+                    'permission', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_accesses',
+                        to='permissions.storedpermission',
+                        verbose_name='Permission'
+                    )
+                ),
+                (
+                    'user', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_accesses',
+                        to=settings.AUTH_USER_MODEL, verbose_name='User'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Effective access entry',
+                'verbose_name_plural': 'Effective access entries',
+                'unique_together': {
+                    ('user', 'permission', 'content_type', 'object_id')
+                },
+            },
+        ),
+        migrations.AddIndex(
+            model_name='effectiveaccess',
+            index=models.Index(
+                fields=['content_type', 'object_id'],
+                name='acls_effect_content_57dafb_idx'
+            ),
+        ),
+        migrations.RunPython(
+            code=code_effective_access_populate,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
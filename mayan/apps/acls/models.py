@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
@@ -14,7 +15,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.permissions.models import Role, StoredPermission
 
 from .events import event_acl_created, event_acl_deleted, event_acl_edited
-from .managers import AccessControlListManager
+from .managers import AccessControlListManager, EffectiveAccessManager
 
 logger = logging.getLogger(name=__name__)
 
@@ -118,3 +119,41 @@ class AccessControlList(ExtraDataModelMixin, models.Model):
 class GlobalAccessControlListProxy(AccessControlList):
     class Meta:
         proxy = True
+
+
+class EffectiveAccess(models.Model):
+    """
+    Flattened, denormalized view of the access control lists. Each row
+    states that a user is granted a permission for an object by way of
+    the ACLs of one or more of the roles of their groups. The rows are
+    maintained from the signals of the ACL, role and group models and
+    allow restricting querysets with a single indexed semi join.
+    """
+    user = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_accesses',
+        to=settings.AUTH_USER_MODEL, verbose_name=_('User')
+    )
+    permission = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_accesses',
+        to=StoredPermission, verbose_name=_('Permission')
+    )
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_accesses',
+        to=ContentType, verbose_name=_('Content type')
+    )
+    object_id = models.PositiveIntegerField(verbose_name=_('Object ID'))
+
+    objects = EffectiveAccessManager()
+
+    class Meta:
+        indexes = (
+            models.Index(fields=('content_type', 'object_id')),
+        )
+        unique_together = ('user', 'permission', 'content_type', 'object_id')
+        verbose_name = _('Effective access entry')
+        verbose_name_plural = _('Effective access entries')
+
+    def __str__(self):
+        return '{}: {}, {}-{}'.format(
+            self.user, self.permission, self.content_type_id, self.object_id
+        )
@@ -7,7 +7,7 @@ from mayan.apps.events.classes import EventModelRegistry
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import ModelPermission
-from ..models import AccessControlList
+from ..models import AccessControlList, EffectiveAccess
 
 from .mixins import ACLTestMixin
 
@@ -51,6 +51,22 @@ class PermissionTestCase(ACLTestMixin, BaseTestCase):
         except PermissionDenied:
             self.fail('PermissionDenied exception was not expected.')
 
+    def test_check_access_bulk(self):
+        self._create_acl_test_object()
+        self._create_test_object()
+
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertEqual(
+            AccessControlList.objects.check_access_bulk(
+                obj_list=self._test_objects,
+                permissions=(self._test_permission,),
+                user=self._test_case_user
+            ), {self._test_object.pk}
+        )
+
     def test_filtering_with_permissions(self):
         self._create_acl_test_object()
 
@@ -626,3 +642,83 @@ class ProxyModelPermissionTestCase(ACLTestMixin, BaseTestCase):
                 user=self._test_case_user
             )
         )
+
+
+class EffectiveAccessTestCase(ACLTestMixin, BaseTestCase):
+    auto_create_acl_test_object = True
+
+    def _get_test_effective_access_queryset(self):
+        return EffectiveAccess.objects.filter(
+            content_type=ContentType.objects.get_for_model(
+                model=self._test_object
+            ), object_id=self._test_object.pk,
+            permission=self._test_permission.stored_permission,
+            user=self._test_case_user
+        )
+
+    def test_acl_grant(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertTrue(self._get_test_effective_access_queryset().exists())
+
+    def test_acl_revoke(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self.revoke_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+
+        self.assertFalse(self._get_test_effective_access_queryset().exists())
+
+    def test_group_delete(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_group.delete()
+
+        self.assertFalse(self._get_test_effective_access_queryset().exists())
+
+    def test_group_user_remove(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_group.user_set.remove(self._test_case_user)
+
+        self.assertFalse(self._get_test_effective_access_queryset().exists())
+
+    def test_role_group_remove(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_role.groups.remove(self._test_case_group)
+
+        self.assertFalse(self._get_test_effective_access_queryset().exists())
+
+    def test_role_group_add(self):
+        self._test_case_role.groups.remove(self._test_case_group)
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_role.groups.add(self._test_case_group)
+
+        self.assertTrue(self._get_test_effective_access_queryset().exists())
+
+    def test_user_group_clear(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        self._test_case_user.groups.clear()
+
+        self.assertFalse(self._get_test_effective_access_queryset().exists())
+
+    def test_rebuild(self):
+        self.grant_access(
+            obj=self._test_object, permission=self._test_permission
+        )
+        EffectiveAccess.objects.all().delete()
+        EffectiveAccess.objects.rebuild()
+
+        self.assertTrue(self._get_test_effective_access_queryset().exists())
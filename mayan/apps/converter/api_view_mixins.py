@@ -1,15 +1,33 @@
+import mimetypes
+
+from PIL import Image
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.base import File
-from django.http import StreamingHttpResponse
+from django.http import (
+    FileResponse, Http404, HttpResponse, StreamingHttpResponse
+)
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.views.decorators.cache import patch_cache_control
 
+from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.mime_types.classes import MIMETypeBackend
+from mayan.apps.storage.compressed_files import ZipArchive
+from mayan.apps.views.literals import PK_LIST_SEPARATOR
 
+from .classes import ImageTilePyramid
+from .literals import IMAGE_BATCH_MAXIMUM_SIZE
 from .settings import (
     setting_image_cache_time, setting_image_generation_timeout
 )
-from .tasks import task_content_object_image_generate
+from .tasks import (
+    task_content_object_image_generate,
+    task_content_object_image_tiles_generate
+)
 from .utils import IndexedDictionary
 
 
@@ -48,6 +66,18 @@ class APIImageViewMixin:
         if maximum_layer_order:
             maximum_layer_order = int(maximum_layer_order)
 
+        etag = self.get_image_etag(
+            maximum_layer_order=maximum_layer_order,
+            transformation_dictionary_list=transformation_dictionary_list
+        )
+
+        if etag:
+            response = get_conditional_response(
+                etag=quote_etag(etag), request=request
+            )
+            if response:
+                return self.patch_response(etag=etag, response=response)
+
         task = task_content_object_image_generate.apply_async(
             kwargs={
                 'content_type_id': self.get_content_type().pk,
@@ -83,7 +113,32 @@ class APIImageViewMixin:
             streaming_content=file_generator()
         )
 
-        if '_hash' in request.GET:
+        return self.patch_response(etag=etag, response=response)
+
+    def get_image_etag(
+        self, maximum_layer_order, transformation_dictionary_list
+    ):
+        """
+        Return the filename of the cached image that would be generated.
+        The cache filename is derived from the content and transformations
+        of the image and is used as its ETag.
+        """
+        if hasattr(self.obj, 'get_combined_cache_filename'):
+            transformation_instance_list = IndexedDictionary.from_dictionary_list(
+                dictionary_list=transformation_dictionary_list
+            ).as_instance_list()
+
+            return self.obj.get_combined_cache_filename(
+                maximum_layer_order=maximum_layer_order,
+                transformation_instance_list=transformation_instance_list,
+                user=self.request.user
+            )
+
+    def patch_response(self, response, etag=None):
+        if etag:
+            response.headers['ETag'] = quote_etag(etag)
+
+        if '_hash' in self.request.GET:
             patch_cache_control(
                 max_age=setting_image_cache_time.value,
                 response=response
@@ -92,3 +147,323 @@ class APIImageViewMixin:
 
     def set_object(self):
         self.obj = self.get_object()
+
+
+class APIImageBatchViewMixin:
+    """
+    Return the images of a list of objects in a single response. The
+    images are generated in parallel by the converter workers and
+    returned as a ZIP archive, or as a manifest of their cacheable image
+    URLs when the `manifest` argument is present.
+    """
+    image_batch_filename = 'images.zip'
+    image_batch_id_list_argument = 'id_list'
+
+    def get_image_batch_id_list(self):
+        value = self.request.GET.get(self.image_batch_id_list_argument, '')
+
+        try:
+            id_list = [
+                int(pk) for pk in value.split(PK_LIST_SEPARATOR) if pk
+            ]
+        except ValueError as exception:
+            raise ValidationError(detail=str(exception))
+
+        if not id_list:
+            raise ValidationError(
+                detail='The `{}` argument is required.'.format(
+                    self.image_batch_id_list_argument
+                )
+            )
+
+        if len(id_list) > IMAGE_BATCH_MAXIMUM_SIZE:
+            raise ValidationError(
+                detail='A maximum of {} images can be requested at once.'.format(
+                    IMAGE_BATCH_MAXIMUM_SIZE
+                )
+            )
+
+        return id_list
+
+    def get_image_batch_object_list(self):
+        """
+        Return the objects of the ID list in the order requested. IDs not
+        found in the view queryset are ignored.
+        """
+        id_list = self.get_image_batch_id_list()
+
+        object_dictionary = self.get_queryset().in_bulk(id_list=id_list)
+
+        return [
+            object_dictionary[pk] for pk in id_list if pk in object_dictionary
+        ]
+
+    def get_serializer(self, *args, **kwargs):
+        return None
+
+    def get_serializer_class(self):
+        return None
+
+    def list(self, request, *args, **kwargs):
+        object_list = self.get_image_batch_object_list()
+
+        transformation_dictionary_list = IndexedDictionary(
+            dictionary=request.GET
+        ).as_dictionary_list()
+
+        # An empty string is not a valid value for maximum_layer_order.
+        # Fallback to None in case of a empty string.
+        maximum_layer_order = request.GET.get('maximum_layer_order') or None
+        if maximum_layer_order:
+            maximum_layer_order = int(maximum_layer_order)
+
+        if 'manifest' in request.GET:
+            transformation_instance_list = IndexedDictionary.from_dictionary_list(
+                dictionary_list=transformation_dictionary_list
+            ).as_instance_list()
+
+            return Response(
+                data=[
+                    {
+                        'id': obj.pk,
+                        'image_url': request.build_absolute_uri(
+                            location=obj.get_api_image_url(
+                                maximum_layer_order=maximum_layer_order,
+                                transformation_instance_list=transformation_instance_list,
+                                user=request.user
+                            )
+                        )
+                    } for obj in object_list
+                ]
+            )
+
+        # Queue all the images before waiting for any of them so that they
+        # are generated concurrently.
+        task_list = []
+        for obj in object_list:
+            task_list.append(
+                (
+                    obj, task_content_object_image_generate.apply_async(
+                        kwargs={
+                            'content_type_id': ContentType.objects.get_for_model(
+                                model=obj
+                            ).pk,
+                            'object_id': obj.pk,
+                            'maximum_layer_order': maximum_layer_order,
+                            'transformation_dictionary_list': transformation_dictionary_list,
+                            'user_id': request.user.pk
+                        }
+                    )
+                )
+            )
+
+        kwargs = {'timeout': setting_image_generation_timeout.value}
+        if settings.DEBUG:
+            # In debug more, task are run synchronously, causing this method
+            # to be called inside another task. Disable the check of nested
+            # tasks when using debug mode.
+            kwargs['disable_sync_subtasks'] = False
+
+        mime_type_backend = MIMETypeBackend.get_backend_instance()
+
+        archive = ZipArchive()
+        archive.create()
+
+        for obj, task in task_list:
+            cache_file = obj.cache_partition.get_file(
+                filename=task.get(**kwargs)
+            )
+
+            with cache_file.open() as file_object:
+                mime_type, mime_encoding = mime_type_backend.get_mime_type(
+                    file_object=file_object, mime_type_only=True
+                )
+                extension = mime_type and mimetypes.guess_extension(
+                    type=mime_type
+                )
+                archive.add_file(
+                    file_object=file_object, filename='{}{}'.format(
+                        obj.pk, extension or ''
+                    )
+                )
+
+        return FileResponse(
+            as_attachment=True, content_type='application/zip',
+            filename=self.image_batch_filename,
+            streaming_content=archive.write()
+        )
+
+
+class APIImageTilesBaseViewMixin:
+    def generate_tiles(self):
+        """
+        Generate the tile pyramid in the converter workers and return its
+        descriptor.
+        """
+        task = task_content_object_image_tiles_generate.apply_async(
+            kwargs={
+                'content_type_id': ContentType.objects.get_for_model(
+                    model=self.obj
+                ).pk,
+                'object_id': self.obj.pk,
+                'maximum_layer_order': self.get_maximum_layer_order(),
+                'user_id': self.request.user.pk
+            }
+        )
+
+        kwargs = {'timeout': setting_image_generation_timeout.value}
+        if settings.DEBUG:
+            # In debug more, task are run synchronously, causing this method
+            # to be called inside another task. Disable the check of nested
+            # tasks when using debug mode.
+            kwargs['disable_sync_subtasks'] = False
+
+        return task.get(**kwargs)
+
+    def get_maximum_layer_order(self):
+        # An empty string is not a valid value for maximum_layer_order.
+        # Fallback to None in case of a empty string.
+        maximum_layer_order = self.request.GET.get('maximum_layer_order') or None
+        if maximum_layer_order:
+            maximum_layer_order = int(maximum_layer_order)
+
+        return maximum_layer_order
+
+    def get_serializer(self, *args, **kwargs):
+        return None
+
+    def get_serializer_class(self):
+        return None
+
+    def get_tile_pyramid(self):
+        return ImageTilePyramid(
+            maximum_layer_order=self.get_maximum_layer_order(),
+            obj=self.obj, user=self.request.user
+        )
+
+    def get_not_modified_response(self, etag):
+        response = get_conditional_response(
+            etag=quote_etag(etag), request=self.request
+        )
+        if response:
+            return self.patch_response(etag=etag, response=response)
+
+    def patch_response(self, response, etag=None):
+        if etag:
+            response.headers['ETag'] = quote_etag(etag)
+
+        if '_hash' in self.request.GET:
+            patch_cache_control(
+                max_age=setting_image_cache_time.value,
+                response=response
+            )
+        return response
+
+    def set_object(self):
+        self.obj = self.get_object()
+
+
+class APIImageRegionViewMixin(APIImageTilesBaseViewMixin):
+    """
+    get: Returns a region of the image of the selected object, scaled by a factor.
+    """
+    def get_region_arguments(self):
+        descriptor = self.generate_tiles()
+
+        try:
+            arguments = {
+                'height': int(
+                    self.request.GET.get('height', descriptor['height'])
+                ),
+                'left': int(self.request.GET.get('left', 0)),
+                'scale': float(self.request.GET.get('scale', 1)),
+                'top': int(self.request.GET.get('top', 0)),
+                'width': int(
+                    self.request.GET.get('width', descriptor['width'])
+                )
+            }
+        except ValueError as exception:
+            raise ValidationError(detail=str(exception))
+
+        return arguments
+
+    def retrieve(self, request, **kwargs):
+        self.set_object()
+
+        tile_pyramid = self.get_tile_pyramid()
+
+        try:
+            image_buffer = tile_pyramid.get_region(
+                **self.get_region_arguments()
+            )
+        except ValueError as exception:
+            raise ValidationError(detail=str(exception))
+
+        response = HttpResponse(
+            content=image_buffer.getvalue(),
+            content_type=Image.MIME[tile_pyramid.tile_format.upper()]
+        )
+
+        return self.patch_response(response=response)
+
+
+class APIImageTileViewMixin(APIImageTilesBaseViewMixin):
+    """
+    get: Returns a tile of the image pyramid of the selected object.
+    """
+    def retrieve(self, request, **kwargs):
+        self.set_object()
+
+        tile_pyramid = self.get_tile_pyramid()
+
+        tile_kwargs = {
+            'column': int(self.kwargs['column']),
+            'level': int(self.kwargs['level']),
+            'row': int(self.kwargs['row'])
+        }
+
+        tile_filename = tile_pyramid.get_tile_filename(**tile_kwargs)
+
+        response = self.get_not_modified_response(etag=tile_filename)
+        if response:
+            return response
+
+        try:
+            cache_file = self.obj.cache_partition.get_file(
+                filename=tile_filename
+            )
+        except CachePartitionFile.DoesNotExist:
+            self.generate_tiles()
+
+            try:
+                cache_file = tile_pyramid.get_tile_file(**tile_kwargs)
+            except CachePartitionFile.DoesNotExist:
+                raise Http404
+
+        def file_generator():
+            with cache_file.open() as file_object:
+                while True:
+                    chunk = file_object.read(File.DEFAULT_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    else:
+                        yield chunk
+
+        response = StreamingHttpResponse(
+            content_type=Image.MIME[tile_pyramid.tile_format.upper()],
+            streaming_content=file_generator()
+        )
+
+        return self.patch_response(etag=tile_filename, response=response)
+
+
+class APIImageTilesViewMixin(APIImageTilesBaseViewMixin):
+    """
+    get: Returns the description of the image tile pyramid of the selected object.
+    """
+    def retrieve(self, request, **kwargs):
+        self.set_object()
+
+        return self.patch_response(
+            response=Response(data=self.generate_tiles())
+        )
@@ -1,6 +1,6 @@
 import io
 import logging
-import shutil
+import os
 import struct
 
 from PIL import Image
@@ -10,7 +10,7 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import TemporaryDirectory
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
@@ -66,19 +66,56 @@ class Python(ConverterBase):
         super().convert(*args, **kwargs)
 
         if self.mime_type == 'application/pdf' and pdftoppm:
-            with NamedTemporaryFile() as new_file_object:
-                self.file_object.seek(0)
-                shutil.copyfileobj(fsrc=self.file_object, fdst=new_file_object)
-                self.file_object.seek(0)
-                new_file_object.seek(0)
-
-                image_buffer = io.BytesIO()
-                pdftoppm(
-                    new_file_object.name, f=self.page_number + 1,
-                    l=self.page_number + 1, _out=image_buffer
+            image_buffer = io.BytesIO()
+            pdftoppm(
+                self.get_file_path(), f=self.page_number + 1,
+                l=self.page_number + 1, _out=image_buffer
+            )
+            image_buffer.seek(0)
+            return Image.open(fp=image_buffer)
+
+    def convert_many(self, page_number_first=0, page_number_last=None):
+        """
+        Rasterize a range of PDF pages with a single pdftoppm execution
+        instead of one execution and one copy of the source file per page.
+        """
+        if self.mime_type != 'application/pdf' or not pdftoppm:
+            yield from super().convert_many(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            )
+            return
+
+        kwargs = {'f': page_number_first + 1}
+        if page_number_last is not None:
+            kwargs['l'] = page_number_last + 1
+
+        with TemporaryDirectory() as output_directory:
+            pdftoppm(
+                self.get_file_path(),
+                os.path.join(output_directory, 'page'), **kwargs
+            )
+
+            # pdftoppm names the output files "page-<number>.<ext>"
+            # padding the page number with zeros based on the total
+            # page count.
+            output_filenames = []
+            for filename in os.listdir(output_directory):
+                name, extension = os.path.splitext(filename)
+                output_filenames.append(
+                    (int(name.rsplit('-', 1)[-1]), filename)
                 )
-                image_buffer.seek(0)
-                return Image.open(fp=image_buffer)
+
+            for page_number, filename in sorted(output_filenames):
+                path = os.path.join(output_directory, filename)
+                with open(file=path, mode='rb') as file_object:
+                    image = Image.open(fp=file_object)
+                    image.load()
+
+                # Free the disk space of each page as soon as it is
+                # loaded.
+                os.unlink(path)
+                yield page_number - 1, image
 
     def get_page_count(self):
         super().get_page_count()
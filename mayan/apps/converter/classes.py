@@ -1,6 +1,8 @@
 import copy
 from io import BytesIO
+import json
 import logging
+import math
 import os
 import shutil
 
@@ -18,13 +20,14 @@ from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.appearance.classes import Icon
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.mime_types.classes import MIMETypeBackend
 from mayan.apps.navigation.classes import Link
 from mayan.apps.storage.compressed_files import MsgArchive
 from mayan.apps.storage.literals import MSG_MIME_TYPES
 from mayan.apps.storage.settings import setting_temporary_directory
 from mayan.apps.storage.utils import (
-    NamedTemporaryFile, TemporaryDirectory, fs_cleanup
+    NamedTemporaryFile, TemporaryDirectory, fs_cleanup, get_file_object_path
 )
 
 from .exceptions import (
@@ -32,10 +35,11 @@ from .exceptions import (
 )
 from .literals import (
     CONVERTER_OFFICE_FILE_MIMETYPES, DEFAULT_LIBREOFFICE_PATH,
-    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT
+    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT, IMAGE_TILE_SIZE
 )
 from .settings import (
-    setting_graphics_backend, setting_graphics_backend_arguments
+    setting_graphics_backend, setting_graphics_backend_arguments,
+    setting_image_generation_timeout
 )
 
 logger = logging.getLogger(name=__name__)
@@ -78,6 +82,7 @@ class ConverterBase:
 
     def __init__(self, file_object, mime_type=None):
         self.file_object = file_object
+        self.file_object_copy = None
         self.image = None
 
         self.mime_type = mime_type or MIMETypeBackend.get_backend_instance().get_mime_type(
@@ -95,6 +100,44 @@ class ConverterBase:
     def convert(self, page_number=DEFAULT_PAGE_NUMBER):
         self.page_number = page_number
 
+    def convert_many(self, page_number_first=0, page_number_last=None):
+        """
+        Generator that converts a range of pages and yields a tuple of the
+        page number and image of each page. Backends that can render several
+        pages in a single pass should override this method. The default
+        implementation converts one page at a time.
+        """
+        if page_number_last is None:
+            page_number_last = self.get_page_count() - 1
+
+        for page_number in range(page_number_first, page_number_last + 1):
+            yield page_number, self.convert(page_number=page_number)
+
+    def get_file_path(self):
+        """
+        Return a filesystem path with the content of the source file object
+        to pass to external programs. File objects backed by a local file
+        are used in place. Other file objects are copied once and the copy
+        is shared by all the pages converted by this instance.
+        """
+        file_path = get_file_object_path(file_object=self.file_object)
+
+        if file_path:
+            return file_path
+
+        if not self.file_object_copy:
+            # Not using a context manager so that the copy is deleted when
+            # the converter instance is discarded.
+            self.file_object_copy = NamedTemporaryFile()
+            self.file_object.seek(0)
+            shutil.copyfileobj(
+                fsrc=self.file_object, fdst=self.file_object_copy
+            )
+            self.file_object.seek(0)
+            self.file_object_copy.flush()
+
+        return self.file_object_copy.name
+
     def get_page(self, output_format=None):
         output_format = output_format or setting_graphics_backend_arguments.value.get(
             'pillow_format', DEFAULT_PILLOW_FORMAT
@@ -123,6 +166,20 @@ class ConverterBase:
         except InvalidOfficeFormat as exception:
             logger.debug('Is not an office format document; %s', exception)
 
+    def get_pages(
+        self, output_format=None, page_number_first=0, page_number_last=None
+    ):
+        """
+        Generator that yields a tuple of the page number and the image
+        buffer for each page of a range of pages. The range is converted
+        in a single pass when supported by the backend.
+        """
+        for page_number in self.seek_pages(
+            page_number_first=page_number_first,
+            page_number_last=page_number_last
+        ):
+            yield page_number, self.get_page(output_format=output_format)
+
     def seek_page(self, page_number):
         """
         Seek the specified page number from the source file object.
@@ -149,6 +206,46 @@ class ConverterBase:
             self.image.seek(page_number)
             self.image.load()
 
+    def seek_pages(self, page_number_first=0, page_number_last=None):
+        """
+        Generator version of `seek_page`. Loads each page of a range of
+        pages in turn as the current image and yields its page number.
+        """
+        self.file_object.seek(0)
+
+        try:
+            image = Image.open(fp=self.file_object)
+        except IOError:
+            # Cannot identify image file.
+            for page_number, image in self.convert_many(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            ):
+                self.image = image
+                yield page_number
+        except PIL.Image.DecompressionBombError as exception:
+            logger.error(
+                'Unable to seek document page. Increase the value of '
+                'the argument "pillow_maximum_image_pixels" in the '
+                'CONVERTER_GRAPHICS_BACKEND_ARGUMENTS setting; %s',
+                exception
+            )
+            raise
+        else:
+            page_number = page_number_first
+
+            while page_number_last is None or page_number <= page_number_last:
+                try:
+                    image.seek(page_number)
+                except EOFError:
+                    # End of sequence.
+                    break
+                else:
+                    image.load()
+                    self.image = image
+                    yield page_number
+                    page_number += 1
+
     def soffice(self):
         """
         Executes LibreOffice as a sub process.
@@ -272,6 +369,275 @@ class ConverterBase:
             self.image = transformation.execute_on(image=self.image)
 
 
+class ImageTilePyramid:
+    """
+    Multi resolution pyramid of image tiles of an object, using the Deep
+    Zoom layout. Level 0 is a single pixel and the last level is the full
+    resolution image produced by the `generate_image` method of the
+    object. Each level halves the size of the next one. The tiles are
+    generated once and stored in the cache partition of the object.
+    """
+    def __init__(self, obj, maximum_layer_order=None, user=None):
+        self.image_cache_filename = obj.get_combined_cache_filename(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+        self.maximum_layer_order = maximum_layer_order
+        self.obj = obj
+        self.tile_format = setting_graphics_backend_arguments.value.get(
+            'pillow_format', DEFAULT_PILLOW_FORMAT
+        )
+        self.tile_size = IMAGE_TILE_SIZE
+        self.user = user
+
+    def _save_image(self, filename, image):
+        if self.tile_format.upper() == 'JPEG' and image.mode != 'RGB':
+            # JPEG doesn't support transparency channel.
+            image = image.convert('RGB')
+
+        with self.obj.cache_partition.create_file(filename=filename) as file_object:
+            image.save(fp=file_object, format=self.tile_format)
+
+    def delete(self):
+        """
+        Delete the descriptor and the tiles of the pyramid.
+        """
+        queryset = self.obj.cache_partition.files.filter(
+            filename__startswith='{}-tile'.format(self.image_cache_filename)
+        )
+        for cache_partition_file in queryset:
+            cache_partition_file.delete()
+
+    def generate(self):
+        """
+        Generate the tiles of all the levels if they don't exist and return
+        the descriptor of the pyramid.
+        """
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        try:
+            return self.get_descriptor()
+        except CachePartitionFile.DoesNotExist:
+            """Not generated yet."""
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.get_lock_name(),
+            timeout=setting_image_generation_timeout.value
+        )
+        try:
+            try:
+                return self.get_descriptor()
+            except CachePartitionFile.DoesNotExist:
+                """Not generated by a concurrent call either."""
+
+            # Remove the tiles of an incomplete previous generation.
+            self.delete()
+
+            cache_filename = self.obj.generate_image(
+                maximum_layer_order=self.maximum_layer_order, user=self.user
+            )
+            cache_file = self.obj.cache_partition.get_file(
+                filename=cache_filename
+            )
+            with cache_file.open() as file_object:
+                image = Image.open(fp=file_object)
+                image.load()
+
+            descriptor = {
+                'format': self.tile_format.lower(),
+                'height': image.height,
+                'levels': ImageTilePyramid.get_level_count(
+                    height=image.height, width=image.width
+                ),
+                'tile_size': self.tile_size,
+                'width': image.width
+            }
+
+            for level in reversed(range(descriptor['levels'])):
+                if level < descriptor['levels'] - 1:
+                    image = image.resize(
+                        resample=Image.LANCZOS, size=(
+                            math.ceil(image.width / 2),
+                            math.ceil(image.height / 2)
+                        )
+                    )
+
+                for row in range(math.ceil(image.height / self.tile_size)):
+                    for column in range(math.ceil(image.width / self.tile_size)):
+                        left = column * self.tile_size
+                        top = row * self.tile_size
+                        self._save_image(
+                            filename=self.get_tile_filename(
+                                column=column, level=level, row=row
+                            ), image=image.crop(
+                                box=(
+                                    left, top,
+                                    min(left + self.tile_size, image.width),
+                                    min(top + self.tile_size, image.height)
+                                )
+                            )
+                        )
+
+            # The descriptor is stored last and marks the pyramid as
+            # complete.
+            with self.obj.cache_partition.create_file(filename=self.get_descriptor_filename()) as file_object:
+                file_object.write(json.dumps(obj=descriptor).encode())
+
+            return descriptor
+        finally:
+            lock.release()
+
+    @staticmethod
+    def get_level_count(height, width):
+        return math.ceil(math.log2(max(height, width, 1))) + 1
+
+    def get_descriptor(self):
+        cache_file = self.obj.cache_partition.get_file(
+            filename=self.get_descriptor_filename()
+        )
+        with cache_file.open() as file_object:
+            return json.loads(s=file_object.read())
+
+    def get_descriptor_filename(self):
+        return '{}-tiles'.format(self.image_cache_filename)
+
+    def get_lock_name(self):
+        return 'image_tile_pyramid_{}_{}_{}'.format(
+            self.obj._meta.label, self.obj.pk, self.image_cache_filename
+        )
+
+    def get_region(self, left, top, width, height, scale=1, _regenerate=True):
+        """
+        Return the region of the full resolution image scaled by the
+        factor as an image file object. The region is assembled from the
+        tiles of the smallest level that has at least the requested
+        resolution.
+        """
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        descriptor = self.generate()
+
+        if not 0 < scale <= 1:
+            raise ValueError('Scale must be bigger than 0 and at most 1.')
+
+        right = min(left + width, descriptor['width'])
+        bottom = min(top + height, descriptor['height'])
+
+        if left < 0 or top < 0 or right <= left or bottom <= top:
+            raise ValueError('Region is outside of the image.')
+
+        level = max(
+            descriptor['levels'] - 1 - int(math.floor(math.log2(1 / scale))),
+            0
+        )
+        level_scale = 2 ** (level - descriptor['levels'] + 1)
+
+        level_box = (
+            math.floor(left * level_scale), math.floor(top * level_scale),
+            math.ceil(right * level_scale), math.ceil(bottom * level_scale)
+        )
+
+        column_first = level_box[0] // self.tile_size
+        column_last = (level_box[2] - 1) // self.tile_size
+        row_first = level_box[1] // self.tile_size
+        row_last = (level_box[3] - 1) // self.tile_size
+
+        canvas = Image.new(
+            mode='RGB', size=(
+                (column_last - column_first + 1) * self.tile_size,
+                (row_last - row_first + 1) * self.tile_size
+            )
+        )
+
+        for row in range(row_first, row_last + 1):
+            for column in range(column_first, column_last + 1):
+                try:
+                    cache_file = self.obj.cache_partition.get_file(
+                        filename=self.get_tile_filename(
+                            column=column, level=level, row=row
+                        )
+                    )
+                except CachePartitionFile.DoesNotExist:
+                    if not _regenerate:
+                        raise
+
+                    # A tile was pruned from the cache, start over.
+                    self.delete()
+                    return self.get_region(
+                        height=height, left=left, scale=scale, top=top,
+                        width=width, _regenerate=False
+                    )
+
+                with cache_file.open() as file_object:
+                    canvas.paste(
+                        box=(
+                            (column - column_first) * self.tile_size,
+                            (row - row_first) * self.tile_size
+                        ), im=Image.open(fp=file_object)
+                    )
+
+        offset_x = column_first * self.tile_size
+        offset_y = row_first * self.tile_size
+
+        image = canvas.crop(
+            box=(
+                level_box[0] - offset_x, level_box[1] - offset_y,
+                level_box[2] - offset_x, level_box[3] - offset_y
+            )
+        )
+
+        size = (
+            max(round((right - left) * scale), 1),
+            max(round((bottom - top) * scale), 1)
+        )
+        if image.size != size:
+            image = image.resize(resample=Image.LANCZOS, size=size)
+
+        image_buffer = BytesIO()
+        image.save(fp=image_buffer, format=self.tile_format)
+        image_buffer.seek(0)
+
+        return image_buffer
+
+    def get_tile_file(self, level, column, row):
+        """
+        Return the cache partition file of a tile, generating the pyramid
+        if needed.
+        """
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        filename = self.get_tile_filename(
+            column=column, level=level, row=row
+        )
+
+        try:
+            return self.obj.cache_partition.get_file(filename=filename)
+        except CachePartitionFile.DoesNotExist:
+            descriptor = self.generate()
+
+            level_scale = 2 ** (level - descriptor['levels'] + 1)
+            if level >= descriptor['levels'] or column * self.tile_size >= math.ceil(descriptor['width'] * level_scale) or row * self.tile_size >= math.ceil(descriptor['height'] * level_scale):
+                raise
+
+            try:
+                return self.obj.cache_partition.get_file(filename=filename)
+            except CachePartitionFile.DoesNotExist:
+                # A tile was pruned from the cache, start over.
+                self.delete()
+                self.generate()
+                return self.obj.cache_partition.get_file(filename=filename)
+
+    def get_tile_filename(self, level, column, row):
+        return '{}-tile-{}-{}-{}'.format(
+            self.image_cache_filename, level, column, row
+        )
+
+
 class Layer:
     _registry = {}
 
@@ -92,6 +92,12 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'pillow_maximum_image_pixels': DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
 }
 
+# Maximum number of objects of a single batch image request.
+IMAGE_BATCH_MAXIMUM_SIZE = 100
+
+# Width and height in pixels of the tiles of the image pyramids.
+IMAGE_TILE_SIZE = 256
+
 STORAGE_NAME_ASSETS = 'converter__assets'
 STORAGE_NAME_ASSETS_CACHE = 'converter__assets_cache'
 
@@ -12,3 +12,8 @@ queue_converter.add_task_type(
     label=_('Generate a image of an object.'),
     name='task_content_object_image_generate',
 )
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.converter.tasks.task_content_object_image_tiles_generate',
+    label=_('Generate the image tiles of an object.'),
+    name='task_content_object_image_tiles_generate',
+)
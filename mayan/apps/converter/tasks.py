@@ -8,6 +8,7 @@ from django.contrib.auth import get_user_model
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .classes import ImageTilePyramid
 from .settings import setting_image_generation_max_retries
 from .utils import IndexedDictionary
 
@@ -62,3 +63,44 @@ def task_content_object_image_generate(
                 'preventing the task from completing.'
             )
             raise
+
+
+@app.task(
+    bind=True, max_retries=setting_image_generation_max_retries.value,
+    retry_backoff=True
+)
+def task_content_object_image_tiles_generate(
+    self, content_type_id, object_id, maximum_layer_order=None, user_id=None
+):
+    ContentType = apps.get_model(
+        app_label='contenttypes', model_name='ContentType'
+    )
+    User = get_user_model()
+
+    content_type = ContentType.objects.get(pk=content_type_id)
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    obj = content_type.get_object_for_this_type(pk=object_id)
+
+    try:
+        return ImageTilePyramid(
+            maximum_layer_order=maximum_layer_order, obj=obj, user=user
+        ).generate()
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate image tiles for %s. '
+            'Retrying.', obj
+        )
+        try:
+            raise self.retry(exc=exception)
+        except celery.exceptions.MaxRetriesExceededError:
+            logger.error(
+                'Maximum retries reached for image tiles generation task. '
+                'System might be overloaded or a stale lock might be '
+                'preventing the task from completing.'
+            )
+            raise
@@ -1,8 +1,13 @@
+import atexit
+from contextlib import contextmanager
 import logging
+import os
+import shutil
+import threading
 
 import gnupg
 
-from mayan.apps.storage.utils import TemporaryDirectory
+from mayan.apps.storage.utils import TemporaryDirectory, mkdtemp
 
 from ..classes import GPGBackend
 from ..literals import DEFAULT_GPG_PATH
@@ -14,7 +19,75 @@ gpg_path = setting_gpg_backend_arguments.value.get(
 logger = logging.getLogger(name=__name__)
 
 
+class PythonGNUPGKeyring:
+    """
+    Keyring that persists for the life of the process. Keys are imported
+    once instead of creating a new keyring and importing the keys for
+    every verification or decryption. The keyring is discarded and
+    recreated when keys are removed from the database or when the
+    process is forked.
+    """
+    def __init__(self):
+        self.fingerprints = set()
+        self.gpg = None
+        self.lock = threading.RLock()
+        self.path = None
+        self.pid = None
+
+        atexit.register(self.destroy)
+
+    def _create(self, gpg_path):
+        self.path = mkdtemp()
+        self.gpg = gnupg.GPG(gnupghome=self.path, gpgbinary=gpg_path)
+        self.fingerprints = set()
+        self.pid = os.getpid()
+
+    def destroy(self):
+        with self.lock:
+            # A forked process must not remove the keyring of its parent.
+            if self.path and self.pid == os.getpid():
+                shutil.rmtree(path=self.path, ignore_errors=True)
+
+            self.fingerprints = set()
+            self.gpg = None
+            self.path = None
+            self.pid = None
+
+    @contextmanager
+    def open(self, gpg_path, keys):
+        with self.lock:
+            if self.pid != os.getpid():
+                self._create(gpg_path=gpg_path)
+
+            for key in keys:
+                if key['fingerprint'] not in self.fingerprints:
+                    self.gpg.import_keys(key_data=key['key_data'])
+                    self.fingerprints.add(key['fingerprint'])
+
+            yield self.gpg
+
+    def prepare(self, fingerprint_list):
+        """
+        Discard the keyring if it contains keys that are not in the
+        fingerprint list anymore and return the fingerprints of the list
+        that are missing from the keyring.
+        """
+        fingerprints = set(fingerprint_list)
+
+        with self.lock:
+            if self.pid == os.getpid() and self.fingerprints - fingerprints:
+                logger.debug(msg='keys were removed, discarding keyring')
+                self.destroy()
+
+            if self.pid != os.getpid():
+                return fingerprints
+            else:
+                return fingerprints - self.fingerprints
+
+
 class PythonGNUPGBackend(GPGBackend):
+    keyring = PythonGNUPGKeyring()
+
     @staticmethod
     def _import_key(gpg, **kwargs):
         return gpg.import_keys(**kwargs)
@@ -44,19 +117,14 @@ class PythonGNUPGBackend(GPGBackend):
         )
 
     @staticmethod
-    def _decrypt_file(gpg, file_object, keys):
-        for key in keys:
-            gpg.import_keys(key_data=key['key_data'])
-
+    def _decrypt_file(gpg, file_object):
         return gpg.decrypt_file(file=file_object)
 
     @staticmethod
-    def _verify_file(gpg, file_object, keys, data_filename=None):
-        for key in keys:
-            gpg.import_keys(key_data=key['key_data'])
-
+    def _verify_file(gpg, file_object, data_filename=None):
+        # The caller owns the signature file object, don't close it.
         return gpg.verify_file(
-            file=file_object, data_filename=data_filename
+            close_file=False, data_filename=data_filename, file=file_object
         )
 
     @staticmethod
@@ -82,6 +150,12 @@ class PythonGNUPGBackend(GPGBackend):
             )
             return function(gpg=gpg, **kwargs)
 
+    def gpg_keyring_command(self, function, keys, **kwargs):
+        with self.keyring.open(
+            gpg_path=self.kwargs['gpg_path'], keys=keys
+        ) as gpg:
+            return function(gpg=gpg, **kwargs)
+
     def import_key(self, key_data):
         return self.gpg_command(
             function=PythonGNUPGBackend._import_key, key_data=key_data
@@ -109,13 +183,16 @@ class PythonGNUPGBackend(GPGBackend):
         )
 
     def decrypt_file(self, file_object, keys):
-        return self.gpg_command(
+        return self.gpg_keyring_command(
             function=PythonGNUPGBackend._decrypt_file, file_object=file_object,
             keys=keys
         )
 
+    def keyring_prepare(self, fingerprint_list):
+        return self.keyring.prepare(fingerprint_list=fingerprint_list)
+
     def verify_file(self, file_object, keys, data_filename=None):
-        return self.gpg_command(
+        return self.gpg_keyring_command(
             function=PythonGNUPGBackend._verify_file, file_object=file_object,
             keys=keys, data_filename=data_filename
         )
@@ -18,6 +18,14 @@ class GPGBackend:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
 
+    def keyring_prepare(self, fingerprint_list):
+        """
+        Return the fingerprints of the keys that must be provided to
+        verify or decrypt files. Backends without a persistent keyring
+        need all of them every time.
+        """
+        return set(fingerprint_list)
+
 
 class KeyStub:
     def __init__(self, raw):
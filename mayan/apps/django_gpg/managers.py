@@ -4,7 +4,9 @@ import shutil
 
 from django.db import models
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import (
+    NamedTemporaryFile, get_file_object_path
+)
 
 from .classes import GPGBackend, KeyStub, SignatureVerification
 from .exceptions import (
@@ -17,6 +19,21 @@ logger = logging.getLogger(name=__name__)
 
 
 class KeyManager(models.Manager):
+    def _get_keyring_keys(self):
+        """
+        Return the keys that the keyring of the GPG backend is missing.
+        Backends with a persistent keyring only need the keys added since
+        the last operation.
+        """
+        fingerprints = GPGBackend.get_instance().keyring_prepare(
+            fingerprint_list=self.values_list('fingerprint', flat=True)
+        )
+
+        if fingerprints:
+            return list(self.filter(fingerprint__in=fingerprints).values())
+        else:
+            return []
+
     def _preload_keys(self, all_keys=False, key_fingerprint=None, key_id=None):
         # Preload keys.
         if all_keys:
@@ -45,9 +62,12 @@ class KeyManager(models.Manager):
     def decrypt_file(
         self, file_object, all_keys=False, key_fingerprint=None, key_id=None
     ):
-        keys = self._preload_keys(
-            all_keys=all_keys, key_fingerprint=key_fingerprint, key_id=key_id
-        )
+        keys = list(
+            self._preload_keys(
+                all_keys=all_keys, key_fingerprint=key_fingerprint,
+                key_id=key_id
+            )
+        ) + self._get_keyring_keys()
 
         decrypt_result = GPGBackend.get_instance().decrypt_file(
             file_object=file_object, keys=keys
@@ -93,30 +113,37 @@ class KeyManager(models.Manager):
         self, file_object, signature_file=None, all_keys=False,
         key_fingerprint=None, key_id=None
     ):
-        keys = self._preload_keys(
-            all_keys=all_keys, key_fingerprint=key_fingerprint, key_id=key_id
-        )
+        keys = list(
+            self._preload_keys(
+                all_keys=all_keys, key_fingerprint=key_fingerprint,
+                key_id=key_id
+            )
+        ) + self._get_keyring_keys()
 
         if signature_file:
-            # Save the original data and invert the argument order:
-            # signature first, file second.
-            with NamedTemporaryFile() as temporary_file_object:
-                shutil.copyfileobj(
-                    fsrc=file_object, fdst=temporary_file_object
+            # Invert the argument order: signature first, file second.
+            # GPG reads the signed data from a path, use the path of the
+            # file when it is a plain local file instead of copying it.
+            data_filename = get_file_object_path(file_object=file_object)
+
+            if data_filename:
+                verify_result = GPGBackend.get_instance().verify_file(
+                    file_object=signature_file, data_filename=data_filename,
+                    keys=keys
                 )
-                temporary_file_object.seek(0)
-
-                with NamedTemporaryFile() as temporary_signature_file_object:
+            else:
+                with NamedTemporaryFile() as temporary_file_object:
                     shutil.copyfileobj(
-                        fsrc=signature_file,
-                        fdst=temporary_signature_file_object
+                        fsrc=file_object, fdst=temporary_file_object
                     )
-                    temporary_signature_file_object.seek(0)
-                    signature_file.seek(0)
+                    temporary_file_object.flush()
+
                     verify_result = GPGBackend.get_instance().verify_file(
-                        file_object=temporary_signature_file_object,
+                        file_object=signature_file,
                         data_filename=temporary_file_object.name, keys=keys
                     )
+
+            signature_file.seek(0)
         else:
             verify_result = GPGBackend.get_instance().verify_file(
                 file_object=file_object, keys=keys
@@ -95,6 +95,34 @@ class KeyTestCase(BaseTestCase):
             with self.assertRaises(expected_exception=KeyDoesNotExist):
                 Key.objects.verify_file(signed_file, key_fingerprint='999')
 
+    def test_embedded_verification_keyring_reuse(self):
+        Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
+
+        with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+            Key.objects.verify_file(signed_file)
+
+        with mock.patch.object(gnupg.GPG, 'import_keys', autospec=True) as import_keys:
+            with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+                result = Key.objects.verify_file(signed_file)
+
+        import_keys.assert_not_called()
+        self.assertTrue(result.valid)
+
+    def test_embedded_verification_keyring_key_deletion(self):
+        key = Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
+
+        with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+            result = Key.objects.verify_file(signed_file)
+
+        self.assertTrue(result.valid)
+
+        key.delete()
+
+        with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+            result = Key.objects.verify_file(signed_file)
+
+        self.assertFalse(result.valid)
+
     def test_signed_file_decryption(self):
         Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
 
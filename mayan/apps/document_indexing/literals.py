@@ -1,5 +1,8 @@
 from django.utils.translation import ugettext_lazy as _
 
+INDEX_TEMPLATE_REBUILD_BULK_BATCH_SIZE = 1000
+INDEX_TEMPLATE_REBUILD_CHUNK_SIZE = 1000
+
 RELATIONSHIP_NO = 'no'
 RELATIONSHIP_YES = 'yes'
 RELATIONSHIP_CHOICES = (
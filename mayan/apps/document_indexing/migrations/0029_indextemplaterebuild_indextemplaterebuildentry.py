@@ -0,0 +1,93 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0080_populate_file_size'),
+        ('document_indexing', '0028_populate_existing_index_template_event_triggers')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexTemplateRebuild',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'datetime', models.DateTimeField(
+                        auto_now_add=True, verbose_name='Date time'
+                    )
+                ),
+                (
+                    'chunk_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Chunk count'
+                    )
+                ),
+                (
+                    'chunk_completed_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Chunks completed'
+                    )
+                ),
+                (
+                    'index_template', models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='rebuild_state',
+                        to='document_indexing.indextemplate',
+                        verbose_name='Index template'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Index template rebuild',
+                'verbose_name_plural': 'Index template rebuilds'
+            }
+        ),
+        migrations.CreateModel(
+            name='IndexTemplateRebuildEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'value', models.CharField(
+                        max_length=128, verbose_name='Value'
+                    )
+                ),
+                (
+                    'document', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to='documents.document',
+                        verbose_name='Document'
+                    )
+                ),
+                (
+                    'index_template_node', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='document_indexing.indextemplatenode',
+                        verbose_name='Index template node'
+                    )
+                ),
+                (
+                    'index_template_rebuild', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='entries',
+                        to='document_indexing.indextemplaterebuild',
+                        verbose_name='Index template rebuild'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Index template rebuild entry',
+                'verbose_name_plural': 'Index template rebuild entries'
+            }
+        )
+    ]
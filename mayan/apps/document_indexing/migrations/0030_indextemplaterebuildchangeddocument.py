@@ -0,0 +1,46 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0080_populate_file_size'),
+        (
+            'document_indexing',
+            '0029_indextemplaterebuild_indextemplaterebuildentry'
+        )
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexTemplateRebuildChangedDocument',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'document', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+', to='documents.document',
+                        verbose_name='Document'
+                    )
+                ),
+                (
+                    'index_template_rebuild', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='changed_documents',
+                        to='document_indexing.indextemplaterebuild',
+                        verbose_name='Index template rebuild'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Index template rebuild changed document',
+                'verbose_name_plural': 'Index template rebuild changed documents',
+                'unique_together': {('index_template_rebuild', 'document')}
+            }
+        )
+    ]
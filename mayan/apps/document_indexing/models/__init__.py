@@ -1,2 +1,3 @@
 from .index_instance_models import *  # NOQA
 from .index_template_models import *  # NOQA
+from .index_template_rebuild_models import *  # NOQA
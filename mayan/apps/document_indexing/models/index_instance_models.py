@@ -1,5 +1,6 @@
 import logging
 
+from django.apps import apps
 from django.db import models, transaction
 from django.urls import reverse
 from django.utils.encoding import force_text
@@ -13,7 +14,6 @@ from mayan.apps.documents.models import Document
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
-from mayan.apps.templating.classes import Template
 
 from ..managers import (
     DocumentIndexInstanceNodeManager, IndexInstanceManager
@@ -72,6 +72,10 @@ class IndexInstance(IndexTemplate):
         result a node is fetched or created and the document is added to that
         node.
         """
+        IndexTemplateRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexTemplateRebuild'
+        )
+
         logger.debug('Index; Indexing document: %s', document)
 
         index_instance_node_id_list = []
@@ -94,6 +98,13 @@ class IndexInstance(IndexTemplate):
                     raise
                 else:
                     try:
+                        # The tree of an unfinished rebuild replaces this
+                        # one when committed and must include this change.
+                        for index_template_rebuild in IndexTemplateRebuild.objects.filter(index_template_id=self.pk):
+                            index_template_rebuild.document_changed(
+                                document=document
+                            )
+
                         self.initialize_index_instance_root_node_node()
 
                         index_instance_node_parent = self.index_instance_root_node
@@ -116,43 +127,24 @@ class IndexInstance(IndexTemplate):
         index_instance_node_id_list = []
 
         for index_template_node in index_instance_node_parent.index_template_node.get_children().filter(enabled=True):
-            try:
-                template = Template(
-                    template_string=index_template_node.expression
-                )
-                result = template.render(
-                    context={'document': document}
-                )
-            except Exception as exception:
-                logger.debug('Evaluating error: %s', exception)
-                error_message = _(
-                    'Error indexing document: %(document)s; expression: '
-                    '%(expression)s; %(exception)s'
-                ) % {
-                    'document': document,
-                    'expression': index_template_node.expression,
-                    'exception': exception
-                }
-                logger.debug(error_message)
-            else:
-                logger.debug('Evaluation result: %s', result)
+            result = index_template_node.evaluate(document=document)
 
-                if result:
-                    index_instance_node, created = index_template_node.index_instance_nodes.get_or_create(
-                        parent=index_instance_node_parent,
-                        value=result
-                    )
-                    index_instance_node_id_list.append(index_instance_node.pk)
+            if result:
+                index_instance_node, created = index_template_node.index_instance_nodes.get_or_create(
+                    parent=index_instance_node_parent,
+                    value=result
+                )
+                index_instance_node_id_list.append(index_instance_node.pk)
 
-                    if index_template_node.link_documents:
-                        index_instance_node.documents.add(document)
+                if index_template_node.link_documents:
+                    index_instance_node.documents.add(document)
 
-                    index_instance_node_id_list.extend(
-                        self._document_add(
-                            document=document,
-                            index_instance_node_parent=index_instance_node
-                        )
+                index_instance_node_id_list.extend(
+                    self._document_add(
+                        document=document,
+                        index_instance_node_parent=index_instance_node
                     )
+                )
 
         return index_instance_node_id_list
 
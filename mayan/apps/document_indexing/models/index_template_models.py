@@ -16,10 +16,12 @@ from mayan.apps.events.classes import (
 )
 from mayan.apps.events.decorators import method_event
 from mayan.apps.events.models import StoredEventType
+from mayan.apps.templating.classes import Template
 
 from ..events import (
     event_index_template_created, event_index_template_edited
 )
+from ..literals import INDEX_TEMPLATE_REBUILD_CHUNK_SIZE
 from ..managers import IndexTemplateManager
 
 logger = logging.getLogger(name=__name__)
@@ -127,29 +129,86 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
     def natural_key(self):
         return (self.slug,)
 
+    def get_rebuild_chunk_ranges(self, chunk_size):
+        """
+        Divide the documents to index into chunks and return the first and
+        last document ID of each chunk.
+        """
+        chunk_ranges = []
+
+        queryset = self.get_rebuild_document_queryset().order_by(
+            'pk'
+        ).values_list('pk', flat=True)
+
+        for index, document_id in enumerate(queryset.iterator()):
+            if index % chunk_size == 0:
+                chunk_ranges.append([document_id, document_id])
+            else:
+                chunk_ranges[-1][1] = document_id
+
+        return chunk_ranges
+
+    def get_rebuild_document_queryset(self):
+        # Same documents as IndexInstance.document_add(), which skips the
+        # documents in the trash.
+        return Document.valid.filter(
+            document_type__in=self.document_types.all()
+        )
+
+    def get_rebuild_progress_display(self):
+        IndexTemplateRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexTemplateRebuild'
+        )
+
+        try:
+            return self.rebuild_state.get_progress_display()
+        except IndexTemplateRebuild.DoesNotExist:
+            return _('None')
+
+    get_rebuild_progress_display.short_description = _('Rebuild progress')
+
     def rebuild(self):
         """
         Delete and reconstruct the index by deleting of all its instance nodes
         and recreating them for the documents whose types are associated with
-        this index
+        this index. The chunks are evaluated serially, use
+        `task_index_template_rebuild` to evaluate them in parallel.
         """
-        IndexInstance = apps.get_model(
-            app_label='document_indexing', model_name='IndexInstance'
+        index_template_rebuild, chunk_ranges = self.rebuild_start()
+
+        if index_template_rebuild:
+            for document_id_first, document_id_last in chunk_ranges:
+                index_template_rebuild.chunk_evaluate(
+                    document_id_first=document_id_first,
+                    document_id_last=document_id_last
+                )
+
+            index_template_rebuild.commit()
+
+    def rebuild_start(self, chunk_size=INDEX_TEMPLATE_REBUILD_CHUNK_SIZE):
+        """
+        Start a new rebuild of the index, discarding any unfinished rebuild.
+        Returns the rebuild state and the document ID ranges of the chunks
+        to be evaluated.
+        """
+        IndexTemplateRebuild = apps.get_model(
+            app_label='document_indexing', model_name='IndexTemplateRebuild'
         )
 
-        if self.enabled:
-            self.delete_index_instance_nodes()
+        if not self.enabled:
+            return None, ()
+        else:
+            IndexTemplateRebuild.objects.filter(index_template=self).delete()
+
+            chunk_ranges = self.get_rebuild_chunk_ranges(
+                chunk_size=chunk_size
+            )
 
-            # Create the new root index instance node.
-            self.index_template_root_node.index_instance_nodes.create()
+            index_template_rebuild = IndexTemplateRebuild.objects.create(
+                chunk_count=len(chunk_ranges), index_template=self
+            )
 
-            index_instance = IndexInstance.objects.get(pk=self.pk)
-            index_instance.index_instance_root_node
-            # Re-index each document with a type associated with this index.
-            for document in Document.objects.filter(document_type__in=self.document_types.all()):
-                # Evaluate each index template node for each document
-                # associated with this index.
-                index_instance.document_add(document=document)
+            return index_template_rebuild, chunk_ranges
 
     def reset(self):
         self.delete_index_instance_nodes()
@@ -269,6 +328,35 @@ class IndexTemplateNode(MPTTModel):
         else:
             return self.expression
 
+    def evaluate(self, document, template=None):
+        """
+        Render the expression of the node for a document. Returns an empty
+        string if the expression has an error. Pass a template already
+        compiled from the expression to avoid compiling it on each call.
+        """
+        try:
+            if template is None:
+                template = Template(template_string=self.expression)
+
+            result = template.render(
+                context={'document': document}
+            )
+        except Exception as exception:
+            logger.debug('Evaluating error: %s', exception)
+            error_message = _(
+                'Error indexing document: %(document)s; expression: '
+                '%(expression)s; %(exception)s'
+            ) % {
+                'document': document,
+                'expression': self.expression,
+                'exception': exception
+            }
+            logger.debug(error_message)
+            return ''
+        else:
+            logger.debug('Evaluation result: %s', result)
+            return result
+
     def get_index_instance_root_node(self):
         return self.index_instance_nodes.get(parent=None)
 
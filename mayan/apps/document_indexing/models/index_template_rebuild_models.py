@@ -0,0 +1,379 @@
+from collections import defaultdict
+from itertools import groupby
+import logging
+from operator import itemgetter
+
+from django.db import models, transaction
+from django.db.models import F
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.documents.models import Document
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.templating.classes import Template
+
+from ..literals import INDEX_TEMPLATE_REBUILD_BULK_BATCH_SIZE
+
+from .index_instance_models import IndexInstance, IndexInstanceNode
+from .index_template_models import IndexTemplate, IndexTemplateNode
+
+logger = logging.getLogger(name=__name__)
+
+
+class IndexTemplateRebuild(models.Model):
+    """
+    Keep track of an index template rebuild. The documents are evaluated
+    in chunks of ID ranges, independently of each other. Once all chunks
+    are evaluated, the instance nodes of the index are replaced with the
+    new ones in a single transaction.
+    """
+    index_template = models.OneToOneField(
+        on_delete=models.CASCADE, related_name='rebuild_state',
+        to=IndexTemplate, verbose_name=_('Index template')
+    )
+    datetime = models.DateTimeField(
+        auto_now_add=True, verbose_name=_('Date time')
+    )
+    chunk_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Chunk count')
+    )
+    chunk_completed_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Chunks completed')
+    )
+
+    class Meta:
+        verbose_name = _('Index template rebuild')
+        verbose_name_plural = _('Index template rebuilds')
+
+    def __str__(self):
+        return str(self.index_template)
+
+    def _commit(self, index_instance):
+        # Documents changed after the rebuild started were only updated in
+        # the current tree. Evaluate them again for the new tree.
+        self._evaluate_changed_documents()
+
+        index_instance.initialize_index_instance_root_node_node()
+        index_instance_root_node = index_instance.index_instance_root_node
+
+        index_template_node_children = defaultdict(list)
+        index_template_node_link_id_set = set()
+
+        for index_template_node in self.index_template.index_template_nodes.filter(enabled=True).order_by('lft'):
+            index_template_node_children[index_template_node.parent_id].append(
+                index_template_node.pk
+            )
+            if index_template_node.link_documents:
+                index_template_node_link_id_set.add(index_template_node.pk)
+
+        # Build the new tree in memory. Each node is keyed by its index
+        # template node and value, which are unique among siblings.
+        tree = {}
+
+        queryset = self.entries.filter(
+            document__in=self.index_template.get_rebuild_document_queryset()
+        ).order_by('document_id').values_list(
+            'document_id', 'index_template_node_id', 'value'
+        )
+
+        for document_id, entries in groupby(queryset.iterator(), key=itemgetter(0)):
+            values = {entry[1]: entry[2] for entry in entries}
+            self._tree_document_add(
+                document_id=document_id,
+                index_template_node_children=index_template_node_children,
+                index_template_node_id=index_instance_root_node.index_template_node_id,
+                index_template_node_link_id_set=index_template_node_link_id_set,
+                nodes=tree, values=values
+            )
+
+        levels = defaultdict(list)
+        root_right = self._tree_flatten(
+            cursor=index_instance_root_node.lft, level=1, levels=levels,
+            nodes=tree, parent_left=index_instance_root_node.lft
+        ) + 1
+
+        # Swap the trees. The transaction keeps the previous nodes visible
+        # to other connections until the new ones are committed.
+        IndexInstanceNode.objects.filter(
+            index_template_node__index=self.index_template,
+            parent__isnull=False
+        ).delete()
+        IndexInstanceNode.objects.filter(
+            pk=index_instance_root_node.pk
+        ).update(rght=root_right)
+
+        DocumentIndexInstanceNodeThrough = IndexInstanceNode.documents.through
+        node_id_map = {
+            index_instance_root_node.lft: index_instance_root_node.pk
+        }
+
+        for level in sorted(levels):
+            IndexInstanceNode.objects.bulk_create(
+                batch_size=INDEX_TEMPLATE_REBUILD_BULK_BATCH_SIZE, objs=(
+                    IndexInstanceNode(
+                        index_template_node_id=key[0], level=level,
+                        lft=left, parent_id=node_id_map[parent_left],
+                        rght=right, tree_id=index_instance_root_node.tree_id,
+                        value=key[1]
+                    ) for left, right, parent_left, key, document_id_list in levels[level]
+                )
+            )
+
+            # Not all database backends return the primary key of bulk
+            # created rows. Find them by their unique left value.
+            node_id_map = dict(
+                IndexInstanceNode.objects.filter(
+                    level=level, tree_id=index_instance_root_node.tree_id
+                ).values_list('lft', 'pk')
+            )
+
+            links = []
+            for left, right, parent_left, key, document_id_list in levels[level]:
+                for document_id in document_id_list:
+                    links.append(
+                        DocumentIndexInstanceNodeThrough(
+                            document_id=document_id,
+                            indexinstancenode_id=node_id_map[left]
+                        )
+                    )
+
+                if len(links) >= INDEX_TEMPLATE_REBUILD_BULK_BATCH_SIZE:
+                    DocumentIndexInstanceNodeThrough.objects.bulk_create(
+                        objs=links
+                    )
+                    links = []
+
+            DocumentIndexInstanceNodeThrough.objects.bulk_create(objs=links)
+
+    def _tree_document_add(
+        self, document_id, index_template_node_children,
+        index_template_node_id, index_template_node_link_id_set, nodes,
+        values
+    ):
+        for index_template_node_child_id in index_template_node_children[index_template_node_id]:
+            value = values.get(index_template_node_child_id)
+
+            if value:
+                node = nodes.setdefault(
+                    (index_template_node_child_id, value), {
+                        'children': {}, 'documents': []
+                    }
+                )
+
+                if index_template_node_child_id in index_template_node_link_id_set:
+                    node['documents'].append(document_id)
+
+                self._tree_document_add(
+                    document_id=document_id,
+                    index_template_node_children=index_template_node_children,
+                    index_template_node_id=index_template_node_child_id,
+                    index_template_node_link_id_set=index_template_node_link_id_set,
+                    nodes=node['children'], values=values
+                )
+
+    def _tree_flatten(self, cursor, level, levels, nodes, parent_left):
+        """
+        Calculate the MPTT left and right values of the nodes and group
+        them by level. Returns the last right value used.
+        """
+        for key in sorted(nodes):
+            node = nodes[key]
+            left = cursor + 1
+            cursor = self._tree_flatten(
+                cursor=left, level=level + 1, levels=levels,
+                nodes=node['children'], parent_left=left
+            ) + 1
+            levels[level].append(
+                (left, cursor, parent_left, key, node['documents'])
+            )
+
+        return cursor
+
+    def chunk_complete(self):
+        """
+        Mark a chunk as evaluated. Returns True when this was the last
+        chunk pending.
+        """
+        with transaction.atomic():
+            IndexTemplateRebuild.objects.filter(pk=self.pk).update(
+                chunk_completed_count=F('chunk_completed_count') + 1
+            )
+            self.refresh_from_db()
+
+        return self.chunk_completed_count == self.chunk_count
+
+    def _evaluate_changed_documents(self):
+        document_id_list = list(
+            self.changed_documents.values_list('document_id', flat=True)
+        )
+
+        if document_id_list:
+            entries = self._evaluate_documents(
+                queryset=self.index_template.get_rebuild_document_queryset().filter(
+                    pk__in=document_id_list
+                )
+            )
+
+            self.entries.filter(document_id__in=document_id_list).delete()
+            IndexTemplateRebuildEntry.objects.bulk_create(
+                batch_size=INDEX_TEMPLATE_REBUILD_BULK_BATCH_SIZE,
+                objs=entries
+            )
+
+    def _evaluate_documents(self, queryset):
+        """
+        Evaluate the enabled index template nodes for the documents of the
+        queryset and return the results as entries. The expressions are
+        compiled only once for all the documents.
+        """
+        index_template_node_children = defaultdict(list)
+
+        for index_template_node in self.index_template.index_template_nodes.filter(enabled=True).order_by('lft'):
+            index_template_node_children[index_template_node.parent_id].append(
+                (
+                    index_template_node, Template(
+                        template_string=index_template_node.expression
+                    )
+                )
+            )
+
+        index_template_root_node = self.index_template.index_template_root_node
+
+        entries = []
+
+        for document in queryset.iterator():
+            entries.extend(
+                self._chunk_evaluate_document(
+                    document=document,
+                    index_template_node_children=index_template_node_children,
+                    index_template_node_id=index_template_root_node.pk
+                )
+            )
+
+        return entries
+
+    def chunk_evaluate(self, document_id_first, document_id_last):
+        """
+        Evaluate the enabled index template nodes for the documents in the
+        ID range and store the results as entries.
+        """
+        entries = self._evaluate_documents(
+            queryset=self.index_template.get_rebuild_document_queryset().filter(
+                pk__gte=document_id_first, pk__lte=document_id_last
+            )
+        )
+
+        with transaction.atomic():
+            # Lock the rebuild to avoid adding entries to a rebuild that
+            # was discarded by a newer one.
+            if IndexTemplateRebuild.objects.select_for_update().filter(pk=self.pk).exists():
+                self.entries.filter(
+                    document_id__gte=document_id_first,
+                    document_id__lte=document_id_last
+                ).delete()
+                IndexTemplateRebuildEntry.objects.bulk_create(
+                    batch_size=INDEX_TEMPLATE_REBUILD_BULK_BATCH_SIZE,
+                    objs=entries
+                )
+
+    def _chunk_evaluate_document(
+        self, document, index_template_node_children, index_template_node_id
+    ):
+        for index_template_node, template in index_template_node_children[index_template_node_id]:
+            result = index_template_node.evaluate(
+                document=document, template=template
+            )
+
+            if result:
+                yield IndexTemplateRebuildEntry(
+                    document=document, index_template_node=index_template_node,
+                    index_template_rebuild=self, value=result
+                )
+
+                yield from self._chunk_evaluate_document(
+                    document=document,
+                    index_template_node_children=index_template_node_children,
+                    index_template_node_id=index_template_node.pk
+                )
+
+    def commit(self):
+        """
+        Replace the instance nodes of the index with the tree built from
+        the evaluated entries and finish the rebuild.
+        """
+        index_instance = IndexInstance.objects.get(pk=self.index_template_id)
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=index_instance.get_lock_string()
+        )
+        try:
+            with transaction.atomic():
+                self._commit(index_instance=index_instance)
+                self.delete()
+        finally:
+            lock.release()
+
+        logger.info('Finished rebuild of index: %s', self.index_template)
+
+    def document_changed(self, document):
+        """
+        Record a document indexed after the rebuild started. The document
+        is evaluated again when the rebuild is committed.
+        """
+        IndexTemplateRebuildChangedDocument.objects.get_or_create(
+            document=document, index_template_rebuild=self
+        )
+
+    def get_progress_display(self):
+        if self.chunk_count:
+            return '{:0.1f}%'.format(
+                self.chunk_completed_count / self.chunk_count * 100
+            )
+        else:
+            return '100.0%'
+
+    get_progress_display.short_description = _('Progress')
+
+
+class IndexTemplateRebuildEntry(models.Model):
+    """
+    Result of the evaluation of an index template node for a document
+    during a rebuild.
+    """
+    index_template_rebuild = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='entries',
+        to=IndexTemplateRebuild, verbose_name=_('Index template rebuild')
+    )
+    document = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=Document,
+        verbose_name=_('Document')
+    )
+    index_template_node = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=IndexTemplateNode,
+        verbose_name=_('Index template node')
+    )
+    value = models.CharField(max_length=128, verbose_name=_('Value'))
+
+    class Meta:
+        verbose_name = _('Index template rebuild entry')
+        verbose_name_plural = _('Index template rebuild entries')
+
+
+class IndexTemplateRebuildChangedDocument(models.Model):
+    """
+    Document indexed while a rebuild is in progress.
+    """
+    index_template_rebuild = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='changed_documents',
+        to=IndexTemplateRebuild, verbose_name=_('Index template rebuild')
+    )
+    document = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=Document,
+        verbose_name=_('Document')
+    )
+
+    class Meta:
+        unique_together = ('index_template_rebuild', 'document')
+        verbose_name = _('Index template rebuild changed document')
+        verbose_name_plural = _(
+            'Index template rebuild changed documents'
+        )
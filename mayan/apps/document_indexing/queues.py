@@ -24,3 +24,11 @@ queue_tools.add_task_type(
     label=_('Rebuild index'),
     dotted_path='mayan.apps.document_indexing.tasks.task_index_template_rebuild'
 )
+queue_tools.add_task_type(
+    label=_('Evaluate a chunk of documents of an index rebuild'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_index_template_rebuild_chunk'
+)
+queue_tools.add_task_type(
+    label=_('Finish an index rebuild'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_index_template_rebuild_commit'
+)
@@ -100,9 +100,96 @@ def task_index_template_rebuild(self, index_id):
         app_label='document_indexing', model_name='IndexTemplate'
     )
 
+    index = IndexTemplate.objects.get(pk=index_id)
+    index_template_rebuild, chunk_ranges = index.rebuild_start()
+
+    if index_template_rebuild:
+        logger.info(
+            'Starting rebuild of index: %s; chunks: %d', index,
+            index_template_rebuild.chunk_count
+        )
+
+        for document_id_first, document_id_last in chunk_ranges:
+            task_index_template_rebuild_chunk.apply_async(
+                kwargs={
+                    'document_id_first': document_id_first,
+                    'document_id_last': document_id_last,
+                    'index_template_rebuild_id': index_template_rebuild.pk
+                }
+            )
+
+        if not chunk_ranges:
+            task_index_template_rebuild_commit.apply_async(
+                kwargs={
+                    'index_template_rebuild_id': index_template_rebuild.pk
+                }
+            )
+
+
+@app.task(
+    bind=True, ignore_result=True, max_retries=None, retry_backoff=True,
+    retry_backoff_max=60
+)
+def task_index_template_rebuild_chunk(
+    self, index_template_rebuild_id, document_id_first, document_id_last
+):
+    IndexTemplateRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexTemplateRebuild'
+    )
+
     try:
-        index = IndexTemplate.objects.get(pk=index_id)
-        index.rebuild()
-    except LockError as exception:
-        # This index is being rebuilt by another task, retry later
+        index_template_rebuild = IndexTemplateRebuild.objects.get(
+            pk=index_template_rebuild_id
+        )
+        index_template_rebuild.chunk_evaluate(
+            document_id_first=document_id_first,
+            document_id_last=document_id_last
+        )
+        is_last_chunk = index_template_rebuild.chunk_complete()
+    except IndexTemplateRebuild.DoesNotExist:
+        """
+        The rebuild was discarded by a newer rebuild, abort.
+        """
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error while trying to evaluate index rebuild '
+            'chunk %d-%d; %s', document_id_first, document_id_last,
+            exception
+        )
+        raise self.retry(exc=exception)
+    else:
+        logger.info(
+            'Rebuild of index: %s; progress: %s',
+            index_template_rebuild,
+            index_template_rebuild.get_progress_display()
+        )
+
+        if is_last_chunk:
+            task_index_template_rebuild_commit.apply_async(
+                kwargs={
+                    'index_template_rebuild_id': index_template_rebuild_id
+                }
+            )
+
+
+@app.task(
+    bind=True, ignore_result=True, max_retries=None, retry_backoff=True,
+    retry_backoff_max=60
+)
+def task_index_template_rebuild_commit(self, index_template_rebuild_id):
+    IndexTemplateRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexTemplateRebuild'
+    )
+
+    try:
+        index_template_rebuild = IndexTemplateRebuild.objects.get(
+            pk=index_template_rebuild_id
+        )
+        index_template_rebuild.commit()
+    except IndexTemplateRebuild.DoesNotExist:
+        """
+        The rebuild was discarded by a newer rebuild, abort.
+        """
+    except (LockError, OperationalError) as exception:
+        # The index is being updated by another task, retry later.
         raise self.retry(exc=exception)
@@ -11,7 +11,8 @@ from mayan.apps.documents.tests.literals import (
 from mayan.apps.metadata.models import MetadataType, DocumentTypeMetadataType
 
 from ..models import (
-    IndexInstance, IndexInstanceNode, IndexTemplate, IndexTemplateNode
+    IndexInstance, IndexInstanceNode, IndexTemplate, IndexTemplateNode,
+    IndexTemplateRebuild, IndexTemplateRebuildEntry
 )
 
 from .literals import (
@@ -295,6 +296,170 @@ class IndexInstanceTestCase(IndexTemplateTestMixin, GenericDocumentTestCase):
         )
 
 
+class IndexTemplateRebuildTestCase(
+    IndexTemplateTestMixin, GenericDocumentTestCase
+):
+    auto_create_test_index_template_node = False
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        level_1 = self._test_index_template.index_template_nodes.create(
+            expression='{{ document.document_type.label }}',
+            link_documents=False, parent=self._test_index_template_root_node
+        )
+        self._test_index_template.index_template_nodes.create(
+            expression='{{ document.label }}', link_documents=True,
+            parent=level_1
+        )
+
+        # Index the documents one by one to get the expected tree.
+        test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+        for test_document in self._test_documents:
+            test_index_instance.document_add(document=test_document)
+
+    def _get_test_index_instance_node_tree(self):
+        result = []
+        index_instance_root_node = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        ).index_instance_root_node
+
+        for index_instance_node in index_instance_root_node.get_descendants(include_self=True):
+            result.append(
+                (
+                    index_instance_node.level,
+                    index_instance_node.get_full_path(),
+                    set(index_instance_node.documents.all())
+                )
+            )
+
+        return sorted(result, key=lambda entry: entry[1])
+
+    def test_rebuild_chunks(self):
+        index_instance_node_tree = self._get_test_index_instance_node_tree()
+        self.assertEqual(len(index_instance_node_tree), 5)
+
+        self._test_index_template.reset()
+
+        index_template_rebuild, chunk_ranges = self._test_index_template.rebuild_start(
+            chunk_size=2
+        )
+
+        self.assertEqual(len(chunk_ranges), 2)
+        self.assertEqual(index_template_rebuild.chunk_count, 2)
+
+        for document_id_first, document_id_last in chunk_ranges:
+            index_template_rebuild.chunk_evaluate(
+                document_id_first=document_id_first,
+                document_id_last=document_id_last
+            )
+            index_template_rebuild.chunk_complete()
+
+        self.assertEqual(
+            index_template_rebuild.get_progress_display(), '100.0%'
+        )
+
+        index_template_rebuild.commit()
+
+        self.assertEqual(
+            self._get_test_index_instance_node_tree(), index_instance_node_tree
+        )
+        self.assertEqual(IndexTemplateRebuild.objects.count(), 0)
+        self.assertEqual(IndexTemplateRebuildEntry.objects.count(), 0)
+
+    def test_rebuild_document_changed(self):
+        index_template_rebuild, chunk_ranges = self._test_index_template.rebuild_start()
+
+        for document_id_first, document_id_last in chunk_ranges:
+            index_template_rebuild.chunk_evaluate(
+                document_id_first=document_id_first,
+                document_id_last=document_id_last
+            )
+            index_template_rebuild.chunk_complete()
+
+        self._test_documents[0].label = TEST_DOCUMENT_LABEL_EDITED
+        self._test_documents[0].save()
+        self._create_test_document_stub()
+
+        test_index_instance = IndexInstance.objects.get(
+            pk=self._test_index_template.pk
+        )
+        test_index_instance.document_add(document=self._test_documents[0])
+        test_index_instance.document_add(document=self._test_documents[-1])
+
+        index_instance_node_tree = self._get_test_index_instance_node_tree()
+
+        index_template_rebuild.commit()
+
+        self.assertEqual(
+            self._get_test_index_instance_node_tree(), index_instance_node_tree
+        )
+
+    def test_rebuild_keeps_tree_until_commit(self):
+        index_instance_node_tree = self._get_test_index_instance_node_tree()
+
+        index_template_rebuild, chunk_ranges = self._test_index_template.rebuild_start()
+
+        for document_id_first, document_id_last in chunk_ranges:
+            index_template_rebuild.chunk_evaluate(
+                document_id_first=document_id_first,
+                document_id_last=document_id_last
+            )
+
+        self.assertEqual(
+            self._get_test_index_instance_node_tree(), index_instance_node_tree
+        )
+
+    def test_rebuild_mptt_fields(self):
+        self._test_index_template.rebuild()
+
+        index_instance_node_values = list(
+            IndexInstanceNode.objects.order_by('pk').values_list(
+                'level', 'lft', 'parent', 'rght', 'tree_id'
+            )
+        )
+
+        IndexInstanceNode.objects.rebuild()
+
+        self.assertEqual(
+            set(
+                IndexInstanceNode.objects.order_by('pk').values_list(
+                    'level', 'lft', 'parent', 'rght', 'tree_id'
+                )
+            ), set(index_instance_node_values)
+        )
+
+    def test_rebuild_no_documents(self):
+        self._test_index_template.document_types.clear()
+
+        self._test_index_template.rebuild()
+
+        self.assertEqual(
+            IndexInstanceNode.objects.filter(
+                index_template_node__index=self._test_index_template
+            ).count(), 1
+        )
+
+    def test_rebuild_start_discards_previous(self):
+        index_template_rebuild, chunk_ranges = self._test_index_template.rebuild_start()
+
+        self._test_index_template.rebuild_start()
+
+        index_template_rebuild.chunk_evaluate(
+            document_id_first=chunk_ranges[0][0],
+            document_id_last=chunk_ranges[0][1]
+        )
+
+        self.assertEqual(IndexTemplateRebuild.objects.count(), 1)
+        self.assertEqual(IndexTemplateRebuildEntry.objects.count(), 0)
+
+
 class IndexIntegrityTestCase(
     IndexTemplateTestMixin, GenericTransactionDocumentTestCase
 ):
@@ -11,6 +11,7 @@ from .events import (
     event_parsing_document_file_finished
 )
 from .parsers import Parser
+from .signals import signal_post_document_file_parsing_finished
 
 logger = logging.getLogger(name=__name__)
 
@@ -43,6 +44,10 @@ class DocumentFilePageContentManager(models.Manager):
                 action_object=document_file.document, actor=user,
                 target=document_file
             )
+
+            signal_post_document_file_parsing_finished.send(
+                sender=document_file._meta.model, instance=document_file
+            )
         except Exception as exception:
             logger.error(
                 'Parsing error for document file: %d; %s',
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+signal_post_document_file_parsing_finished = Signal(
+    providing_args=('instance',), use_caching=True
+)
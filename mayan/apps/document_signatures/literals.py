@@ -8,3 +8,4 @@ DEFAULT_SIGNATURES_STORAGE_BACKEND_ARGUMENTS = {
 }
 RETRY_DELAY = 10
 STORAGE_NAME_DOCUMENT_SIGNATURES_DETACHED_SIGNATURE = 'document_signatures__detachedsignature'
+VERIFY_DOCUMENT_FILE_BATCH_SIZE = 100
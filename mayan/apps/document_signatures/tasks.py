@@ -4,6 +4,8 @@ from django.apps import apps
 
 from mayan.celery import app
 
+from .literals import VERIFY_DOCUMENT_FILE_BATCH_SIZE
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -53,12 +55,26 @@ def task_verify_missing_embedded_signature(self):
         app_label='document_signatures', model_name='EmbeddedSignature'
     )
 
-    for document_file in EmbeddedSignature.objects.unsigned_document_files():
-        task_verify_document_file.apply_async(
+    # Verify the files in batches to reuse the keyring of the worker
+    # for many files. Page using the primary key since verified files
+    # leave the queryset while the batches are processed.
+    queryset = EmbeddedSignature.objects.unsigned_document_files().order_by(
+        'pk'
+    ).values_list('pk', flat=True)
+
+    document_file_id_list = list(queryset[:VERIFY_DOCUMENT_FILE_BATCH_SIZE])
+
+    while document_file_id_list:
+        task_verify_document_file_batch.apply_async(
             kwargs={
-                'document_file_pk': document_file.pk
+                'document_file_id_list': document_file_id_list
             }
         )
+        document_file_id_list = list(
+            queryset.filter(
+                pk__gt=document_file_id_list[-1]
+            )[:VERIFY_DOCUMENT_FILE_BATCH_SIZE]
+        )
 
 
 @app.task(bind=True, ignore_result=True)
@@ -82,6 +98,27 @@ def task_verify_document_file(self, document_file_pk):
         raise IOError(error_message)
 
 
+@app.task(bind=True, ignore_result=True)
+def task_verify_document_file_batch(self, document_file_id_list):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    EmbeddedSignature = apps.get_model(
+        app_label='document_signatures', model_name='EmbeddedSignature'
+    )
+
+    for document_file in DocumentFile.objects.filter(pk__in=document_file_id_list):
+        try:
+            EmbeddedSignature.objects.create(document_file=document_file)
+        except IOError as exception:
+            # Don't abort the rest of the batch.
+            logger.error(
+                'File missing for document file ID %s; %s',
+                document_file.pk, exception
+            )
+
+
 @app.task(ignore_result=True)
 def task_refresh_signature_information():
     DetachedSignature = apps.get_model(
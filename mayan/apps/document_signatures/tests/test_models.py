@@ -1,4 +1,5 @@
 import hashlib
+from unittest import mock
 
 from mayan.apps.django_gpg.events import event_key_created
 from mayan.apps.django_gpg.tests.literals import (
@@ -347,6 +348,32 @@ class EmbeddedSignaturesTestCase(
             TEST_UNSIGNED_DOCUMENT_COUNT
         )
 
+    def test_task_verify_missing_embedded_signature_multiple_batches(self):
+        # Silence converter logging
+        self._silence_logger(name='mayan.apps.converter.backends')
+
+        old_hooks = DocumentFile._post_save_hooks
+
+        DocumentFile._post_save_hooks = {}
+
+        TEST_SIGNED_DOCUMENT_COUNT = 3
+
+        self._test_document_path = TEST_SIGNED_DOCUMENT_PATH
+        for count in range(TEST_SIGNED_DOCUMENT_COUNT):
+            self._upload_test_document()
+
+        DocumentFile._post_save_hooks = old_hooks
+
+        with mock.patch(
+            'mayan.apps.document_signatures.tasks.VERIFY_DOCUMENT_FILE_BATCH_SIZE',
+            2
+        ):
+            task_verify_missing_embedded_signature.apply_async()
+
+        self.assertEqual(
+            EmbeddedSignature.objects.unsigned_document_files().count(), 0
+        )
+
     def test_embedded_signing(self):
         self._create_test_key_private()
 
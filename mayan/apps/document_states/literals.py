@@ -52,3 +52,7 @@ WORKFLOW_ACTION_WHEN_CHOICES = (
     (WORKFLOW_ACTION_ON_ENTRY, _('On entry')),
     (WORKFLOW_ACTION_ON_EXIT, _('On exit')),
 )
+
+# Number of documents for which a workflow is launched by each bulk
+# launch task.
+WORKFLOW_LAUNCH_BATCH_SIZE = 1000
@@ -6,7 +6,8 @@ from graphviz import Digraph
 
 from django.apps import apps
 from django.core import serializers
-from django.db import IntegrityError, models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Exists, OuterRef
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
@@ -16,11 +17,14 @@ from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.common.validators import validate_internal_name
 from mayan.apps.documents.models import Document, DocumentType
 from mayan.apps.documents.permissions import permission_document_view
-from mayan.apps.events.classes import EventManagerSave
+from mayan.apps.events.classes import (
+    EventManagerSave, EventNotificationCoalescer
+)
 from mayan.apps.events.decorators import method_event
 from mayan.apps.file_caching.models import CachePartitionFile
 from ..events import (
-    event_workflow_template_created, event_workflow_template_edited
+    event_workflow_instance_created, event_workflow_template_created,
+    event_workflow_template_edited
 )
 from ..literals import (
     STORAGE_NAME_WORKFLOW_CACHE, SYMBOL_MATH_CONDITIONAL,
@@ -146,6 +150,75 @@ class Workflow(ExtraDataModelMixin, models.Model):
 
         return final_url.tostr()
 
+    def _execute_initial_state_actions(self, action_list, workflow_instance):
+        for action in action_list:
+            context = workflow_instance.get_context()
+            context.update(
+                {
+                    'action': action
+                }
+            )
+            action.execute(
+                context=context, workflow_instance=workflow_instance
+            )
+
+    def _launch_for_document_id_list_individually(
+        self, action_list, document_id_list, user=None
+    ):
+        WorkflowInstance = apps.get_model(
+            app_label='document_states', model_name='WorkflowInstance'
+        )
+
+        count = 0
+
+        with EventNotificationCoalescer():
+            for document in Document.valid.filter(pk__in=document_id_list):
+                try:
+                    with transaction.atomic():
+                        workflow_instance = WorkflowInstance(
+                            document=document, workflow=self
+                        )
+                        workflow_instance._event_actor = user
+                        workflow_instance.save()
+
+                        self._execute_initial_state_actions(
+                            action_list=action_list,
+                            workflow_instance=workflow_instance
+                        )
+                except IntegrityError:
+                    logger.info(
+                        'Workflow %s already launched for document %s',
+                        self, document
+                    )
+                except Exception as exception:
+                    logger.error(
+                        'Error launching workflow %s for document %s; %s',
+                        self, document, exception, exc_info=True
+                    )
+                else:
+                    count += 1
+
+        return count
+
+    def get_documents_pending_launch(self):
+        """
+        Return the valid documents of the workflow document types that do
+        not have an instance of this workflow.
+        """
+        WorkflowInstance = apps.get_model(
+            app_label='document_states', model_name='WorkflowInstance'
+        )
+
+        return Document.valid.filter(
+            document_type__in=self.document_types.all()
+        ).filter(
+            ~Exists(
+                queryset=WorkflowInstance.objects.filter(
+                    document=OuterRef('pk'), workflow=self
+                )
+            )
+        )
+
     def get_document_types_not_in_workflow(self):
         return DocumentType.objects.exclude(pk__in=self.document_types.all())
 
@@ -186,17 +259,11 @@ class Workflow(ExtraDataModelMixin, models.Model):
 
                 initial_state = self.get_initial_state()
                 if initial_state:
-                    for action in initial_state.entry_actions.filter(enabled=True):
-                        context = workflow_instance.get_context()
-                        context.update(
-                            {
-                                'action': action
-                            }
-                        )
-                        action.execute(
-                            context=context,
-                            workflow_instance=workflow_instance
-                        )
+                    self._execute_initial_state_actions(
+                        action_list=initial_state.entry_actions.filter(
+                            enabled=True
+                        ), workflow_instance=workflow_instance
+                    )
             except IntegrityError:
                 logger.info(
                     'Workflow %s already launched for document %s', self, document
@@ -212,6 +279,86 @@ class Workflow(ExtraDataModelMixin, models.Model):
                 'document.'
             )
 
+    def launch_for_document_id_list(self, document_id_list, user=None):
+        """
+        Launch the workflow for several documents, creating the workflow
+        instances with a single bulk insert. The creation events and the
+        initial state actions of each document run in their own savepoint;
+        a document whose initial state actions fail has its workflow
+        instance removed and is launched again by the next batch. Return
+        the number of workflow instances created.
+        """
+        WorkflowInstance = apps.get_model(
+            app_label='document_states', model_name='WorkflowInstance'
+        )
+
+        document_id_list = list(
+            Document.valid.filter(pk__in=document_id_list).values_list(
+                'pk', flat=True
+            )
+        )
+
+        initial_state = self.get_initial_state()
+        if initial_state:
+            action_list = list(
+                initial_state.entry_actions.filter(enabled=True)
+            )
+        else:
+            action_list = ()
+
+        try:
+            with transaction.atomic():
+                WorkflowInstance.objects.bulk_create(
+                    objs=[
+                        WorkflowInstance(
+                            document_id=document_id, workflow=self
+                        ) for document_id in document_id_list
+                    ]
+                )
+        except IntegrityError:
+            # Some of the documents were launched in the meantime. Fall
+            # back to launching the documents one by one.
+            logger.info(
+                'Workflow %s already launched for some documents, '
+                'launching individually', self
+            )
+            return self._launch_for_document_id_list_individually(
+                action_list=action_list, document_id_list=document_id_list,
+                user=user
+            )
+
+        queryset = WorkflowInstance.objects.filter(
+            document_id__in=document_id_list, workflow=self
+        ).select_related('document')
+
+        count = 0
+
+        with EventNotificationCoalescer():
+            for workflow_instance in queryset:
+                try:
+                    with transaction.atomic():
+                        event_workflow_instance_created.commit(
+                            action_object=workflow_instance.document,
+                            actor=user, target=workflow_instance
+                        )
+                        self._execute_initial_state_actions(
+                            action_list=action_list,
+                            workflow_instance=workflow_instance
+                        )
+                except Exception as exception:
+                    logger.error(
+                        'Error launching workflow %s for document %s; %s',
+                        self, workflow_instance.document, exception,
+                        exc_info=True
+                    )
+                    WorkflowInstance.objects.filter(
+                        pk=workflow_instance.pk
+                    ).delete()
+                else:
+                    count += 1
+
+        return count
+
     def render(self):
         diagram = Digraph(
             name='finite_state_machine', graph_attr={
@@ -17,6 +17,10 @@ queue_document_states_medium.add_task_type(
     label=_('Launch a workflow for a document'),
     dotted_path='mayan.apps.document_states.tasks.task_launch_workflow_for'
 )
+queue_document_states_medium.add_task_type(
+    label=_('Launch a workflow for a range of documents'),
+    dotted_path='mayan.apps.document_states.tasks.task_launch_workflow_batch'
+)
 queue_document_states_medium.add_task_type(
     label=_('Launch all workflows for a document'),
     dotted_path='mayan.apps.document_states.tasks.task_launch_all_workflow_for'
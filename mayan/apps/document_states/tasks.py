@@ -5,33 +5,86 @@ from django.contrib.auth import get_user_model
 
 from mayan.celery import app
 
+from .literals import WORKFLOW_LAUNCH_BATCH_SIZE
+
 logger = logging.getLogger(name=__name__)
 
 
 @app.task(ignore_result=True)
 def task_launch_all_workflows(user_id=None):
-    Document = apps.get_model(app_label='documents', model_name='Document')
     Workflow = apps.get_model(
         app_label='document_states', model_name='Workflow'
     )
 
-    User = get_user_model()
-
-    if user_id:
-        user = User.objects.get(pk=user_id)
-    else:
-        user = None
-
     logger.info('Start launching workflows')
-    for document in Document.valid.all():
-        Workflow.objects.launch_for(document=document, user=user)
+    for workflow in Workflow.objects.filter(auto_launch=True):
+        task_launch_workflow.apply_async(
+            kwargs={'user_id': user_id, 'workflow_id': workflow.pk}
+        )
 
     logger.info('Finished launching workflows')
 
 
 @app.task(ignore_result=True)
 def task_launch_workflow(workflow_id, user_id=None):
-    Document = apps.get_model(app_label='documents', model_name='Document')
+    """
+    Split the documents pending the launch of the workflow into ranges of
+    document IDs and queue a bulk launch task for each range. Documents
+    that already have an instance of the workflow are skipped, which
+    allows resuming an interrupted launch by executing it again.
+    """
+    Workflow = apps.get_model(
+        app_label='document_states', model_name='Workflow'
+    )
+
+    workflow = Workflow.objects.get(pk=workflow_id)
+
+    queryset = workflow.get_documents_pending_launch().order_by('pk')
+
+    logger.info('Start launching workflow: %d', workflow_id)
+
+    batch_count = 0
+    document_count = 0
+    document_id_last = 0
+
+    while True:
+        document_id_list = list(
+            queryset.filter(pk__gt=document_id_last).values_list(
+                'pk', flat=True
+            )[:WORKFLOW_LAUNCH_BATCH_SIZE]
+        )
+
+        if not document_id_list:
+            break
+
+        document_id_last = document_id_list[-1]
+
+        task_launch_workflow_batch.apply_async(
+            kwargs={
+                'document_id_end': document_id_last,
+                'document_id_start': document_id_list[0],
+                'user_id': user_id, 'workflow_id': workflow_id
+            }
+        )
+
+        batch_count += 1
+        document_count += len(document_id_list)
+
+        logger.info(
+            'Queued launch batch %d of workflow: %d; %d documents',
+            batch_count, workflow_id, document_count
+        )
+
+    logger.info(
+        'Finished queuing the launch of workflow: %d; %d documents in %d '
+        'batches', workflow_id, document_count, batch_count
+    )
+
+
+@app.task(ignore_result=True)
+def task_launch_workflow_batch(
+    document_id_end, document_id_start, workflow_id, user_id=None
+):
     Workflow = apps.get_model(
         app_label='document_states', model_name='Workflow'
     )
@@ -45,11 +98,24 @@ def task_launch_workflow(workflow_id, user_id=None):
 
     workflow = Workflow.objects.get(pk=workflow_id)
 
-    logger.info('Start launching workflow: %d', workflow_id)
-    for document in Document.valid.filter(document_type__in=workflow.document_types.all()):
-        workflow.launch_for(document=document, user=user)
+    document_id_list = list(
+        workflow.get_documents_pending_launch().filter(
+            pk__gte=document_id_start, pk__lte=document_id_end
+        ).values_list('pk', flat=True)
+    )
 
-    logger.info('Finished launching workflow: %d', workflow_id)
+    if document_id_list:
+        workflow_instance_count = workflow.launch_for_document_id_list(
+            document_id_list=document_id_list, user=user
+        )
+    else:
+        workflow_instance_count = 0
+
+    logger.info(
+        'Launched workflow: %d for documents %d to %d; %d workflow '
+        'instances created', workflow_id, document_id_start,
+        document_id_end, workflow_instance_count
+    )
 
 
 @app.task(ignore_result=True)
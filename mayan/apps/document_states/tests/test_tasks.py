@@ -1,7 +1,11 @@
+from unittest import mock
+
 from mayan.apps.documents.models.document_models import Document
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
-from ..events import event_workflow_instance_transitioned
+from ..events import (
+    event_workflow_instance_created, event_workflow_instance_transitioned
+)
 
 from .mixins.workflow_template_mixins import (
     WorkflowTaskTestCaseMixin, WorkflowTemplateTestMixin
@@ -10,11 +14,15 @@ from .mixins.workflow_template_state_escalation_mixins import (
     WorkflowTemplateStateEscalationTaskTestMixin,
     WorkflowTemplateStateEscalationTestMixin
 )
+from .mixins.workflow_template_state_mixins import (
+    WorkflowTemplateStateActionTestMixin
+)
+from .workflow_actions import TestWorkflowAction
 
 
 class WorkflowTaskTestCase(
-    WorkflowTaskTestCaseMixin, WorkflowTemplateTestMixin,
-    GenericDocumentTestCase
+    WorkflowTaskTestCaseMixin, WorkflowTemplateStateActionTestMixin,
+    WorkflowTemplateTestMixin, GenericDocumentTestCase
 ):
     auto_upload_test_document = False
 
@@ -53,6 +61,71 @@ class WorkflowTaskTestCase(
             self._test_document.workflows.count(), workflow_instance_count + 1
         )
 
+    @mock.patch('mayan.apps.document_states.tasks.WORKFLOW_LAUNCH_BATCH_SIZE', 2)
+    def test_task_launch_workflow_multiple_batches(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+
+        self._test_workflow_template.launch_for(
+            document=self._test_documents[1]
+        )
+
+        self._clear_events()
+
+        self._execute_task_launch_workflow()
+
+        for test_document in self._test_documents:
+            self.assertEqual(test_document.workflows.count(), 1)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 2)
+
+        self.assertEqual(
+            {event.action_object for event in events},
+            {self._test_documents[0], self._test_documents[2]}
+        )
+        self.assertEqual(
+            events[0].verb, event_workflow_instance_created.id
+        )
+
+    def test_task_launch_workflow_action_error(self):
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+        self._create_test_workflow_template_state_action()
+
+        test_document_error = self._test_documents[1]
+
+        def execute(self, context):
+            if context['document'] == test_document_error:
+                raise ValueError
+
+        with mock.patch.object(TestWorkflowAction, 'execute', execute):
+            self._execute_task_launch_workflow()
+
+        self.assertEqual(self._test_documents[0].workflows.count(), 1)
+        self.assertEqual(self._test_documents[1].workflows.count(), 0)
+        self.assertEqual(self._test_documents[2].workflows.count(), 1)
+
+        self._execute_task_launch_workflow()
+
+        self.assertEqual(self._test_documents[1].workflows.count(), 1)
+
+    def test_launch_for_document_id_list_launched_document(self):
+        self._create_test_document_stub()
+        self._test_workflow_template.launch_for(
+            document=self._test_documents[0]
+        )
+
+        count = self._test_workflow_template.launch_for_document_id_list(
+            document_id_list=(
+                self._test_documents[0].pk, self._test_documents[1].pk
+            )
+        )
+
+        self.assertEqual(count, 1)
+        self.assertEqual(self._test_documents[0].workflows.count(), 1)
+        self.assertEqual(self._test_documents[1].workflows.count(), 1)
+
     def test_trashed_document_task_launch_workflow(self):
         workflow_instance_count = self._test_document.workflows.count()
 
@@ -102,14 +102,27 @@ class APIDocumentFileDownloadView(
         'GET': (permission_document_file_download,),
     }
 
+    def get_download_etag(self):
+        return self.get_object().checksum
+
     def get_download_file_object(self):
         instance = self.get_object()
+
+        if self.is_download_continuation(size=instance.size):
+            return instance.open(raw=True)
+
         instance._event_actor = self.request.user
         return instance.get_download_file_object()
 
+    def get_download_file_size(self, file_object):
+        return self.get_object().size
+
     def get_download_filename(self):
         return self.get_object().filename
 
+    def get_download_last_modified(self):
+        return self.get_object().timestamp.timestamp()
+
     def get_serializer(self, *args, **kwargs):
         return None
 
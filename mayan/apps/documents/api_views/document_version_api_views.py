@@ -2,7 +2,10 @@ import logging
 
 from rest_framework import status
 
-from mayan.apps.converter.api_view_mixins import APIImageViewMixin
+from mayan.apps.converter.api_view_mixins import (
+    APIImageBatchViewMixin, APIImageRegionViewMixin, APIImageTileViewMixin,
+    APIImageTilesViewMixin, APIImageViewMixin
+)
 from mayan.apps.rest_api import generics
 
 from ..classes import DocumentVersionModification
@@ -173,6 +176,24 @@ class APIDocumentVersionPageDetailView(
         return self.get_document_version().pages.all()
 
 
+class APIDocumentVersionPageImageBatchView(
+    APIImageBatchViewMixin, ParentObjectDocumentVersionAPIViewMixin,
+    generics.ListAPIView
+):
+    """
+    get: Returns the images of a list of pages of the selected document version as a ZIP archive, or a manifest of their image URLs.
+    """
+    image_batch_filename = 'document_version_page_images.zip'
+    image_batch_id_list_argument = 'document_version_page_id_list'
+
+    def get_queryset(self):
+        # The access is checked once for the document version instead of
+        # once for each page.
+        return self.get_document_version(
+            permission=permission_document_version_view
+        ).pages.all()
+
+
 class APIDocumentVersionPageImageView(
     APIImageViewMixin, ParentObjectDocumentVersionAPIViewMixin,
     generics.RetrieveAPIView
@@ -189,6 +210,54 @@ class APIDocumentVersionPageImageView(
         return self.get_document_version().pages.all()
 
 
+class APIDocumentVersionPageImageRegionView(
+    APIImageRegionViewMixin, ParentObjectDocumentVersionAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns a region of the image of the selected document version page, scaled by a factor.
+    """
+    lookup_url_kwarg = 'document_version_page_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_version_view,),
+    }
+
+    def get_queryset(self):
+        return self.get_document_version().pages.all()
+
+
+class APIDocumentVersionPageImageTileView(
+    APIImageTileViewMixin, ParentObjectDocumentVersionAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns a tile of the image pyramid of the selected document version page.
+    """
+    lookup_url_kwarg = 'document_version_page_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_version_view,),
+    }
+
+    def get_queryset(self):
+        return self.get_document_version().pages.all()
+
+
+class APIDocumentVersionPageImageTilesView(
+    APIImageTilesViewMixin, ParentObjectDocumentVersionAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns the description of the image tile pyramid of the selected document version page.
+    """
+    lookup_url_kwarg = 'document_version_page_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_version_view,),
+    }
+
+    def get_queryset(self):
+        return self.get_document_version().pages.all()
+
+
 class APIDocumentVersionPageListView(
     ParentObjectDocumentVersionAPIViewMixin, generics.ListCreateAPIView
 ):
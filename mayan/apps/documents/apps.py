@@ -79,7 +79,9 @@ from .events import (
 from .handlers import (
     handler_create_default_document_type,
     handler_create_document_file_page_image_cache,
-    handler_create_document_version_page_image_cache
+    handler_create_document_version_page_image_cache,
+    handler_document_file_page_image_cache_generate,
+    handler_document_version_page_renditions_generate
 )
 from .html_widgets import ThumbnailWidget
 from .links.document_links import (
@@ -164,6 +166,9 @@ from .literals import (
     IMAGE_ERROR_VERSION_PAGE_TRANSFORMATION_ERROR
 )
 from .menus import menu_documents
+from .signals import (
+    signal_post_document_file_upload, signal_post_document_version_remap
+)
 
 # Documents
 
@@ -315,7 +320,8 @@ class DocumentsApp(MayanAppConfig):
         ).add_fields(
             field_names=(
                 'label', 'trash_time_period', 'trash_time_unit',
-                'delete_time_period', 'delete_time_unit', 'filenames'
+                'delete_time_period', 'delete_time_unit', 'filenames',
+                'rendition_profile'
             )
         )
         ModelCopy(
@@ -1008,6 +1014,16 @@ class DocumentsApp(MayanAppConfig):
             dispatch_uid='documents_handler_create_document_version_page_image_cache',
             receiver=handler_create_document_version_page_image_cache,
         )
+        signal_post_document_file_upload.connect(
+            dispatch_uid='documents_handler_document_file_page_image_cache_generate',
+            receiver=handler_document_file_page_image_cache_generate,
+            sender=DocumentFile
+        )
+        signal_post_document_version_remap.connect(
+            dispatch_uid='documents_handler_document_version_page_renditions_generate',
+            receiver=handler_document_version_page_renditions_generate,
+            sender=DocumentVersion
+        )
         signal_post_initial_setup.connect(
             dispatch_uid='documents_handler_create_default_document_type',
             receiver=handler_create_default_document_type
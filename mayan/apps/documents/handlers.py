@@ -6,9 +6,14 @@ from .literals import (
 )
 from .settings import (
     setting_document_file_page_image_cache_maximum_size,
+    setting_document_file_page_image_cache_pregenerate,
     setting_document_version_page_image_cache_maximum_size
 )
 from .signals import signal_post_initial_document_type
+from .tasks import (
+    task_document_file_page_image_cache_generate,
+    task_document_version_page_renditions_generate
+)
 
 
 def handler_create_default_document_type(sender, **kwargs):
@@ -34,6 +39,15 @@ def handler_create_document_file_page_image_cache(sender, **kwargs):
     )
 
 
+def handler_document_file_page_image_cache_generate(
+    sender, instance, **kwargs
+):
+    if setting_document_file_page_image_cache_pregenerate.value:
+        task_document_file_page_image_cache_generate.apply_async(
+            kwargs={'document_file_id': instance.pk}
+        )
+
+
 def handler_create_document_version_page_image_cache(sender, **kwargs):
     Cache = apps.get_model(app_label='file_caching', model_name='Cache')
     Cache.objects.update_or_create(
@@ -41,3 +55,12 @@ def handler_create_document_version_page_image_cache(sender, **kwargs):
             'maximum_size': setting_document_version_page_image_cache_maximum_size.value,
         }, defined_storage_name=STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE,
     )
+
+
+def handler_document_version_page_renditions_generate(
+    sender, instance, **kwargs
+):
+    if instance.document.document_type.rendition_profile:
+        task_document_version_page_renditions_generate.apply_async(
+            kwargs={'document_version_id': instance.pk}
+        )
@@ -22,11 +22,15 @@ DEFAULT_DOCUMENTS_STORAGE_BACKEND_ARGUMENTS = {
 DEFAULT_DOCUMENTS_DISPLAY_HEIGHT = ''
 DEFAULT_DOCUMENTS_DISPLAY_WIDTH = '3600'
 DEFAULT_DOCUMENTS_FAVORITE_COUNT = 400
+DEFAULT_DOCUMENTS_FILE_CHECKSUM_ALGORITHMS = []
+DEFAULT_DOCUMENTS_FILE_MIME_TYPE_SNIFF_SIZE = 8 * 2 ** 20  # 8 Megabytes
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE = 500 * 2 ** 20  # 500 Megabytes
+DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_PREGENERATE = False
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS = {
     'location': os.path.join(settings.MEDIA_ROOT, 'document_file_storage')
 }
+DEFAULT_DOCUMENTS_FILE_STORAGE_DEDUPLICATION = False
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS = {
     'location': os.path.join(
@@ -74,6 +78,8 @@ DEFAULT_LANGUAGE_CODES = (
 )
 DEFAULT_STUB_EXPIRATION_INTERVAL = 60 * 60 * 24  # 24 hours
 
+DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME = 'base_image'
+
 DOCUMENT_VERSION_EXPORT_MESSAGE_BODY = _(
     'Document version "%(document_version)s" has been '
     'exported and is available for download using the '
@@ -100,9 +106,16 @@ PAGE_RANGE_CHOICES = (
     (PAGE_RANGE_ALL, _('All pages')), (PAGE_RANGE_RANGE, _('Page range'))
 )
 
+PAGE_IMAGE_CACHE_GENERATE_RETRY_DELAY = 10
+
+RENDITIONS_GENERATE_RETRY_DELAY = 10
+
+STORAGE_DELETE_RETRY_DELAY = 10
+
 STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE = 'documents__documentfilepageimagecache'
 STORAGE_NAME_DOCUMENT_FILES = 'documents__documentfiles'
 STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE = 'documents__documentversionpageimagecache'
 
+TRASHED_DOCUMENT_DELETE_RETRY_DELAY = 10
 UPDATE_PAGE_COUNT_RETRY_DELAY = 10
 UPLOAD_NEW_VERSION_RETRY_DELAY = 10
@@ -32,6 +32,19 @@ class DocumentManager(models.Manager):
 
 
 class DocumentFileManager(models.Manager):
+    def filter_by_checksum(self, checksum, algorithm=None):
+        """
+        Return the document files with a checksum. Use the algorithm
+        argument to match the checksum of an additional algorithm instead
+        of the checksum field.
+        """
+        if algorithm in (None, self.model.hash_function().name):
+            return self.filter(checksum=checksum)
+        else:
+            return self.filter(
+                checksums__algorithm=algorithm, checksums__value=checksum
+            )
+
     def get_by_natural_key(self, checksum, document_natural_key):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
@@ -0,0 +1,46 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0080_populate_file_size')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentFileChecksum',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True,
+                        serialize=False, verbose_name='ID'
+                    )
+                ),
+                (
+                    'algorithm', models.CharField(
+                        max_length=32, verbose_name='Algorithm'
+                    )
+                ),
+                (
+                    'value', models.CharField(
+                        db_index=True, max_length=128, verbose_name='Value'
+                    )
+                ),
+                (
+                    'document_file', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='checksums',
+                        to='documents.documentfile',
+                        verbose_name='Document file'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Document file checksum',
+                'verbose_name_plural': 'Document file checksums',
+                'ordering': ('algorithm',),
+                'unique_together': {('document_file', 'algorithm')}
+            }
+        )
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+import mayan.apps.documents.models.document_file_models
+import mayan.apps.storage.classes
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0081_documentfilechecksum')
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='documentfile',
+            name='file',
+            field=models.FileField(
+                db_index=True,
+                storage=mayan.apps.storage.classes.DefinedStorageLazy(
+                    name='documents__documentfiles'
+                ), upload_to=mayan.apps.documents.models.document_file_models.upload_to,
+                verbose_name='File'
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+import mayan.apps.common.validators
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0082_documentfile_file_index')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttype', name='rendition_profile',
+            field=models.TextField(
+                blank=True, help_text='Page image renditions to generate '
+                'in the background when the pages of the documents of this '
+                'type are created, as a YAML dictionary. Each entry is a '
+                'rendition name with a dictionary of the width and '
+                'optional height in pixels. Example: {thumbnail: {width: '
+                '800}, preview: {width: 1600}}. Renditions are pinned in '
+                'the page image cache.', validators=[
+                    mayan.apps.common.validators.YAMLValidator()
+                ], verbose_name='Rendition profile'
+            )
+        )
+    ]
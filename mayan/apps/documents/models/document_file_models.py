@@ -1,4 +1,5 @@
 import hashlib
+from io import BytesIO
 import logging
 import shutil
 
@@ -19,26 +20,36 @@ from mayan.apps.converter.exceptions import (
 from mayan.apps.events.classes import EventManagerMethodAfter
 from mayan.apps.events.decorators import method_event
 from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.mime_types.classes import MIMETypeBackend
-from mayan.apps.storage.classes import DefinedStorageLazy
+from mayan.apps.storage.classes import DefinedStorageLazy, DigestFile
 
 from ..events import (
     event_document_file_created, event_document_file_deleted,
     event_document_file_downloaded, event_document_file_edited
 )
 from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
     STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE, STORAGE_NAME_DOCUMENT_FILES
 )
 from ..managers import DocumentFileManager, ValidDocumentFileManager
-from ..settings import setting_hash_block_size
+from ..settings import (
+    setting_document_file_checksum_algorithms,
+    setting_document_file_mime_type_sniff_size,
+    setting_document_file_storage_deduplication, setting_hash_block_size
+)
 from ..signals import (
     signal_post_document_created, signal_post_document_file_upload
 )
+from ..tasks import task_document_file_storage_delete
 
 from .document_models import Document
 from .mixins import HooksModelMixin
 
-__all__ = ('DocumentFile', 'DocumentFileSearchResult')
+__all__ = (
+    'DocumentFile', 'DocumentFileChecksum', 'DocumentFileSearchResult'
+)
 logger = logging.getLogger(name=__name__)
 
 
@@ -70,6 +81,7 @@ class DocumentFile(
     _pre_open_hooks = []
     _pre_save_hooks = []
     _post_save_hooks = []
+    _upload_file_object = None
 
     document = models.ForeignKey(
         on_delete=models.CASCADE, related_name='files', to=Document,
@@ -87,6 +99,7 @@ class DocumentFile(
     )
     # File related fields.
     file = models.FileField(
+        db_index=True,
         storage=DefinedStorageLazy(name=STORAGE_NAME_DOCUMENT_FILES),
         upload_to=upload_to, verbose_name=_('File')
     )
@@ -128,6 +141,20 @@ class DocumentFile(
     objects = DocumentFileManager()
     valid = ValidDocumentFileManager()
 
+    @staticmethod
+    def get_checksum_algorithms():
+        """
+        Return the name of the algorithm of the checksum field followed by
+        the additional algorithms.
+        """
+        result = [DocumentFile.hash_function().name]
+
+        for algorithm in setting_document_file_checksum_algorithms.value:
+            if algorithm not in result:
+                result.append(algorithm)
+
+        return result
+
     @staticmethod
     def hash_function():
         return hashlib.sha256()
@@ -183,34 +210,134 @@ class DocumentFile(
         )
         return partition
 
+    def _execute_pre_open_hooks(self, file_object):
+        result = DocumentFile._execute_hooks(
+            hook_list=DocumentFile._pre_open_hooks,
+            instance=self, file_object=file_object
+        )
+
+        if result:
+            return result['file_object']
+        else:
+            return file_object
+
+    @staticmethod
+    def get_storage_lock_name(name):
+        return 'document_file-storage-{}'.format(name)
+
+    @staticmethod
+    def storage_file_delete(name):
+        """
+        Delete a stored file unless document files reference it. The
+        reference count and the deletion happen under the same lock used
+        to take new references.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=DocumentFile.get_storage_lock_name(name=name)
+        )
+        try:
+            if not DocumentFile.objects.filter(file=name).exists():
+                DocumentFile._meta.get_field(
+                    field_name='file'
+                ).storage.delete(name=name)
+        finally:
+            lock.release()
+
+    def _file_deduplicate(self):
+        """
+        Reference an existing stored file with the same content instead of
+        the copy just stored. Returns the lock of the referenced stored
+        file, which must be held until the reference is committed to keep
+        the stored file from being deleted in the meantime.
+        """
+        queryset = DocumentFile.objects.filter(
+            checksum=self.checksum, size=self.size
+        ).exclude(file=self.file.name).order_by()
+
+        for name in queryset.values_list('file', flat=True).distinct():
+            try:
+                lock = LockingBackend.get_backend().acquire_lock(
+                    name=DocumentFile.get_storage_lock_name(name=name)
+                )
+            except LockError:
+                # The stored file is being deleted or referenced.
+                continue
+            else:
+                # The stored file could have been deleted before the lock
+                # was acquired.
+                if self.file.storage.exists(name=name):
+                    self.file.close()
+                    self.file.name = name
+
+                    logger.debug(
+                        'Document file "%s" references stored file "%s".',
+                        self, name
+                    )
+                    return lock
+                else:
+                    lock.release()
+
+    def _file_delete(self):
+        """
+        Delete the stored file. When deduplication is enabled, the deletion
+        is queued once the deletion of this document file is committed and
+        the task deletes the stored file only if no other document files
+        reference it.
+        """
+        name = self.file.name
+        self.file.close()
+
+        if setting_document_file_storage_deduplication.value:
+            transaction.on_commit(
+                func=lambda: task_document_file_storage_delete.apply_async(
+                    kwargs={'name': name}
+                )
+            )
+        else:
+            self.file.storage.delete(name=name)
+
     def checksum_update(self, save=True):
         """
         Open a document file's file and update the checksum field using
-        the user provided checksum function.
+        the user provided checksum function. The checksums of the
+        additional algorithms are updated too. Reuses the values
+        calculated while a new file was being stored if available.
         """
-        block_size = setting_hash_block_size.value
-        if block_size == 0:
-            # If the setting value is 0 that means disable read limit. To disable
-            # the read limit passing None won't work, we pass -1 instead as per
-            # the Python documentation.
-            # https://docs.python.org/2/tutorial/inputoutput.html#methods-of-file-objects
-            block_size = -1
+        if self._upload_file_object is not None:
+            digests = self._upload_file_object.get_digests()
+        elif self.exists():
+            block_size = setting_hash_block_size.value
+            if block_size == 0:
+                # If the setting value is 0 that means disable read limit. To disable
+                # the read limit passing None won't work, we pass -1 instead as per
+                # the Python documentation.
+                # https://docs.python.org/2/tutorial/inputoutput.html#methods-of-file-objects
+                block_size = -1
 
-        if self.exists():
-            hash_object = DocumentFile.hash_function()
             with self.open(raw=True) as file_object:
-                while (True):
-                    data = file_object.read(block_size)
-                    if not data:
-                        break
+                digest_file = DigestFile(
+                    algorithms=DocumentFile.get_checksum_algorithms(),
+                    file=file_object
+                )
+                while digest_file.read(block_size):
+                    """Read the entire file."""
 
-                    hash_object.update(data)
+            digests = digest_file.get_digests()
+        else:
+            return
 
-            self.checksum = force_text(s=hash_object.hexdigest())
-            if save:
-                self.save(update_fields=('checksum',))
+        self.checksum = force_text(
+            s=digests.pop(DocumentFile.hash_function().name)
+        )
+        if save:
+            self.save(update_fields=('checksum',))
 
-            return self.checksum
+        for algorithm, value in digests.items():
+            self.checksums.update_or_create(
+                algorithm=algorithm, defaults={'value': value}
+            )
+
+        return self.checksum
 
     @method_event(
         event_manager_class=EventManagerMethodAfter,
@@ -221,9 +348,7 @@ class DocumentFile(
         for page in self.pages.all():
             page.delete()
 
-        name = self.file.name
-        self.file.close()
-        self.file.storage.delete(name=name)
+        self._file_delete()
         self.cache_partition.delete()
 
         result = super().delete(*args, **kwargs)
@@ -283,6 +408,20 @@ class DocumentFile(
 
         return result
 
+    def get_duplicate_files(self, algorithm=None):
+        """
+        Return the other document files with the same checksum, using the
+        checksum field or the checksum of an additional algorithm.
+        """
+        if algorithm is None:
+            checksum = self.checksum
+        else:
+            checksum = self.checksums.get(algorithm=algorithm).value
+
+        return DocumentFile.objects.filter_by_checksum(
+            algorithm=algorithm, checksum=checksum
+        ).exclude(pk=self.pk)
+
     @method_event(
         event_manager_class=EventManagerMethodAfter,
         event=event_document_file_downloaded,
@@ -344,11 +483,23 @@ class DocumentFile(
     def mimetype_update(self, save=True):
         """
         Read a document verions's file and determine the mimetype by using
-        the MIME type backend.
+        the MIME type backend. Uses the start of the file kept while a new
+        file was being stored when the file is not transformed when opened.
         """
         if self.exists():
             try:
-                with self.open() as file_object:
+                file_object_raw = self.open(raw=True)
+                file_object = self._execute_pre_open_hooks(
+                    file_object=file_object_raw
+                )
+
+                if self._upload_file_object is not None and file_object is file_object_raw:
+                    file_object_raw.close()
+                    file_object = BytesIO(
+                        initial_bytes=self._upload_file_object.get_buffer()
+                    )
+
+                with file_object:
                     mimetype_backend = MIMETypeBackend.get_backend_instance()
                     self.mimetype, self.encoding = mimetype_backend.get_mime_type(
                         file_object=file_object
@@ -371,20 +522,12 @@ class DocumentFile(
         """
         name = self.file.name
         self.file.close()
+        file_object = self.file.storage.open(name=name)
+
         if raw:
-            return self.file.storage.open(name=name)
+            return file_object
         else:
-            file_object = self.file.storage.open(name=name)
-
-            result = DocumentFile._execute_hooks(
-                hook_list=DocumentFile._pre_open_hooks,
-                instance=self, file_object=file_object
-            )
-
-            if result:
-                return result['file_object']
-            else:
-                return file_object
+            return self._execute_pre_open_hooks(file_object=file_object)
 
     def page_count_update(self, save=True, user=None):
         try:
@@ -425,6 +568,62 @@ class DocumentFile(
     def pages_first(self):
         return self.pages.first()
 
+    def pages_image_cache_generate(
+        self, page_number_first=None, page_number_last=None
+    ):
+        """
+        Generate the base image cache file of a range of pages, or of all
+        the pages, in a single converter pass. Pages that already have a
+        base image cache file are skipped. Returns the number of page
+        images generated.
+        """
+        queryset = self.file_pages.all()
+
+        if page_number_first is not None:
+            queryset = queryset.filter(page_number__gte=page_number_first)
+
+        if page_number_last is not None:
+            queryset = queryset.filter(page_number__lte=page_number_last)
+
+        pending_pages = {}
+        for document_file_page in queryset:
+            try:
+                document_file_page.cache_partition.get_file(
+                    filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+                )
+            except CachePartitionFile.DoesNotExist:
+                pending_pages[document_file_page.page_number] = document_file_page
+
+        if not pending_pages:
+            return 0
+
+        page_count = 0
+
+        with self.get_intermediate_file() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
+            # Restrict the conversion to the smallest range containing all
+            # the pages without a cache file.
+            for page_number, page_image in converter.get_pages(
+                page_number_first=min(pending_pages) - 1,
+                page_number_last=max(pending_pages) - 1
+            ):
+                document_file_page = pending_pages.get(page_number + 1)
+
+                if document_file_page:
+                    with document_file_page.cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as cache_file_object:
+                        cache_file_object.write(page_image.getvalue())
+
+                    page_count += 1
+
+        logger.debug(
+            'Generated %d page images for document file: %s', page_count,
+            self
+        )
+
+        return page_count
+
     def save(self, *args, **kwargs):
         """
         Overloaded save method that updates the document file's checksum,
@@ -432,6 +631,7 @@ class DocumentFile(
         """
         user = kwargs.pop('_user', self.__dict__.pop('_event_actor', None))
         new_document_file = not self.pk
+        upload_file_object = None
 
         if new_document_file:
             logger.info('Creating new file for document: %s', self.document)
@@ -443,6 +643,16 @@ class DocumentFile(
                 }
             )
 
+            if not self.file._committed:
+                # Calculate the checksums, size and keep the start of the
+                # file for the MIME type while it is being stored.
+                upload_file_object = DigestFile(
+                    algorithms=DocumentFile.get_checksum_algorithms(),
+                    buffer_size=setting_document_file_mime_type_sniff_size.value,
+                    file=self.file.file, name=self.file.name
+                )
+                self.file.file = upload_file_object
+
         try:
             self.execute_pre_save_hooks()
 
@@ -452,6 +662,9 @@ class DocumentFile(
 
             super().save(*args, **kwargs)
 
+            if upload_file_object is not None and upload_file_object.is_complete:
+                self._upload_file_object = upload_file_object
+
             DocumentFile._execute_hooks(
                 hook_list=DocumentFile._post_save_hooks,
                 instance=self
@@ -463,26 +676,48 @@ class DocumentFile(
                     actor=user, target=self, action_object=self.document
                 )
 
-                with transaction.atomic():
-                    self.checksum_update(save=False)
-                    self.mimetype_update(save=False)
-                    self.size_update(save=False)
-                    self._event_actor = user
-                    self.save()
-                    self.page_count_update(save=False)
-
-                    logger.info(
-                        'New document file "%s" created for document: %s',
-                        self, self.document
-                    )
-
-                    self.document.is_stub = False
-                    if not self.document.label:
-                        self.document.label = force_text(s=self.file)
-
-                    self.document._event_ignore = True
-                    self.document.save(update_fields=('is_stub', 'label'))
+                lock = None
+                name_copy = self.file.name
+                try:
+                    with transaction.atomic():
+                        self.checksum_update(save=False)
+                        self.mimetype_update(save=False)
+                        self.size_update(save=False)
+                        self._upload_file_object = None
+
+                        if not self.document.label:
+                            self.document.label = force_text(s=self.file)
+
+                        if setting_document_file_storage_deduplication.value:
+                            lock = self._file_deduplicate()
+
+                        self._event_actor = user
+                        self.save()
+                        self.page_count_update(save=False)
+
+                        logger.info(
+                            'New document file "%s" created for document: %s',
+                            self, self.document
+                        )
+
+                        self.document.is_stub = False
+                        self.document._event_ignore = True
+                        self.document.save(update_fields=('is_stub', 'label'))
+                except Exception:
+                    # Keep referencing the copy just stored, which is the
+                    # file the rolled back row pointed to.
+                    self.file.name = name_copy
+                    raise
+                finally:
+                    if lock:
+                        lock.release()
+
+                if self.file.name != name_copy:
+                    # Delete the copy only after the reference to the
+                    # existing stored file is committed.
+                    self.file.storage.delete(name=name_copy)
         except Exception as exception:
+            self._upload_file_object = None
             logger.error(
                 'Error creating new document file for document "%s"; %s',
                 self.document, exception, exc_info=True
@@ -514,15 +749,20 @@ class DocumentFile(
     def size_update(self, save=True):
         """
         Get a document version's file size from the storage layer and store
-        it into the model.
+        it into the model. Reuses the size measured while a new file was
+        being stored if available.
         """
-        if self.exists():
+        if self._upload_file_object is not None:
+            self.size = self._upload_file_object.read_size
+        elif self.exists():
             name = self.file.name
             self.file.close()
             self.size = self.file.storage.size(name=name)
+        else:
+            return
 
-            if save:
-                self.save(update_fields=('size',))
+        if save:
+            self.save(update_fields=('size',))
 
     @property
     def uuid(self):
@@ -530,6 +770,32 @@ class DocumentFile(
         return '{}-{}'.format(self.document.uuid, self.pk)
 
 
+class DocumentFileChecksum(models.Model):
+    """
+    Checksum of a document file calculated with an additional hash
+    algorithm.
+    """
+    document_file = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='checksums', to=DocumentFile,
+        verbose_name=_('Document file')
+    )
+    algorithm = models.CharField(
+        max_length=32, verbose_name=_('Algorithm')
+    )
+    value = models.CharField(
+        db_index=True, max_length=128, verbose_name=_('Value')
+    )
+
+    class Meta:
+        ordering = ('algorithm',)
+        unique_together = ('document_file', 'algorithm')
+        verbose_name = _('Document file checksum')
+        verbose_name_plural = _('Document file checksums')
+
+    def __str__(self):
+        return '{}: {}'.format(self.algorithm, self.value)
+
+
 class DocumentFileSearchResult(DocumentFile):
     class Meta:
         proxy = True
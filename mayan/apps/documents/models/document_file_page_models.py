@@ -15,7 +15,10 @@ from mayan.apps.converter.transformations import BaseTransformation
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
-from ..literals import IMAGE_ERROR_FILE_PAGE_TRANSFORMATION_ERROR
+from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+    IMAGE_ERROR_FILE_PAGE_TRANSFORMATION_ERROR
+)
 from ..managers import DocumentFilePageManager, ValidDocumentFilePageManager
 
 from .document_file_models import DocumentFile
@@ -208,7 +211,7 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         return result
 
     def get_image(self, transformation_instance_list=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
@@ -1,6 +1,9 @@
 import logging
 
+import yaml
+
 from django.apps import apps
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
 from django.utils.translation import ugettext_lazy as _
@@ -10,6 +13,7 @@ from mayan.apps.common.literals import TIME_DELTA_UNIT_CHOICES
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.common.serialization import yaml_load
 from mayan.apps.common.validators import YAMLValidator
+from mayan.apps.converter.transformations import TransformationResize
 from mayan.apps.events.classes import (
     EventManagerMethodAfter, EventManagerSave
 )
@@ -75,6 +79,16 @@ class DocumentType(ExtraDataModelMixin, models.Model):
             'Filename generator backend arguments'
         )
     )
+    rendition_profile = models.TextField(
+        blank=True, help_text=_(
+            'Page image renditions to generate in the background when the '
+            'pages of the documents of this type are created, as a YAML '
+            'dictionary. Each entry is a rendition name with a dictionary '
+            'of the width and optional height in pixels. Example: '
+            '{thumbnail: {width: 800}, preview: {width: 1600}}. Renditions '
+            'are pinned in the page image cache.'
+        ), validators=[YAMLValidator()], verbose_name=_('Rendition profile')
+    )
 
     objects = DocumentTypeManager()
 
@@ -86,6 +100,17 @@ class DocumentType(ExtraDataModelMixin, models.Model):
     def __str__(self):
         return self.label
 
+    def clean(self):
+        try:
+            self.get_rendition_transformation_lists()
+        except yaml.YAMLError:
+            # Invalid YAML is reported by the field validator.
+            pass
+        except ValueError as exception:
+            raise ValidationError(
+                {'rendition_profile': str(exception)}
+            )
+
     def delete(self, *args, **kwargs):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
@@ -119,6 +144,68 @@ class DocumentType(ExtraDataModelMixin, models.Model):
 
         return queryset.count()
 
+    def get_rendition_transformation_lists(self):
+        """
+        Return a list of transformation lists, one for each rendition of
+        the rendition profile. The arguments are converted to text to
+        match the transformations built from the API image view query
+        string so that both produce the same cache filename. Raises
+        ValueError if the profile is not valid.
+        """
+        result = []
+
+        renditions = yaml_load(stream=self.rendition_profile or '{}') or {}
+
+        if not isinstance(renditions, dict):
+            raise ValueError(
+                _('The rendition profile must be a dictionary.')
+            )
+
+        for name, arguments in sorted(renditions.items(), key=str):
+            if not isinstance(arguments, dict):
+                raise ValueError(
+                    _(
+                        'Rendition "%s" must be a dictionary of a width '
+                        'and an optional height.'
+                    ) % name
+                )
+
+            unknown_keys = set(arguments).difference(('height', 'width'))
+            if unknown_keys:
+                raise ValueError(
+                    _('Rendition "%(name)s" has unknown keys: %(keys)s.') % {
+                        'keys': ', '.join(sorted(map(str, unknown_keys))),
+                        'name': name
+                    }
+                )
+
+            for key in ('height', 'width'):
+                value = arguments.get(key)
+                if value is None and key == 'height':
+                    continue
+
+                is_integer = isinstance(value, int) and not isinstance(
+                    value, bool
+                )
+                if not is_integer or value < 1:
+                    raise ValueError(
+                        _(
+                            'The %(key)s of rendition "%(name)s" must be a '
+                            'positive integer.'
+                        ) % {'key': key, 'name': name}
+                    )
+
+            result.append(
+                (
+                    TransformationResize(
+                        height=str(arguments.get('height') or ''),
+                        width=str(arguments['width'])
+                    ),
+                )
+            )
+
+        return result
+
     def get_upload_filename(self, instance, filename):
         generator_klass = BaseDocumentFilenameGenerator.get(
             name=self.filename_generator_backend
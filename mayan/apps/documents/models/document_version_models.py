@@ -337,6 +337,29 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
             sender=DocumentVersion, instance=self
         )
 
+    def pages_renditions_generate(self):
+        """
+        Generate the page images of the rendition profile of the document
+        type and pin them in the cache, so that the first views of the
+        pages don't wait for the converter. Returns the number of
+        renditions generated.
+        """
+        transformation_lists = self.document.document_type.get_rendition_transformation_lists()
+
+        rendition_count = 0
+
+        for page in self.pages.all():
+            for transformation_instance_list in transformation_lists:
+                cache_filename = page.generate_image(
+                    transformation_instance_list=transformation_instance_list
+                )
+                page.cache_partition.get_file(
+                    filename=cache_filename
+                ).pin()
+                rendition_count += 1
+
+        return rendition_count
+
     def pages_reset(self, document_file=None, _user=None):
         """
         Remove all page mappings and recreate them to be a 1 to 1 match
@@ -3,7 +3,7 @@ from datetime import timedelta
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.task_manager.classes import CeleryQueue
-from mayan.apps.task_manager.workers import worker_b, worker_c
+from mayan.apps.task_manager.workers import worker_b, worker_c, worker_d
 
 from .literals import (
     CHECK_DELETE_PERIOD_INTERVAL, CHECK_TRASH_PERIOD_INTERVAL,
@@ -20,6 +20,10 @@ queue_uploads = CeleryQueue(
 queue_documents = CeleryQueue(
     name='documents', label=_('Documents'), worker=worker_b
 )
+queue_documents_renditions = CeleryQueue(
+    name='documents_renditions', label=_('Documents renditions'),
+    transient=True, worker=worker_d
+)
 
 queue_documents.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_trash_can_empty',
@@ -45,6 +49,10 @@ queue_documents.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_version_export',
     label=_('Export a document version')
 )
+queue_documents.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_storage_delete',
+    label=_('Delete a stored document file')
+)
 
 queue_documents_periodic.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_type_document_trash_periods_check',
@@ -67,10 +75,19 @@ queue_documents_periodic.add_task_type(
     )
 )
 
+queue_documents_renditions.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_version_page_renditions_generate',
+    label=_('Generate the page renditions of a document version')
+)
+
 queue_uploads.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_page_count_update',
     label=_('Update document page count')
 )
+queue_uploads.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_page_image_cache_generate',
+    label=_('Generate the page images of a document file')
+)
 queue_uploads.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_upload',
     label=_('Upload new document file')
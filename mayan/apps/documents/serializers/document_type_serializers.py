@@ -1,3 +1,5 @@
+from rest_framework.exceptions import ValidationError
+
 from mayan.apps.rest_api import serializers
 from mayan.apps.rest_api.relations import MultiKwargHyperlinkedIdentityField
 
@@ -46,8 +48,18 @@ class DocumentTypeSerializer(serializers.HyperlinkedModelSerializer):
             'delete_time_period', 'delete_time_unit',
             'filename_generator_backend',
             'filename_generator_backend_arguments', 'id', 'label',
-            'quick_label_list_url', 'trash_time_period', 'trash_time_unit',
-            'url'
+            'quick_label_list_url', 'rendition_profile', 'trash_time_period',
+            'trash_time_unit', 'url'
         )
         model = DocumentType
         read_only_fields = ('id', 'quick_label_list_url', 'url')
+
+    def validate_rendition_profile(self, value):
+        try:
+            DocumentType(
+                rendition_profile=value
+            ).get_rendition_transformation_lists()
+        except ValueError as exception:
+            raise ValidationError(str(exception))
+
+        return value
@@ -67,6 +67,23 @@ class DocumentVersionPageSerializer(serializers.HyperlinkedModelSerializer):
         ),
         view_name='rest_api:documentversionpage-image'
     )
+    image_tiles_url = MultiKwargHyperlinkedIdentityField(
+        view_kwargs=(
+            {
+                'lookup_field': 'document_version.document.pk',
+                'lookup_url_kwarg': 'document_id',
+            },
+            {
+                'lookup_field': 'document_version_id',
+                'lookup_url_kwarg': 'document_version_id',
+            },
+            {
+                'lookup_field': 'pk',
+                'lookup_url_kwarg': 'document_version_page_id',
+            }
+        ),
+        view_name='rest_api:documentversionpage-image-tiles'
+    )
     url = MultiKwargHyperlinkedIdentityField(
         view_kwargs=(
             {
@@ -88,13 +105,13 @@ class DocumentVersionPageSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         fields = (
             'content_type', 'content_type_id', 'document_version_id',
-            'document_version_url', 'id', 'image_url', 'object_id',
-            'page_number', 'url'
+            'document_version_url', 'id', 'image_tiles_url', 'image_url',
+            'object_id', 'page_number', 'url'
         )
         model = DocumentVersionPage
         read_only_fields = (
             'content_type', 'document_version_id', 'document_version_url',
-            'id', 'image_url', 'url'
+            'id', 'image_tiles_url', 'image_url', 'url'
         )
 
 
@@ -0,0 +1,46 @@
+import hashlib
+
+import yaml
+
+from django.core.exceptions import ValidationError
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.common.serialization import yaml_load
+
+
+def validation_function_check_checksum_algorithms(setting, raw_value):
+    if isinstance(raw_value, str):
+        try:
+            raw_value = yaml_load(stream=raw_value)
+        except yaml.YAMLError:
+            raise ValidationError(
+                message=_('"%s" not a valid entry.') % raw_value
+            )
+
+    if not raw_value:
+        return []
+
+    if not isinstance(raw_value, (list, tuple)):
+        raise ValidationError(
+            message=_('The value must be a list of hash algorithm names.')
+        )
+
+    unknown_algorithms = [
+        algorithm for algorithm in raw_value
+        if algorithm not in hashlib.algorithms_available
+    ]
+
+    if unknown_algorithms:
+        raise ValidationError(
+            message=_(
+                'Unknown hash algorithms: %(algorithms)s. Available '
+                'algorithms are: %(available)s.'
+            ) % {
+                'algorithms': ', '.join(map(str, unknown_algorithms)),
+                'available': ', '.join(
+                    sorted(hashlib.algorithms_available)
+                )
+            }
+        )
+
+    return list(raw_value)
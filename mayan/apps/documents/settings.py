@@ -5,11 +5,15 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 from .literals import (
     DEFAULT_DOCUMENTS_DISPLAY_HEIGHT, DEFAULT_DOCUMENTS_DISPLAY_WIDTH,
     DEFAULT_DOCUMENTS_FAVORITE_COUNT,
+    DEFAULT_DOCUMENTS_FILE_CHECKSUM_ALGORITHMS,
+    DEFAULT_DOCUMENTS_FILE_MIME_TYPE_SNIFF_SIZE,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_PREGENERATE,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS,
+    DEFAULT_DOCUMENTS_FILE_STORAGE_DEDUPLICATION,
     DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE, DEFAULT_DOCUMENTS_LIST_THUMBNAIL_WIDTH,
     DEFAULT_DOCUMENTS_PREVIEW_HEIGHT, DEFAULT_DOCUMENTS_PREVIEW_WIDTH,
     DEFAULT_DOCUMENTS_PRINT_HEIGHT, DEFAULT_DOCUMENTS_PRINT_WIDTH,
@@ -28,6 +32,9 @@ from .setting_callbacks import (
     callback_update_document_version_page_image_cache_size
 )
 from .setting_migrations import DocumentsSettingMigration
+from .setting_validators import (
+    validation_function_check_checksum_algorithms
+)
 
 namespace = SettingNamespace(
     label=_('Documents'), migration_class=DocumentsSettingMigration,
@@ -51,6 +58,33 @@ setting_document_file_page_image_cache_maximum_size = namespace.add_setting(
         'the size in bytes.'
     ), post_edit_function=callback_update_document_file_page_image_cache_size
 )
+setting_document_file_checksum_algorithms = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_CHECKSUM_ALGORITHMS,
+    global_name='DOCUMENTS_FILE_CHECKSUM_ALGORITHMS', help_text=_(
+        'List of additional hash algorithms, like "md5" or "sha1", with '
+        'which to calculate checksums for new document files. These '
+        'are calculated in the same pass that stores the file.'
+    ), validation_function=validation_function_check_checksum_algorithms
+)
+setting_document_file_mime_type_sniff_size = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_MIME_TYPE_SNIFF_SIZE,
+    global_name='DOCUMENTS_FILE_MIME_TYPE_SNIFF_SIZE', help_text=_(
+        'Number of bytes from the start of a new document file to keep '
+        'while it is being stored, to determine its MIME type without '
+        'reading the stored file again. MIME type backends only examine '
+        'the start of files; the value must be larger than the amount '
+        'they read.'
+    )
+)
+setting_document_file_page_image_cache_pregenerate = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_PREGENERATE,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_CACHE_PREGENERATE',
+    help_text=_(
+        'Generate the base images of all the pages of a new document file '
+        'in a single background pass right after it is uploaded, instead '
+        'of generating each page image on demand.'
+    )
+)
 setting_document_file_storage_backend = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     global_name='DOCUMENTS_FILE_STORAGE_BACKEND', help_text=_(
@@ -64,6 +98,16 @@ setting_document_file_storage_backend_arguments = namespace.add_setting(
         'Arguments to pass to the DOCUMENT_FILE_STORAGE_BACKEND.'
     )
 )
+setting_document_file_storage_deduplication = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_STORAGE_DEDUPLICATION,
+    global_name='DOCUMENTS_FILE_STORAGE_DEDUPLICATION', help_text=_(
+        'Store the content of identical document files only once. New '
+        'document files with the same checksum and size as an existing '
+        'one reference the existing stored file and the new copy is '
+        'discarded. Stored files are deleted when no document file '
+        'references them anymore.'
+    )
+)
 setting_document_file_page_image_cache_storage_backend = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND,
     global_name='DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND', help_text=_(
@@ -5,9 +5,12 @@ from django.contrib.auth import get_user_model
 from django.db import OperationalError
 from django.utils.module_loading import import_string
 
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
 from .literals import (
+    PAGE_IMAGE_CACHE_GENERATE_RETRY_DELAY, RENDITIONS_GENERATE_RETRY_DELAY,
+    STORAGE_DELETE_RETRY_DELAY, TRASHED_DOCUMENT_DELETE_RETRY_DELAY,
     UPDATE_PAGE_COUNT_RETRY_DELAY, UPLOAD_NEW_VERSION_RETRY_DELAY
 )
 
@@ -45,6 +48,50 @@ def task_document_file_page_count_update(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True, default_retry_delay=PAGE_IMAGE_CACHE_GENERATE_RETRY_DELAY,
+    ignore_result=True
+)
+def task_document_file_page_image_cache_generate(
+    self, document_file_id, page_number_first=None, page_number_last=None
+):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    document_file = DocumentFile.objects.get(pk=document_file_id)
+    try:
+        document_file.pages_image_cache_generate(
+            page_number_first=page_number_first,
+            page_number_last=page_number_last
+        )
+    except (LockError, OperationalError) as exception:
+        logger.warning(
+            'Error during attempt to generate the page images of '
+            'document file: %s; %s. Retrying.', document_file, exception
+        )
+        raise self.retry(exc=exception)
+
+
+@app.task(
+    bind=True, default_retry_delay=STORAGE_DELETE_RETRY_DELAY,
+    ignore_result=True
+)
+def task_document_file_storage_delete(self, name):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    try:
+        DocumentFile.storage_file_delete(name=name)
+    except LockError as exception:
+        logger.warning(
+            'Unable to delete the stored document file: %s; %s. '
+            'Retrying.', name, exception
+        )
+        raise self.retry(exc=exception)
+
+
 @app.task(
     bind=True, default_retry_delay=UPLOAD_NEW_VERSION_RETRY_DELAY,
     ignore_result=True
@@ -294,6 +341,39 @@ def task_document_version_export(
     )
 
 
+@app.task(
+    bind=True, default_retry_delay=RENDITIONS_GENERATE_RETRY_DELAY,
+    ignore_result=True
+)
+def task_document_version_page_renditions_generate(self, document_version_id):
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    try:
+        document_version = DocumentVersion.objects.get(
+            pk=document_version_id
+        )
+    except DocumentVersion.DoesNotExist:
+        # The document version was deleted before its turn in the
+        # renditions queue.
+        logger.debug(
+            'Document version %s no longer exists, skipping renditions.',
+            document_version_id
+        )
+        return
+
+    try:
+        document_version.pages_renditions_generate()
+    except (LockError, OperationalError) as exception:
+        logger.warning(
+            'Error during attempt to generate the page renditions of '
+            'document version: %s; %s. Retrying.', document_version,
+            exception
+        )
+        raise self.retry(exc=exception)
+
+
 # Trash can
 
 @app.task(ignore_result=True)
@@ -313,8 +393,11 @@ def task_trash_can_empty(user_id=None):
 
 # Trashed document
 
-@app.task(ignore_result=True)
-def task_trashed_document_delete(trashed_document_id, user_id=None):
+@app.task(
+    bind=True, default_retry_delay=TRASHED_DOCUMENT_DELETE_RETRY_DELAY,
+    ignore_result=True
+)
+def task_trashed_document_delete(self, trashed_document_id, user_id=None):
     TrashedDocument = apps.get_model(
         app_label='documents', model_name='TrashedDocument'
     )
@@ -328,5 +411,12 @@ def task_trashed_document_delete(trashed_document_id, user_id=None):
     logger.debug(msg='Executing')
     trashed_document = TrashedDocument.objects.get(pk=trashed_document_id)
     trashed_document._event_actor = user
-    trashed_document.delete()
+    try:
+        trashed_document.delete()
+    except LockError as exception:
+        logger.warning(
+            'Unable to delete the files of trashed document: %s; %s. '
+            'Retrying.', trashed_document, exception
+        )
+        raise self.retry(exc=exception)
     logger.debug(msg='Finished')
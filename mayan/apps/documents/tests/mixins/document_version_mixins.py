@@ -215,6 +215,22 @@ class DocumentVersionPageAPIViewTestMixin:
             }
         )
 
+    def _request_test_document_version_page_image_batch_api_view(
+        self, query=None
+    ):
+        query = query or {}
+        query.setdefault(
+            'document_version_page_id_list',
+            str(self._test_document_version_page.pk)
+        )
+
+        return self.get(
+            viewname='rest_api:documentversionpage-image-batch', kwargs={
+                'document_id': self._test_document.pk,
+                'document_version_id': self._test_document_version.pk
+            }, query=query
+        )
+
     def _request_test_document_version_page_image_api_view(self):
         return self.get(
             viewname='rest_api:documentversionpage-image', kwargs={
@@ -224,6 +240,40 @@ class DocumentVersionPageAPIViewTestMixin:
             }
         )
 
+    def _request_test_document_version_page_image_region_api_view(
+        self, query=None
+    ):
+        return self.get(
+            viewname='rest_api:documentversionpage-image-region', kwargs={
+                'document_id': self._test_document.pk,
+                'document_version_id': self._test_document_version.pk,
+                'document_version_page_id': self._test_document_version_page.pk
+            }, query=query
+        )
+
+    def _request_test_document_version_page_image_tile_api_view(
+        self, column=0, level=0, row=0
+    ):
+        return self.get(
+            viewname='rest_api:documentversionpage-image-tile', kwargs={
+                'column': column,
+                'document_id': self._test_document.pk,
+                'document_version_id': self._test_document_version.pk,
+                'document_version_page_id': self._test_document_version_page.pk,
+                'level': level,
+                'row': row
+            }
+        )
+
+    def _request_test_document_version_page_image_tiles_api_view(self):
+        return self.get(
+            viewname='rest_api:documentversionpage-image-tiles', kwargs={
+                'document_id': self._test_document.pk,
+                'document_version_id': self._test_document_version.pk,
+                'document_version_page_id': self._test_document_version_page.pk
+            }
+        )
+
     def _request_test_document_version_page_list_api_view(self):
         return self.get(
             viewname='rest_api:documentversionpage-list', kwargs={
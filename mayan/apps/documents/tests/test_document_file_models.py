@@ -1,7 +1,18 @@
+import hashlib
 from pathlib import Path
+from unittest import mock
+
+from mayan.apps.storage.classes import DefinedStorage
+
+from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, STORAGE_NAME_DOCUMENT_FILES
+)
+from ..models.document_file_models import DocumentFile
 
 from .base import GenericDocumentTestCase
-from .literals import TEST_DOCUMENT_SMALL_CHECKSUM
+from .literals import (
+    TEST_DOCUMENT_SMALL_CHECKSUM, TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+)
 from .mixins.document_file_mixins import DocumentFileTestMixin
 
 
@@ -49,3 +60,248 @@ class DocumentFileTestCase(DocumentFileTestMixin, GenericDocumentTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self._test_document.file_latest.get_absolute_url())
+
+
+class DocumentFileChecksumTestCase(
+    DocumentFileTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def _get_test_document_file_digest(self, algorithm):
+        self._calculate_test_document_file_path()
+
+        with open(file=self._test_document_path, mode='rb') as file_object:
+            return hashlib.new(algorithm, file_object.read()).hexdigest()
+
+    def test_checksum_algorithms(self):
+        with self.override_setting(global_name='DOCUMENTS_FILE_CHECKSUM_ALGORITHMS', value=['md5', 'sha1']):
+            self._upload_test_document()
+
+        self.assertEqual(
+            self._test_document_file.checksum, TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+        self.assertEqual(
+            dict(
+                self._test_document_file.checksums.values_list(
+                    'algorithm', 'value'
+                )
+            ), {
+                'md5': self._get_test_document_file_digest(algorithm='md5'),
+                'sha1': self._get_test_document_file_digest(algorithm='sha1')
+            }
+        )
+
+    def test_checksum_update(self):
+        with self.override_setting(global_name='DOCUMENTS_FILE_CHECKSUM_ALGORITHMS', value=['md5']):
+            self._upload_test_document()
+
+            DocumentFile.objects.filter(
+                pk=self._test_document_file.pk
+            ).update(checksum='')
+            self._test_document_file.checksums.all().delete()
+
+            self._test_document_file.refresh_from_db()
+            self._test_document_file.checksum_update()
+
+        self._test_document_file.refresh_from_db()
+        self.assertEqual(
+            self._test_document_file.checksum, TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+        self.assertEqual(
+            self._test_document_file.checksums.get(algorithm='md5').value,
+            self._get_test_document_file_digest(algorithm='md5')
+        )
+
+    @mock.patch.object(DocumentFile, 'exists')
+    def test_upload_single_pass(self, mock_document_file_exists):
+        # Storage is only checked by the MIME type update, which needs to
+        # execute the pre open hooks.
+        mock_document_file_exists.return_value = True
+
+        with mock.patch('django.core.files.storage.FileSystemStorage.size') as mock_storage_size:
+            self._upload_test_document()
+
+        self.assertFalse(mock_storage_size.called)
+        self.assertEqual(
+            self._test_document_file.checksum, TEST_DOCUMENT_SMALL_CHECKSUM
+        )
+        self.assertEqual(self._test_document_file.mimetype, 'image/png')
+        self.assertEqual(
+            self._test_document_file.size,
+            Path(self._test_document_path).stat().st_size
+        )
+
+    def test_get_duplicate_files(self):
+        with self.override_setting(global_name='DOCUMENTS_FILE_CHECKSUM_ALGORITHMS', value=['md5']):
+            self._upload_test_document()
+            test_document_file = self._test_document_file
+            self._upload_test_document()
+
+        self.assertEqual(
+            list(self._test_document_file.get_duplicate_files()),
+            [test_document_file]
+        )
+        self.assertEqual(
+            list(
+                self._test_document_file.get_duplicate_files(algorithm='md5')
+            ), [test_document_file]
+        )
+        self.assertEqual(
+            list(
+                DocumentFile.objects.filter_by_checksum(
+                    algorithm='md5', checksum=self._get_test_document_file_digest(
+                        algorithm='md5'
+                    )
+                )
+            ), [test_document_file, self._test_document_file]
+        )
+
+
+class DocumentFileStorageDeduplicationTestCase(
+    DocumentFileTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def _get_test_document_file_storage_file_count(self):
+        storage = DefinedStorage.get(
+            name=STORAGE_NAME_DOCUMENT_FILES
+        ).get_storage_instance()
+        return len(storage.listdir(path='')[1])
+
+    def _get_test_document_file_storage_exists(self, document_file):
+        return document_file.file.storage.exists(
+            name=document_file.file.name
+        )
+
+    def test_deduplication_disabled(self):
+        self._upload_test_document()
+        test_document_file = self._test_document_file
+        self._upload_test_document()
+
+        self.assertNotEqual(
+            test_document_file.file.name, self._test_document_file.file.name
+        )
+
+    def test_deduplication(self):
+        storage_file_count = self._get_test_document_file_storage_file_count()
+
+        with self.override_setting(global_name='DOCUMENTS_FILE_STORAGE_DEDUPLICATION', value=True):
+            self._upload_test_document()
+            test_document_file = self._test_document_file
+            self._upload_test_document()
+
+        self._test_document_file.refresh_from_db()
+        self.assertEqual(
+            test_document_file.file.name, self._test_document_file.file.name
+        )
+        self.assertEqual(
+            self._get_test_document_file_storage_file_count(),
+            storage_file_count + 1
+        )
+
+        with self._test_document_file.open() as file_object:
+            self.assertEqual(
+                hashlib.sha256(file_object.read()).hexdigest(),
+                TEST_DOCUMENT_SMALL_CHECKSUM
+            )
+
+    def test_deduplication_delete(self):
+        with self.override_setting(global_name='DOCUMENTS_FILE_STORAGE_DEDUPLICATION', value=True):
+            self._upload_test_document()
+            test_document_file = self._test_document_file
+            self._upload_test_document()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                test_document_file.delete()
+
+            self.assertTrue(
+                self._get_test_document_file_storage_exists(
+                    document_file=self._test_document_file
+                )
+            )
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self._test_document_file.delete()
+
+        self.assertFalse(
+            self._get_test_document_file_storage_exists(
+                document_file=self._test_document_file
+            )
+        )
+
+    def test_deduplication_disabled_storage_delete(self):
+        self._upload_test_document()
+
+        self._test_document_file.delete()
+
+        self.assertFalse(
+            self._get_test_document_file_storage_exists(
+                document_file=self._test_document_file
+            )
+        )
+
+    def test_deduplication_storage_delete_after_commit(self):
+        with self.override_setting(global_name='DOCUMENTS_FILE_STORAGE_DEDUPLICATION', value=True):
+            self._upload_test_document()
+
+            with self.captureOnCommitCallbacks() as callbacks:
+                self._test_document_file.delete()
+
+            self.assertTrue(
+                self._get_test_document_file_storage_exists(
+                    document_file=self._test_document_file
+                )
+            )
+
+            for callback in callbacks:
+                callback()
+
+        self.assertFalse(
+            self._get_test_document_file_storage_exists(
+                document_file=self._test_document_file
+            )
+        )
+
+
+class DocumentFilePageImageCacheTestCase(GenericDocumentTestCase):
+    _test_document_filename = TEST_FILE_MULTI_PAGE_TIFF_FILENAME
+
+    def _get_test_document_file_page_cache_file_count(self):
+        return sum(
+            document_file_page.cache_partition.files.filter(
+                filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+            ).count() for document_file_page in self._test_document_file.pages.all()
+        )
+
+    def test_pages_image_cache_generate(self):
+        page_count = self._test_document_file.pages.count()
+
+        self.assertEqual(
+            self._test_document_file.pages_image_cache_generate(), page_count
+        )
+        self.assertEqual(
+            self._get_test_document_file_page_cache_file_count(), page_count
+        )
+
+    def test_pages_image_cache_generate_range(self):
+        self.assertEqual(
+            self._test_document_file.pages_image_cache_generate(
+                page_number_first=2, page_number_last=2
+            ), 1
+        )
+        self.assertEqual(
+            self._get_test_document_file_page_cache_file_count(), 1
+        )
+
+    def test_pages_image_cache_generate_existing(self):
+        self._test_document_file.pages.first().get_image()
+
+        page_count = self._test_document_file.pages.count()
+
+        self.assertEqual(
+            self._test_document_file.pages_image_cache_generate(),
+            page_count - 1
+        )
+        self.assertEqual(
+            self._get_test_document_file_page_cache_file_count(), page_count
+        )
@@ -436,6 +436,106 @@ class DocumentFileDownloadViewTestCase(
         self.assertEqual(events[0].target, self._test_document_file)
         self.assertEqual(events[0].verb, event_document_file_downloaded.id)
 
+    def test_document_file_download_view_conditional_with_permission(self):
+        self.grant_access(
+            obj=self._test_document,
+            permission=permission_document_file_download
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_download_view(
+            headers={
+                'HTTP_IF_NONE_MATCH': '"{}"'.format(
+                    self._test_document.file_latest.checksum
+                )
+            }
+        )
+        self.assertEqual(response.status_code, 304)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_download_view_range_with_permission(self):
+        # Set the expected_content_types for
+        # common.tests.mixins.ContentTypeCheckMixin
+        self.expected_content_types = (
+            self._test_document.file_latest.mimetype,
+        )
+
+        self.grant_access(
+            obj=self._test_document,
+            permission=permission_document_file_download
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_download_view(
+            headers={'HTTP_RANGE': 'bytes=10-19'}
+        )
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(
+            response['Content-Range'], 'bytes 10-19/{}'.format(
+                self._test_document.file_latest.size
+            )
+        )
+
+        with self._test_document.file_latest.open() as file_object:
+            self.assertEqual(
+                b''.join(response.streaming_content),
+                file_object.read()[10:20]
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_download_view_range_initial_with_permission(self):
+        # Set the expected_content_types for
+        # common.tests.mixins.ContentTypeCheckMixin
+        self.expected_content_types = (
+            self._test_document.file_latest.mimetype,
+        )
+
+        self.grant_access(
+            obj=self._test_document,
+            permission=permission_document_file_download
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_download_view(
+            headers={'HTTP_RANGE': 'bytes=0-'}
+        )
+        self.assertEqual(response.status_code, 206)
+
+        with self._test_document.file_latest.open() as file_object:
+            self.assertEqual(
+                b''.join(response.streaming_content), file_object.read()
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 1)
+
+        self.assertEqual(events[0].action_object, self._test_document)
+        self.assertEqual(events[0].actor, self._test_case_user)
+        self.assertEqual(events[0].target, self._test_document.file_latest)
+        self.assertEqual(events[0].verb, event_document_file_downloaded.id)
+
+    def test_document_file_download_view_range_not_satisfiable_with_permission(self):
+        self.grant_access(
+            obj=self._test_document,
+            permission=permission_document_file_download
+        )
+
+        response = self._request_test_document_file_download_view(
+            headers={
+                'HTTP_RANGE': 'bytes={}-'.format(
+                    self._test_document.file_latest.size
+                )
+            }
+        )
+        self.assertEqual(response.status_code, 416)
+
     def test_trashed_document_file_download_view_with_permission(self):
         self.grant_access(
             obj=self._test_document,
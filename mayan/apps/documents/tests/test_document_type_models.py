@@ -1,3 +1,5 @@
+from django.core.exceptions import ValidationError
+
 from ..classes import OriginalDocumentFilenameGenerator, UUIDDocumentFilenameGenerator, UUIDPlusOriginalFilename
 from ..models import TrashedDocument, Document, DocumentType
 
@@ -93,3 +95,18 @@ class DocumentTypeModelTestCase(GenericDocumentTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self._test_document_type.get_absolute_url())
+
+    def test_rendition_profile_clean(self):
+        self._test_document_type.rendition_profile = '{thumbnail: {width: 800}}'
+        self._test_document_type.clean()
+
+    def test_rendition_profile_clean_invalid(self):
+        for rendition_profile in (
+            '{thumbnail: 800}', '{thumbnail: {height: 600}}',
+            '{thumbnail: {width: -1}}', '{thumbnail: {width: 800, x: 1}}',
+            '[800]'
+        ):
+            self._test_document_type.rendition_profile = rendition_profile
+
+            with self.assertRaises(expected_exception=ValidationError):
+                self._test_document_type.clean()
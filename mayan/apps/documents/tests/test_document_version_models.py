@@ -88,6 +88,23 @@ class DocumentVersionTestCase(
             test_document_version_expected_page_content_objects
         )
 
+    def test_version_page_renditions_generate(self):
+        self._test_document_type.rendition_profile = (
+            '{preview: {width: 200}, thumbnail: {width: 100}}'
+        )
+        self._test_document_type.save()
+
+        self._upload_test_document_file(
+            action=DocumentFileActionUseNewPages.backend_id
+        )
+
+        for document_version_page in self._test_document_version.pages.all():
+            self.assertEqual(
+                document_version_page.cache_partition.files.filter(
+                    pinned=True
+                ).count(), 2
+            )
+
     def test_method_get_absolute_url(self):
         self.assertTrue(self._test_document.version_active.get_absolute_url())
 
@@ -1,5 +1,10 @@
+from io import BytesIO
+from zipfile import ZipFile
+
+from PIL import Image
 from rest_framework import status
 
+from mayan.apps.converter.classes import ImageTilePyramid
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
 
 from ..events import (
@@ -362,6 +367,159 @@ class DocumentVersionPageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_version_page_image_batch_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_batch_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_batch_api_view_with_access(self):
+        self.grant_access(
+            obj=self._test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_batch_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with ZipFile(file=BytesIO(b''.join(response.streaming_content))) as archive:
+            self.assertEqual(len(archive.namelist()), 1)
+            self.assertTrue(
+                archive.namelist()[0].startswith(
+                    str(self._test_document_version_page.pk)
+                )
+            )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_batch_api_view_manifest_with_access(self):
+        self.grant_access(
+            obj=self._test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_batch_api_view(
+            query={'manifest': ''}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(
+            response.data[0]['id'], self._test_document_version_page.pk
+        )
+        self.assertTrue('_hash' in response.data[0]['image_url'])
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_region_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_region_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_region_api_view_with_access(self):
+        self.grant_access(
+            obj=self._test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_region_api_view(
+            query={'height': 100, 'scale': 0.5, 'width': 200}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        image = Image.open(fp=BytesIO(initial_bytes=response.content))
+        self.assertEqual(image.size, (100, 50))
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tile_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tile_api_view_with_access(self):
+        self.grant_access(
+            obj=self._test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        image = Image.open(
+            fp=BytesIO(initial_bytes=b''.join(response.streaming_content))
+        )
+        self.assertEqual(image.size, (1, 1))
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tile_api_view_invalid_tile(self):
+        self.grant_access(
+            obj=self._test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_api_view(
+            column=1
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tiles_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tiles_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tiles_api_view_with_access(self):
+        self.grant_access(
+            obj=self._test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tiles_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(
+            response.data['levels'], ImageTilePyramid.get_level_count(
+                height=response.data['height'], width=response.data['width']
+            )
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_version_page_list_api_view_no_permission(self):
         self._clear_events()
 
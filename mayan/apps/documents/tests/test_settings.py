@@ -1,3 +1,5 @@
+from django.core.exceptions import ValidationError
+
 from mayan.apps.documents import storages
 from mayan.apps.smart_settings.tests.mixins import SmartSettingTestMixin
 from mayan.apps.storage.tests.mixins import StorageSettingTestMixin
@@ -8,6 +10,7 @@ from ..literals import (
     STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE
 )
 from ..settings import (
+    setting_document_file_checksum_algorithms,
     setting_document_file_page_image_cache_storage_backend_arguments,
     setting_document_file_page_image_cache_maximum_size,
     setting_document_file_storage_backend_arguments,
@@ -18,6 +21,17 @@ from ..settings import (
 
 
 class DocumentSettingsTestCase(SmartSettingTestMixin, BaseTestCase):
+    def test_documents_file_checksum_algorithms_validation(self):
+        setting_document_file_checksum_algorithms.validate(
+            raw_value='["md5", "sha1"]'
+        )
+
+    def test_documents_file_checksum_algorithms_unknown_validation(self):
+        with self.assertRaises(expected_exception=ValidationError):
+            setting_document_file_checksum_algorithms.validate(
+                raw_value='["md5", "unknown"]'
+            )
+
     def test_documents_language_codes_setting_double_quotes(self):
         self._set_environment_variable(
             name='MAYAN_{}'.format(setting_language_codes.global_name),
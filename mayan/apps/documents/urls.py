@@ -18,6 +18,9 @@ from .api_views.document_version_api_views import (
     APIDocumentVersionDetailView, APIDocumentVersionExportView,
     APIDocumentVersionListView, APIDocumentVersionModificationBackendListView,
     APIDocumentVersionModificationView, APIDocumentVersionPageDetailView,
+    APIDocumentVersionPageImageBatchView,
+    APIDocumentVersionPageImageRegionView,
+    APIDocumentVersionPageImageTileView, APIDocumentVersionPageImageTilesView,
     APIDocumentVersionPageImageView, APIDocumentVersionPageListView
 )
 from .api_views.favorite_document_api_views import (
@@ -647,6 +650,11 @@ api_urls_document_versions = [
         name='documentversionpage-list',
         view=APIDocumentVersionPageListView.as_view()
     ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/images/$',
+        name='documentversionpage-image-batch',
+        view=APIDocumentVersionPageImageBatchView.as_view()
+    ),
     url(
         regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/$',
         name='documentversionpage-detail',
@@ -656,6 +664,21 @@ api_urls_document_versions = [
         regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/$',
         name='documentversionpage-image',
         view=APIDocumentVersionPageImageView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/region/$',
+        name='documentversionpage-image-region',
+        view=APIDocumentVersionPageImageRegionView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/tiles/$',
+        name='documentversionpage-image-tiles',
+        view=APIDocumentVersionPageImageTilesView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/tiles/(?P<level>[0-9]+)/(?P<column>[0-9]+)_(?P<row>[0-9]+)/$',
+        name='documentversionpage-image-tile',
+        view=APIDocumentVersionPageImageTileView.as_view()
     )
 ]
 
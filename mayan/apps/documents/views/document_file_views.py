@@ -106,15 +106,28 @@ class DocumentFileDownloadView(SingleObjectDownloadView):
     source_queryset = DocumentFile.valid.all()
     view_icon = icon_document_file_download_quick
 
+    def get_download_etag(self):
+        return self.object.checksum
+
     def get_download_file_object(self):
         instance = self.get_object()
+
+        if self.is_download_continuation(size=instance.size):
+            return instance.open(raw=True)
+
         instance._event_action_object = instance.document
         instance._event_actor = self.request.user
         return instance.get_download_file_object()
 
+    def get_download_file_size(self, file_object):
+        return self.object.size
+
     def get_download_filename(self):
         return self.object.filename
 
+    def get_download_last_modified(self):
+        return self.object.timestamp.timestamp()
+
     def get_download_mime_type_and_encoding(self, file_object):
         return self.object.mimetype, self.object.encoding
 
@@ -126,7 +126,7 @@ class DocumentTypeDeleteView(SingleObjectDeleteView):
 
 
 class DocumentTypeEditView(SingleObjectEditView):
-    fields = ('label',)
+    fields = ('label', 'rendition_profile')
     model = DocumentType
     object_permission = permission_document_type_edit
     pk_url_kwarg = 'document_type_id'
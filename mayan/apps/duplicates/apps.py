@@ -6,12 +6,17 @@ from mayan.apps.common.apps import MayanAppConfig
 from mayan.apps.common.menus import menu_list_facet, menu_tools
 from mayan.apps.documents.menus import menu_documents
 from mayan.apps.documents.permissions import permission_document_view
+from mayan.apps.document_parsing.signals import (
+    signal_post_document_file_parsing_finished
+)
 from mayan.apps.documents.signals import signal_post_document_file_upload
 from mayan.apps.navigation.classes import SourceColumn
+from mayan.apps.ocr.signals import signal_post_document_version_ocr_finished
 
 from .classes import DuplicateBackend
 from .handlers import (
-    handler_remove_empty_duplicates_lists, handler_scan_duplicates_for
+    handler_remove_empty_duplicates_lists, handler_scan_duplicates_for,
+    handler_scan_duplicates_for_ocr, handler_scan_duplicates_for_parsing
 )
 from .links import (
     link_document_duplicates_list, link_duplicated_document_list,
@@ -77,7 +82,15 @@ class DuplicatesApp(MayanAppConfig):
             receiver=handler_remove_empty_duplicates_lists,
             sender=Document
         )
+        signal_post_document_file_parsing_finished.connect(
+            dispatch_uid='duplicates_handler_scan_duplicates_for_parsing',
+            receiver=handler_scan_duplicates_for_parsing
+        )
         signal_post_document_file_upload.connect(
             dispatch_uid='duplicates_handler_scan_duplicates_for',
             receiver=handler_scan_duplicates_for
         )
+        signal_post_document_version_ocr_finished.connect(
+            dispatch_uid='duplicates_handler_scan_duplicates_for_ocr',
+            receiver=handler_scan_duplicates_for_ocr
+        )
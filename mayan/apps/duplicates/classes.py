@@ -1,12 +1,30 @@
+import hashlib
 import logging
+import random
+import re
+
+from PIL import Image
 
 from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
 
+from .literals import (
+    DUPLICATES_SCAN_TRIGGER_FILE_UPLOAD, IMAGE_HASH_BAND_COUNT, IMAGE_HASH_SIMILARITY_THRESHOLD, IMAGE_HASH_SIZE,
+    TEXT_MINHASH_BAND_COUNT, TEXT_MINHASH_PERMUTATION_COUNT,
+    TEXT_MINHASH_PRIME, TEXT_MINHASH_SEED, TEXT_MINHASH_SHINGLE_SIZE,
+    TEXT_MINHASH_SIMILARITY_THRESHOLD
+)
+from .settings import setting_near_duplicate_backends
+
 
-__all__ = ('DuplicateBackend',)
+__all__ = (
+    'DuplicateBackend', 'DuplicateBackendImageHash',
+    'DuplicateBackendLocalitySensitiveHash', 'DuplicateBackendTextMinHash'
+)
 logger = logging.getLogger(name=__name__)
 
 
@@ -29,6 +47,10 @@ class DuplicateBackend(
     AppsModuleLoaderMixin, metaclass=DuplicateBackendMetaclass
 ):
     _loader_module_name = 'duplicate_backends'
+    # Near duplicate backends are only used when enabled by the
+    # DUPLICATES_NEAR_DUPLICATE_BACKENDS setting.
+    near_duplicate = False
+    scan_trigger_list = (DUPLICATES_SCAN_TRIGGER_FILE_UPLOAD,)
 
     @classmethod
     def get(cls, name):
@@ -44,16 +66,32 @@ class DuplicateBackend(
             (
                 (
                     key, backend.label
-                ) for key, backend in cls.get_all().items()
+                ) for key, backend in cls.get_all()
             ), key=lambda x: x[1]
         )
 
     @classmethod
     def get_class_path(cls):
-        for path, klass in cls.get_all().items():
+        for path, klass in cls.get_all():
             if klass is cls:
                 return path
 
+    @classmethod
+    def get_enabled(cls, scan_trigger=None):
+        """
+        Return the path and class of the backends in use. Pass scan_trigger
+        to return only the backends that scan documents again after that
+        event.
+        """
+        return [
+            (path, klass) for path, klass in cls.get_all()
+            if (
+                not klass.near_duplicate or path in setting_near_duplicate_backends.value
+            ) and (
+                scan_trigger is None or scan_trigger in klass.scan_trigger_list
+            )
+        ]
+
     @classmethod
     def verify(cls, document):
         """
@@ -66,6 +104,16 @@ class DuplicateBackend(
         self.model_instance_id = model_instance_id
         self.kwargs = kwargs
 
+    def get_duplicate_key_queryset(self):
+        """
+        Optional method to support set based scanning. Return a queryset of
+        the documents to scan annotated with a `duplicate_key` value. Every
+        document sharing the same non null key with another document is a
+        duplicate of it. Backends that return None are scanned one document
+        at a time.
+        """
+        return None
+
     def get_model_instance(self):
         StoredDuplicateBackend = apps.get_model(
             app_label='duplicated', model_name='StoredDuplicateBackend'
@@ -86,5 +134,230 @@ class DuplicateBackend(
         )
 
 
+class DuplicateBackendLocalitySensitiveHash(DuplicateBackend):
+    """
+    Base class for near duplicate backends. Subclasses compute a fixed
+    length signature per document. The signature is split into bands which
+    are stored in an indexed table. Candidates are the documents sharing
+    the value of any band and only those are compared.
+    """
+    band_count = None
+    near_duplicate = True
+    similarity_threshold = None
+
+    @staticmethod
+    def signature_dump(signature):
+        return ','.join(map(str, signature))
+
+    @staticmethod
+    def signature_load(value):
+        return tuple(int(item) for item in value.split(','))
+
+    def _process(self, document):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        DuplicateBackendBucket = apps.get_model(
+            app_label='duplicates', model_name='DuplicateBackendBucket'
+        )
+        DuplicateBackendSignature = apps.get_model(
+            app_label='duplicates', model_name='DuplicateBackendSignature'
+        )
+
+        signature = self.get_signature(document=document)
+
+        with transaction.atomic():
+            DuplicateBackendBucket.objects.filter(
+                document=document, stored_backend_id=self.model_instance_id
+            ).delete()
+            DuplicateBackendSignature.objects.filter(
+                document=document, stored_backend_id=self.model_instance_id
+            ).delete()
+
+            if not signature:
+                return Document.objects.none()
+
+            DuplicateBackendSignature.objects.create(
+                document=document, signature=self.signature_dump(
+                    signature=signature
+                ), stored_backend_id=self.model_instance_id
+            )
+
+            band_list = self.get_band_list(signature=signature)
+
+            DuplicateBackendBucket.objects.bulk_create(
+                [
+                    DuplicateBackendBucket(
+                        band=band, document=document,
+                        stored_backend_id=self.model_instance_id, value=value
+                    ) for band, value in enumerate(band_list)
+                ]
+            )
+
+        query = Q()
+        for band, value in enumerate(band_list):
+            query |= Q(band=band, value=value)
+
+        candidate_queryset = DuplicateBackendBucket.objects.filter(
+            query, stored_backend_id=self.model_instance_id
+        ).exclude(document=document).values('document_id')
+
+        document_id_list = []
+        for document_id, value in DuplicateBackendSignature.objects.filter(
+            document_id__in=candidate_queryset,
+            stored_backend_id=self.model_instance_id
+        ).values_list('document_id', 'signature'):
+            similarity = self.get_similarity(
+                signature=signature,
+                signature_other=self.signature_load(value=value)
+            )
+            if similarity >= self.similarity_threshold:
+                document_id_list.append(document_id)
+
+        return Document.objects.filter(pk__in=document_id_list)
+
+    def get_band_list(self, signature):
+        row_count = len(signature) // self.band_count
+        result = []
+
+        for band in range(self.band_count):
+            rows = signature[band * row_count:(band + 1) * row_count]
+            result.append(
+                hashlib.blake2b(
+                    self.signature_dump(signature=rows).encode(),
+                    digest_size=8
+                ).hexdigest()
+            )
+
+        return result
+
+    def get_signature(self, document):
+        """
+        Return a sequence of integers of fixed length or None when the
+        document cannot be hashed.
+        """
+        raise NotImplementedError(
+            'Your %s class has not defined the required '
+            'get_signature() method.' % self.__class__.__name__
+        )
+
+    def get_similarity(self, signature, signature_other):
+        """
+        Fraction of matching positions. Estimates the Jaccard similarity for
+        MinHash signatures and is the complement of the normalized Hamming
+        distance for bit signatures.
+        """
+        matches = sum(
+            1 for item, item_other in zip(signature, signature_other)
+            if item == item_other
+        )
+        return matches / max(len(signature), len(signature_other))
+
+
+class DuplicateBackendImageHash(DuplicateBackendLocalitySensitiveHash):
+    """
+    Difference hash of the first page image of the active document version.
+    Tolerates the changes in brightness, scale and noise between scans of
+    the same paper document.
+    """
+    band_count = IMAGE_HASH_BAND_COUNT
+    similarity_threshold = IMAGE_HASH_SIMILARITY_THRESHOLD
+
+    def get_image_hash(self, image):
+        image = image.convert('L').resize(
+            resample=Image.LANCZOS, size=(
+                IMAGE_HASH_SIZE + 1, IMAGE_HASH_SIZE
+            )
+        )
+        pixels = list(image.getdata())
+
+        return tuple(
+            int(
+                pixels[row * (IMAGE_HASH_SIZE + 1) + column] > pixels[
+                    row * (IMAGE_HASH_SIZE + 1) + column + 1
+                ]
+            ) for row in range(IMAGE_HASH_SIZE)
+            for column in range(IMAGE_HASH_SIZE)
+        )
+
+    def get_signature(self, document):
+        version_active = document.version_active
+        if not version_active:
+            return
+
+        document_version_page = version_active.pages.first()
+        if not document_version_page:
+            return
+
+        cache_filename = document_version_page.generate_image()
+
+        with document_version_page.cache_partition.get_file(
+            filename=cache_filename
+        ).open() as file_object:
+            return self.get_image_hash(image=Image.open(fp=file_object))
+
+
+class DuplicateBackendTextMinHash(DuplicateBackendLocalitySensitiveHash):
+    """
+    MinHash of the word shingles of a document text.
+    """
+    band_count = TEXT_MINHASH_BAND_COUNT
+    similarity_threshold = TEXT_MINHASH_SIMILARITY_THRESHOLD
+
+    _coefficient_list = None
+
+    @classmethod
+    def get_coefficient_list(cls):
+        # Fixed seed, signatures must be comparable across processes.
+        if DuplicateBackendTextMinHash._coefficient_list is None:
+            generator = random.Random(TEXT_MINHASH_SEED)
+            DuplicateBackendTextMinHash._coefficient_list = [
+                (
+                    generator.randrange(1, TEXT_MINHASH_PRIME),
+                    generator.randrange(0, TEXT_MINHASH_PRIME)
+                ) for index in range(TEXT_MINHASH_PERMUTATION_COUNT)
+            ]
+
+        return DuplicateBackendTextMinHash._coefficient_list
+
+    def get_shingle_hash_set(self, text):
+        words = re.findall(pattern=r'\w+', string=text.lower())
+        shingle_size = min(len(words), TEXT_MINHASH_SHINGLE_SIZE)
+
+        return {
+            int.from_bytes(
+                hashlib.blake2b(
+                    ' '.join(words[index:index + shingle_size]).encode(),
+                    digest_size=8
+                ).digest(), byteorder='big'
+            ) % TEXT_MINHASH_PRIME for index in range(
+                len(words) - shingle_size + 1
+            )
+        } if words else set()
+
+    def get_signature(self, document):
+        shingle_hash_set = self.get_shingle_hash_set(
+            text=' '.join(self.get_text(document=document))
+        )
+        if not shingle_hash_set:
+            return
+
+        return tuple(
+            min(
+                (a * shingle_hash + b) % TEXT_MINHASH_PRIME
+                for shingle_hash in shingle_hash_set
+            ) for a, b in self.get_coefficient_list()
+        )
+
+    def get_text(self, document):
+        """
+        Return an iterable of the text fragments of the document.
+        """
+        raise NotImplementedError(
+            'Your %s class has not defined the required '
+            'get_text() method.' % self.__class__.__name__
+        )
+
+
 class NullBackend(DuplicateBackend):
     label = _('Null backend')
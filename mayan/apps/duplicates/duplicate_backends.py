@@ -1,8 +1,13 @@
 from django.apps import apps
-from django.db.models import F, Max
+from django.db.models import F, Max, OuterRef, Subquery
 from django.utils.translation import ugettext_lazy as _
 
-from .classes import DuplicateBackend
+from .classes import (
+    DuplicateBackend, DuplicateBackendImageHash, DuplicateBackendTextMinHash
+)
+from .literals import (
+    DUPLICATES_SCAN_TRIGGER_OCR, DUPLICATES_SCAN_TRIGGER_PARSING
+)
 
 
 class DuplicateBackendFileChecksum(DuplicateBackend):
@@ -12,6 +17,22 @@ class DuplicateBackendFileChecksum(DuplicateBackend):
     def verify(cls, document):
         return document.file_latest
 
+    def get_duplicate_key_queryset(self):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+
+        checksum_latest = DocumentFile.objects.filter(
+            document=OuterRef('pk')
+        ).order_by('-timestamp').values('checksum')[:1]
+
+        return Document.valid.annotate(
+            duplicate_key=Subquery(queryset=checksum_latest)
+        )
+
     def process(self, document):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
@@ -31,6 +52,12 @@ class DuplicateBackendFileChecksum(DuplicateBackend):
 class DuplicateBackendLabel(DuplicateBackend):
     label = _('Exact document label')
 
+    def get_duplicate_key_queryset(self):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        return Document.valid.annotate(duplicate_key=F('label'))
+
     def process(self, document):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
@@ -38,3 +65,23 @@ class DuplicateBackendLabel(DuplicateBackend):
         return Document.objects.filter(
             label=document.label
         ).exclude(pk=document.pk)
+
+
+class DuplicateBackendFirstPageImageHash(DuplicateBackendImageHash):
+    label = _('Similar first page image')
+
+
+class DuplicateBackendOCRContentMinHash(DuplicateBackendTextMinHash):
+    label = _('Similar OCR content')
+    scan_trigger_list = (DUPLICATES_SCAN_TRIGGER_OCR,)
+
+    def get_text(self, document):
+        return document.ocr_content()
+
+
+class DuplicateBackendParsedContentMinHash(DuplicateBackendTextMinHash):
+    label = _('Similar parsed content')
+    scan_trigger_list = (DUPLICATES_SCAN_TRIGGER_PARSING,)
+
+    def get_text(self, document):
+        return document.content()
@@ -1,9 +1,45 @@
+from .classes import DuplicateBackend
+from .literals import (
+    DUPLICATES_SCAN_TRIGGER_FILE_UPLOAD, DUPLICATES_SCAN_TRIGGER_OCR,
+    DUPLICATES_SCAN_TRIGGER_PARSING
+)
 from .tasks import task_duplicates_clean_empty_lists, task_duplicates_scan_for
 
 
+def _scan_duplicates_for(document_id, scan_trigger):
+    backend_path_list = [
+        backend_path for backend_path, backend_class in DuplicateBackend.get_enabled(
+            scan_trigger=scan_trigger
+        )
+    ]
+
+    if backend_path_list:
+        task_duplicates_scan_for.apply_async(
+            kwargs={
+                'backend_path_list': backend_path_list,
+                'document_id': document_id
+            }
+        )
+
+
 def handler_scan_duplicates_for(sender, instance, **kwargs):
-    task_duplicates_scan_for.apply_async(
-        kwargs={'document_id': instance.document_id}
+    _scan_duplicates_for(
+        document_id=instance.document_id,
+        scan_trigger=DUPLICATES_SCAN_TRIGGER_FILE_UPLOAD
+    )
+
+
+def handler_scan_duplicates_for_ocr(sender, instance, **kwargs):
+    _scan_duplicates_for(
+        document_id=instance.document_id,
+        scan_trigger=DUPLICATES_SCAN_TRIGGER_OCR
+    )
+
+
+def handler_scan_duplicates_for_parsing(sender, instance, **kwargs):
+    _scan_duplicates_for(
+        document_id=instance.document_id,
+        scan_trigger=DUPLICATES_SCAN_TRIGGER_PARSING
     )
 
 
@@ -0,0 +1,23 @@
+DEFAULT_DUPLICATES_NEAR_DUPLICATE_BACKENDS = []
+
+DUPLICATES_SCAN_ALL_CHUNK_SIZE = 1000
+
+# Events after which a document is scanned again by a backend.
+DUPLICATES_SCAN_TRIGGER_FILE_UPLOAD = 'file_upload'
+DUPLICATES_SCAN_TRIGGER_OCR = 'ocr'
+DUPLICATES_SCAN_TRIGGER_PARSING = 'parsing'
+
+# Difference hash of the first page image. 64 bits split in 4 bands. Any
+# two images with up to 3 different bits share at least one band.
+IMAGE_HASH_BAND_COUNT = 4
+IMAGE_HASH_SIZE = 8
+IMAGE_HASH_SIMILARITY_THRESHOLD = 0.9
+
+# MinHash of the document text word shingles. 100 hashes in 20 bands of 5
+# rows finds pairs with a similarity of 0.8 with a 99.9% probability.
+TEXT_MINHASH_BAND_COUNT = 20
+TEXT_MINHASH_PERMUTATION_COUNT = 100
+TEXT_MINHASH_PRIME = (1 << 61) - 1
+TEXT_MINHASH_SEED = 1
+TEXT_MINHASH_SHINGLE_SIZE = 3
+TEXT_MINHASH_SIMILARITY_THRESHOLD = 0.8
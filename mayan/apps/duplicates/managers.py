@@ -1,22 +1,160 @@
 import logging
 
 from django.apps import apps
-from django.db import models
-from django.db.models import Q, Value
+from django.db import models, transaction
+from django.db.models import Count, Q, Value
 
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 
 from .classes import DuplicateBackend
+from .literals import DUPLICATES_SCAN_ALL_CHUNK_SIZE
 
 logger = logging.getLogger(name=__name__)
 
 
 class StoredDuplicateBackendManager(models.Manager):
-    def scan_document(self, document):
+    def _scan_all_backend(self, stored_backend, queryset):
+        DuplicateBackendEntry = apps.get_model(
+            app_label='duplicates', model_name='DuplicateBackendEntry'
+        )
+        DuplicateBackendEntryDocument = DuplicateBackendEntry.documents.through
+
+        queryset = queryset.filter(duplicate_key__isnull=False)
+
+        key_queryset = queryset.values('duplicate_key').annotate(
+            document_count=Count('pk')
+        ).filter(document_count__gt=1).order_by('duplicate_key')
+
+        # Walk the duplicated keys in chunks using the last key of the
+        # previous chunk instead of holding a cursor open while writing.
+        duplicated_document_id_set = set()
+        last_key = None
+
+        while True:
+            chunk_queryset = key_queryset
+            if last_key is not None:
+                chunk_queryset = chunk_queryset.filter(
+                    duplicate_key__gt=last_key
+                )
+
+            key_list = list(
+                chunk_queryset.values_list(
+                    'duplicate_key', flat=True
+                )[:DUPLICATES_SCAN_ALL_CHUNK_SIZE]
+            )
+
+            if not key_list:
+                break
+
+            last_key = key_list[-1]
+
+            groups = {}
+            for key, document_id in queryset.filter(
+                duplicate_key__in=key_list
+            ).values_list('duplicate_key', 'pk'):
+                groups.setdefault(key, []).append(document_id)
+
+            document_id_list = [
+                document_id for group in groups.values()
+                for document_id in group
+            ]
+            duplicated_document_id_set.update(document_id_list)
+
+            with transaction.atomic():
+                DuplicateBackendEntry.objects.bulk_create(
+                    [
+                        DuplicateBackendEntry(
+                            stored_backend=stored_backend,
+                            document_id=document_id
+                        ) for document_id in document_id_list
+                    ], ignore_conflicts=True
+                )
+
+                entry_ids = dict(
+                    stored_backend.duplicate_entries.filter(
+                        document_id__in=document_id_list
+                    ).values_list('document_id', 'pk')
+                )
+
+                # Replace the duplicate lists of the documents in this
+                # chunk instead of diffing them.
+                DuplicateBackendEntryDocument.objects.filter(
+                    duplicatebackendentry_id__in=entry_ids.values()
+                ).delete()
+
+                DuplicateBackendEntryDocument.objects.bulk_create(
+                    [
+                        DuplicateBackendEntryDocument(
+                            duplicatebackendentry_id=entry_ids[document_id],
+                            document_id=duplicate_id
+                        ) for group in groups.values()
+                        for document_id in group
+                        for duplicate_id in group
+                        if duplicate_id != document_id
+                    ], ignore_conflicts=True
+                )
+
+        # Remove the entries of the documents that are no longer
+        # duplicated.
+        stale_entry_id_list = [
+            entry_id for entry_id, document_id in stored_backend.duplicate_entries.values_list(
+                'pk', 'document_id'
+            ) if document_id not in duplicated_document_id_set
+        ]
+
+        for index in range(
+            0, len(stale_entry_id_list), DUPLICATES_SCAN_ALL_CHUNK_SIZE
+        ):
+            DuplicateBackendEntry.objects.filter(
+                pk__in=stale_entry_id_list[
+                    index:index + DUPLICATES_SCAN_ALL_CHUNK_SIZE
+                ]
+            ).delete()
+
+    def scan_all(self):
+        """
+        Rebuild the duplicate lists of every backend that supports set
+        based scanning using one grouped query per backend instead of one
+        scan per document. Returns the paths of the backends that need to
+        be scanned one document at a time.
+        """
+        backend_path_list = []
+
+        for backend_path, backend_class in DuplicateBackend.get_enabled():
+            stored_backend, created = self.get_or_create(
+                backend_path=backend_path
+            )
+            queryset = stored_backend.get_backend_instance().get_duplicate_key_queryset()
+
+            if queryset is None:
+                backend_path_list.append(backend_path)
+                continue
+
+            lock_name = 'duplicates__scan_all-{}'.format(stored_backend.pk)
+            try:
+                logger.debug('trying to acquire lock: %s', lock_name)
+                lock = LockingBackend.get_backend().acquire_lock(
+                    name=lock_name
+                )
+                logger.debug('acquired lock: %s', lock_name)
+                try:
+                    self._scan_all_backend(
+                        stored_backend=stored_backend, queryset=queryset
+                    )
+                finally:
+                    lock.release()
+            except LockError:
+                logger.debug('unable to obtain lock: %s' % lock_name)
+                raise
+
+        return backend_path_list
+
+    def scan_document(self, document, backend_path_list=None):
         """
         Find duplicates of document based on each registered backend's logic.
+        Use backend_path_list to limit the scan to some of the backends.
         """
         lock_name = 'duplicates__scan_document-{}'.format(document.pk)
         try:
@@ -28,12 +166,15 @@ class StoredDuplicateBackendManager(models.Manager):
                     app_label='duplicates', model_name='DuplicateBackendEntry'
                 )
 
-                for backend_path, backend_class in DuplicateBackend.get_all():
-                    if backend_class.verify(document=document):
+                for backend_path, backend_class in DuplicateBackend.get_enabled():
+                    if backend_path_list is not None and backend_path not in backend_path_list:
+                        continue
 
-                        stored_backend, created = self.get_or_create(
-                            backend_path=backend_path
-                        )
+                    stored_backend, created = self.get_or_create(
+                        backend_path=backend_path
+                    )
+
+                    if backend_class.verify(document=document):
                         duplicates = stored_backend.get_backend_instance().process(
                             document=document
                         )
@@ -0,0 +1,46 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0083_documenttype_rendition_profile'),
+        ('duplicates', '0010_auto_20210419_0709'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DuplicateBackendSignature',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('signature', models.TextField(verbose_name='Signature')),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_signatures', to='documents.Document', verbose_name='Document')),
+                ('stored_backend', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signatures', to='duplicates.StoredDuplicateBackend', verbose_name='Stored duplicate backend')),
+            ],
+            options={
+                'verbose_name': 'Duplicate backend signature',
+                'verbose_name_plural': 'Duplicate backend signatures',
+                'unique_together': {('stored_backend', 'document')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DuplicateBackendBucket',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField(verbose_name='Band')),
+                ('value', models.CharField(max_length=32, verbose_name='Value')),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_buckets', to='documents.Document', verbose_name='Document')),
+                ('stored_backend', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='buckets', to='duplicates.StoredDuplicateBackend', verbose_name='Stored duplicate backend')),
+            ],
+            options={
+                'verbose_name': 'Duplicate backend bucket',
+                'verbose_name_plural': 'Duplicate backend buckets',
+                'unique_together': {('stored_backend', 'document', 'band')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='duplicatebackendbucket',
+            index=models.Index(fields=['stored_backend', 'band', 'value'], name='duplicates__stored__332abb_idx'),
+        ),
+    ]
@@ -50,6 +50,52 @@ class DuplicateBackendEntry(models.Model):
         verbose_name_plural = _('Duplicated backend entries')
 
 
+class DuplicateBackendSignature(models.Model):
+    """
+    Signature computed by a locality sensitive hash backend for a document.
+    Kept to compare the candidates found in the bucket index.
+    """
+    stored_backend = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='signatures',
+        to=StoredDuplicateBackend, verbose_name=_('Stored duplicate backend')
+    )
+    document = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='duplicate_signatures',
+        to=Document, verbose_name=_('Document')
+    )
+    signature = models.TextField(verbose_name=_('Signature'))
+
+    class Meta:
+        unique_together = ('stored_backend', 'document')
+        verbose_name = _('Duplicate backend signature')
+        verbose_name_plural = _('Duplicate backend signatures')
+
+
+class DuplicateBackendBucket(models.Model):
+    """
+    One band of a document signature. Documents that share the value of
+    any band are near duplicate candidates.
+    """
+    stored_backend = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='buckets',
+        to=StoredDuplicateBackend, verbose_name=_('Stored duplicate backend')
+    )
+    document = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='duplicate_buckets',
+        to=Document, verbose_name=_('Document')
+    )
+    band = models.PositiveSmallIntegerField(verbose_name=_('Band'))
+    value = models.CharField(max_length=32, verbose_name=_('Value'))
+
+    class Meta:
+        indexes = (
+            models.Index(fields=('stored_backend', 'band', 'value')),
+        )
+        unique_together = ('stored_backend', 'document', 'band')
+        verbose_name = _('Duplicate backend bucket')
+        verbose_name_plural = _('Duplicate backend buckets')
+
+
 class DuplicateSourceDocument(Document):
     class Meta:
         proxy = True
@@ -0,0 +1,17 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import DEFAULT_DUPLICATES_NEAR_DUPLICATE_BACKENDS
+
+namespace = SettingNamespace(label=_('Duplicates'), name='duplicates')
+
+setting_near_duplicate_backends = namespace.add_setting(
+    default=DEFAULT_DUPLICATES_NEAR_DUPLICATE_BACKENDS,
+    global_name='DUPLICATES_NEAR_DUPLICATE_BACKENDS', help_text=_(
+        'List of the full paths of the near duplicate backends to enable. '
+        'Near duplicate backends compare the first page image or the text '
+        'of the documents. They are more expensive than the exact '
+        'duplicate backends and are disabled by default.'
+    )
+)
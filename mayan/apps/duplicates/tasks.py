@@ -12,22 +12,34 @@ def task_duplicates_clean_empty_lists():
     DuplicateBackendEntry.objects.clean_empty_duplicate_lists()
 
 
-@app.task(ignore_result=True)
-def task_duplicates_scan_all():
+@app.task(bind=True, ignore_result=True)
+def task_duplicates_scan_all(self):
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
+    StoredDuplicateBackend = apps.get_model(
+        app_label='duplicates', model_name='StoredDuplicateBackend'
+    )
 
-    for document in Document.valid.all():
-        task_duplicates_scan_for.apply_async(
-            kwargs={
-                'document_id': document.pk
-            }
-        )
+    try:
+        backend_path_list = StoredDuplicateBackend.objects.scan_all()
+    except LockError as exception:
+        raise self.retry(exc=exception)
+
+    # Fall back to per document scans only for the backends that don't
+    # support set based scanning.
+    if backend_path_list:
+        for document_id in Document.valid.values_list('pk', flat=True):
+            task_duplicates_scan_for.apply_async(
+                kwargs={
+                    'backend_path_list': backend_path_list,
+                    'document_id': document_id
+                }
+            )
 
 
 @app.task(bind=True, ignore_result=True)
-def task_duplicates_scan_for(self, document_id):
+def task_duplicates_scan_for(self, document_id, backend_path_list=None):
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
@@ -39,7 +51,7 @@ def task_duplicates_scan_for(self, document_id):
 
     try:
         StoredDuplicateBackend.objects.scan_document(
-            document=document
+            backend_path_list=backend_path_list, document=document
         )
     except LockError as exception:
         raise self.retry(exc=exception)
@@ -1,6 +1,13 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
-from ..models import DuplicateBackendEntry, StoredDuplicateBackend
+from ..duplicate_backends import (
+    DuplicateBackendFirstPageImageHash, DuplicateBackendOCRContentMinHash
+)
+from ..models import (
+    DuplicateBackendBucket, DuplicateBackendEntry, StoredDuplicateBackend
+)
+
+from ..settings import setting_near_duplicate_backends
 
 from .mixins import DuplicatedDocumentTestMixin
 
@@ -50,3 +57,122 @@ class DuplicatedDocumentModelTestCase(
         StoredDuplicateBackend.objects.scan_document(
             document=self._test_documents[0]
         )
+
+    def test_scan_all(self):
+        self._upload_duplicate_document()
+        DuplicateBackendEntry.objects.all().delete()
+
+        self.assertEqual(StoredDuplicateBackend.objects.scan_all(), [])
+
+        self.assertTrue(
+            self._test_documents[1] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_documents[0]
+            )
+        )
+        self.assertTrue(
+            self._test_documents[0] in DuplicateBackendEntry.objects.get_duplicates_of(
+                document=self._test_documents[1]
+            )
+        )
+
+    def test_scan_document_backend_path_list(self):
+        self._upload_duplicate_document()
+        DuplicateBackendEntry.objects.all().delete()
+
+        backend_path = 'mayan.apps.duplicates.duplicate_backends.DuplicateBackendLabel'
+
+        StoredDuplicateBackend.objects.scan_document(
+            backend_path_list=(backend_path,),
+            document=self._test_documents[0]
+        )
+
+        self.assertEqual(
+            set(
+                DuplicateBackendEntry.objects.values_list(
+                    'stored_backend__backend_path', flat=True
+                )
+            ), {backend_path}
+        )
+
+    def test_scan_all_stale_entries(self):
+        self._upload_duplicate_document()
+        self._test_documents[1].delete()
+
+        StoredDuplicateBackend.objects.scan_all()
+
+        self.assertEqual(
+            DuplicateBackendEntry.objects.filter(
+                document=self._test_documents[0]
+            ).count(), 0
+        )
+
+    def test_text_minhash_similarity(self):
+        backend = DuplicateBackendOCRContentMinHash(model_instance_id=None)
+        text = ' '.join(
+            'word{}'.format(index) for index in range(200)
+        )
+
+        backend.get_text = lambda document: (text,)
+        signature = backend.get_signature(document=None)
+
+        backend.get_text = lambda document: (text + ' extra',)
+        signature_similar = backend.get_signature(document=None)
+
+        backend.get_text = lambda document: ('unrelated content',)
+        signature_different = backend.get_signature(document=None)
+
+        self.assertTrue(
+            backend.get_similarity(
+                signature=signature, signature_other=signature_similar
+            ) >= backend.similarity_threshold
+        )
+        self.assertTrue(
+            backend.get_similarity(
+                signature=signature, signature_other=signature_different
+            ) < backend.similarity_threshold
+        )
+
+
+class NearDuplicateDocumentModelTestCase(
+    DuplicatedDocumentTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._old_near_duplicate_backends = setting_near_duplicate_backends.value
+        setting_near_duplicate_backends.set(
+            value=[DuplicateBackendFirstPageImageHash.get_class_path()]
+        )
+        self._upload_test_document()
+
+    def tearDown(self):
+        setting_near_duplicate_backends.set(
+            value=self._old_near_duplicate_backends
+        )
+        super().tearDown()
+
+    def test_first_page_image_hash(self):
+        self._upload_duplicate_document()
+
+        stored_backend = StoredDuplicateBackend.objects.get(
+            backend_path=DuplicateBackendFirstPageImageHash.get_class_path()
+        )
+
+        self.assertEqual(
+            DuplicateBackendBucket.objects.filter(
+                document=self._test_documents[0],
+                stored_backend=stored_backend
+            ).count(), DuplicateBackendFirstPageImageHash.band_count
+        )
+        self.assertTrue(
+            self._test_documents[1] in stored_backend.duplicate_entries.get(
+                document=self._test_documents[0]
+            ).documents.all()
+        )
+
+    def test_scan_all_near_duplicate_fallback(self):
+        self.assertEqual(
+            StoredDuplicateBackend.objects.scan_all(),
+            [DuplicateBackendFirstPageImageHash.get_class_path()]
+        )
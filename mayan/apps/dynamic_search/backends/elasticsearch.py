@@ -199,16 +199,15 @@ class ElasticSearchBackend(SearchBackend):
             id=instance.pk, document=document
         )
 
-    def index_instances(self, search_model, id_list):
+    def index_instances(self, search_model, id_list, queryset=None):
         client = self.get_client()
         index_name = self.get_index_name(search_model=search_model)
 
-        def generate_actions():
+        if queryset is None:
             queryset = search_model.get_queryset()
 
-            queryset = queryset.filter(pk__in=id_list)
-
-            for instance in queryset:
+        def generate_actions():
+            for instance in queryset.filter(pk__in=id_list):
                 kwargs = search_model.populate(
                     backend=self, instance=instance
                 )
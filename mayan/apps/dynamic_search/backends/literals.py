@@ -10,6 +10,8 @@ DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_CONNECTION_FAIL = False
 DEFAULT_ELASTICSEARCH_CLIENT_SNIFFER_TIMEOUT = None
 DEFAULT_ELASTICSEARCH_HOST = 'http://127.0.0.1:9200'
 DEFAULT_ELASTICSEARCH_INDICES_NAMESPACE = 'mayan'
+DEFAULT_POSTGRESQL_SEARCH_CONFIG = 'simple'
+DEFAULT_POSTGRESQL_TABLE_PREFIX = 'search_fulltext'
 
 QUERY_OPERATION_AND = 1
 QUERY_OPERATION_OR = 2
@@ -44,6 +46,31 @@ DJANGO_TO_ELASTICSEARCH_FIELD_MAP = {
     }
 }
 
+# PostgreSQL specific.
+POSTGRESQL_LOOKUP_EXACT = 'exact'
+POSTGRESQL_LOOKUP_FULLTEXT = 'fulltext'
+POSTGRESQL_LOOKUP_TRIGRAM = 'trigram'
+
+# Characters of a field value used to build its tsvector. Keeps very large
+# OCR or parsed contents under the tsvector size limit.
+POSTGRESQL_TSVECTOR_CONTENT_LIMIT = 500000
+
+DJANGO_TO_POSTGRESQL_FIELD_MAP = {
+    models.AutoField: {
+        'lookup': POSTGRESQL_LOOKUP_EXACT, 'transformation': str
+    },
+    models.CharField: {'lookup': POSTGRESQL_LOOKUP_TRIGRAM},
+    models.DateTimeField: {
+        'lookup': POSTGRESQL_LOOKUP_TRIGRAM,
+        'transformation': lambda value: value.isoformat()
+    },
+    models.EmailField: {'lookup': POSTGRESQL_LOOKUP_TRIGRAM},
+    models.TextField: {'lookup': POSTGRESQL_LOOKUP_FULLTEXT},
+    models.UUIDField: {
+        'lookup': POSTGRESQL_LOOKUP_TRIGRAM, 'transformation': str
+    }
+}
+
 # Whoosh specific.
 DJANGO_TO_WHOOSH_FIELD_MAP = {
     models.AutoField: {
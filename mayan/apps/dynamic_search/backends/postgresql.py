@@ -0,0 +1,401 @@
+import logging
+
+from django.db import ProgrammingError, connection, transaction
+from django.db.models import Case, IntegerField, Value, When
+
+from ..classes import SearchBackend, SearchModel
+from ..exceptions import DynamicSearchException
+from ..settings import setting_results_limit
+
+from .django import SearchTermCollection
+from .literals import (
+    DEFAULT_POSTGRESQL_SEARCH_CONFIG, DEFAULT_POSTGRESQL_TABLE_PREFIX,
+    DJANGO_TO_POSTGRESQL_FIELD_MAP, POSTGRESQL_LOOKUP_EXACT,
+    POSTGRESQL_LOOKUP_FULLTEXT, POSTGRESQL_TSVECTOR_CONTENT_LIMIT,
+    QUERY_OPERATION_AND, QUERY_OPERATION_OR, TERM_OPERATION_OR
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class PostgreSQLSearchBackend(SearchBackend):
+    """
+    Search backend that uses the native PostgreSQL full text search.
+    Each search model gets a side table with one row per instance field.
+    Text fields are matched against a GIN indexed tsvector and ranked with
+    ts_rank. The rest of the fields are matched by substring using a
+    trigram GIN index.
+    """
+    field_map = DJANGO_TO_POSTGRESQL_FIELD_MAP
+
+    def __init__(self, **kwargs):
+        self.search_config = kwargs.pop(
+            'search_config', DEFAULT_POSTGRESQL_SEARCH_CONFIG
+        )
+        self.table_prefix = kwargs.pop(
+            'table_prefix', DEFAULT_POSTGRESQL_TABLE_PREFIX
+        )
+
+        super().__init__(**kwargs)
+
+    def _execute(self, search_model, function):
+        """
+        Execute a function that accesses the search model table. Creates
+        the table if it does not exist yet and executes the function again.
+        """
+        try:
+            with transaction.atomic():
+                return function()
+        except ProgrammingError:
+            self.update_mappings(search_model=search_model)
+
+            with transaction.atomic():
+                return function()
+
+    def _get_status(self):
+        result = []
+
+        title = 'PostgreSQL search model indexing status'
+        result.append(title)
+        result.append(len(title) * '=')
+
+        for search_model in SearchModel.all():
+            def get_count():
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT COUNT(DISTINCT object_id) FROM {}'.format(
+                            self.get_table_name(search_model=search_model)
+                        )
+                    )
+                    return cursor.fetchone()[0]
+
+            result.append(
+                '{}: {}'.format(
+                    search_model.label, self._execute(
+                        function=get_count, search_model=search_model
+                    )
+                )
+            )
+
+        return '\n'.join(result)
+
+    def _initialize(self):
+        self.update_mappings()
+
+    def _search(
+        self, query, search_model, user, global_and_search=False,
+        ignore_limit=False
+    ):
+        field_map = self.get_resolved_field_map(search_model=search_model)
+
+        branch_list = []
+        params = []
+
+        for search_field in search_model.get_search_fields():
+            search_term_collection = SearchTermCollection(
+                text=query.get(search_field.field, '').strip()
+            )
+            lookup = field_map.get(search_field.field, {}).get('lookup')
+
+            if not lookup:
+                continue
+
+            field_query = self.get_field_query(
+                lookup=lookup, search_field=search_field,
+                search_term_collection=search_term_collection
+            )
+
+            if field_query:
+                condition, condition_params, rank, rank_params = field_query
+
+                branch_list.append(
+                    'SELECT object_id, {rank} AS rank, {branch} AS branch '
+                    'FROM {table} WHERE field = %s AND {condition}'.format(
+                        branch=len(branch_list), condition=condition,
+                        rank=rank, table=self.get_table_name(
+                            search_model=search_model
+                        )
+                    )
+                )
+                params.extend(rank_params)
+                params.append(search_field.field)
+                params.extend(condition_params)
+
+        if not branch_list:
+            return search_model.get_queryset().none()
+
+        sql = (
+            'SELECT object_id FROM ({}) AS matches GROUP BY object_id'.format(
+                ' UNION ALL '.join(branch_list)
+            )
+        )
+
+        if global_and_search:
+            sql = '{} HAVING COUNT(DISTINCT branch) = %s'.format(sql)
+            params.append(len(branch_list))
+
+        sql = '{} ORDER BY SUM(rank) DESC'.format(sql)
+
+        if not ignore_limit:
+            sql = '{} LIMIT %s'.format(sql)
+            params.append(setting_results_limit.value)
+
+        def get_id_list():
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                return [row[0] for row in cursor.fetchall()]
+
+        id_list = self._execute(
+            function=get_id_list, search_model=search_model
+        )
+
+        queryset = search_model.get_queryset().filter(pk__in=id_list)
+
+        if id_list and not ignore_limit:
+            # Keep the rank order of the results.
+            queryset = queryset.order_by(
+                Case(
+                    *[
+                        When(pk=pk, then=Value(position))
+                        for position, pk in enumerate(id_list)
+                    ], output_field=IntegerField()
+                )
+            )
+
+        return queryset
+
+    def deindex_instance(self, instance):
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        def delete():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'DELETE FROM {} WHERE object_id = %s'.format(
+                        self.get_table_name(search_model=search_model)
+                    ), [instance.pk]
+                )
+
+        self._execute(function=delete, search_model=search_model)
+
+    def get_field_query(self, lookup, search_field, search_term_collection):
+        """
+        Return the SQL condition matching the terms for a field, its
+        parameters, and the rank expression with its parameters. Terms are
+        combined the same way as the Django search backend.
+        """
+        query_operation = QUERY_OPERATION_AND
+        expression = None
+        params = []
+
+        for term in search_term_collection.terms:
+            if term.is_meta:
+                if term.string == TERM_OPERATION_OR:
+                    query_operation = QUERY_OPERATION_OR
+                continue
+
+            if search_field.transformation_function:
+                term_string = search_field.transformation_function(
+                    term_string=term.string
+                )
+            else:
+                term_string = term.string
+
+            if lookup == POSTGRESQL_LOOKUP_FULLTEXT:
+                if ' ' in term_string:
+                    term_expression = 'phraseto_tsquery(%s::regconfig, %s)'
+                else:
+                    term_expression = 'plainto_tsquery(%s::regconfig, %s)'
+
+                params.extend((self.search_config, term_string))
+
+                if term.negated:
+                    term_expression = '!!({})'.format(term_expression)
+
+                operators = {
+                    QUERY_OPERATION_AND: '&&', QUERY_OPERATION_OR: '||'
+                }
+            else:
+                if lookup == POSTGRESQL_LOOKUP_EXACT:
+                    term_expression = 'content = %s'
+                    params.append(term_string)
+                else:
+                    # Only rows without a tsvector are covered by the
+                    # trigram index.
+                    term_expression = 'vector IS NULL AND content ILIKE %s'
+                    params.append(
+                        '%{}%'.format(
+                            term_string.replace(
+                                '\\', '\\\\'
+                            ).replace('%', '\\%').replace('_', '\\_')
+                        )
+                    )
+
+                if term.negated:
+                    term_expression = 'NOT ({})'.format(term_expression)
+
+                operators = {
+                    QUERY_OPERATION_AND: 'AND', QUERY_OPERATION_OR: 'OR'
+                }
+
+            if expression is None:
+                expression = term_expression
+            else:
+                expression = '({} {} {})'.format(
+                    expression, operators[query_operation], term_expression
+                )
+
+        if expression is None:
+            return None
+
+        if lookup == POSTGRESQL_LOOKUP_FULLTEXT:
+            return (
+                'vector @@ {}'.format(expression), params,
+                'ts_rank(vector, {})'.format(expression), params
+            )
+        else:
+            return '({})'.format(expression), params, '0', []
+
+    def get_table_name(self, search_model):
+        return connection.ops.quote_name(
+            name='{}_{}'.format(
+                self.table_prefix,
+                search_model.get_full_name().replace('.', '_')
+            )
+        )
+
+    def index_instance(self, instance, exclude_model=None, exclude_kwargs=None):
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        document = search_model.populate(
+            backend=self, instance=instance, exclude_model=exclude_model,
+            exclude_kwargs=exclude_kwargs
+        )
+
+        self.index_documents(
+            document_list=((instance.pk, document),),
+            search_model=search_model
+        )
+
+    def index_documents(self, document_list, search_model):
+        field_map = self.get_resolved_field_map(search_model=search_model)
+        table_name = self.get_table_name(search_model=search_model)
+
+        sql_upsert = (
+            'INSERT INTO {table} (object_id, field, content, vector) VALUES '
+            '(%s, %s, %s, {vector}) ON CONFLICT (object_id, field) DO UPDATE '
+            'SET content = EXCLUDED.content, vector = EXCLUDED.vector'
+        )
+        sql_fulltext = sql_upsert.format(
+            table=table_name, vector='to_tsvector(%s::regconfig, left(%s, %s))'
+        )
+        sql_text = sql_upsert.format(table=table_name, vector='NULL')
+
+        params_fulltext = []
+        params_text = []
+
+        for object_id, document in document_list:
+            for field_name, value in document.items():
+                content = '' if value is None else str(value)
+
+                lookup = field_map.get(field_name, {}).get('lookup')
+
+                if lookup == POSTGRESQL_LOOKUP_FULLTEXT:
+                    params_fulltext.append(
+                        (
+                            object_id, field_name, content,
+                            self.search_config, content,
+                            POSTGRESQL_TSVECTOR_CONTENT_LIMIT
+                        )
+                    )
+                else:
+                    params_text.append((object_id, field_name, content))
+
+        def upsert():
+            with connection.cursor() as cursor:
+                if params_fulltext:
+                    cursor.executemany(sql_fulltext, params_fulltext)
+                if params_text:
+                    cursor.executemany(sql_text, params_text)
+
+        self._execute(function=upsert, search_model=search_model)
+
+    def index_instances(self, search_model, id_list, queryset=None):
+        if queryset is None:
+            queryset = search_model.get_queryset()
+
+        queryset = queryset.filter(pk__in=id_list)
+
+        self.index_documents(
+            document_list=[
+                (
+                    instance.pk, search_model.populate(
+                        backend=self, instance=instance
+                    )
+                ) for instance in queryset
+            ], search_model=search_model
+        )
+
+    def reset(self, search_model=None):
+        self.tear_down(search_model=search_model)
+        self.update_mappings(search_model=search_model)
+
+    def tear_down(self, search_model=None):
+        if search_model:
+            search_models = (search_model,)
+        else:
+            search_models = SearchModel.all()
+
+        with connection.cursor() as cursor:
+            for search_model in search_models:
+                cursor.execute(
+                    'DROP TABLE IF EXISTS {}'.format(
+                        self.get_table_name(search_model=search_model)
+                    )
+                )
+
+    def update_mappings(self, search_model=None):
+        if connection.vendor != 'postgresql':
+            raise DynamicSearchException(
+                'The PostgreSQL search backend requires a PostgreSQL '
+                'database.'
+            )
+
+        if search_model:
+            search_models = (search_model,)
+        else:
+            search_models = SearchModel.all()
+
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+            for search_model in search_models:
+                table_name = self.get_table_name(search_model=search_model)
+                index_prefix = '{}_{}'.format(
+                    self.table_prefix,
+                    search_model.get_full_name().replace('.', '_')
+                )
+
+                cursor.execute(
+                    'CREATE TABLE IF NOT EXISTS {} ('
+                    'object_id integer NOT NULL, '
+                    'field varchar(255) NOT NULL, '
+                    'content text NOT NULL, '
+                    'vector tsvector NULL, '
+                    'PRIMARY KEY (object_id, field))'.format(table_name)
+                )
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS {} ON {} USING gin '
+                    '(vector)'.format(
+                        connection.ops.quote_name(
+                            name='{}_vector'.format(index_prefix)
+                        ), table_name
+                    )
+                )
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS {} ON {} USING gin '
+                    '(content gin_trgm_ops) WHERE vector IS NULL'.format(
+                        connection.ops.quote_name(
+                            name='{}_content'.format(index_prefix)
+                        ), table_name
+                    )
+                )
@@ -220,8 +220,10 @@ class WhooshSearchBackend(SearchBackend):
             finally:
                 lock.release()
 
-    def index_instances(self, search_model, id_list):
-        queryset = search_model.get_queryset()
+    def index_instances(self, search_model, id_list, queryset=None):
+        if queryset is None:
+            queryset = search_model.get_queryset()
+
         queryset = queryset.filter(pk__in=id_list)
 
         try:
@@ -1,5 +1,6 @@
 import itertools
 import logging
+import threading
 
 from django.apps import apps
 from django.contrib.admin.utils import (
@@ -187,6 +188,9 @@ class SearchBackend:
                 entries = flatten_list(value=result)
 
                 for entry in entries:
+                    if not exclude_kwargs and SearchIndexingCoalescer.add_instance(instance=entry):
+                        continue
+
                     task_kwargs = {
                         'app_label': entry._meta.app_label,
                         'model_name': entry._meta.model_name,
@@ -216,6 +220,9 @@ class SearchBackend:
                     entries = flatten_list(value=result)
 
                     for entry in entries:
+                        if not exclude_kwargs and SearchIndexingCoalescer.add_instance(instance=entry):
+                            continue
+
                         task_kwargs = {
                             'app_label': entry._meta.app_label,
                             'model_name': entry._meta.model_name,
@@ -388,9 +395,11 @@ class SearchBackend:
         index.
         """
 
-    def index_instances(self, search_model, id_list=None):
+    def index_instances(self, search_model, id_list=None, queryset=None):
         """
         Optional method to add or update all instance of a model.
+        The instances are selected from `queryset`, which defaults to the
+        queryset of the search model.
         """
 
     def initialize(self):
@@ -561,6 +570,137 @@ class SearchField:
         return reverse_field_path(model=self.model, path=self.field)[1]
 
 
+class SearchIndexingCoalescer:
+    """
+    Context manager that gathers the index updates requested in the current
+    thread and queues them in bulk when the outermost context exits. An
+    instance saved several times is indexed only once and the many to many
+    changes of the same instance are merged into a single task.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def add_instance(cls, instance):
+        """
+        Add an instance to be indexed. Returns False if no context is
+        active and the caller must queue the instance itself.
+        """
+        if getattr(cls._local, 'depth', 0):
+            search_model = SearchModel.get_for_model(instance=instance)
+            cls._local.instances.setdefault(
+                search_model.get_full_name(), set()
+            ).add(instance.pk)
+            return True
+        else:
+            return False
+
+    @classmethod
+    def add_related_instance_m2m(cls, kwargs, through_model):
+        """
+        Add a many to many change to be indexed. Returns False if no
+        context is active and the caller must queue the change itself.
+        """
+        if getattr(cls._local, 'depth', 0):
+            key = (
+                get_class_full_name(klass=through_model), kwargs['action'],
+                kwargs['instance_app_label'], kwargs['instance_model_name'],
+                kwargs['instance_object_id'], kwargs['model_app_label'],
+                kwargs['model_model_name']
+            )
+            entry = cls._local.related_instances_m2m.setdefault(
+                key, dict(kwargs, pk_set=set())
+            )
+            entry['pk_set'].update(kwargs['pk_set'])
+            return True
+        else:
+            return False
+
+    def __enter__(self):
+        if not getattr(self._local, 'depth', 0):
+            self._local.depth = 0
+            self._local.instances = {}
+            self._local.related_instances_m2m = {}
+
+        self._local.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._local.depth -= 1
+
+        if not self._local.depth:
+            instances = self._local.instances
+            related_instances_m2m = self._local.related_instances_m2m
+            self._local.instances = {}
+            self._local.related_instances_m2m = {}
+
+            try:
+                self.flush(
+                    instances=instances,
+                    related_instances_m2m=related_instances_m2m
+                )
+            except Exception as exception:
+                # Don't turn a successful request into an error, queue the
+                # updates one by one as done outside of a context.
+                logger.error(
+                    'Unable to queue the bulk search index updates; %s. '
+                    'Queuing them individually.', exception, exc_info=True
+                )
+                self.flush_individually(
+                    instances=instances,
+                    related_instances_m2m=related_instances_m2m
+                )
+
+    def flush(self, instances, related_instances_m2m):
+        # Hidden import.
+        from .tasks import (
+            task_index_instances, task_index_related_instance_m2m
+        )
+
+        chunk_size = setting_indexing_chunk_size.value
+
+        for search_model_full_name, id_set in instances.items():
+            id_list = sorted(id_set)
+
+            for index in range(0, len(id_list), chunk_size):
+                # Use the default manager like task_index_instance, the
+                # search model queryset can exclude some of the instances.
+                task_index_instances.apply_async(
+                    kwargs={
+                        'id_list': id_list[index:index + chunk_size],
+                        'search_model_full_name': search_model_full_name,
+                        'use_default_manager': True
+                    }
+                )
+
+        for kwargs in related_instances_m2m.values():
+            task_index_related_instance_m2m.apply_async(
+                kwargs=dict(kwargs, pk_set=tuple(kwargs['pk_set']))
+            )
+
+    def flush_individually(self, instances, related_instances_m2m):
+        # Hidden import.
+        from .tasks import (
+            task_index_instance, task_index_related_instance_m2m
+        )
+
+        for search_model_full_name, id_set in instances.items():
+            model = SearchModel.get(name=search_model_full_name).model
+
+            for object_id in sorted(id_set):
+                task_index_instance.apply_async(
+                    kwargs={
+                        'app_label': model._meta.app_label,
+                        'model_name': model._meta.model_name,
+                        'object_id': object_id
+                    }
+                )
+
+        for kwargs in related_instances_m2m.values():
+            task_index_related_instance_m2m.apply_async(
+                kwargs=dict(kwargs, pk_set=tuple(kwargs['pk_set']))
+            )
+
+
 class SearchModel(AppsModuleLoaderMixin):
     _loader_module_name = 'search'
     _registry = {}
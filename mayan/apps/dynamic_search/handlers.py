@@ -3,7 +3,7 @@ from mayan.apps.common.utils import (
     ResolverPipelineModelAttribute, flatten_list
 )
 
-from .classes import SearchBackend
+from .classes import SearchBackend, SearchIndexingCoalescer
 from .tasks import (
     task_deindex_instance, task_index_instance,
     task_index_related_instance_m2m
@@ -64,13 +64,14 @@ def handler_factory_index_related_instance_save(reverse_field_path):
         entries = flatten_list(value=result)
 
         def call_task(instance):
-            task_index_instance.apply_async(
-                kwargs={
-                    'app_label': instance._meta.app_label,
-                    'model_name': instance._meta.model_name,
-                    'object_id': instance.pk
-                }
-            )
+            if not SearchIndexingCoalescer.add_instance(instance=instance):
+                task_index_instance.apply_async(
+                    kwargs={
+                        'app_label': instance._meta.app_label,
+                        'model_name': instance._meta.model_name,
+                        'object_id': instance.pk
+                    }
+                )
 
         if isinstance(entries, Iterable):
             for instance in entries:
@@ -106,23 +107,29 @@ def handler_factory_index_related_instance_m2m(data):
             'serialized_search_model_related_paths': serialized_search_model_related_paths
         }
 
-        task_index_related_instance_m2m.apply_async(
-            kwargs=kwargs
+        is_coalesced = SearchIndexingCoalescer.add_related_instance_m2m(
+            kwargs=kwargs, through_model=sender
         )
 
+        if not is_coalesced:
+            task_index_related_instance_m2m.apply_async(
+                kwargs=kwargs
+            )
+
     return handler_index_related_instance_m2m
 
 
 def handler_index_instance(sender, **kwargs):
     instance = kwargs['instance']
 
-    task_index_instance.apply_async(
-        kwargs={
-            'app_label': instance._meta.app_label,
-            'model_name': instance._meta.model_name,
-            'object_id': instance.pk
-        }
-    )
+    if not SearchIndexingCoalescer.add_instance(instance=instance):
+        task_index_instance.apply_async(
+            kwargs={
+                'app_label': instance._meta.app_label,
+                'model_name': instance._meta.model_name,
+                'object_id': instance.pk
+            }
+        )
 
 
 def handler_search_backend_initialize(sender, **kwargs):
@@ -0,0 +1,14 @@
+from ..classes import SearchIndexingCoalescer
+
+
+class SearchIndexingCoalescerMiddleware:
+    """
+    Index the instances changed during a request in bulk once the request
+    is processed, instead of queuing a task for each change.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with SearchIndexingCoalescer():
+            return self.get_response(request)
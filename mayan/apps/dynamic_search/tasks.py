@@ -5,7 +5,7 @@ from django.apps import apps
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
-from .classes import SearchBackend, SearchModel
+from .classes import SearchBackend, SearchIndexingCoalescer, SearchModel
 from .exceptions import DynamicSearchException, DynamicSearchRetry
 from .literals import (
     TASK_DEINDEX_INSTANCE_MAX_RETRIES,
@@ -94,13 +94,18 @@ def task_index_instance(
     max_retries=TASK_INDEX_INSTANCES_MAX_RETRIES, retry_backoff=True,
     retry_backoff_max=TASK_INDEX_INSTANCES_RETRY_BACKOFF_MAX
 )
-def task_index_instances(self, search_model_full_name, id_list):
+def task_index_instances(
+    self, search_model_full_name, id_list, use_default_manager=False
+):
     search_model = SearchModel.get(name=search_model_full_name)
 
     kwargs = {
         'id_list': id_list, 'search_model': search_model
     }
 
+    if use_default_manager:
+        kwargs['queryset'] = search_model.model._meta.default_manager.all()
+
     try:
         SearchBackend.get_instance().index_instances(**kwargs)
     except (DynamicSearchRetry, LockError) as exception:
@@ -144,10 +149,11 @@ def task_index_related_instance_m2m(
         )
         search_model_related_paths[DeserializedModel] = value
 
-    SearchBackend.index_related_instance_m2m(
-        action=action, instance=instance, model=Model, pk_set=pk_set,
-        search_model_related_paths=search_model_related_paths
-    )
+    with SearchIndexingCoalescer():
+        SearchBackend.index_related_instance_m2m(
+            action=action, instance=instance, model=Model, pk_set=pk_set,
+            search_model_related_paths=search_model_related_paths
+        )
 
 
 @app.task(ignore_result=True)
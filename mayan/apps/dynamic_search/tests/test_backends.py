@@ -1,6 +1,6 @@
-from unittest import skip
+from unittest import skip, skipIf
 
-from django.db import models
+from django.db import connection, models
 
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.documents.search import search_model_document
@@ -732,6 +732,63 @@ class ElasticSearchBackendDocumentSearchTestCase(
         self.assertTrue(self._test_documents[1] in queryset)
 
 
+@skipIf(
+    connection.vendor != 'postgresql',
+    'The PostgreSQL search backend requires a PostgreSQL database.'
+)
+class PostgreSQLSearchBackendDocumentSearchTestCase(
+    CommonBackendFunctionalityTestCaseMixin, DocumentTestMixin,
+    BaseTestCase
+):
+    _test_search_backend_path = 'mayan.apps.dynamic_search.backends.postgresql.PostgreSQLSearchBackend'
+    auto_upload_test_document = False
+
+    def test_full_text_rank(self):
+        self._create_test_document_stub(label='first_doc')
+        self._test_document.description = 'invoice'
+        self._test_document.save()
+        self._create_test_document_stub(label='second_doc')
+        self._test_document.description = 'invoice invoices invoice total'
+        self._test_document.save()
+
+        for test_document in self._test_documents:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+        queryset = self.search_backend.search(
+            search_model=search_model_document,
+            query={'description': 'invoice'}, user=self._test_case_user
+        )
+
+        self.assertEqual(
+            list(queryset), [self._test_documents[1], self._test_documents[0]]
+        )
+
+    def test_substring_field(self):
+        self._create_test_document_stub(label='P01208-06')
+        self._create_test_document_stub(label='P00025-06')
+
+        for test_document in self._test_documents:
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
+
+        queryset = self.search_backend.search(
+            search_model=search_model_document,
+            query={'label': '1208'}, user=self._test_case_user
+        )
+
+        self.assertEqual(list(queryset), [self._test_documents[0]])
+
+        queryset = self.search_backend.search(
+            search_model=search_model_document,
+            query={'label': 'P0'}, user=self._test_case_user
+        )
+
+        self.assertEqual(queryset.count(), 2)
+
+
 class WhooshSearchBackendDocumentSearchTestCase(
     CommonBackendFunctionalityTestCaseMixin, DocumentTestMixin,
     BaseTestCase
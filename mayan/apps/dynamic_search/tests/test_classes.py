@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.db import models
 
 from mayan.apps.documents.permissions import permission_document_view
@@ -6,12 +8,86 @@ from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
 from mayan.apps.tags.tests.mixins import TagTestMixin
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..classes import SearchModel
+from ..classes import SearchIndexingCoalescer, SearchModel
 from ..exceptions import DynamicSearchException
 
 from .mixins import SearchTestMixin
 
 
+class SearchIndexingCoalescerTestCase(SearchTestMixin, BaseTestCase):
+    auto_create_test_object_model = True
+    auto_create_test_object_fields = {
+        'test_field': models.CharField(max_length=8)
+    }
+
+    def _do_search(self, search_terms):
+        return self.search_backend.search(
+            search_model=self._test_model_search,
+            query={
+                'test_field': search_terms
+            }, user=self._test_case_user
+        )
+
+    def _setup_test_model_search(self):
+        self._test_model_search = SearchModel(
+            app_label=self.TestModel._meta.app_label,
+            model_name=self.TestModel._meta.model_name,
+        )
+        self._test_model_search.add_model_field(field='test_field')
+
+    @mock.patch('mayan.apps.dynamic_search.tasks.task_index_instance.apply_async')
+    @mock.patch('mayan.apps.dynamic_search.tasks.task_index_instances.apply_async')
+    def test_instance_coalescing(
+        self, mock_task_index_instances, mock_task_index_instance
+    ):
+        with SearchIndexingCoalescer():
+            self._create_test_object(instance_kwargs={'test_field': 'abc'})
+            self._test_object.save()
+
+            with SearchIndexingCoalescer():
+                self._test_object.save()
+
+            self.assertFalse(mock_task_index_instances.called)
+
+        self.assertFalse(mock_task_index_instance.called)
+        self.assertEqual(mock_task_index_instances.call_count, 1)
+        self.assertEqual(
+            mock_task_index_instances.call_args[1]['kwargs'], {
+                'id_list': [self._test_object.pk],
+                'search_model_full_name': self._test_model_search.get_full_name(),
+                'use_default_manager': True
+            }
+        )
+
+    @mock.patch('mayan.apps.dynamic_search.tasks.task_index_instance.apply_async')
+    @mock.patch('mayan.apps.dynamic_search.tasks.task_index_instances.apply_async')
+    def test_instance_coalescing_flush_error(
+        self, mock_task_index_instances, mock_task_index_instance
+    ):
+        mock_task_index_instances.side_effect = Exception
+
+        with SearchIndexingCoalescer():
+            self._create_test_object(instance_kwargs={'test_field': 'abc'})
+
+        self.assertEqual(mock_task_index_instance.call_count, 1)
+        self.assertEqual(
+            mock_task_index_instance.call_args[1]['kwargs'], {
+                'app_label': self.TestModel._meta.app_label,
+                'model_name': self.TestModel._meta.model_name,
+                'object_id': self._test_object.pk
+            }
+        )
+
+    def test_instance_indexing(self):
+        with SearchIndexingCoalescer():
+            self._create_test_object(instance_kwargs={'test_field': 'abc'})
+
+        queryset = self._do_search(
+            search_terms=self._test_object.test_field
+        )
+        self.assertTrue(self._test_object in queryset)
+
+
 class SearchModelTestCase(SearchTestMixin, BaseTestCase):
     def _setup_test_model_search(self):
         self._test_search_model = SearchModel(
@@ -1,10 +1,11 @@
 import csv
 import logging
+import threading
 
 from furl import furl
 
 from django.apps import apps
-from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.urls import reverse
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
@@ -19,7 +20,7 @@ from mayan.apps.common.utils import return_attrib
 from .literals import (
     DEFAULT_EVENT_LIST_EXPORT_FILENAME, EVENT_MANAGER_ORDER_AFTER,
     EVENT_TYPE_NAMESPACE_NAME, EVENT_EVENTS_CLEARED_NAME,
-    EVENT_EVENTS_EXPORTED_NAME
+    EVENT_EVENTS_EXPORTED_NAME, NOTIFICATION_BULK_BATCH_SIZE
 )
 from .links import (
     link_object_event_list, link_object_event_type_user_subscription_list
@@ -284,6 +285,66 @@ class EventModelRegistry:
                 )
 
 
+class EventNotificationCoalescer:
+    """
+    Context manager that gathers the actions committed in the current
+    thread and queues the creation of their notifications in a single task
+    when the outermost context exits. Outside of a context, a task is
+    queued for each action. The tasks are queued only after the current
+    transaction commits.
+    """
+    _local = threading.local()
+
+    @classmethod
+    def add_action(cls, action):
+        if getattr(cls._local, 'depth', 0):
+            cls._local.action_id_list.append(action.pk)
+        else:
+            cls.flush(action_id_list=(action.pk,))
+
+    @staticmethod
+    def flush(action_id_list):
+        """
+        Queue the tasks once the current transaction commits so that the
+        workers can read the actions. Outside of a transaction the tasks
+        are queued immediately.
+        """
+        # Hidden import.
+        from .tasks import task_event_notifications_create
+
+        action_id_list = list(action_id_list)
+
+        def queue_tasks():
+            for index in range(0, len(action_id_list), NOTIFICATION_BULK_BATCH_SIZE):
+                task_event_notifications_create.apply_async(
+                    kwargs={
+                        'action_id_list': action_id_list[
+                            index:index + NOTIFICATION_BULK_BATCH_SIZE
+                        ]
+                    }
+                )
+
+        transaction.on_commit(func=queue_tasks)
+
+    def __enter__(self):
+        if not getattr(self._local, 'depth', 0):
+            self._local.depth = 0
+            self._local.action_id_list = []
+
+        self._local.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._local.depth -= 1
+
+        if not self._local.depth:
+            action_id_list = self._local.action_id_list
+            self._local.action_id_list = []
+
+            if action_id_list:
+                self.flush(action_id_list=action_id_list)
+
+
 class EventTypeNamespace(AppsModuleLoaderMixin):
     _registry = {}
     _loader_module_name = 'events'
@@ -357,17 +418,6 @@ class EventType:
         return '{}: {}'.format(self.namespace.label, self.label)
 
     def commit(self, actor=None, action_object=None, target=None):
-        EventSubscription = apps.get_model(
-            app_label='events', model_name='EventSubscription'
-        )
-        Notification = apps.get_model(
-            app_label='events', model_name='Notification'
-        )
-        ObjectEventSubscription = apps.get_model(
-            app_label='events', model_name='ObjectEventSubscription'
-        )
-        User = get_user_model()
-
         if actor is None and target is None:
             # If the actor and the target are None there is no way to
             # create a new event.
@@ -384,47 +434,9 @@ class EventType:
         # The [0][1] means: get the first and only action from the list
         # and ignore the handler.
 
-        # Create notifications for the actions created by the event committed.
-
-        # Gather the users subscribed globally to the event.
-        user_queryset = User.objects.filter(
-            id__in=EventSubscription.objects.filter(
-                stored_event_type__name=result.verb
-            ).values('user')
-        )
-
-        # Gather the users subscribed to the target object event.
-        if result.target:
-            user_queryset = user_queryset | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.target_content_type,
-                    object_id=result.target.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
-            )
-
-        # Gather the users subscribed to the action object event.
-        if result.action_object:
-            user_queryset = user_queryset | User.objects.filter(
-                id__in=ObjectEventSubscription.objects.filter(
-                    content_type=result.action_object_content_type,
-                    object_id=result.action_object.pk,
-                    stored_event_type__name=result.verb
-                ).values('user')
-            )
-
-        for user in user_queryset:
-            if result.action_object:
-                Notification.objects.create(action=result, user=user)
-                # Don't check or add any other notification for the
-                # same user-event-object.
-                continue
-
-            if result.target:
-                Notification.objects.create(action=result, user=user)
-                # Don't check or add any other notification for the
-                # same user-event-object.
-                continue
+        # Create notifications for the actions created by the event
+        # committed outside of the current request or task.
+        EventNotificationCoalescer.add_action(action=result)
 
         return result
 
@@ -9,4 +9,6 @@ EVENT_TYPE_NAMESPACE_NAME = 'events'
 EVENT_EVENTS_CLEARED_NAME = 'event_cleared'
 EVENT_EVENTS_EXPORTED_NAME = 'event_exported'
 
+NOTIFICATION_BULK_BATCH_SIZE = 500
+
 TEXT_UNKNOWN_EVENT_ID = _('Unknown or obsolete event type: %s')
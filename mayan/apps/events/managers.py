@@ -1,6 +1,10 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
+from .literals import NOTIFICATION_BULK_BATCH_SIZE
+
 
 class EventSubscriptionManager(models.Manager):
     def create_for(self, stored_event_type, user):
@@ -15,6 +19,63 @@ class EventSubscriptionManager(models.Manager):
 
 
 class NotificationManager(models.Manager):
+    def create_for_actions(self, action_queryset):
+        """
+        Create the notifications of the users subscribed to the event type
+        of each action, globally or for the action's target or action
+        object.
+        """
+        EventSubscription = apps.get_model(
+            app_label='events', model_name='EventSubscription'
+        )
+        ObjectEventSubscription = apps.get_model(
+            app_label='events', model_name='ObjectEventSubscription'
+        )
+        User = get_user_model()
+
+        notifications = []
+
+        for action in action_queryset.iterator():
+            # Only actions with a target or an action object notify.
+            if not action.target_object_id and not action.action_object_object_id:
+                continue
+
+            # Gather the users subscribed globally to the event.
+            user_queryset = User.objects.filter(
+                id__in=EventSubscription.objects.filter(
+                    stored_event_type__name=action.verb
+                ).values('user')
+            )
+
+            # Gather the users subscribed to the target object event.
+            if action.target_object_id:
+                user_queryset = user_queryset | User.objects.filter(
+                    id__in=ObjectEventSubscription.objects.filter(
+                        content_type_id=action.target_content_type_id,
+                        object_id=action.target_object_id,
+                        stored_event_type__name=action.verb
+                    ).values('user')
+                )
+
+            # Gather the users subscribed to the action object event.
+            if action.action_object_object_id:
+                user_queryset = user_queryset | User.objects.filter(
+                    id__in=ObjectEventSubscription.objects.filter(
+                        content_type_id=action.action_object_content_type_id,
+                        object_id=action.action_object_object_id,
+                        stored_event_type__name=action.verb
+                    ).values('user')
+                )
+
+            for user_id in user_queryset.values_list('pk', flat=True):
+                notifications.append(
+                    self.model(action_id=action.pk, user_id=user_id)
+                )
+
+        return self.bulk_create(
+            batch_size=NOTIFICATION_BULK_BATCH_SIZE, objs=notifications
+        )
+
     def get_unread(self):
         return self.filter(read=False)
 
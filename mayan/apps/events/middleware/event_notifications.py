@@ -0,0 +1,14 @@
+from ..classes import EventNotificationCoalescer
+
+
+class EventNotificationCoalescerMiddleware:
+    """
+    Create the notifications of the events committed during a request
+    in a single task once the request is processed.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with EventNotificationCoalescer():
+            return self.get_response(request)
@@ -10,6 +10,20 @@ from .events import event_events_cleared
 from .permissions import permission_events_clear
 
 
+@app.task(ignore_result=True)
+def task_event_notifications_create(action_id_list):
+    Action = apps.get_model(app_label='actstream', model_name='Action')
+    Notification = apps.get_model(
+        app_label='events', model_name='Notification'
+    )
+
+    # The task is queued after the actions are committed. Missing actions
+    # were deleted in the meantime and are skipped.
+    action_queryset = Action.objects.filter(pk__in=action_id_list)
+
+    Notification.objects.create_for_actions(action_queryset=action_queryset)
+
+
 @app.task(ignore_result=True)
 def task_event_queryset_clear(
     decomposed_queryset, target_content_type_id=None, target_object_id=None,
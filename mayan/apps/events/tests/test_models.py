@@ -1,5 +1,8 @@
+from unittest import mock
+
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..classes import EventNotificationCoalescer
 from ..models import EventSubscription, ObjectEventSubscription
 
 from .mixins import (
@@ -26,7 +29,8 @@ class EventTypeNotificationModelTestCase(
     def test_event_type_notification_creation(self):
         test_notification_count = self._test_case_user.notifications.count()
 
-        self._create_test_event(target=self._test_object)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_test_event(target=self._test_object)
         self.assertEqual(
             self._test_case_user.notifications.count(),
             test_notification_count + 1
@@ -52,8 +56,81 @@ class ObjectEventNotificationModelTestCase(
     def test_object_notification_creation(self):
         test_notification_count = self._test_case_user.notifications.count()
 
-        self._create_test_event(target=self._test_object)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_test_event(target=self._test_object)
         self.assertEqual(
             self._test_case_user.notifications.count(),
             test_notification_count + 1
         )
+
+
+class EventNotificationCoalescerTestCase(
+    EventObjectTestMixin, EventTestMixin, EventTypeTestMixin,
+    NotificationTestMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+
+        self._create_test_event_type()
+        self._create_test_object_with_event_type_and_permission()
+        self._create_test_user()
+
+        for user in (self._test_case_user, self._test_user):
+            EventSubscription.objects.create(
+                stored_event_type=self._test_event_type.get_stored_event_type(),
+                user=user
+            )
+
+    @mock.patch('mayan.apps.events.tasks.task_event_notifications_create.apply_async')
+    def test_action_coalescing(self, mock_task_event_notifications_create):
+        with self.captureOnCommitCallbacks(execute=True):
+            with EventNotificationCoalescer():
+                self._create_test_event(target=self._test_object)
+
+                with EventNotificationCoalescer():
+                    self._create_test_event(target=self._test_object)
+
+                self.assertFalse(mock_task_event_notifications_create.called)
+
+        self.assertEqual(mock_task_event_notifications_create.call_count, 1)
+        self.assertEqual(
+            mock_task_event_notifications_create.call_args[1]['kwargs'], {
+                'action_id_list': [
+                    test_event.pk for test_event in self._test_events
+                ]
+            }
+        )
+
+    def test_notification_creation(self):
+        test_notification_count = self._test_user.notifications.count()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with EventNotificationCoalescer():
+                self._create_test_event(target=self._test_object)
+                self._create_test_event(target=self._test_object)
+
+                self.assertEqual(
+                    self._test_user.notifications.count(),
+                    test_notification_count
+                )
+
+        self.assertEqual(
+            self._test_user.notifications.count(),
+            test_notification_count + 2
+        )
+        self.assertEqual(
+            self._test_case_user.notifications.count(),
+            test_notification_count + 2
+        )
+
+    @mock.patch('mayan.apps.events.tasks.task_event_notifications_create.apply_async')
+    def test_action_queue_on_commit(self, mock_task_event_notifications_create):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._create_test_event(target=self._test_object)
+
+        self.assertFalse(mock_task_event_notifications_create.called)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(mock_task_event_notifications_create.call_count, 1)
@@ -1,2 +1,9 @@
+CACHE_PRUNE_BATCH_SIZE = 100
+
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_PRUNE_HIGH_WATERMARK = 90
+DEFAULT_PRUNE_LOW_WATERMARK = 75
+
+TASK_CACHES_PRUNE_INTERVAL = 60 * 10
+TASK_CACHES_TOTAL_SIZE_RECONCILE_INTERVAL = 60 * 60 * 24
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0010_cache_total_size')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachepartitionfile', name='pinned',
+            field=models.BooleanField(
+                db_index=True, default=False, help_text='Pinned files are '
+                'not evicted when the cache is pruned. They are deleted '
+                'along with their cache partition.', verbose_name='Pinned'
+            ),
+        ),
+    ]
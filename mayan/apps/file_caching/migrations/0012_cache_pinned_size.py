@@ -0,0 +1,39 @@
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def code_cache_pinned_size_update(apps, schema_editor):
+    Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    for cache in Cache.objects.using(alias=schema_editor.connection.alias).all():
+        cache.pinned_size = CachePartitionFile.objects.using(
+            alias=schema_editor.connection.alias
+        ).filter(partition__cache=cache, pinned=True).aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        cache.save(update_fields=('pinned_size',))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0011_cachepartitionfile_pinned')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache', name='pinned_size',
+            field=models.BigIntegerField(
+                default=0, editable=False, help_text='Size of the pinned '
+                'files of the cache in bytes. Pinned files are not part of '
+                'the size that triggers the pruning and are limited to the '
+                'maximum size on their own.', verbose_name='Pinned size'
+            ),
+        ),
+        migrations.RunPython(
+            code=code_cache_pinned_size_update,
+            reverse_code=migrations.RunPython.noop
+        )
+    ]
@@ -3,8 +3,9 @@ import logging
 
 from django.core import validators
 from django.core.files.base import ContentFile
-from django.db import models
-from django.db.models import F, Sum
+from django.db import models, transaction
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
 from django.utils.encoding import force_text
@@ -27,9 +28,10 @@ from .events import (
     event_cache_purged
 )
 from .exceptions import FileCachingException
+from .literals import CACHE_PRUNE_BATCH_SIZE
 from .settings import (
     setting_maximum_failed_prune_attempts,
-    setting_maximum_normal_prune_attempts
+    setting_maximum_normal_prune_attempts, setting_prune_low_watermark
 )
 
 logger = logging.getLogger(name=__name__)
@@ -46,6 +48,19 @@ class Cache(ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_('Maximum size')
     )
+    total_size = models.BigIntegerField(
+        default=0, editable=False, help_text=_(
+            'Total size of all the files of the cache in bytes. Updated '
+            'when files are created or deleted.'
+        ), verbose_name=_('Total size')
+    )
+    pinned_size = models.BigIntegerField(
+        default=0, editable=False, help_text=_(
+            'Size of the pinned files of the cache in bytes. Pinned files '
+            'are not part of the size that triggers the pruning and are '
+            'limited to the maximum size on their own.'
+        ), verbose_name=_('Pinned size')
+    )
 
     class Meta:
         ordering = ('id',)
@@ -81,13 +96,25 @@ class Cache(ValueChangeModelMixin, models.Model):
                 dotted_path='', label=_('Unknown'), name='unknown'
             )
 
+    def get_low_watermark_size(self):
+        return self.maximum_size * setting_prune_low_watermark.value / 100
+
+    def get_prunable_size(self):
+        """
+        Return the size of the files that can be evicted, which excludes
+        the pinned files.
+        """
+        return Cache.objects.filter(pk=self.pk).annotate(
+            prunable_size=F('total_size') - F('pinned_size')
+        ).values_list('prunable_size', flat=True).first() or 0
+
     def get_total_size(self):
         """
-        Return the actual usage of the cache.
+        Return the actual usage of the cache from the maintained counter.
         """
-        return self.get_files().aggregate(
-            file_size__sum=Sum('file_size')
-        )['file_size__sum'] or 0
+        return Cache.objects.filter(pk=self.pk).values_list(
+            'total_size', flat=True
+        ).first() or 0
 
     def get_total_size_display(self):
         return format_lazy(
@@ -102,54 +129,124 @@ class Cache(ValueChangeModelMixin, models.Model):
     def label(self):
         return self.get_defined_storage().label
 
-    def prune(self):
+    def prune(self, threshold_size=None):
         """
-        Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        Evict files when the total size of the cache reaches the threshold
+        size, the maximum size of the cache by default. Files are evicted
+        in batches, least used and oldest first, until the total size is
+        below the low watermark. Pinned files are not counted and are
+        never evicted. Files locked by other processes are skipped. Returns
+        the number of files deleted.
         """
-        failed_attempts = 0
-        normal_attempts = 0
-        file_index = 0
+        if threshold_size is None:
+            threshold_size = self.maximum_size
 
-        while self.get_total_size() >= self.maximum_size:
-            cache_partition_file_queryset = self.get_files().order_by(
-                'hits', 'datetime'
-            )
+        total_size = self.get_prunable_size()
+
+        if total_size < threshold_size:
+            return 0
 
+        target_size = self.get_low_watermark_size()
+
+        deleted_count = 0
+        failed_attempts = 0
+        normal_attempts = 0
+        skipped_id_list = []
+
+        while total_size >= target_size:
+            queryset = self.get_files().filter(pinned=False).exclude(
+                pk__in=skipped_id_list
+            ).order_by('hits', 'datetime').values_list(
+                'pk', 'file_size', 'filename', 'partition_id',
+                'partition__name'
+            )[:CACHE_PRUNE_BATCH_SIZE]
+
+            batch = []
+            batch_size = 0
+            for entry in queryset:
+                batch.append(entry)
+                batch_size += entry[1]
+
+                if total_size - batch_size < target_size:
+                    break
+
+            if not batch:
+                # Only locked files remain.
+                break
+
+            locks = []
             try:
-                cache_partition_file = cache_partition_file_queryset[file_index]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-            else:
-                try:
-                    cache_partition_file.delete()
-                except CachePartitionFile.DoesNotExist:
-                    # The file selected from deletion was deleted by another
-                    # process before the lock was acquired.
-                    file_index += 1
-                except LockError:
-                    logger.debug(
-                        'Lock error trying to delete file "%s" for prune. '
-                        'Skipping and attempting next file.',
-                        cache_partition_file
+                locked_entry_list = []
+
+                for entry in batch:
+                    pk, file_size, filename, partition_id, partition_name = entry
+                    try:
+                        locks.append(
+                            LockingBackend.get_backend().acquire_lock(
+                                name=CachePartition.get_lock_name(
+                                    cache_id=self.pk,
+                                    filename=filename,
+                                    partition_id=partition_id
+                                )
+                            )
+                        )
+                    except LockError:
+                        logger.debug(
+                            'Lock error trying to delete file "%s" for '
+                            'prune. Skipping and attempting next file.',
+                            filename
+                        )
+                        skipped_id_list.append(pk)
+                        failed_attempts += 1
+                    else:
+                        locked_entry_list.append(entry)
+
+                with transaction.atomic():
+                    # Another prune could have deleted some of the files
+                    # after the batch was selected. Only the rows still
+                    # present are deleted and subtracted from the counter.
+                    deleted_id_list = list(
+                        CachePartitionFile.objects.select_for_update().filter(
+                            pinned=False,
+                            pk__in=[entry[0] for entry in locked_entry_list]
+                        ).values_list('pk', flat=True)
+                    )
+                    deleted_size = 0
+
+                    for pk, file_size, filename, partition_id, partition_name in locked_entry_list:
+                        if pk in deleted_id_list:
+                            self.storage.delete(
+                                name=CachePartition.get_combined_filename(
+                                    parent=partition_name, filename=filename
+                                )
+                            )
+                            deleted_size += file_size
+
+                    CachePartitionFile.objects.filter(
+                        pk__in=deleted_id_list
+                    ).delete()
+                    Cache.objects.filter(pk=self.pk).update(
+                        total_size=F('total_size') - deleted_size
                     )
-                    failed_attempts += 1
-                    file_index += 1
+            finally:
+                for lock in locks:
+                    lock.release()
 
-                    if failed_attempts > setting_maximum_failed_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prune attempts failed.'
-                        )
-                else:
-                    file_index = 0
-                    normal_attempts += 1
+            deleted_count += len(deleted_id_list)
+            total_size = self.get_prunable_size()
 
-                    if normal_attempts > setting_maximum_normal_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prunes trying to create a '
-                            'single new file.'
-                        )
+            if failed_attempts > setting_maximum_failed_prune_attempts.value:
+                raise FileCachingException(
+                    'Too many cache prune attempts failed.'
+                )
+
+            normal_attempts += 1
+            if normal_attempts > setting_maximum_normal_prune_attempts.value:
+                raise FileCachingException(
+                    'Too many cache prune batches trying to free up space.'
+                )
+
+        return deleted_count
 
     @method_event(
         event=event_cache_purged,
@@ -173,6 +270,8 @@ class Cache(ValueChangeModelMixin, models.Model):
                 partition._event_actor = getattr(self, '_event_actor', None)
                 partition.purge()
 
+            self.total_size_reconcile()
+
     @method_event(
         event_manager_class=EventManagerSave,
         created={
@@ -189,6 +288,16 @@ class Cache(ValueChangeModelMixin, models.Model):
             field='maximum_size'
         )
 
+        if not self._state.adding and 'update_fields' not in kwargs:
+            # Never overwrite the size counters with the values loaded in
+            # memory, they are updated atomically by the cache files.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in (
+                    'pinned_size', 'total_size'
+                )
+            ]
+
         result = super().save(*args, **kwargs)
 
         if self.maximum_size < old_maximum_size:
@@ -200,6 +309,33 @@ class Cache(ValueChangeModelMixin, models.Model):
     def storage(self):
         return self.get_defined_storage().get_storage_instance()
 
+    def total_size_reconcile(self):
+        """
+        Recalculate the total size and pinned size counters from the sizes
+        of the cache files.
+        """
+        queryset = CachePartitionFile.objects.filter(
+            partition__cache=OuterRef('pk')
+        )
+
+        Cache.objects.filter(pk=self.pk).update(
+            pinned_size=Coalesce(
+                Subquery(
+                    queryset.filter(pinned=True).values(
+                        'partition__cache'
+                    ).annotate(
+                        file_size__sum=Sum('file_size')
+                    ).values('file_size__sum')
+                ), 0
+            ), total_size=Coalesce(
+                Subquery(
+                    queryset.values('partition__cache').annotate(
+                        file_size__sum=Sum('file_size')
+                    ).values('file_size__sum')
+                ), 0
+            )
+        )
+
 
 class CachePartition(models.Model):
     cache = models.ForeignKey(
@@ -219,6 +355,12 @@ class CachePartition(models.Model):
     def get_combined_filename(parent, filename):
         return '{}-{}'.format(parent, filename)
 
+    @staticmethod
+    def get_lock_name(cache_id, partition_id, filename):
+        return 'cache_partition-file-{}-{}-{}'.format(
+            cache_id, partition_id, filename
+        )
+
     def _lock_manager_get_lock_name(self, filename):
         return self.get_file_lock_name(filename=filename)
 
@@ -289,8 +431,8 @@ class CachePartition(models.Model):
         return self.files.get(filename=filename)
 
     def get_file_lock_name(self, filename):
-        return 'cache_partition-file-{}-{}-{}'.format(
-            self.cache.pk, self.pk, filename
+        return CachePartition.get_lock_name(
+            cache_id=self.cache_id, filename=filename, partition_id=self.pk
         )
 
     def get_full_filename(self, filename):
@@ -343,6 +485,12 @@ class CachePartitionFile(models.Model):
             'Times this cache partition file has been accessed.'
         ), verbose_name='Hits'
     )
+    pinned = models.BooleanField(
+        db_index=True, default=False, help_text=_(
+            'Pinned files are not evicted when the cache is pruned. They '
+            'are deleted along with their cache partition.'
+        ), verbose_name=_('Pinned')
+    )
 
     class Meta:
         get_latest_by = 'datetime'
@@ -376,10 +524,14 @@ class CachePartitionFile(models.Model):
         """
         Called after creation and initial write only.
         """
+        file_size_previous = self.file_size
         self.file_size = self.partition.cache.storage.size(
             name=self.full_filename
         )
         self.save(update_fields=('file_size',))
+        Cache.objects.filter(pk=self.partition.cache_id).update(
+            total_size=F('total_size') + self.file_size - file_size_previous
+        )
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -395,7 +547,18 @@ class CachePartitionFile(models.Model):
     @locked_class_method
     def delete(self, *args, **kwargs):
         self.partition.cache.storage.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+        pinned = CachePartitionFile.objects.filter(pk=self.pk).values_list(
+            'pinned', flat=True
+        ).first()
+        result = super().delete(*args, **kwargs)
+        # Only subtract the size if the row was still present.
+        if result[0]:
+            Cache.objects.filter(pk=self.partition.cache_id).update(
+                pinned_size=F('pinned_size') - (
+                    self.file_size if pinned else 0
+                ), total_size=F('total_size') - self.file_size
+            )
+        return result
 
     @cached_property
     def full_filename(self):
@@ -403,6 +566,39 @@ class CachePartitionFile(models.Model):
             parent=self.partition.name, filename=self.filename
         )
 
+    @locked_class_method
+    def pin(self):
+        """
+        Exclude the file from the cache pruning. The pinned files of a
+        cache are limited to its maximum size, the file is left unpinned
+        when it would exceed it. Returns True if the file is pinned.
+        """
+        with transaction.atomic():
+            cache = Cache.objects.select_for_update().get(
+                pk=self.partition.cache_id
+            )
+            file_size, pinned = CachePartitionFile.objects.filter(
+                pk=self.pk
+            ).values_list('file_size', 'pinned').get()
+
+            if pinned:
+                return True
+
+            if cache.pinned_size + file_size > cache.maximum_size:
+                logger.debug(
+                    'Pinned files of cache "%s" would exceed its maximum '
+                    'size. Not pinning file "%s".', cache, self.filename
+                )
+                return False
+
+            CachePartitionFile.objects.filter(pk=self.pk).update(pinned=True)
+            Cache.objects.filter(pk=cache.pk).update(
+                pinned_size=F('pinned_size') + file_size
+            )
+            self.pinned = True
+
+            return True
+
     @contextmanager
     def open(self):
         """
@@ -1,9 +1,15 @@
+from datetime import timedelta
+
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.queues import queue_tools
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_b
 
+from .literals import (
+    TASK_CACHES_PRUNE_INTERVAL, TASK_CACHES_TOTAL_SIZE_RECONCILE_INTERVAL
+)
+
 queue_file_caching = CeleryQueue(
     name='file_caching', label=_('File caching'), worker=worker_b
 )
@@ -12,6 +18,17 @@ queue_file_caching.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_partition_purge',
     label=_('Purge a file cache partition')
 )
+queue_file_caching.add_task_type(
+    dotted_path='mayan.apps.file_caching.tasks.task_caches_prune',
+    label=_('Prune the file caches'), name='task_caches_prune',
+    schedule=timedelta(seconds=TASK_CACHES_PRUNE_INTERVAL)
+)
+queue_file_caching.add_task_type(
+    dotted_path='mayan.apps.file_caching.tasks.task_caches_total_size_reconcile',
+    label=_('Reconcile the file caches total size'),
+    name='task_caches_total_size_reconcile',
+    schedule=timedelta(seconds=TASK_CACHES_TOTAL_SIZE_RECONCILE_INTERVAL)
+)
 
 queue_tools.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_purge',
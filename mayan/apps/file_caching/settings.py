@@ -4,7 +4,8 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS, DEFAULT_PRUNE_HIGH_WATERMARK,
+    DEFAULT_PRUNE_LOW_WATERMARK
 )
 
 namespace = SettingNamespace(label=_('File caching'), name='file_caching')
@@ -24,3 +25,17 @@ setting_maximum_normal_prune_attempts = namespace.add_setting(
         'space for new a file being requested, before giving up.'
     )
 )
+setting_prune_high_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_HIGH_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_HIGH_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache at which the periodic '
+        'prune task will start deleting files in the background.'
+    )
+)
+setting_prune_low_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_LOW_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_LOW_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache to which files will be '
+        'deleted once a cache prune starts.'
+    )
+)
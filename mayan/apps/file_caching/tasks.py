@@ -6,6 +6,9 @@ from django.contrib.auth import get_user_model
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .exceptions import FileCachingException
+from .settings import setting_prune_high_watermark
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -69,3 +72,33 @@ def task_cache_purge(self, cache_id, user_id=None):
         raise self.retry(exc=exception)
     else:
         logger.info('Finished cache id %s purge', cache)
+
+
+@app.task(bind=True, ignore_result=True)
+def task_caches_prune(self):
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    for cache in Cache.objects.all():
+        logger.debug('Starting cache id %s prune', cache.pk)
+        try:
+            cache.prune(
+                threshold_size=cache.maximum_size * setting_prune_high_watermark.value / 100
+            )
+        except FileCachingException as exception:
+            logger.warning(
+                'Unable to prune cache id %s; %s', cache.pk, exception
+            )
+        else:
+            logger.debug('Finished cache id %s prune', cache.pk)
+
+
+@app.task(ignore_result=True)
+def task_caches_total_size_reconcile():
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    for cache in Cache.objects.all():
+        cache.total_size_reconcile()
@@ -4,7 +4,10 @@ from mayan.apps.storage.classes import DefinedStorage
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
 from ..models import Cache
-from ..tasks import task_cache_partition_purge, task_cache_purge
+from ..tasks import (
+    task_cache_partition_purge, task_cache_purge, task_caches_prune,
+    task_caches_total_size_reconcile
+)
 
 from .literals import (
     TEST_CACHE_MAXIMUM_SIZE, TEST_CACHE_PARTITION_FILE_FILENAME,
@@ -113,3 +116,9 @@ class FileCachingTaskTestMixin:
                 'cache_id': self._test_cache.pk
             }
         ).get()
+
+    def _execute_task_caches_prune(self):
+        task_caches_prune.apply_async().get()
+
+    def _execute_task_caches_total_size_reconcile(self):
+        task_caches_total_size_reconcile.apply_async().get()
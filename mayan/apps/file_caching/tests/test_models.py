@@ -4,7 +4,7 @@ from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..exceptions import FileCachingException
-from ..models import CachePartitionFile
+from ..models import Cache, CachePartition, CachePartitionFile
 
 from .literals import TEST_CACHE_PARTITION_FILE_FILENAME
 from .mixins import CacheTestMixin
@@ -92,6 +92,73 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             )
         )
 
+    def test_cache_total_size(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=2)
+        self._create_test_cache_partition_file(file_size=3)
+
+        self.assertEqual(self._test_cache.get_total_size(), 5)
+
+        self._test_cache_partition_files[0].delete()
+
+        self.assertEqual(self._test_cache.get_total_size(), 3)
+
+    def test_cache_total_size_save(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=2)
+
+        # Instance loaded before the counter changed must not overwrite it.
+        self._test_cache.total_size = 0
+        self._test_cache.save()
+
+        self.assertEqual(self._test_cache.get_total_size(), 2)
+
+    def test_cache_total_size_reconcile(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=2)
+
+        self._test_cache_partition_file.pin()
+
+        Cache.objects.filter(pk=self._test_cache.pk).update(
+            pinned_size=100, total_size=100
+        )
+
+        self._test_cache.total_size_reconcile()
+
+        self.assertEqual(self._test_cache.get_total_size(), 2)
+        self._test_cache.refresh_from_db()
+        self.assertEqual(self._test_cache.pinned_size, 2)
+
+    def test_cache_prune_concurrent_delete(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 4
+            }
+        )
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=3)
+        self._create_test_cache_partition_file(file_size=3)
+
+        get_lock_name = CachePartition.get_lock_name
+        deleted = []
+
+        def side_effect(**kwargs):
+            # Another process deletes the first file after the prune
+            # selected its batch.
+            if not deleted:
+                deleted.append(True)
+                self._test_cache_partition_files[0].delete()
+            return get_lock_name(**kwargs)
+
+        with mock.patch.object(CachePartition, 'get_lock_name', side_effect=side_effect):
+            self._test_cache.prune()
+
+        self.assertEqual(CachePartitionFile.objects.count(), 0)
+        self.assertEqual(self._test_cache.get_total_size(), 0)
+
     def test_cache_partition_file_hits(self):
         self._create_test_cache()
         self._create_test_cache_partition()
@@ -133,6 +200,78 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             self._test_cache_partition_files[1] not in CachePartitionFile.objects.all()
         )
 
+    def test_cache_partition_file_low_watermark_eviction(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 10
+            }
+        )
+
+        self._create_test_cache_partition()
+        for index in range(11):
+            self._create_test_cache_partition_file(file_size=1)
+
+        # Reaching the maximum size evicts files down to below the 75% low
+        # watermark in a single pass: 3 files evicted, then the new file
+        # is added.
+        self.assertEqual(CachePartitionFile.objects.count(), 8)
+        self.assertEqual(self._test_cache.get_total_size(), 8)
+        self.assertTrue(
+            self._test_cache_partition_files[-1] in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self._test_cache_partition_files[0] not in CachePartitionFile.objects.all()
+        )
+
+    def test_cache_partition_file_pinned_eviction(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 2
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self.assertTrue(self._test_cache_partition_file.pin())
+
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        # The pinned file is not part of the size that triggers the prune.
+        self.assertEqual(CachePartitionFile.objects.count(), 3)
+
+        self._create_test_cache_partition_file(file_size=1)
+
+        # The pinned file is older and has the same hits but was kept.
+        self.assertTrue(
+            self._test_cache_partition_files[0] in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self._test_cache_partition_files[1] not in CachePartitionFile.objects.all()
+        )
+
+    def test_cache_partition_file_pinned_maximum_size(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 2
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=2)
+        self.assertTrue(self._test_cache_partition_file.pin())
+
+        self._create_test_cache_partition_file(file_size=1)
+        self.assertFalse(self._test_cache_partition_file.pin())
+
+        self._test_cache.refresh_from_db()
+        self.assertEqual(self._test_cache.pinned_size, 2)
+
+        self._test_cache_partition_files[0].delete()
+
+        self._test_cache.refresh_from_db()
+        self.assertEqual(self._test_cache.pinned_size, 0)
+
     def test_cache_partition_file_size_protection(self):
         self._create_test_cache(
             extra_data={
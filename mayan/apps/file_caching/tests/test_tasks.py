@@ -1,6 +1,7 @@
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..events import event_cache_partition_purged, event_cache_purged
+from ..models import Cache
 
 from .mixins import CacheTestMixin, FileCachingTaskTestMixin
 
@@ -48,3 +49,34 @@ class FileCachingTaskTestCase(
         self.assertEqual(events[1].actor, self._test_cache)
         self.assertEqual(events[1].target, self._test_cache)
         self.assertEqual(events[1].verb, event_cache_purged.id)
+
+    def test_task_caches_prune(self):
+        self._test_cache.maximum_size = 10
+        self._test_cache.save()
+
+        for index in range(8):
+            self._create_test_cache_partition_file(file_size=1)
+
+        self._clear_events()
+
+        # Cache is at 90%, the default high watermark.
+        self._execute_task_caches_prune()
+
+        self.assertTrue(self._test_cache.get_total_size() < 10 * 0.9)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_task_caches_total_size_reconcile(self):
+        cache_total_size = self._test_cache.get_total_size()
+
+        Cache.objects.filter(pk=self._test_cache.pk).update(total_size=0)
+
+        self._clear_events()
+
+        self._execute_task_caches_total_size_reconcile()
+
+        self.assertEqual(self._test_cache.get_total_size(), cache_total_size)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
@@ -1,10 +1,13 @@
 from django.apps import apps
-from django.db.models.signals import pre_delete, pre_save
+from django.db.models.signals import m2m_changed, pre_delete, pre_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
 
-from .handlers import handler_document_cache_delete, handler_node_cache_delete
+from .handlers import (
+    handler_document_cache_delete, handler_node_cache_delete,
+    handler_node_documents_cache_delete
+)
 
 
 class MirroringApp(MayanAppConfig):
@@ -22,6 +25,11 @@ class MirroringApp(MayanAppConfig):
             app_label='document_indexing', model_name='IndexInstanceNode'
         )
 
+        m2m_changed.connect(
+            handler_node_documents_cache_delete,
+            dispatch_uid='mirroring_handler_node_documents_cache_delete',
+            sender=IndexInstanceNode.documents.through
+        )
         pre_delete.connect(
             handler_document_cache_delete,
             dispatch_uid='mirroring_handler_document_cache_delete',
@@ -1,18 +1,147 @@
+from collections import OrderedDict
 import hashlib
+import os
+import shutil
+import tempfile
 
 from django.core.cache import caches
 from django.utils.encoding import force_bytes
 
+from mayan.apps.storage.utils import fs_cleanup, mkdtemp
+
 from .settings import (
     setting_document_lookup_cache_timeout, setting_node_lookup_cache_timeout
 )
 
 
+class MirrorFileBlockCache:
+    """
+    In memory LRU cache of fixed size blocks of the decoded content of the
+    document files served by the mirror.
+    """
+    def __init__(self, block_size, maximum_size):
+        self.block_size = block_size
+        self.blocks = OrderedDict()
+        self.maximum_size = maximum_size
+        self.size = 0
+
+    def get(self, key, index):
+        try:
+            self.blocks.move_to_end(key=(key, index))
+        except KeyError:
+            return None
+        else:
+            return self.blocks[(key, index)]
+
+    def set(self, key, index, data):
+        previous = self.blocks.pop((key, index), None)
+        if previous is not None:
+            self.size -= len(previous)
+
+        self.blocks[(key, index)] = data
+        self.size += len(data)
+
+        while self.size > self.maximum_size and self.blocks:
+            evicted_key, evicted_data = self.blocks.popitem(last=False)
+            self.size -= len(evicted_data)
+
+
+class MirrorFileSpillCache:
+    """
+    Local copies of the decoded content of the document files served by
+    the mirror. Files are evicted in least recently used order when the
+    total size exceeds the maximum. Without a path, a temporary directory
+    is created on first use and removed by `destroy`.
+    """
+    def __init__(self, maximum_size, path=None):
+        self.entries = OrderedDict()
+        self.maximum_size = maximum_size
+        self.path = path
+        self.size = 0
+        self.temporary = not path
+
+        if path:
+            os.makedirs(name=path, exist_ok=True)
+
+            # Keep the copies left by a previous mount, the oldest first.
+            entries = sorted(
+                (entry.stat().st_atime, entry.name, entry.stat().st_size)
+                for entry in os.scandir(path) if entry.is_file()
+            )
+            for atime, name, size in entries:
+                self.entries[name] = size
+                self.size += size
+
+            self.prune()
+
+    def destroy(self):
+        if self.temporary and self.path:
+            fs_cleanup(filename=self.path)
+            self.entries.clear()
+            self.path = None
+            self.size = 0
+
+    def get(self, key):
+        """
+        Return the path of the local copy of the key or None.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key=key)
+            return os.path.join(self.path, key)
+
+    def prune(self):
+        while self.size > self.maximum_size and self.entries:
+            key, size = self.entries.popitem(last=False)
+            self.size -= size
+            fs_cleanup(filename=os.path.join(self.path, key))
+
+    def set(self, key, file_object):
+        """
+        Copy the content of the file object and return the path of the
+        local copy.
+        """
+        if not self.path:
+            self.path = mkdtemp()
+
+        with tempfile.NamedTemporaryFile(delete=False, dir=self.path) as temporary_file_object:
+            shutil.copyfileobj(fsrc=file_object, fdst=temporary_file_object)
+
+        size = os.path.getsize(temporary_file_object.name)
+
+        if size > self.maximum_size:
+            fs_cleanup(filename=temporary_file_object.name)
+            return None
+
+        path = os.path.join(self.path, key)
+        os.rename(temporary_file_object.name, path)
+
+        if key in self.entries:
+            self.size -= self.entries[key]
+
+        self.entries[key] = size
+        self.size += size
+        self.prune()
+
+        return path
+
+
 class MirrorFilesystemCache:
     @staticmethod
     def get_key_hash(key):
         return hashlib.sha256(force_bytes(s=key)).hexdigest()
 
+    @staticmethod
+    def get_attributes_key(path):
+        return MirrorFilesystemCache.get_key_hash(
+            key='attributes_{}'.format(path)
+        )
+
+    @staticmethod
+    def get_directory_key(path):
+        return MirrorFilesystemCache.get_key_hash(
+            key='directory_{}'.format(path)
+        )
+
     @staticmethod
     def get_document_key(document):
         return MirrorFilesystemCache.get_key_hash(
@@ -58,8 +187,22 @@ class MirrorFilesystemCache:
         self.cache.delete(key=document_key)
 
     def clean_path(self, path):
-        self.cache.delete(
-            key=MirrorFilesystemCache.get_path_key(path=path)
+        self.cache.delete_many(
+            keys=(
+                MirrorFilesystemCache.get_attributes_key(path=path),
+                MirrorFilesystemCache.get_directory_key(path=path),
+                MirrorFilesystemCache.get_path_key(path=path)
+            )
+        )
+
+    def get_attributes(self, path):
+        return self.cache.get(
+            key=MirrorFilesystemCache.get_attributes_key(path=path)
+        )
+
+    def get_directory(self, path):
+        return self.cache.get(
+            key=MirrorFilesystemCache.get_directory_key(path=path)
         )
 
     def get_path(self, path):
@@ -67,6 +210,27 @@ class MirrorFilesystemCache:
             key=MirrorFilesystemCache.get_path_key(path=path)
         )
 
+    def set_attributes(self, path, attributes, timeout):
+        self.cache.set(
+            key=MirrorFilesystemCache.get_attributes_key(path=path),
+            value=attributes, timeout=timeout
+        )
+
+    def set_directory(self, path, node, entries):
+        """
+        Store the directory entries of a node. The node key is updated to
+        allow invalidating the entries when the node changes.
+        """
+        self.cache.set(
+            key=MirrorFilesystemCache.get_directory_key(path=path),
+            value=entries, timeout=setting_node_lookup_cache_timeout.value
+        )
+        self.cache.set(
+            key=MirrorFilesystemCache.get_node_key(node=node),
+            value={'path': path},
+            timeout=setting_node_lookup_cache_timeout.value
+        )
+
     def set_path(self, path, document=None, node=None):
         # Must provide a document_pk or a node_pk
         # not both.
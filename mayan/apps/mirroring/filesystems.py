@@ -1,6 +1,7 @@
 import datetime
 from errno import ENOENT
 import logging
+import os
 from stat import S_IFDIR, S_IFREG
 from time import time
 
@@ -13,11 +14,19 @@ from django.db.models import (
 from django.db.models.functions import Concat
 
 from mayan.apps.documents.models import Document
+from mayan.apps.storage.utils import get_file_object_path
 
+from .caches import MirrorFileBlockCache, MirrorFileSpillCache
 from .literals import (
-    MAX_FILE_DESCRIPTOR, MIN_FILE_DESCRIPTOR, FILE_MODE, DIRECTORY_MODE
+    MAX_FILE_DESCRIPTOR, MIN_FILE_DESCRIPTOR, FILE_MODE, DIRECTORY_MODE,
+    READ_AHEAD_MAXIMUM_BLOCKS, READ_BLOCK_SIZE
 )
 from .runtime import cache
+from .settings import (
+    setting_block_cache_maximum_size, setting_document_lookup_cache_timeout,
+    setting_node_lookup_cache_timeout, setting_spill_cache_maximum_size,
+    setting_spill_cache_path
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -27,6 +36,115 @@ class Trim(Transform):
     lookup_name = 'trim'
 
 
+class MirrorFileHandle:
+    """
+    Open document file of the mirror. Document files stored as local files
+    are read directly. Other document files are copied once to the spill
+    cache when they fit, otherwise they are read in blocks kept in the
+    block cache, reading ahead when the access is sequential.
+    """
+    def __init__(self, document_file, block_cache, spill_cache):
+        self.block_cache = block_cache
+        self.file_descriptor = None
+        self.key = 'document_file-{}'.format(document_file.pk)
+        self.offset_next = None
+        self.read_ahead = 0
+        self.source_file_object = document_file.open()
+
+        path = get_file_object_path(file_object=self.source_file_object)
+
+        if not path and spill_cache.maximum_size:
+            path = spill_cache.get(key=self.key)
+
+            if not path and (document_file.size or 0) <= spill_cache.maximum_size:
+                path = spill_cache.set(
+                    key=self.key, file_object=self.source_file_object
+                )
+
+        if path:
+            self.file_descriptor = os.open(path, os.O_RDONLY)
+            self.source_file_object.close()
+            self.source_file_object = None
+
+    def _read_blocks(self, index_first, index_last):
+        """
+        Read the blocks from the source file object. Seek only when the
+        source is not already positioned at the first block, to avoid
+        restarting the decoding of the content.
+        """
+        offset = index_first * self.block_cache.block_size
+
+        if self.source_file_object.tell() != offset:
+            self.source_file_object.seek(offset)
+
+        data = self.source_file_object.read(
+            (index_last - index_first + 1) * self.block_cache.block_size
+        )
+
+        for index in range(index_first, index_last + 1):
+            start = (index - index_first) * self.block_cache.block_size
+            block = data[start:start + self.block_cache.block_size]
+            self.block_cache.set(key=self.key, index=index, data=block)
+
+            if len(block) < self.block_cache.block_size:
+                # End of file.
+                break
+
+    def close(self):
+        if self.file_descriptor is not None:
+            os.close(self.file_descriptor)
+            self.file_descriptor = None
+
+        if self.source_file_object is not None:
+            self.source_file_object.close()
+            self.source_file_object = None
+
+    def read(self, size, offset):
+        if self.file_descriptor is not None:
+            if size < 0:
+                size = max(os.fstat(self.file_descriptor).st_size - offset, 0)
+
+            return os.pread(self.file_descriptor, size, offset)
+
+        if size < 0:
+            self.source_file_object.seek(offset)
+            return self.source_file_object.read()
+
+        if offset == self.offset_next:
+            self.read_ahead = min(
+                max(self.read_ahead * 2, 1), READ_AHEAD_MAXIMUM_BLOCKS
+            )
+        else:
+            self.read_ahead = 0
+
+        self.offset_next = offset + size
+
+        block_size = self.block_cache.block_size
+        index_first = offset // block_size
+        index_last = (offset + size - 1) // block_size
+
+        result = []
+        for index in range(index_first, index_last + 1):
+            block = self.block_cache.get(key=self.key, index=index)
+            if block is None:
+                self._read_blocks(
+                    index_first=index,
+                    index_last=index_last + self.read_ahead
+                )
+                block = self.block_cache.get(key=self.key, index=index)
+
+            if not block:
+                break
+
+            result.append(block)
+
+            if len(block) < block_size:
+                break
+
+        start = offset - index_first * block_size
+        return b''.join(result)[start:start + size]
+
+
 class MirrorFilesystem(LoggingMixIn, Operations):
     @staticmethod
     def _clean_queryset(queryset, source_field_name, destination_field_name):
@@ -205,6 +323,15 @@ class MirrorFilesystem(LoggingMixIn, Operations):
         self.func_document_container_node = func_document_container_node
         self.node_text_attribute = node_text_attribute
 
+        self.block_cache = MirrorFileBlockCache(
+            block_size=READ_BLOCK_SIZE,
+            maximum_size=setting_block_cache_maximum_size.value
+        )
+        self.spill_cache = MirrorFileSpillCache(
+            maximum_size=setting_spill_cache_maximum_size.value,
+            path=setting_spill_cache_path.value
+        )
+
     def access(self, path, fh=None):
         result = self._path_to_node(
             path=path, access_only=True, directory_only=False
@@ -213,10 +340,24 @@ class MirrorFilesystem(LoggingMixIn, Operations):
         if not result:
             raise FuseOSError(ENOENT)
 
+    def destroy(self, path):
+        for file_handle in self.file_descriptors.values():
+            if file_handle:
+                file_handle.close()
+
+        self.file_descriptors.clear()
+        self.spill_cache.destroy()
+
     def getattr(self, path, fh=None):
         logger.debug('path: %s, fh: %s', path, fh)
 
         now = time()
+
+        function_result = cache.get_attributes(path=path)
+        if function_result:
+            function_result['st_atime'] = now
+            return function_result
+
         result = self._path_to_node(path=path, directory_only=False)
 
         if not result:
@@ -238,11 +379,17 @@ class MirrorFilesystem(LoggingMixIn, Operations):
                 'st_size': result.file_latest.size or 0,
                 'st_nlink': 1
             }
+            timeout = setting_document_lookup_cache_timeout.value
         else:
             function_result = {
                 'st_mode': (S_IFDIR | DIRECTORY_MODE), 'st_ctime': now,
                 'st_mtime': now, 'st_atime': now, 'st_nlink': 2
             }
+            timeout = setting_node_lookup_cache_timeout.value
+
+        cache.set_attributes(
+            attributes=function_result, path=path, timeout=timeout
+        )
 
         logger.debug('function_result: %s', function_result)
         return function_result
@@ -252,45 +399,55 @@ class MirrorFilesystem(LoggingMixIn, Operations):
 
         if isinstance(result, Document):
             next_file_descriptor = self._get_next_file_descriptor()
-            self.file_descriptors[next_file_descriptor] = result.file_latest.open()
+            self.file_descriptors[next_file_descriptor] = MirrorFileHandle(
+                block_cache=self.block_cache,
+                document_file=result.file_latest,
+                spill_cache=self.spill_cache
+            )
             return next_file_descriptor
         else:
             raise FuseOSError(ENOENT)
 
     def read(self, path, size, offset, fh):
-        self.file_descriptors[fh].seek(offset)
-        return self.file_descriptors[fh].read(size)
+        return self.file_descriptors[fh].read(offset=offset, size=size)
 
     def readdir(self, path, fh):
         logger.debug('path: %s', path)
 
-        node = self._path_to_node(path=path, directory_only=True)
+        entries = cache.get_directory(path=path)
 
-        if not node:
-            raise FuseOSError(ENOENT)
+        if entries is None:
+            node = self._path_to_node(path=path, directory_only=True)
 
-        yield '.'
-        yield '..'
+            if not node:
+                raise FuseOSError(ENOENT)
 
-        # Serve nodes as directories.
-        queryset = MirrorFilesystem._clean_queryset(
-            queryset=node.get_children(),
-            source_field_name=self.node_text_attribute,
-            destination_field_name='value_clean'
-        )
+            # Serve nodes as directories.
+            queryset = MirrorFilesystem._clean_queryset(
+                queryset=node.get_children(),
+                source_field_name=self.node_text_attribute,
+                destination_field_name='value_clean'
+            )
 
-        for value in queryset.values_list('value_clean', flat=True):
-            yield value
+            entries = list(queryset.values_list('value_clean', flat=True))
 
-        # Then serve nodes documents as files.
-        queryset = MirrorFilesystem._clean_queryset(
-            queryset=node.get_documents(), source_field_name='label',
-            destination_field_name='label_clean'
-        )
+            # Then serve nodes documents as files.
+            queryset = MirrorFilesystem._clean_queryset(
+                queryset=node.get_documents(), source_field_name='label',
+                destination_field_name='label_clean'
+            )
+
+            entries.extend(queryset.values_list('label_clean', flat=True))
+
+            cache.set_directory(entries=entries, node=node, path=path)
+
+        yield '.'
+        yield '..'
 
-        for value in queryset.values_list('label_clean', flat=True):
+        for value in entries:
             yield value
 
     def release(self, path, fh):
+        self.file_descriptors[fh].close()
         self.file_descriptors[fh] = None
         del(self.file_descriptors[fh])
@@ -6,4 +6,41 @@ def handler_document_cache_delete(sender, **kwargs):
 
 
 def handler_node_cache_delete(sender, **kwargs):
-    cache.clear_node(node=kwargs['instance'])
+    node = kwargs['instance']
+
+    cache.clear_node(node=node)
+
+    # The directory entries of the parent include the node.
+    if node.parent_id:
+        cache.clear_node(node=node.parent)
+
+
+def handler_node_documents_cache_delete(sender, **kwargs):
+    if kwargs['action'] in ('post_add', 'post_remove', 'pre_clear'):
+        instance = kwargs['instance']
+
+        if kwargs['reverse']:
+            # The instance is a document.
+            cache.clear_document(document=instance)
+
+            if kwargs['pk_set']:
+                node_queryset = kwargs['model'].objects.filter(
+                    pk__in=kwargs['pk_set']
+                )
+            else:
+                node_queryset = instance.index_instance_nodes.all()
+
+            for node in node_queryset:
+                cache.clear_node(node=node)
+        else:
+            cache.clear_node(node=instance)
+
+            if kwargs['pk_set']:
+                document_queryset = kwargs['model'].objects.filter(
+                    pk__in=kwargs['pk_set']
+                )
+            else:
+                document_queryset = instance.documents.all()
+
+            for document in document_queryset:
+                cache.clear_document(document=document)
@@ -1,7 +1,15 @@
+DEFAULT_MIRRORING_BLOCK_CACHE_MAXIMUM_SIZE = 64 * 2 ** 20  # 64 Megabytes
 DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT = 10
 DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT = 10
+DEFAULT_MIRRORING_SPILL_CACHE_MAXIMUM_SIZE = 1024 * 2 ** 20  # 1 Gigabyte
+DEFAULT_MIRRORING_SPILL_CACHE_PATH = None
 
 FILE_MODE = DIRECTORY_MODE = 0o555
 
 MAX_FILE_DESCRIPTOR = 65535
 MIN_FILE_DESCRIPTOR = 0
+
+# Size of the blocks of the block cache and maximum number of blocks read
+# ahead for sequential reads.
+READ_BLOCK_SIZE = 128 * 2 ** 10  # 128 Kilobytes
+READ_AHEAD_MAXIMUM_BLOCKS = 16
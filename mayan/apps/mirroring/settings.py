@@ -3,12 +3,23 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
+    DEFAULT_MIRRORING_BLOCK_CACHE_MAXIMUM_SIZE,
     DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT,
-    DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT
+    DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT,
+    DEFAULT_MIRRORING_SPILL_CACHE_MAXIMUM_SIZE,
+    DEFAULT_MIRRORING_SPILL_CACHE_PATH
 )
 
 namespace = SettingNamespace(label=_('Mirroring'), name='mirroring')
 
+setting_block_cache_maximum_size = namespace.add_setting(
+    default=DEFAULT_MIRRORING_BLOCK_CACHE_MAXIMUM_SIZE,
+    global_name='MIRRORING_BLOCK_CACHE_MAXIMUM_SIZE',
+    help_text=_(
+        'Size in bytes of the memory cache of document file blocks read '
+        'by the mirror.'
+    )
+)
 setting_document_lookup_cache_timeout = namespace.add_setting(
     default=DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT,
     global_name='MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT',
@@ -19,3 +30,22 @@ setting_node_lookup_cache_timeout = namespace.add_setting(
     global_name='MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT',
     help_text=_('Time in seconds to cache the path lookup to an index node.')
 )
+setting_spill_cache_maximum_size = namespace.add_setting(
+    default=DEFAULT_MIRRORING_SPILL_CACHE_MAXIMUM_SIZE,
+    global_name='MIRRORING_SPILL_CACHE_MAXIMUM_SIZE',
+    help_text=_(
+        'Size in bytes of the local copies of decoded document files kept '
+        'by the mirror. Applies to document files that are encrypted, '
+        'compressed or not stored in a local filesystem. Use 0 to disable '
+        'the local copies.'
+    )
+)
+setting_spill_cache_path = namespace.add_setting(
+    default=DEFAULT_MIRRORING_SPILL_CACHE_PATH,
+    global_name='MIRRORING_SPILL_CACHE_PATH',
+    help_text=_(
+        'Directory where the mirror keeps the local copies of decoded '
+        'document files. If not set, a temporary directory is used and '
+        'removed when the mirror is unmounted.'
+    )
+)
@@ -1,8 +1,11 @@
+import io
 import warnings
 
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..caches import MirrorFilesystemCache
+from ..caches import (
+    MirrorFileBlockCache, MirrorFileSpillCache, MirrorFilesystemCache
+)
 
 from .literals import (
     TEST_CACHE_KEY_BAD_CHARACTERS, TEST_DOCUMENT_PK, TEST_KEY_UNICODE,
@@ -67,3 +70,48 @@ class MirrorFilesystemCacheTestCase(BaseTestCase):
             self.cache.get_key_hash(key=TEST_KEY_UNICODE),
             TEST_KEY_UNICODE_HASH
         )
+
+
+class MirrorFileBlockCacheTestCase(BaseTestCase):
+    def test_least_recently_used_eviction(self):
+        block_cache = MirrorFileBlockCache(block_size=4, maximum_size=8)
+
+        block_cache.set(key='test', index=0, data=b'0000')
+        block_cache.set(key='test', index=1, data=b'1111')
+        block_cache.get(key='test', index=0)
+        block_cache.set(key='test', index=2, data=b'2222')
+
+        self.assertEqual(block_cache.get(key='test', index=0), b'0000')
+        self.assertEqual(block_cache.get(key='test', index=1), None)
+        self.assertEqual(block_cache.get(key='test', index=2), b'2222')
+        self.assertEqual(block_cache.size, 8)
+
+
+class MirrorFileSpillCacheTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.spill_cache = MirrorFileSpillCache(maximum_size=8)
+
+    def tearDown(self):
+        self.spill_cache.destroy()
+        super().tearDown()
+
+    def test_least_recently_used_eviction(self):
+        self.spill_cache.set(key='test_0', file_object=io.BytesIO(b'0000'))
+        self.spill_cache.set(key='test_1', file_object=io.BytesIO(b'1111'))
+        self.spill_cache.get(key='test_0')
+        self.spill_cache.set(key='test_2', file_object=io.BytesIO(b'2222'))
+
+        with open(self.spill_cache.get(key='test_0'), mode='rb') as file_object:
+            self.assertEqual(file_object.read(), b'0000')
+
+        self.assertEqual(self.spill_cache.get(key='test_1'), None)
+        self.assertEqual(self.spill_cache.size, 8)
+
+    def test_file_bigger_than_maximum_size(self):
+        self.assertEqual(
+            self.spill_cache.set(
+                key='test', file_object=io.BytesIO(b'0' * 16)
+            ), None
+        )
+        self.assertEqual(self.spill_cache.size, 0)
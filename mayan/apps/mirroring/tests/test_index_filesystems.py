@@ -140,6 +140,40 @@ class IndexInstanceNodeMirroringTestCase(
             self._test_document.file_latest.checksum
         )
 
+    def test_document_readdir_cache_invalidation(self):
+        self._create_test_index_template_node(
+            expression=TEST_NODE_EXPRESSION
+        )
+
+        self._create_test_document_stub()
+
+        test_filesystem = self._get_test_filesystem()
+
+        self.assertEqual(
+            list(
+                test_filesystem.readdir(
+                    '/{}'.format(TEST_NODE_EXPRESSION), ''
+                )
+            )[2:], [self._test_documents[0].label]
+        )
+
+        self._create_test_document_stub()
+
+        self.assertEqual(
+            sorted(
+                list(
+                    test_filesystem.readdir(
+                        '/{}'.format(TEST_NODE_EXPRESSION), ''
+                    )
+                )[2:]
+            ), sorted(
+                [
+                    self._test_documents[0].label,
+                    self._test_documents[1].label
+                ]
+            )
+        )
+
     def test_multiline_indexes(self):
         self._create_test_index_template_node(
             expression=TEST_NODE_EXPRESSION_MULTILINE
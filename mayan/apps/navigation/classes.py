@@ -9,10 +9,12 @@ from django.contrib.admin.utils import (
 from django.core.exceptions import (
     FieldDoesNotExist, ImproperlyConfigured, PermissionDenied
 )
+from django.db import models
+from django.db.models import QuerySet
 from django.db.models.constants import LOOKUP_SEP
 from django.template import RequestContext, Variable, VariableDoesNotExist
 from django.template.defaulttags import URLNode
-from django.urls import resolve, reverse
+from django.urls import reverse
 from django.utils.encoding import force_str, force_text
 from django.utils.translation import ugettext_lazy as _
 
@@ -78,11 +80,73 @@ class Link(TemplateObjectMixin):
         if name:
             self.__class__._registry[name] = self
 
-    def resolve(self, context=None, request=None, resolved_object=None):
+    def check_permissions(self, context, request, resolved_object=None):
+        """
+        Check the link permissions against the resolved object or the user
+        if there is no object. Results are cached in the request for its
+        duration. Model instances are checked in bulk together with the
+        rest of the view's object list, the first time any of them is
+        checked.
+        """
         AccessControlList = apps.get_model(
             app_label='acls', model_name='AccessControlList'
         )
 
+        cache = request.__dict__.setdefault('_link_permission_cache', {})
+
+        if not isinstance(resolved_object, models.Model):
+            if resolved_object:
+                try:
+                    AccessControlList.objects.check_access(
+                        obj=resolved_object, permissions=self.permissions,
+                        user=request.user
+                    )
+                except PermissionDenied:
+                    return False
+                else:
+                    return True
+
+            cache_key = (None, tuple(self.permissions))
+            try:
+                return cache[cache_key]
+            except KeyError:
+                try:
+                    Permission.check_user_permissions(
+                        permissions=self.permissions, user=request.user
+                    )
+                except PermissionDenied:
+                    cache[cache_key] = False
+                else:
+                    cache[cache_key] = True
+
+                return cache[cache_key]
+
+        model = resolved_object._meta.model
+        allowed_pk_set, checked_pk_set = cache.setdefault(
+            (model, tuple(self.permissions)), (set(), set())
+        )
+
+        if resolved_object.pk not in checked_pk_set:
+            obj_list = [resolved_object]
+
+            object_list = context.get('object_list', ())
+            if isinstance(object_list, (list, tuple, QuerySet)):
+                obj_list.extend(
+                    obj for obj in object_list
+                    if isinstance(obj, model) and obj.pk not in checked_pk_set
+                )
+
+            allowed_pk_set.update(
+                AccessControlList.objects.check_access_bulk(
+                    obj_list=obj_list, permissions=self.permissions,
+                    user=request.user
+                )
+            )
+            checked_pk_set.update(obj.pk for obj in obj_list)
+
+        return resolved_object.pk in allowed_pk_set
+
+    def resolve(self, context=None, request=None, resolved_object=None):
         if not context and not request:
             raise ImproperlyConfigured(
                 'Must provide a context or a request in order to resolve the '
@@ -94,8 +158,7 @@ class Link(TemplateObjectMixin):
 
         request = self.get_request(context=context, request=request)
 
-        current_path = request.META['PATH_INFO']
-        current_view_name = resolve(path=current_path).view_name
+        current_view_name = get_current_view_name(request=request)
 
         # ACL is tested against the resolved_object or just {{ object }}
         # if not.
@@ -108,21 +171,11 @@ class Link(TemplateObjectMixin):
         # If this link has a required permission check that the user has it
         # too.
         if self.permissions:
-            if resolved_object:
-                try:
-                    AccessControlList.objects.check_access(
-                        obj=resolved_object, permissions=self.permissions,
-                        user=request.user
-                    )
-                except PermissionDenied:
-                    return None
-            else:
-                try:
-                    Permission.check_user_permissions(
-                        permissions=self.permissions, user=request.user
-                    )
-                except PermissionDenied:
-                    return None
+            if not self.check_permissions(
+                context=context, request=request,
+                resolved_object=resolved_object
+            ):
+                return None
 
         # If we were passed an instance of the view context object we are
         # resolving, inject it into the context. This help resolve links for
@@ -267,6 +320,7 @@ class Menu(TemplateObjectMixin):
         if name in self.__class__._registry:
             raise Exception('A menu with this name already exists')
 
+        self._links_for_cache = {}
         self.bound_links = {}
         self.condition = condition
         self.excluded_links = {}
@@ -283,6 +337,8 @@ class Menu(TemplateObjectMixin):
         return '<Menu: {}>'.format(self.name)
 
     def _map_links_to_source(self, links, source, map_variable, position=None):
+        self._links_for_cache.clear()
+
         source_links = getattr(self, map_variable).setdefault(source, [])
 
         position = position or len(source_links)
@@ -292,6 +348,7 @@ class Menu(TemplateObjectMixin):
             self.link_positions[link] = position + link_index
 
     def add_proxy_exclusion(self, source):
+        self._links_for_cache.clear()
         self.proxy_exclusions.add(source)
 
     def add_unsorted_source(self, source):
@@ -356,6 +413,36 @@ class Menu(TemplateObjectMixin):
             return self.link_positions.get(item, 0) or 0
 
     def get_links_for(self, resolved_navigation_object):
+        """
+        Return the links bound to an object. The matches of view names,
+        classes and model instances are compiled once per class and reused
+        until the menu bindings change.
+        """
+        if hasattr(resolved_navigation_object, 'model'):
+            cache_key = None
+        elif isinstance(resolved_navigation_object, models.Model):
+            cache_key = (resolved_navigation_object._meta.model, True)
+        elif isinstance(resolved_navigation_object, (str, type)) or resolved_navigation_object is None:
+            cache_key = (resolved_navigation_object, False)
+        else:
+            cache_key = None
+
+        if cache_key is None:
+            return self._get_links_for(
+                resolved_navigation_object=resolved_navigation_object
+            )
+
+        try:
+            matched_links = self._links_for_cache[cache_key]
+        except KeyError:
+            matched_links = self._get_links_for(
+                resolved_navigation_object=resolved_navigation_object
+            )
+            self._links_for_cache[cache_key] = matched_links
+
+        return set(matched_links)
+
+    def _get_links_for(self, resolved_navigation_object):
         matched_links = set()
 
         try:
@@ -667,6 +754,7 @@ class Separator(Link):
 
 
 class SourceColumn(TemplateObjectMixin):
+    _column_matches_cache = {}
     _registry = {}
 
     @staticmethod
@@ -696,6 +784,24 @@ class SourceColumn(TemplateObjectMixin):
 
     @classmethod
     def get_column_matches(cls, source):
+        """
+        Return the columns of a source. The matches of model classes and
+        instances are compiled once per model and reused until a column is
+        added or excluded.
+        """
+        if hasattr(source, 'model') or not hasattr(source, '_meta'):
+            return cls._get_column_matches(source=source)
+
+        try:
+            columns = cls._column_matches_cache[source._meta.model]
+        except KeyError:
+            columns = cls._get_column_matches(source=source)
+            cls._column_matches_cache[source._meta.model] = columns
+
+        return list(columns)
+
+    @classmethod
+    def _get_column_matches(cls, source):
         columns = []
 
         try:
@@ -806,6 +912,7 @@ class SourceColumn(TemplateObjectMixin):
             if not self.widget:
                 self.widget = SourceColumnLinkWidget
 
+        self.__class__._column_matches_cache.clear()
         self.__class__._registry.setdefault(source, [])
         self.__class__._registry[source].append(self)
 
@@ -870,6 +977,7 @@ class SourceColumn(TemplateObjectMixin):
         self.label = self._label
 
     def add_exclude(self, source):
+        self.__class__._column_matches_cache.clear()
         self.excludes.add(source)
 
     def get_absolute_url(self, obj):
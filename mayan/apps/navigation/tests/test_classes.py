@@ -100,6 +100,33 @@ class LinkClassTestCase(GenericViewTestCase):
         self.assertNotEqual(resolved_link, None)
         self.assertEqual(resolved_link.url, reverse(viewname=self._test_view_name))
 
+    def test_link_permission_resolve_object_list_cache(self):
+        link = Link(
+            permissions=(self._test_permission,), text=TEST_LINK_TEXT,
+            view=self._test_view_name
+        )
+
+        self.grant_access(obj=self._test_object, permission=self._test_permission)
+
+        response = self.get(viewname=self._test_view_name)
+        response.context.update(
+            {
+                'object_list': [self._test_object],
+                'request': response.wsgi_request
+            }
+        )
+
+        context = Context(response.context)
+
+        link.resolve(context=context, resolved_object=self._test_object)
+
+        with self.assertNumQueries(0):
+            resolved_link = link.resolve(
+                context=context, resolved_object=self._test_object
+            )
+
+        self.assertNotEqual(resolved_link, None)
+
     def test_link_with_unicode_querystring_request(self):
         url = furl(reverse(self._test_view_name))
         url.args['unicode_key'] = TEST_UNICODE_STRING
@@ -276,6 +303,19 @@ class SourceColumnClassTestCase(GenericViewTestCase):
 
         self.assertEqual(len(columns), 0)
 
+    def test_get_for_source_column_added_after_match(self):
+        self.assertEqual(
+            len(SourceColumn.get_for_source(source=self._test_object)), 0
+        )
+
+        SourceColumn(
+            attribute='__str__', source=self.TestModel
+        )
+
+        self.assertEqual(
+            len(SourceColumn.get_for_source(source=self._test_object)), 1
+        )
+
     def test_get_for_source_for_querysets_no_columns(self):
         columns = SourceColumn.get_for_source(
             source=self.TestModel.objects.all()
@@ -6,3 +6,6 @@ else:
     DEFAULT_TESSERACT_BINARY_PATH = '/usr/bin/tesseract'
 
 DEFAULT_TESSERACT_TIMEOUT = 600  # 600 seconds, 10 minutes
+
+# Form feed, the default page separator of the text output.
+TESSERACT_PAGE_SEPARATOR = '\f'
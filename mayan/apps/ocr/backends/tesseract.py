@@ -7,17 +7,24 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import TemporaryFile
+from mayan.apps.storage.utils import TemporaryDirectory
 
 from ..classes import OCRBackendBase
 from ..exceptions import OCRError
 
-from .literals import DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT
+from .literals import (
+    DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT,
+    TESSERACT_PAGE_SEPARATOR
+)
 
 logger = logging.getLogger(name=__name__)
 
 
 class Tesseract(OCRBackendBase):
+    # Cache of the available languages per binary, to avoid querying them
+    # every time the backend is instantiated.
+    _languages_cache = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.read_settings()
@@ -25,6 +32,35 @@ class Tesseract(OCRBackendBase):
         if kwargs.get('auto_initialize', True):
             self.initialize()
 
+    def _execute_command(self, arguments, keyword_arguments):
+        if self.language:
+            keyword_arguments['l'] = self.language
+
+        environment = os.environ.copy()
+        environment.update(self.environment)
+        keyword_arguments['_env'] = environment
+
+        try:
+            result = self.command_tesseract(
+                *arguments, **keyword_arguments
+            )
+            return force_text(s=result.stdout)
+        except Exception as exception:
+            error_message = (
+                'Exception calling Tesseract with language option: {}; {}'
+            ).format(self.language, exception)
+
+            if self.language not in self.languages:
+                error_message = (
+                    '{}\nThe requested OCR language "{}" is not '
+                    'available and needs to be installed.\n'
+                ).format(
+                    error_message, self.language
+                )
+
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+
     def execute(self, *args, **kwargs):
         """
         Execute the command line binary of tesseract.
@@ -32,48 +68,69 @@ class Tesseract(OCRBackendBase):
         super().execute(*args, **kwargs)
 
         if self.command_tesseract:
-            image = self.converter.get_page()
-
-            with TemporaryFile() as temporary_image_file:
-                shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
-                temporary_image_file.seek(0)
-
-                arguments = ['-', '-']
-
-                keyword_arguments = {
-                    '_in': temporary_image_file,
+            return self._execute_command(
+                arguments=('-', '-'), keyword_arguments={
+                    '_in': self.converter.get_page(),
                     '_timeout': self.command_timeout
                 }
+            )
 
-                if self.language:
-                    keyword_arguments['l'] = self.language
+    def execute_batch(self, file_objects, language=None, transformations=None):
+        """
+        Execute a single tesseract process for all the images using a list
+        file as input. The language data is loaded only once and the text
+        of each image is separated by a page separator in the output.
+        """
+        if len(file_objects) == 1:
+            return super().execute_batch(
+                file_objects=file_objects, language=language,
+                transformations=transformations
+            )
 
-                environment = os.environ.copy()
-                environment.update(self.environment)
-                keyword_arguments['_env'] = environment
+        self.language = language
 
-                try:
-                    result = self.command_tesseract(
-                        *arguments, **keyword_arguments
+        if self.command_tesseract:
+            with TemporaryDirectory() as temporary_directory:
+                image_filenames = []
+
+                for index, file_object in enumerate(file_objects):
+                    converter = self.get_converter(
+                        file_object=file_object,
+                        transformations=transformations
+                    )
+                    image_filename = os.path.join(
+                        temporary_directory, 'image_{}'.format(index)
                     )
-                    return force_text(s=result.stdout)
-                except Exception as exception:
-                    error_message = (
-                        'Exception calling Tesseract with language option: {}; {}'
-                    ).format(self.language, exception)
-
-                    if self.language not in self.languages:
-                        error_message = (
-                            '{}\nThe requested OCR language "{}" is not '
-                            'available and needs to be installed.\n'
-                        ).format(
-                            error_message, self.language
+                    with open(file=image_filename, mode='wb') as image_file:
+                        shutil.copyfileobj(
+                            fsrc=converter.get_page(), fdst=image_file
                         )
-
-                    logger.error(error_message, exc_info=True)
-                    raise OCRError(error_message)
-                else:
-                    return result
+                    image_filenames.append(image_filename)
+
+                list_filename = os.path.join(
+                    temporary_directory, 'images.txt'
+                )
+                with open(file=list_filename, mode='w') as list_file:
+                    list_file.write('\n'.join(image_filenames))
+
+                result = self._execute_command(
+                    arguments=(list_filename, '-'), keyword_arguments={
+                        '_timeout': self.command_timeout * len(file_objects)
+                    }
+                )
+
+            # Remove the trailing separator added by some versions.
+            results = result.split(TESSERACT_PAGE_SEPARATOR)[:len(file_objects)]
+
+            if len(results) != len(file_objects):
+                raise OCRError(
+                    'Tesseract returned the text of {} images, expected '
+                    '{}.'.format(len(results), len(file_objects))
+                )
+
+            return results
+        else:
+            return [None] * len(file_objects)
 
     def initialize(self):
         self.languages = ()
@@ -86,24 +143,34 @@ class Tesseract(OCRBackendBase):
                 _('Tesseract OCR not found.')
             )
         else:
-            # Get version.
-            result = self.command_tesseract(v=True)
-            logger.debug('Tesseract version: %s', result.stdout)
-
-            # Get languages.
-            result = self.command_tesseract(list_langs=True)
-            # Sample output format.
-            # List of available languages (3):
-            # deu
-            # eng
-            # osd
-            # <- empty line
-
-            # Extaction: strip last line, split by newline, discard the first
-            # line.
-            self.languages = force_text(s=result.stdout).strip().split('\n')[1:]
-
-            logger.debug('Available languages: %s', ', '.join(self.languages))
+            try:
+                self.languages = Tesseract._languages_cache[
+                    self.tesseract_binary_path
+                ]
+            except KeyError:
+                # Get version.
+                result = self.command_tesseract(v=True)
+                logger.debug('Tesseract version: %s', result.stdout)
+
+                # Get languages.
+                result = self.command_tesseract(list_langs=True)
+                # Sample output format.
+                # List of available languages (3):
+                # deu
+                # eng
+                # osd
+                # <- empty line
+
+                # Extaction: strip last line, split by newline, discard the
+                # first line.
+                self.languages = force_text(s=result.stdout).strip().split('\n')[1:]
+                Tesseract._languages_cache[
+                    self.tesseract_binary_path
+                ] = self.languages
+
+                logger.debug(
+                    'Available languages: %s', ', '.join(self.languages)
+                )
 
     def read_settings(self):
         self.command_timeout = self.kwargs.get(
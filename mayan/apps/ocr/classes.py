@@ -18,13 +18,29 @@ class OCRBackendBase:
 
     def execute(self, file_object, language=None, transformations=None):
         self.language = language
+        self.converter = self.get_converter(
+            file_object=file_object, transformations=transformations
+        )
 
-        if not transformations:
-            transformations = []
-
-        self.converter = ConverterBase.get_converter_class()(
+    def execute_batch(self, file_objects, language=None, transformations=None):
+        """
+        Return the text of several images. Backends that can process
+        several images at once more efficiently should override this
+        method.
+        """
+        return [
+            self.execute(
+                file_object=file_object, language=language,
+                transformations=transformations
+            ) for file_object in file_objects
+        ]
+
+    def get_converter(self, file_object, transformations=None):
+        converter = ConverterBase.get_converter_class()(
             file_object=file_object
         )
 
-        for transformation in transformations:
-            self.converter.transform(transformation=transformation)
+        for transformation in transformations or ():
+            converter.transform(transformation=transformation)
+
+        return converter
@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 import logging
 
 from django.apps import apps
@@ -24,54 +25,84 @@ class DocumentVersionPageOCRContentManager(models.Manager):
     def process_document_version_page(
         self, document_version_page, user=None
     ):
-        logger.info(
-            'Processing page: %d of document version: %s',
-            document_version_page.page_number,
-            document_version_page.document_version
+        self.process_document_version_page_list(
+            document_version_page_list=(document_version_page,), user=user
         )
 
+    def process_document_version_page_list(
+        self, document_version_page_list, user=None
+    ):
+        """
+        Process the pages of a document version with a single execution
+        of the OCR backend.
+        """
+        for document_version_page in document_version_page_list:
+            logger.info(
+                'Processing page: %d of document version: %s',
+                document_version_page.page_number,
+                document_version_page.document_version
+            )
+
         DocumentVersionPageOCRContent = apps.get_model(
             app_label='ocr', model_name='DocumentVersionPageOCRContent'
         )
 
-        lock_name = document_version_page.get_lock_name(user=user)
+        document_version_page_locks = []
 
         try:
-            document_version_page_lock = LockingBackend.get_backend().acquire_lock(
-                name=lock_name,
-                timeout=setting_image_generation_timeout.value * 2
-            )
-        except Exception:
-            raise
-        else:
-            try:
-                cache_filename = document_version_page.generate_image(
-                    _acquire_lock=False, user=user
+            for document_version_page in document_version_page_list:
+                lock_name = document_version_page.get_lock_name(user=user)
+
+                document_version_page_locks.append(
+                    LockingBackend.get_backend().acquire_lock(
+                        name=lock_name,
+                        timeout=setting_image_generation_timeout.value * 2
+                    )
                 )
 
-                with document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
-                    ocr_content = OCRBackendBase.get_instance().execute(
-                        file_object=file_object,
-                        language=document_version_page.document_version.document.language
+            with ExitStack() as stack:
+                file_objects = []
+                for document_version_page in document_version_page_list:
+                    cache_filename = document_version_page.generate_image(
+                        _acquire_lock=False, user=user
                     )
-                    DocumentVersionPageOCRContent.objects.update_or_create(
-                        document_version_page=document_version_page, defaults={
-                            'content': ocr_content
-                        }
+
+                    file_objects.append(
+                        stack.enter_context(
+                            document_version_page.cache_partition.get_file(
+                                filename=cache_filename
+                            ).open()
+                        )
                     )
-            except Exception as exception:
-                logger.error(
-                    'OCR error for document version page: %d; %s',
-                    document_version_page.pk, exception, exc_info=True
+
+                ocr_content_list = OCRBackendBase.get_instance().execute_batch(
+                    file_objects=file_objects,
+                    language=document_version_page_list[0].document_version.document.language
+                )
+
+            for document_version_page, ocr_content in zip(document_version_page_list, ocr_content_list):
+                DocumentVersionPageOCRContent.objects.update_or_create(
+                    document_version_page=document_version_page, defaults={
+                        'content': ocr_content
+                    }
                 )
-                raise
-            else:
+        except Exception as exception:
+            logger.error(
+                'OCR error for document version pages: %s; %s',
+                ', '.join(
+                    str(document_version_page.pk) for document_version_page in document_version_page_list
+                ), exception, exc_info=True
+            )
+            raise
+        else:
+            for document_version_page in document_version_page_list:
                 logger.info(
                     'Finished processing page: %d of document version: %s',
                     document_version_page.page_number,
                     document_version_page.document_version
                 )
-            finally:
+        finally:
+            for document_version_page_lock in document_version_page_locks:
                 document_version_page_lock.release()
 
 
@@ -3,7 +3,8 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
-    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
+    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS,
+    DEFAULT_OCR_DOCUMENT_VERSION_PAGE_BATCH_SIZE
 )
 from .setting_migrations import OCRSettingMigration
 
@@ -26,3 +27,12 @@ setting_ocr_backend_arguments = namespace.add_setting(
     default=DEFAULT_OCR_BACKEND_ARGUMENTS,
     global_name='OCR_BACKEND_ARGUMENTS'
 )
+setting_ocr_document_version_page_batch_size = namespace.add_setting(
+    default=DEFAULT_OCR_DOCUMENT_VERSION_PAGE_BATCH_SIZE,
+    global_name='OCR_DOCUMENT_VERSION_PAGE_BATCH_SIZE', help_text=_(
+        'Number of pages of a document version to process in a single '
+        'task. The pages of a task are passed to the OCR backend together, '
+        'which avoids the overhead of a task and of a backend execution '
+        'for each page. A value of 1 processes each page in its own task.'
+    )
+)
@@ -3,6 +3,8 @@ from django.test import override_settings
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import TEST_FILE_GERMAN_PATH
 
+from ..models import DocumentVersionPageOCRContent
+
 from .literals import (
     TEST_DOCUMENT_VERSION_OCR_CONTENT, TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_1,
     TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2
@@ -16,6 +18,25 @@ class DocumentOCRTestCase(GenericDocumentTestCase):
         self.assertTrue(TEST_DOCUMENT_VERSION_OCR_CONTENT in content)
 
 
+@override_settings(OCR_AUTO_OCR=False)
+class DocumentOCRBatchTestCase(GenericDocumentTestCase):
+    def test_process_document_version_page_list(self):
+        self._upload_test_document()
+
+        document_version_page_list = [
+            test_document.version_active.pages.first() for test_document in self._test_documents
+        ]
+
+        DocumentVersionPageOCRContent.objects.process_document_version_page_list(
+            document_version_page_list=document_version_page_list
+        )
+
+        for document_version_page in document_version_page_list:
+            self.assertTrue(
+                TEST_DOCUMENT_VERSION_OCR_CONTENT in document_version_page.ocr_content.content
+            )
+
+
 @override_settings(OCR_AUTO_OCR=True)
 class GermanOCRSupportTestCase(GenericDocumentTestCase):
     _test_document_path = TEST_FILE_GERMAN_PATH
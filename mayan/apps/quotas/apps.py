@@ -1,5 +1,8 @@
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.db.models.signals import (
+    post_delete, post_save, pre_delete, pre_save
+)
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -15,6 +18,13 @@ from mayan.apps.views.html_widgets import TwoStateWidget
 
 from .classes import QuotaBackend
 from .events import event_quota_created, event_quota_edited
+from .handlers import (
+    handler_document_count_usage_action_created,
+    handler_document_count_usage_document_post_delete,
+    handler_document_count_usage_document_post_save,
+    handler_document_count_usage_document_pre_delete,
+    handler_document_count_usage_document_pre_save
+)
 from .links import (
     link_quota_create, link_quota_delete, link_quota_edit, link_quota_list,
     link_quota_setup
@@ -35,10 +45,17 @@ class QuotasApp(MayanAppConfig):
     def ready(self, *args, **kwargs):
         super().ready(*args, **kwargs)
 
+        Action = apps.get_model(app_label='actstream', model_name='Action')
         Group = apps.get_model(app_label='auth', model_name='Group')
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
         DocumentType = apps.get_model(
             app_label='documents', model_name='DocumentType'
         )
+        TrashedDocument = apps.get_model(
+            app_label='documents', model_name='TrashedDocument'
+        )
         Quota = self.get_model(model_name='Quota')
         User = get_user_model()
 
@@ -109,3 +126,34 @@ class QuotasApp(MayanAppConfig):
         )
 
         menu_setup.bind_links(links=(link_quota_setup,))
+
+        post_save.connect(
+            dispatch_uid='quotas_handler_document_count_usage_action_created',
+            receiver=handler_document_count_usage_action_created,
+            sender=Action
+        )
+        post_save.connect(
+            dispatch_uid='quotas_handler_document_count_usage_document_post_save',
+            receiver=handler_document_count_usage_document_post_save,
+            sender=Document
+        )
+        pre_save.connect(
+            dispatch_uid='quotas_handler_document_count_usage_document_pre_save',
+            receiver=handler_document_count_usage_document_pre_save,
+            sender=Document
+        )
+
+        # Documents are deleted from the trash using the proxy model.
+        for model in (Document, TrashedDocument):
+            post_delete.connect(
+                dispatch_uid='quotas_handler_document_count_usage_document_post_delete_{}'.format(
+                    model._meta.model_name
+                ), receiver=handler_document_count_usage_document_post_delete,
+                sender=model
+            )
+            pre_delete.connect(
+                dispatch_uid='quotas_handler_document_count_usage_document_pre_delete_{}'.format(
+                    model._meta.model_name
+                ), receiver=handler_document_count_usage_document_pre_delete,
+                sender=model
+            )
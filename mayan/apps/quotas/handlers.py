@@ -1,4 +1,109 @@
 from django.apps import apps
+from django.contrib.auth import get_user_model
+
+from mayan.apps.documents.events import event_document_created
+
+
+def handler_document_count_usage_action_created(
+    sender, instance, created, **kwargs
+):
+    ContentType = apps.get_model(
+        app_label='contenttypes', model_name='ContentType'
+    )
+    Document = apps.get_model(app_label='documents', model_name='Document')
+    DocumentCountUsage = apps.get_model(
+        app_label='quotas', model_name='DocumentCountUsage'
+    )
+    User = get_user_model()
+
+    if created and instance.verb == event_document_created.id:
+        if instance.target_content_type_id == ContentType.objects.get_for_model(model=Document).pk:
+            document_type_id = Document.objects.filter(
+                pk=instance.target_object_id
+            ).values_list('document_type_id', flat=True).first()
+
+            if document_type_id:
+                if instance.actor_content_type_id == ContentType.objects.get_for_model(model=User).pk:
+                    user_id = int(instance.actor_object_id)
+                else:
+                    user_id = None
+
+                DocumentCountUsage.objects.update_document_count(
+                    document_type_id=document_type_id, user_id=user_id,
+                    value=1
+                )
+
+
+def handler_document_count_usage_document_post_delete(
+    sender, instance, **kwargs
+):
+    DocumentCountUsage = apps.get_model(
+        app_label='quotas', model_name='DocumentCountUsage'
+    )
+
+    if '_document_count_usage_user_id' in instance.__dict__:
+        DocumentCountUsage.objects.update_document_count(
+            document_type_id=instance.document_type_id,
+            user_id=instance.__dict__.pop('_document_count_usage_user_id'),
+            value=-1
+        )
+
+
+def handler_document_count_usage_document_post_save(
+    sender, instance, **kwargs
+):
+    DocumentCountUsage = apps.get_model(
+        app_label='quotas', model_name='DocumentCountUsage'
+    )
+
+    document_type_id = instance.__dict__.pop(
+        '_document_count_usage_document_type_id', None
+    )
+
+    if document_type_id and document_type_id != instance.document_type_id:
+        user_id = DocumentCountUsage.objects.get_document_creator_id(
+            document=instance
+        )
+
+        DocumentCountUsage.objects.update_document_count(
+            document_type_id=document_type_id, user_id=user_id, value=-1
+        )
+        DocumentCountUsage.objects.update_document_count(
+            document_type_id=instance.document_type_id, user_id=user_id,
+            value=1
+        )
+
+
+def handler_document_count_usage_document_pre_delete(
+    sender, instance, **kwargs
+):
+    DocumentCountUsage = apps.get_model(
+        app_label='quotas', model_name='DocumentCountUsage'
+    )
+
+    # The events of the document are deleted along with it. Obtain the
+    # creator while the document created event still exists.
+    if DocumentCountUsage.objects._get_document_created_action_queryset().filter(
+        target_object_id=str(instance.pk)
+    ).exists():
+        instance._document_count_usage_user_id = DocumentCountUsage.objects.get_document_creator_id(
+            document=instance
+        )
+
+
+def handler_document_count_usage_document_pre_save(
+    sender, instance, **kwargs
+):
+    Document = apps.get_model(app_label='documents', model_name='Document')
+
+    update_fields = kwargs.get('update_fields') or ()
+
+    # Only document type changes are tracked. Other saves don't change the
+    # document type and are not queried.
+    if instance.pk and 'document_type' in update_fields:
+        instance._document_count_usage_document_type_id = Document.objects.filter(
+            pk=instance.pk
+        ).values_list('document_type_id', flat=True).first()
 
 
 def handler_process_quota_signal(sender, **kwargs):
@@ -0,0 +1,3 @@
+DOCUMENT_COUNT_USAGE_BULK_BATCH_SIZE = 1000
+
+TASK_DOCUMENT_COUNT_USAGE_RECONCILE_INTERVAL = 60 * 60 * 24
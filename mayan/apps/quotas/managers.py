@@ -0,0 +1,136 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Cast, Greatest
+
+from mayan.apps.documents.events import event_document_created
+
+from .literals import DOCUMENT_COUNT_USAGE_BULK_BATCH_SIZE
+
+
+class DocumentCountUsageManager(models.Manager):
+    def _get_document_created_action_queryset(self):
+        Action = apps.get_model(app_label='actstream', model_name='Action')
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        return Action.objects.filter(
+            target_content_type=ContentType.objects.get_for_model(
+                model=Document
+            ), verb=event_document_created.id
+        )
+
+    def get_document_count(self, document_type_id_list=None, user=None):
+        """
+        Return the number of documents created by the user or by everyone
+        when no user is provided. The count can be restricted to a list
+        of document types.
+        """
+        queryset = self.filter(user=user)
+
+        if document_type_id_list is not None:
+            queryset = queryset.filter(
+                document_type_id__in=document_type_id_list
+            )
+
+        return queryset.aggregate(
+            document_count__sum=Sum('document_count')
+        )['document_count__sum'] or 0
+
+    def get_document_creator_id(self, document):
+        """
+        Return the ID of the user that created the document from the
+        document created event.
+        """
+        User = get_user_model()
+
+        return self._get_document_created_action_queryset().filter(
+            actor_content_type=ContentType.objects.get_for_model(model=User),
+            target_object_id=str(document.pk)
+        ).annotate(
+            actor_object_id_int=Cast(
+                'actor_object_id', output_field=IntegerField()
+            )
+        ).values_list('actor_object_id_int', flat=True).first()
+
+    def reconcile(self):
+        """
+        Recalculate the counters from the document created events of the
+        existing documents.
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        User = get_user_model()
+
+        action_queryset = self._get_document_created_action_queryset().annotate(
+            target_object_id_int=Cast(
+                'target_object_id', output_field=IntegerField()
+            )
+        )
+        creator_queryset = action_queryset.filter(
+            actor_content_type=ContentType.objects.get_for_model(model=User),
+            target_object_id_int=OuterRef('pk')
+        ).annotate(
+            actor_object_id_int=Cast(
+                'actor_object_id', output_field=IntegerField()
+            )
+        ).values('actor_object_id_int')[:1]
+
+        document_queryset = Document.objects.filter(
+            pk__in=action_queryset.values('target_object_id_int')
+        ).order_by()
+
+        counters = [
+            self.model(
+                document_count=entry['document_count'],
+                document_type_id=entry['document_type'], user=None
+            ) for entry in document_queryset.values('document_type').annotate(
+                document_count=Count('pk')
+            )
+        ]
+
+        user_document_queryset = document_queryset.annotate(
+            creator_id=Subquery(queryset=creator_queryset)
+        ).filter(creator_id__in=User.objects.values('pk'))
+
+        counters.extend(
+            [
+                self.model(
+                    document_count=entry['document_count'],
+                    document_type_id=entry['document_type'],
+                    user_id=entry['creator_id']
+                ) for entry in user_document_queryset.values(
+                    'document_type', 'creator_id'
+                ).annotate(document_count=Count('pk'))
+            ]
+        )
+
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(
+                batch_size=DOCUMENT_COUNT_USAGE_BULK_BATCH_SIZE,
+                objs=counters
+            )
+
+    def update_document_count(self, document_type_id, user_id, value):
+        """
+        Add the value to the counter of the document type for all users
+        and to the counter of the user if provided.
+        """
+        if user_id is None:
+            user_id_list = (None,)
+        else:
+            user_id_list = (None, user_id)
+
+        with transaction.atomic():
+            for counter_user_id in user_id_list:
+                counter, created = self.get_or_create(
+                    document_type_id=document_type_id, user_id=counter_user_id
+                )
+                self.filter(pk=counter.pk).update(
+                    document_count=Greatest(F('document_count') + value, 0)
+                )
@@ -0,0 +1,143 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Cast
+import django.db.models.deletion
+
+
+def code_document_count_usage_populate(apps, schema_editor):
+    Action = apps.get_model(app_label='actstream', model_name='Action')
+    ContentType = apps.get_model(
+        app_label='contenttypes', model_name='ContentType'
+    )
+    Document = apps.get_model(app_label='documents', model_name='Document')
+    DocumentCountUsage = apps.get_model(
+        app_label='quotas', model_name='DocumentCountUsage'
+    )
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+
+    alias = schema_editor.connection.alias
+
+    try:
+        document_content_type = ContentType.objects.using(alias=alias).get(
+            app_label='documents', model='document'
+        )
+    except ContentType.DoesNotExist:
+        # New installation, there are no documents.
+        return
+
+    user_content_type = ContentType.objects.using(alias=alias).get_for_model(
+        model=User
+    )
+
+    action_queryset = Action.objects.using(alias=alias).filter(
+        target_content_type=document_content_type,
+        verb='documents.document_create'
+    ).annotate(
+        target_object_id_int=Cast(
+            'target_object_id', output_field=IntegerField()
+        )
+    )
+    creator_queryset = action_queryset.filter(
+        actor_content_type=user_content_type,
+        target_object_id_int=OuterRef('pk')
+    ).annotate(
+        actor_object_id_int=Cast(
+            'actor_object_id', output_field=IntegerField()
+        )
+    ).values('actor_object_id_int')[:1]
+
+    document_queryset = Document.objects.using(alias=alias).filter(
+        pk__in=action_queryset.values('target_object_id_int')
+    ).order_by()
+
+    counters = [
+        DocumentCountUsage(
+            document_count=entry['document_count'],
+            document_type_id=entry['document_type'], user=None
+        ) for entry in document_queryset.values('document_type').annotate(
+            document_count=Count('pk')
+        )
+    ]
+
+    user_document_queryset = document_queryset.annotate(
+        creator_id=Subquery(queryset=creator_queryset)
+    ).filter(creator_id__in=User.objects.using(alias=alias).values('pk'))
+
+    counters.extend(
+        [
+            DocumentCountUsage(
+                document_count=entry['document_count'],
+                document_type_id=entry['document_type'],
+                user_id=entry['creator_id']
+            ) for entry in user_document_queryset.values(
+                'document_type', 'creator_id'
+            ).annotate(document_count=Count('pk'))
+        ]
+    )
+
+    DocumentCountUsage.objects.using(alias=alias).bulk_create(
+        batch_size=1000, objs=counters
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('actstream', '__first__'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('documents', '0082_documentfile_file_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('quotas', '0002_alter_quota_options')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentCountUsage',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'document_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Document count'
+                    )
+                ),
+                (
+                    'document_type', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='count_usages',
+                        to='documents.documenttype',
+                        verbose_name='Document type'
+                    )
+                ),
+                (
+                    'user', models.ForeignKey(
+                        blank=True, null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='document_count_usages',
+                        to=settings.AUTH_USER_MODEL, verbose_name='User'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Document count usage',
+                'verbose_name_plural': 'Document count usages',
+                'unique_together': {('document_type', 'user')},
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='documentcountusage',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(user__isnull=True),
+                fields=('document_type',),
+                name='quotas_documentcountusage_document_type_unique'
+            ),
+        ),
+        migrations.RunPython(
+            code=code_document_count_usage_populate,
+            reverse_code=migrations.RunPython.noop
+        )
+    ]
@@ -1,6 +1,7 @@
 import json
 import logging
 
+from django.conf import settings
 from django.db import models
 from django.urls import reverse
 from django.utils.encoding import force_text
@@ -13,10 +14,48 @@ from mayan.apps.events.decorators import method_event
 
 from .classes import NullBackend
 from .events import event_quota_created, event_quota_edited
+from .managers import DocumentCountUsageManager
 
 logger = logging.getLogger(__name__)
 
 
+class DocumentCountUsage(models.Model):
+    """
+    Counter of the documents created per document type. The entries without
+    a user count the documents created by everyone, the entries with a user
+    count the documents created by that user.
+    """
+    document_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='count_usages',
+        to='documents.DocumentType', verbose_name=_('Document type')
+    )
+    user = models.ForeignKey(
+        blank=True, null=True, on_delete=models.CASCADE,
+        related_name='document_count_usages', to=settings.AUTH_USER_MODEL,
+        verbose_name=_('User')
+    )
+    document_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Document count')
+    )
+
+    objects = DocumentCountUsageManager()
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                condition=models.Q(user__isnull=True),
+                fields=('document_type',),
+                name='quotas_documentcountusage_document_type_unique'
+            ),
+        )
+        unique_together = ('document_type', 'user')
+        verbose_name = _('Document count usage')
+        verbose_name_plural = _('Document count usages')
+
+    def __str__(self):
+        return force_text(s=self.document_count)
+
+
 class Quota(ExtraDataModelMixin, models.Model):
     backend_path = models.CharField(
         max_length=255,
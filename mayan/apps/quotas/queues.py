@@ -0,0 +1,14 @@
+from datetime import timedelta
+
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.common.queues import queue_tools
+
+from .literals import TASK_DOCUMENT_COUNT_USAGE_RECONCILE_INTERVAL
+
+queue_tools.add_task_type(
+    dotted_path='mayan.apps.quotas.tasks.task_document_count_usage_reconcile',
+    label=_('Reconcile the document count quota usage'),
+    name='task_document_count_usage_reconcile',
+    schedule=timedelta(seconds=TASK_DOCUMENT_COUNT_USAGE_RECONCILE_INTERVAL)
+)
@@ -1,22 +1,16 @@
 import types
 
-from django.contrib.auth import get_user_model
-from django.contrib.contenttypes.models import ContentType
-from django.db.models import IntegerField
-from django.db.models.functions import Cast
 from django.template.defaultfilters import filesizeformat
 from django.utils.translation import ugettext_lazy as _
 
-from actstream.models import Action
-
 from mayan.apps.common.signals import signal_mayan_pre_save
-from mayan.apps.documents.events import event_document_created
 from mayan.apps.documents.models import Document, DocumentFile
 from mayan.apps.user_management.querysets import get_user_queryset
 
 from .classes import QuotaBackend
 from .exceptions import QuotaExceeded
 from .mixins import DocumentTypesQuotaMixin, GroupsUsersQuotaMixin
+from .models import DocumentCountUsage
 
 
 def hook_factory_document_check_quota(klass):
@@ -109,24 +103,10 @@ class DocumentCountQuota(
         }
 
     def _get_user_document_count(self, user):
-        action_queryset = Action.objects.annotate(
-            target_object_id_int=Cast(
-                'target_object_id', output_field=IntegerField()
-            ),
-        )
-        action_filter_kwargs = {
-            'verb': event_document_created.id
-        }
-        document_filter_kwargs = {}
-
-        if not self.document_type_all:
-            document_filter_kwargs.update(
-                {
-                    'document_type_id__in': self._get_document_types().values(
-                        'pk'
-                    ),
-                }
-            )
+        if self.document_type_all:
+            document_type_id_list = None
+        else:
+            document_type_id_list = self.document_type_ids
 
         if user:
             # Admins are always excluded.
@@ -142,27 +122,15 @@ class DocumentCountQuota(
                     # User is not in the restricted list of users and groups.
                     return 0
                 else:
-                    content_type = ContentType.objects.get_for_model(
-                        model=get_user_model()
+                    return DocumentCountUsage.objects.get_document_count(
+                        document_type_id_list=document_type_id_list,
+                        user=user
                     )
 
-                    action_filter_kwargs.update(
-                        {
-                            'actor_object_id': user.pk,
-                            'actor_content_type': content_type,
-                        }
-                    )
-
-        action_queryset = action_queryset.filter(**action_filter_kwargs)
-
-        document_filter_kwargs.update(
-            {
-                'pk__in': action_queryset.values('target_object_id_int')
-            }
+        return DocumentCountUsage.objects.get_document_count(
+            document_type_id_list=document_type_id_list
         )
 
-        return Document.objects.filter(**document_filter_kwargs).count()
-
     def process(self, **kwargs):
         # Only for new documents.
         if not kwargs['instance'].pk:
@@ -0,0 +1,18 @@
+import logging
+
+from django.apps import apps
+
+from mayan.celery import app
+
+logger = logging.getLogger(name=__name__)
+
+
+@app.task(ignore_result=True)
+def task_document_count_usage_reconcile():
+    DocumentCountUsage = apps.get_model(
+        app_label='quotas', model_name='DocumentCountUsage'
+    )
+
+    logger.info('Starting document count usage reconciliation')
+    DocumentCountUsage.objects.reconcile()
+    logger.info('Finished document count usage reconciliation')
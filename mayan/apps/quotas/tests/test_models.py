@@ -1,5 +1,8 @@
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..models import DocumentCountUsage
+
 from .mixins import QuotaTestMixin
 
 
@@ -8,3 +11,60 @@ class QuotaModelTestCase(QuotaTestMixin, BaseTestCase):
         self._create_test_quota()
 
         self.assertTrue(self._test_quota.get_absolute_url())
+
+
+class DocumentCountUsageTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._upload_test_document(_user=self._test_case_user)
+
+    def _get_test_document_counts(self):
+        return (
+            DocumentCountUsage.objects.get_document_count(
+                document_type_id_list=(self._test_document_types[0].pk,)
+            ),
+            DocumentCountUsage.objects.get_document_count(
+                document_type_id_list=(self._test_document_types[0].pk,),
+                user=self._test_case_user
+            )
+        )
+
+    def test_document_create(self):
+        self.assertEqual(self._get_test_document_counts(), (1, 1))
+
+    def test_document_create_no_user(self):
+        self._upload_test_document()
+
+        self.assertEqual(self._get_test_document_counts(), (2, 1))
+
+    def test_document_delete(self):
+        self._test_document.delete(to_trash=False)
+
+        self.assertEqual(self._get_test_document_counts(), (0, 0))
+
+    def test_document_trash(self):
+        self._test_document.delete()
+
+        self.assertEqual(self._get_test_document_counts(), (1, 1))
+
+    def test_document_type_change(self):
+        self._create_test_document_type()
+        self._test_document.document_type_change(
+            document_type=self._test_document_types[1]
+        )
+
+        self.assertEqual(self._get_test_document_counts(), (0, 0))
+        self.assertEqual(
+            DocumentCountUsage.objects.get_document_count(
+                document_type_id_list=(self._test_document_types[1].pk,),
+                user=self._test_case_user
+            ), 1
+        )
+
+    def test_reconcile(self):
+        DocumentCountUsage.objects.all().delete()
+        DocumentCountUsage.objects.reconcile()
+
+        self.assertEqual(self._get_test_document_counts(), (1, 1))
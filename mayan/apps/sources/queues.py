@@ -24,3 +24,7 @@ queue_sources.add_task_type(
     label=_('Handle upload'),
     dotted_path='mayan.apps.sources.tasks.task_process_document_upload'
 )
+queue_sources_fast.add_task_type(
+    label=_('Generate staging folder file images'),
+    dotted_path='mayan.apps.sources.tasks.task_staging_folder_file_image_generate'
+)
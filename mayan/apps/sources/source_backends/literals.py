@@ -6,10 +6,18 @@ DEFAULT_EMAIL_IMAP_STORE_COMMANDS = '+FLAGS (\\Deleted)'
 DEFAULT_EMAIL_METADATA_ATTACHMENT_NAME = 'metadata.yaml'
 DEFAULT_EMAIL_POP3_TIMEOUT = 60
 DEFAULT_PERIOD_INTERVAL = 600
+DEFAULT_WATCH_FOLDER_STABILITY_PERIOD = 5
 
 REGULAR_EXPRESSION_MATCH_EVERYTHING = '.*'
 REGULAR_EXPRESSION_MATCH_NOTHING = '_^'
 
+# Number of pages, starting with the one being viewed, whose staging
+# folder file images are generated in the background.
+STAGING_FOLDER_FILE_IMAGE_PREGENERATE_PAGES = 2
+# Directories modified less than this number of seconds before the scan
+# could change again without changing their modification time.
+STAGING_FOLDER_SNAPSHOT_MTIME_GRANULARITY = 1
+
 SOURCE_UNCOMPRESS_CHOICE_ALWAYS = 'y'
 SOURCE_UNCOMPRESS_CHOICE_NEVER = 'n'
 SOURCE_UNCOMPRESS_CHOICE_ASK = 'a'
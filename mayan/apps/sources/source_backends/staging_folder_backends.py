@@ -1,8 +1,10 @@
 import base64
+import hashlib
 import logging
 import os
 from pathlib import Path
 import re
+import threading
 import time
 from urllib.parse import quote_plus, unquote_plus
 
@@ -20,6 +22,7 @@ from django.utils.translation import ugettext_lazy as _
 from django.views.generic.list import MultipleObjectMixin
 
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404 as rest_get_object_or_404
 from rest_framework.response import Response
 from rest_framework.reverse import reverse as rest_framework_reverse
@@ -34,6 +37,8 @@ from mayan.apps.converter.utils import IndexedDictionary
 from mayan.apps.documents.html_widgets import ThumbnailWidget
 from mayan.apps.documents.models.document_type_models import DocumentType
 from mayan.apps.documents.permissions import permission_document_create
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.navigation.classes import Link, SourceColumn
 from mayan.apps.sources.classes import SourceBackend
 from mayan.apps.sources.forms import UploadBaseForm
@@ -47,10 +52,14 @@ from mayan.apps.storage.models import SharedUploadedFile
 from mayan.apps.views.settings import setting_paginate_by
 
 from ..classes import SourceBackendAction
-from ..tasks import task_process_document_upload
+from ..tasks import (
+    task_process_document_upload, task_staging_folder_file_image_generate
+)
 
 from .literals import (
-    REGULAR_EXPRESSION_MATCH_EVERYTHING, REGULAR_EXPRESSION_MATCH_NOTHING
+    REGULAR_EXPRESSION_MATCH_EVERYTHING, REGULAR_EXPRESSION_MATCH_NOTHING,
+    STAGING_FOLDER_FILE_IMAGE_PREGENERATE_PAGES,
+    STAGING_FOLDER_SNAPSHOT_MTIME_GRANULARITY
 )
 
 __all__ = ('SourceBackendStagingFolder',)
@@ -109,29 +118,46 @@ class StagingFolderFile:
         os.unlink(self.get_full_path())
 
     def generate_image(self, transformation_instance_list=None):
+        """
+        Store the image of the file in the cache storage and return its
+        cache filename. The image is generated and stored under a lock,
+        readers never see a partial image. Returns None if another process
+        is generating the image.
+        """
         # Check is transformed image is available.
         logger.debug('transformations cache filename: %s', self.cache_filename)
 
-        if self.storage.exists(self.cache_filename):
-            logger.debug(
-                'staging file cache file "%s" found', self.cache_filename
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=self.get_image_lock_name()
             )
-        else:
+        except LockError:
             logger.debug(
-                'staging file cache file "%s" not found', self.cache_filename
-            )
-            image = self.get_image(
-                transformation_instance_list=transformation_instance_list
+                'staging file cache file "%s" is being generated',
+                self.cache_filename
             )
+            return None
 
-            # Since open "wb+" doesn't create files, check if the file
-            # exists, if not then create it.
-            self.storage.save(
-                name=self.cache_filename, content=ContentFile(content='')
-            )
+        try:
+            if self.storage.exists(self.cache_filename):
+                logger.debug(
+                    'staging file cache file "%s" found', self.cache_filename
+                )
+            else:
+                logger.debug(
+                    'staging file cache file "%s" not found',
+                    self.cache_filename
+                )
+                image = self.get_image(
+                    transformation_instance_list=transformation_instance_list
+                )
 
-            with self.storage.open(name=self.cache_filename, mode='wb+') as file_object:
-                file_object.write(image.getvalue())
+                self.storage.save(
+                    name=self.cache_filename,
+                    content=ContentFile(content=image.getvalue())
+                )
+        finally:
+            lock.release()
 
         return self.cache_filename
 
@@ -179,6 +205,11 @@ class StagingFolderFile:
             self.staging_folder.kwargs['folder_path'], self.filename
         )
 
+    def get_image_lock_name(self):
+        return 'staging_folder_file-image-{}'.format(
+            hashlib.sha256(self.cache_filename.encode('utf8')).hexdigest()
+        )
+
     def get_image(self, transformation_instance_list=None):
         try:
             with open(file=self.get_full_path(), mode='rb') as file_object:
@@ -211,24 +242,227 @@ class StagingFolderFile:
         ).get_storage_instance()
 
 
+class StagingFolderFileList:
+    """
+    Sequence of the files of a staging folder snapshot. The file instances
+    are created only for the items accessed, allowing the paginator to
+    slice the visible page without instancing every file.
+    """
+    def __init__(self, staging_folder, filenames):
+        self.filenames = filenames
+        self.staging_folder = staging_folder
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                StagingFolderFile(
+                    filename=filename, staging_folder=self.staging_folder
+                ) for filename in self.filenames[index]
+            ]
+        else:
+            return StagingFolderFile(
+                filename=self.filenames[index],
+                staging_folder=self.staging_folder
+            )
+
+    def __iter__(self):
+        for filename in self.filenames:
+            yield StagingFolderFile(
+                filename=filename, staging_folder=self.staging_folder
+            )
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def count(self):
+        return len(self.filenames)
+
+    def get_index_after(self, filename):
+        """
+        Return the position of the first file that sorts after the
+        filename. The filename doesn't need to be in the list, allowing
+        cursors to survive files being added or removed.
+        """
+        key = StagingFolderSnapshot.get_sort_key(filename=filename)
+
+        low = 0
+        high = len(self.filenames)
+
+        while low < high:
+            middle = (low + high) // 2
+            if StagingFolderSnapshot.get_sort_key(filename=self.filenames[middle]) <= key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def has_filename(self, filename):
+        index = self.get_index_after(filename=filename)
+        return index > 0 and self.filenames[index - 1] == filename
+
+
+class StagingFolderSnapshot:
+    """
+    Sorted list of the relative filenames of a staging folder. A snapshot
+    is reused while the modification time of its directories stays the
+    same, which happens until files are added, removed or renamed.
+    """
+    _lock = threading.Lock()
+    _registry = {}
+
+    @classmethod
+    def get_filenames(cls, staging_folder):
+        options = (
+            staging_folder.kwargs['folder_path'],
+            staging_folder.kwargs.get('include_subdirectories', False),
+            staging_folder.kwargs.get(
+                'include_regex', REGULAR_EXPRESSION_MATCH_EVERYTHING
+            ),
+            staging_folder.kwargs.get(
+                'exclude_regex', REGULAR_EXPRESSION_MATCH_NOTHING
+            ) or REGULAR_EXPRESSION_MATCH_NOTHING
+        )
+
+        with cls._lock:
+            snapshot = cls._registry.get(staging_folder.model_instance_id)
+
+        if not snapshot or snapshot.options != options or not snapshot.is_valid():
+            snapshot = cls(options=options)
+
+            with cls._lock:
+                if snapshot.is_cacheable():
+                    cls._registry[staging_folder.model_instance_id] = snapshot
+                else:
+                    cls._registry.pop(staging_folder.model_instance_id, None)
+
+        return snapshot.filenames
+
+    @staticmethod
+    def get_sort_key(filename):
+        return filename.split(os.sep)
+
+    def __init__(self, options):
+        self.directory_mtimes = {}
+        self.options = options
+        self.time = time.time()
+
+        folder_path, include_subdirectories, include_regex, exclude_regex = options
+
+        # Force path check to trigger any error.
+        Path(folder_path).lstat()
+
+        self.filenames = list(
+            self._scan(
+                exclude_regex=re.compile(pattern=exclude_regex),
+                folder_path=folder_path,
+                include_regex=re.compile(pattern=include_regex),
+                include_subdirectories=include_subdirectories,
+                path=folder_path
+            )
+        )
+        self.filenames.sort(key=StagingFolderSnapshot.get_sort_key)
+
+    def _scan(
+        self, exclude_regex, folder_path, include_regex,
+        include_subdirectories, path
+    ):
+        self.directory_mtimes[path] = os.stat(path=path).st_mtime_ns
+
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                if entry.is_dir(follow_symlinks=False):
+                    if include_subdirectories:
+                        yield from self._scan(
+                            exclude_regex=exclude_regex,
+                            folder_path=folder_path,
+                            include_regex=include_regex,
+                            include_subdirectories=include_subdirectories,
+                            path=entry.path
+                        )
+                elif entry.is_file() and include_regex.match(string=entry.name) and not exclude_regex.match(string=entry.name):
+                    yield os.path.relpath(path=entry.path, start=folder_path)
+
+    def is_cacheable(self):
+        """
+        Directories modified right before the scan could be modified again
+        within the resolution of the filesystem timestamps. Don't reuse
+        the snapshot of those.
+        """
+        limit = (
+            self.time - STAGING_FOLDER_SNAPSHOT_MTIME_GRANULARITY
+        ) * 1e9
+
+        return all(
+            mtime < limit for mtime in self.directory_mtimes.values()
+        )
+
+    def is_valid(self):
+        for path, mtime in self.directory_mtimes.items():
+            try:
+                if os.stat(path=path).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+
+class StagingFolderFileChoiceField(forms.ChoiceField):
+    """
+    Choice field that validates the selected file against the staging
+    folder instead of a list with a choice for every file.
+    """
+    def __init__(self, *args, **kwargs):
+        self.staging_folder = None
+        super().__init__(*args, **kwargs)
+
+    def valid_value(self, value):
+        if not self.staging_folder:
+            return False
+
+        try:
+            staging_folder_file = self.staging_folder.get_file(
+                encoded_filename=value
+            )
+        except Http404:
+            return False
+
+        return self.staging_folder.get_files().has_filename(
+            filename=staging_folder_file.filename
+        )
+
+
 class StagingUploadForm(UploadBaseForm):
     """
     Form that show all the files in the staging folder specified by the
-    StagingFolderFile class passed as 'cls' argument.
+    StagingFolderFile class passed as 'cls' argument. Only the selected
+    file is added as a choice, the files are selected from the paginated
+    staging file list.
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        field = self.fields['staging_folder_file_id']
+
         try:
-            self.fields['staging_folder_file_id'].choices = [
-                (
-                    staging_folder_file.encoded_filename, force_text(s=staging_folder_file)
-                ) for staging_folder_file in self.source.get_backend_instance().get_files()
-            ]
+            field.staging_folder = self.source.get_backend_instance()
+
+            value = self.data.get(self.add_prefix('staging_folder_file_id'))
+            if value and field.valid_value(value=value):
+                field.choices = [
+                    (
+                        value, force_text(
+                            s=field.staging_folder.get_file(
+                                encoded_filename=value
+                            )
+                        )
+                    )
+                ]
         except Exception as exception:
             logger.error('exception: %s', exception)
 
-    staging_folder_file_id = forms.ChoiceField(
+    staging_folder_file_id = StagingFolderFileChoiceField(
         label=_('Staging file'), widget=forms.widgets.Select(
             attrs={'class': 'select2'}
         )
@@ -247,7 +481,10 @@ class SourceBackendStagingFolder(
             name='file_image', arguments=('encoded_filename',),
             confirmation=False
         ),
-        SourceBackendAction(name='file_list', confirmation=False),
+        SourceBackendAction(
+            name='file_list', arguments=('cursor', 'page_size'),
+            confirmation=False
+        ),
         SourceBackendAction(
             name='file_upload', arguments=(
                 'document_type_id', 'encoded_filename', 'expand'
@@ -356,7 +593,10 @@ class SourceBackendStagingFolder(
             view='sources:source_action'
         )
         link_staging_folder_file_select = Link(
-            html_data={'encoded_filename': 'object.encoded_filename'},
+            html_data={
+                'encoded_filename': 'object.encoded_filename',
+                'filename': 'object.filename'
+            },
             html_extra_classes='sources-staging_folder-select',
             icon=cls.icon_staging_folder_file_select, text=_('Select'),
             url=''
@@ -419,8 +659,19 @@ class SourceBackendStagingFolder(
             name=STORAGE_NAME_SOURCE_CACHE_FOLDER
         ).get_storage_instance()
 
+        def get_file_object():
+            if cache_filename:
+                return storage_staging_folder_file_image_cache.open(
+                    name=cache_filename
+                )
+            else:
+                # Another process is caching the image, don't wait for it.
+                return staging_folder_file.get_image(
+                    transformation_instance_list=combined_transformation_list
+                )
+
         def file_generator():
-            with storage_staging_folder_file_image_cache.open(name=cache_filename) as file_object:
+            with get_file_object() as file_object:
                 converter = ConverterBase.get_converter_class()(
                     file_object=file_object
                 )
@@ -441,10 +692,44 @@ class SourceBackendStagingFolder(
         )
         return None, response
 
-    def action_file_list(self, request):
+    def action_file_list(self, request, cursor=None, page_size=None):
+        """
+        Return a page of the staging folder files. The `cursor` is the
+        encoded filename of the last file of the previous page. The URL of
+        the next page is returned in the `Link` header.
+        """
+        # Query string arguments are received as lists.
+        if isinstance(cursor, (list, tuple)):
+            cursor = cursor[0]
+
+        if isinstance(page_size, (list, tuple)):
+            page_size = page_size[0]
+
+        if page_size:
+            try:
+                page_size = int(page_size)
+            except ValueError:
+                page_size = 0
+
+            if page_size < 1:
+                raise ValidationError(
+                    {'page_size': _('Must be a positive integer.')}
+                )
+        else:
+            page_size = setting_paginate_by.value
+
+        staging_files = self.get_files()
+
+        if cursor:
+            start = staging_files.get_index_after(
+                filename=self.get_file(encoded_filename=cursor).filename
+            )
+        else:
+            start = 0
+
         staging_folder_files = []
 
-        for staging_folder_file in self.get_files():
+        for staging_folder_file in staging_files[start:start + page_size]:
             staging_folder_files.append(
                 {
                     'filename': staging_folder_file.filename,
@@ -467,7 +752,15 @@ class SourceBackendStagingFolder(
                 }
             )
 
-        return staging_folder_files, None
+        headers = {}
+
+        if start + page_size < len(staging_files):
+            next_url = furl(url=request.build_absolute_uri())
+            next_url.args['cursor'] = staging_folder_files[-1]['encoded_filename']
+            next_url.args['page_size'] = page_size
+            headers['Link'] = '<{}>; rel="next"'.format(next_url.tostr())
+
+        return None, Response(data=staging_folder_files, headers=headers)
 
     def action_file_upload(
         self, request, document_type_id, encoded_filename, expand=False
@@ -561,36 +854,12 @@ class SourceBackendStagingFolder(
             raise Http404
 
     def get_files(self):
-        include_regex = re.compile(
-            pattern=self.kwargs.get(
-                'include_regex', REGULAR_EXPRESSION_MATCH_EVERYTHING
-            )
-        )
-        exclude_regex = re.compile(
-            pattern=self.kwargs.get(
-                'exclude_regex', REGULAR_EXPRESSION_MATCH_NOTHING
-            ) or REGULAR_EXPRESSION_MATCH_NOTHING
+        return StagingFolderFileList(
+            filenames=StagingFolderSnapshot.get_filenames(
+                staging_folder=self
+            ), staging_folder=self
         )
 
-        path = Path(self.kwargs['folder_path'])
-
-        # Force path check to trigger any error.
-        path.lstat()
-
-        if self.kwargs.get('include_subdirectories', False):
-            iterator = path.rglob(pattern='*')
-        else:
-            iterator = path.glob(pattern='*')
-
-        for entry in sorted(iterator):
-            if entry.is_file() and include_regex.match(string=entry.name) and not exclude_regex.match(string=entry.name):
-                relative_filename = str(
-                    entry.relative_to(self.kwargs['folder_path'])
-                )
-                yield self.get_file(
-                    filename=relative_filename
-                )
-
     def get_shared_uploaded_files(self):
         staging_folder_file = self.get_file(
             encoded_filename=self.process_kwargs['forms']['source_form'].cleaned_data['staging_folder_file_id']
@@ -603,9 +872,36 @@ class SourceBackendStagingFolder(
             ),
         )
 
+    def pregenerate_file_images(self, page, staging_files):
+        """
+        Generate the images of the files of the page being viewed and of
+        the pages that follow in the background.
+        """
+        if page:
+            start = page.start_index() - 1
+            end = start + page.paginator.per_page * STAGING_FOLDER_FILE_IMAGE_PREGENERATE_PAGES
+        else:
+            start = 0
+            end = len(staging_files)
+
+        encoded_filename_list = [
+            staging_folder_file.encoded_filename for staging_folder_file in staging_files[start:end]
+            if not staging_folder_file.storage.exists(
+                name=staging_folder_file.cache_filename
+            )
+        ]
+
+        if encoded_filename_list:
+            task_staging_folder_file_image_generate.apply_async(
+                kwargs={
+                    'encoded_filename_list': encoded_filename_list,
+                    'source_id': self.model_instance_id
+                }
+            )
+
     def get_view_context(self, context, request):
         try:
-            staging_files = list(self.get_files())
+            staging_files = self.get_files()
         except Exception as exception:
             messages.error(
                 message=_(
@@ -640,6 +936,11 @@ class SourceBackendStagingFolder(
 
         template_staging_file_list_context.update(view.get_context_data())
 
+        self.pregenerate_file_images(
+            page=template_staging_file_list_context.get('page_obj'),
+            staging_files=staging_files
+        )
+
         subtemplates_list = [
             {
                 'name': 'appearance/generic_multiform_subtemplate.html',
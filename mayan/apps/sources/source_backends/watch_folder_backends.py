@@ -1,8 +1,9 @@
 import logging
+import os
 from pathlib import Path
 import re
+import time
 
-from django.core.files import File
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.storage.models import SharedUploadedFile
@@ -11,8 +12,8 @@ from ..classes import SourceBackend
 from ..exceptions import SourceException
 
 from .literals import (
-    REGULAR_EXPRESSION_MATCH_EVERYTHING, REGULAR_EXPRESSION_MATCH_NOTHING,
-    SOURCE_INTERVAL_UNCOMPRESS_CHOICES
+    DEFAULT_WATCH_FOLDER_STABILITY_PERIOD, REGULAR_EXPRESSION_MATCH_EVERYTHING,
+    REGULAR_EXPRESSION_MATCH_NOTHING, SOURCE_INTERVAL_UNCOMPRESS_CHOICES
 )
 from .mixins import (
     SourceBackendCompressedMixin, SourceBackendPeriodicMixin, SourceBaseMixin
@@ -28,7 +29,7 @@ class SourceBackendWatchFolder(
 ):
     field_order = (
         'folder_path', 'include_subdirectories', 'include_regex',
-        'exclude_regex'
+        'exclude_regex', 'stability_period'
     )
     fields = {
         'folder_path': {
@@ -70,11 +71,42 @@ class SourceBackendWatchFolder(
             ),
             'label': _('Exclude regular expression'),
             'required': False
+        },
+        'stability_period': {
+            'class': 'django.forms.IntegerField',
+            'default': DEFAULT_WATCH_FOLDER_STABILITY_PERIOD,
+            'help_text': _(
+                'Number of seconds that the size and modification time of a '
+                'file must remain unchanged before the file is uploaded. '
+                'Avoids uploading files that are still being written.'
+            ),
+            'kwargs': {
+                'min_value': 0
+            },
+            'label': _('Stability period'),
+            'required': False
         }
     }
     label = _('Watch folder')
     uncompress_choices = SOURCE_INTERVAL_UNCOMPRESS_CHOICES
 
+    @staticmethod
+    def _get_entries(path, include_subdirectories):
+        """
+        Walk the folder using directory entries, which cache the file type
+        and avoid a stat call per entry.
+        """
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                if entry.is_dir(follow_symlinks=False):
+                    if include_subdirectories:
+                        yield from SourceBackendWatchFolder._get_entries(
+                            include_subdirectories=include_subdirectories,
+                            path=entry.path
+                        )
+                elif entry.is_file() or entry.is_symlink():
+                    yield entry
+
     def get_shared_uploaded_files(self):
         dry_run = self.process_kwargs.get('dry_run', False)
         include_regex = re.compile(
@@ -88,25 +120,62 @@ class SourceBackendWatchFolder(
             ) or REGULAR_EXPRESSION_MATCH_NOTHING
         )
         path = Path(self.kwargs['folder_path'])
+        stability_period = self.kwargs.get('stability_period')
+
+        if stability_period in (None, ''):
+            stability_period = DEFAULT_WATCH_FOLDER_STABILITY_PERIOD
 
         # Force testing the path and raise errors for the log.
         path.lstat()
         if not path.is_dir():
             raise SourceException('Path {} is not a directory.'.format(path))
 
-        if self.kwargs.get('include_subdirectories', False):
-            iterator = path.rglob(pattern='*')
-        else:
-            iterator = path.glob(pattern='*')
-
-        for entry in iterator:
-            if entry.is_file() or entry.is_symlink():
-                if include_regex.match(string=entry.name) and not exclude_regex.match(string=entry.name):
-                    with entry.open(mode='rb+') as file_object:
-                        shared_uploaded_file = SharedUploadedFile.objects.create(
-                            file=File(file=file_object), filename=entry.name
-                        )
-                        if not dry_run:
-                            entry.unlink()
+        entries = self._get_entries(
+            include_subdirectories=self.kwargs.get(
+                'include_subdirectories', False
+            ), path=path
+        )
+
+        for entry in entries:
+            if include_regex.match(string=entry.name) and not exclude_regex.match(string=entry.name):
+                try:
+                    entry_stat = entry.stat()
+                except FileNotFoundError:
+                    # Removed after the folder was scanned.
+                    continue
+
+                if time.time() - entry_stat.st_mtime < int(stability_period):
+                    logger.debug(
+                        'Skipping file "%s", modified less than %s seconds '
+                        'ago.', entry.path, stability_period
+                    )
+                    continue
+
+                # Check again right before the upload to detect files that
+                # are still being written.
+                try:
+                    entry_stat_current = os.stat(path=entry.path)
+                except FileNotFoundError:
+                    continue
+
+                if (entry_stat.st_size, entry_stat.st_mtime_ns) != (entry_stat_current.st_size, entry_stat_current.st_mtime_ns):
+                    logger.debug(
+                        'Skipping file "%s", size or modification time '
+                        'changed.', entry.path
+                    )
+                    continue
+
+                shared_uploaded_file = SharedUploadedFile.objects.create_from_path(
+                    filename=entry.name, keep_source=dry_run,
+                    path=entry.path
+                )
+
+                if not shared_uploaded_file:
+                    # Removed after the file was checked.
+                    continue
+
+                yield shared_uploaded_file
 
-                        return (shared_uploaded_file,)
+                if dry_run:
+                    # Test uploads process a single file.
+                    return
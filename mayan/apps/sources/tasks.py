@@ -101,3 +101,23 @@ def task_process_document_upload(
             )
 
         shared_uploaded_file.delete()
+
+
+@app.task(ignore_result=True)
+def task_staging_folder_file_image_generate(encoded_filename_list, source_id):
+    Source = apps.get_model(
+        app_label='sources', model_name='Source'
+    )
+
+    staging_folder = Source.objects.get(pk=source_id).get_backend_instance()
+
+    for encoded_filename in encoded_filename_list:
+        try:
+            staging_folder.get_file(
+                encoded_filename=encoded_filename
+            ).generate_image()
+        except Exception as exception:
+            logger.warning(
+                'Unable to generate the image of staging folder file: %s; '
+                '%s', encoded_filename, exception
+            )
@@ -36,11 +36,13 @@ class StagingFolderActionAPIViewTestMixin:
             }, query={'encoded_filename': self._test_staging_folder_file.encoded_filename}
         )
 
-    def _request_test_staging_folder_file_list_action_api_view(self):
+    def _request_test_staging_folder_file_list_action_api_view(
+        self, query=None
+    ):
         return self.get(
             viewname='rest_api:source-action', kwargs={
                 'action_name': 'file_list', 'source_id': self._test_source.pk
-            }
+            }, query=query
         )
 
     def _request_test_staging_folder_file_upload_action_api_view(self):
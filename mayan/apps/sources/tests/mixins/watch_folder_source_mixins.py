@@ -33,6 +33,7 @@ class WatchFolderSourceTestMixin(SourceTestMixin):
             'folder_path': temporary_folder,
             'include_subdirectories': False,
             'interval': DEFAULT_PERIOD_INTERVAL,
+            'stability_period': 0,
             'uncompress': SOURCE_UNCOMPRESS_CHOICE_NEVER
         }
 
@@ -132,6 +132,40 @@ class StagingFolderActionAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_staging_folder_file_list_action_api_view_cursor_with_access(self):
+        self.grant_access(
+            obj=self._test_source, permission=permission_document_create
+        )
+
+        self._copy_test_staging_folder_document(filename='test_file_1')
+        self._copy_test_staging_folder_document(filename='test_file_2')
+
+        self._clear_events()
+
+        response = self._request_test_staging_folder_file_list_action_api_view(
+            query={'page_size': 1}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['filename'], 'test_file_1')
+        self.assertTrue('rel="next"' in response['Link'])
+
+        response = self._request_test_staging_folder_file_list_action_api_view(
+            query={
+                'cursor': response.data[0]['encoded_filename'],
+                'page_size': 1
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['filename'], 'test_file_2')
+        self.assertFalse(response.has_header('Link'))
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_staging_folder_file_upload_api_view_no_permission(self):
         self._create_test_document_type()
 
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -6,6 +7,7 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import (
     TEST_DOCUMENT_SMALL_CHECKSUM, TEST_FILE_SMALL_PATH
 )
+from mayan.apps.lock_manager.backends.base import LockingBackend
 
 from .mixins.base_mixins import InteractiveSourceBackendTestMixin
 from .mixins.staging_folder_source_mixins import StagingFolderTestMixin
@@ -86,3 +88,77 @@ class StagingFolderSourceBackendTestCase(
         path = Path(self._test_source.get_backend_data()['folder_path'])
 
         self.assertEqual(sum(1 for x in path.glob('*') if x.is_file()), 0)
+
+    def test_file_list_snapshot_refresh(self):
+        self._create_test_staging_folder()
+
+        self._copy_test_staging_folder_document()
+
+        path = self._test_source.get_backend_data()['folder_path']
+
+        # Age the folder to allow caching its snapshot.
+        os.utime(path=path, times=(0, 0))
+
+        source_backend_instance = self._test_source.get_backend_instance()
+
+        self.assertEqual(len(source_backend_instance.get_files()), 1)
+
+        self._copy_test_staging_folder_document(filename='test_file_2')
+
+        self.assertEqual(len(source_backend_instance.get_files()), 2)
+
+    def test_file_image_generate_locked(self):
+        self._create_test_staging_folder()
+
+        self._copy_test_staging_folder_document()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self._test_staging_folder_file.get_image_lock_name()
+        )
+
+        try:
+            self.assertEqual(
+                self._test_staging_folder_file.generate_image(), None
+            )
+        finally:
+            lock.release()
+
+        self.assertFalse(
+            self._test_staging_folder_file.storage.exists(
+                name=self._test_staging_folder_file.cache_filename
+            )
+        )
+
+    def test_file_image_pregenerate(self):
+        self._create_test_staging_folder()
+
+        self._copy_test_staging_folder_document()
+
+        source_backend_instance = self._test_source.get_backend_instance()
+
+        source_backend_instance.pregenerate_file_images(
+            page=None, staging_files=source_backend_instance.get_files()
+        )
+
+        self.assertTrue(
+            self._test_staging_folder_file.storage.exists(
+                name=self._test_staging_folder_file.cache_filename
+            )
+        )
+
+    def test_file_list_index_after(self):
+        self._create_test_staging_folder()
+
+        self._copy_test_staging_folder_document(filename='test_file_1')
+        self._copy_test_staging_folder_document(filename='test_file_3')
+
+        staging_files = self._test_source.get_backend_instance().get_files()
+
+        self.assertEqual(
+            staging_files.get_index_after(filename='test_file_1'), 1
+        )
+        self.assertEqual(
+            staging_files.get_index_after(filename='test_file_2'), 1
+        )
+        self.assertTrue(staging_files.has_filename(filename='test_file_3'))
+        self.assertFalse(staging_files.has_filename(filename='test_file_2'))
@@ -160,3 +160,47 @@ class WatchFolderSourceBackendTestCase(
         self.assertEqual(document.file_latest.size, 17436)
         self.assertEqual(document.file_latest.mimetype, 'image/png')
         self.assertEqual(document.file_latest.encoding, 'binary')
+
+    def test_stability_period(self):
+        self._create_test_watch_folder(
+            extra_data={'stability_period': 60}
+        )
+
+        document_count = Document.objects.count()
+
+        temporary_directory = self._test_source.get_backend_data()['folder_path']
+
+        shutil.copy(src=TEST_FILE_SMALL_PATH, dst=temporary_directory)
+
+        self._test_source.get_backend_instance().process_documents()
+
+        self.assertEqual(Document.objects.count(), document_count)
+
+        backend_data = self._test_source.get_backend_data()
+        backend_data['stability_period'] = 0
+        self._test_source.set_backend_data(obj=backend_data)
+
+        self._test_source.get_backend_instance().process_documents()
+
+        self.assertEqual(Document.objects.count(), document_count + 1)
+
+    def test_upload_multiple_files(self):
+        self._create_test_watch_folder()
+
+        document_count = Document.objects.count()
+
+        temporary_directory = self._test_source.get_backend_data()['folder_path']
+
+        shutil.copy(
+            src=TEST_FILE_SMALL_PATH,
+            dst=Path(temporary_directory, 'test_file_1')
+        )
+        shutil.copy(
+            src=TEST_FILE_SMALL_PATH,
+            dst=Path(temporary_directory, 'test_file_2')
+        )
+
+        self._test_source.get_backend_instance().process_documents()
+
+        self.assertEqual(Document.objects.count(), document_count + 2)
+        self.assertEqual(list(Path(temporary_directory).iterdir()), [])
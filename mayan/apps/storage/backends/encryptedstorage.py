@@ -1,21 +1,40 @@
+import io
+import os
+import shutil
+import struct
+
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
 from Crypto.Protocol.KDF import PBKDF2
+from Crypto.Random import get_random_bytes
 from Crypto.Util.Padding import pad, unpad
 
 from django.conf import settings
-from django.core.files.base import ContentFile
-from django.utils.encoding import force_text
+from django.core.files.base import ContentFile, File
+from django.utils.encoding import force_bytes, force_text
 
 from ..classes import BufferedFile, PassthroughStorage
+from ..exceptions import EncryptedFileError
 
 from .literals import (
-    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
+    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_FORMAT_HEADER_STRUCT,
+    ENCRYPTION_FORMAT_MAGIC, ENCRYPTION_FORMAT_NONCE_PREFIX_SIZE,
+    ENCRYPTION_FORMAT_TAG_SIZE, ENCRYPTION_FORMAT_VERSION_1,
+    ENCRYPTION_FORMAT_VERSION_2, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
     ENCRYPTION_KEY_SIZE
 )
 
+ENCRYPTION_FORMAT_HEADER_SIZE = struct.calcsize(
+    ENCRYPTION_FORMAT_HEADER_STRUCT
+)
+
 
 class BufferedEncryptedFile(BufferedFile):
+    """
+    Encrypted file format version 1. The entire file is a single AES-CBC
+    stream and can only be read sequentially. Kept to be able to read
+    files saved before format version 2.
+    """
     def __init__(self, *args, **kwargs):
         self.key = kwargs.pop('key')
 
@@ -29,7 +48,11 @@ class BufferedEncryptedFile(BufferedFile):
         self.position = 0
 
     def _get_file_object_chunk(self):
-        chunk = self.file_object.read(ENCRYPTION_FILE_CHUNK_SIZE)
+        # Each chunk was padded when written, read the chunk plus the
+        # padding block.
+        chunk = self.file_object.read(
+            ENCRYPTION_FILE_CHUNK_SIZE + AES.block_size
+        )
 
         if chunk:
             data = unpad(
@@ -83,6 +106,284 @@ class BufferedEncryptedFile(BufferedFile):
         return count
 
 
+class ChunkedEncryptedFile(File):
+    """
+    Encrypted file format version 2. The file is stored as a header
+    followed by fixed size chunks, each encrypted and authenticated
+    independently with AES-GCM. Any chunk can be decrypted on its own which
+    allows random access reads and computing the size of the file without
+    decrypting it.
+
+    The nonce of each chunk is derived from a random per file prefix and
+    the chunk index. The header and a flag marking the last chunk are
+    authenticated with every chunk to detect chunk reordering and
+    truncation.
+    """
+    @staticmethod
+    def get_size_from_stored_size(chunk_size, stored_size):
+        stored_chunk_size = chunk_size + ENCRYPTION_FORMAT_TAG_SIZE
+        chunk_count, remainder = divmod(
+            stored_size - ENCRYPTION_FORMAT_HEADER_SIZE, stored_chunk_size
+        )
+
+        if remainder == 0:
+            if chunk_count == 0:
+                raise EncryptedFileError('Encrypted file is truncated.')
+            return chunk_count * chunk_size
+        elif remainder < ENCRYPTION_FORMAT_TAG_SIZE:
+            raise EncryptedFileError('Encrypted file is truncated.')
+        else:
+            return chunk_count * chunk_size + remainder - ENCRYPTION_FORMAT_TAG_SIZE
+
+    @staticmethod
+    def parse_header(header):
+        """
+        Return the chunk size and nonce prefix of a format version 2 header
+        or None if the header is not from a format version 2 file.
+        """
+        if len(header) != ENCRYPTION_FORMAT_HEADER_SIZE:
+            return None
+
+        magic, version, chunk_size, nonce_prefix = struct.unpack(
+            ENCRYPTION_FORMAT_HEADER_STRUCT, header
+        )
+
+        if magic == ENCRYPTION_FORMAT_MAGIC and version == ENCRYPTION_FORMAT_VERSION_2:
+            return chunk_size, nonce_prefix
+
+    def __init__(self, file_object, key, mode, header=None, name=None):
+        self.binary_mode = 'b' in mode
+        self.file_object = file_object
+        self.key = key
+        self.mode = mode
+        self.name = name
+        self.position = 0
+
+        self._chunk = None
+        self._chunk_index = None
+        self._closed = False
+        self._size = None
+
+        if header:
+            self.chunk_size, self.nonce_prefix = ChunkedEncryptedFile.parse_header(
+                header=header
+            )
+            self.header = header
+            # Position of the underlying file, used to avoid seeking it
+            # during sequential reads.
+            self._file_object_position = ENCRYPTION_FORMAT_HEADER_SIZE
+        else:
+            self.chunk_size = ENCRYPTION_FILE_CHUNK_SIZE
+            self.nonce_prefix = get_random_bytes(
+                ENCRYPTION_FORMAT_NONCE_PREFIX_SIZE
+            )
+            self.header = struct.pack(
+                ENCRYPTION_FORMAT_HEADER_STRUCT, ENCRYPTION_FORMAT_MAGIC,
+                ENCRYPTION_FORMAT_VERSION_2, self.chunk_size,
+                self.nonce_prefix
+            )
+            self._file_object_position = None
+            self._header_written = False
+            self._write_buffer = bytearray()
+            self._write_chunk_index = 0
+
+    def _get_chunk(self, index):
+        """
+        Return a tuple with the decrypted data of the chunk and a flag
+        indicating if it is the last chunk of the file.
+        """
+        if index == self._chunk_index:
+            return self._chunk
+
+        stored_chunk_size = self.chunk_size + ENCRYPTION_FORMAT_TAG_SIZE
+        offset = ENCRYPTION_FORMAT_HEADER_SIZE + index * stored_chunk_size
+
+        if self._file_object_position != offset:
+            self.file_object.seek(offset)
+
+        data = bytearray()
+        while len(data) < stored_chunk_size:
+            buffer = self.file_object.read(stored_chunk_size - len(data))
+            if not buffer:
+                break
+            data.extend(buffer)
+
+        self._file_object_position = offset + len(data)
+
+        if not data:
+            # Reading past the end of the file is only valid if the last
+            # chunk available is marked as the final chunk.
+            last_index = max(self.size - 1, 0) // self.chunk_size
+            if index > last_index and self._get_chunk(index=last_index)[1]:
+                return b'', True
+            else:
+                raise EncryptedFileError('Encrypted file is truncated.')
+
+        ciphertext = bytes(data[:-ENCRYPTION_FORMAT_TAG_SIZE])
+        tag = bytes(data[-ENCRYPTION_FORMAT_TAG_SIZE:])
+
+        for final in (False, True):
+            cipher = self._get_cipher(index=index, final=final)
+            try:
+                plaintext = cipher.decrypt_and_verify(
+                    ciphertext=ciphertext, received_mac_tag=tag
+                )
+            except ValueError:
+                """Not authenticated with this final chunk flag value."""
+            else:
+                break
+        else:
+            raise EncryptedFileError(
+                'Encrypted file chunk {} failed authentication.'.format(index)
+            )
+
+        if not final and len(plaintext) != self.chunk_size:
+            raise EncryptedFileError('Encrypted file is truncated.')
+
+        self._chunk = (plaintext, final)
+        self._chunk_index = index
+
+        return self._chunk
+
+    def _get_cipher(self, index, final):
+        cipher = AES.new(
+            key=self.key, mode=AES.MODE_GCM,
+            nonce=self.nonce_prefix + struct.pack('>I', index)
+        )
+        cipher.update(self.header + (b'\x01' if final else b'\x00'))
+        return cipher
+
+    def _get_size(self):
+        if self._size is None:
+            try:
+                self.file_object.seek(0, io.SEEK_END)
+                stored_size = self.file_object.tell()
+            except (AttributeError, OSError):
+                # The underlying file does not support seeking to the end.
+                # Find the last chunk reading the chunks sequentially.
+                index = 0
+                while True:
+                    data, final = self._get_chunk(index=index)
+                    if final:
+                        break
+                    index += 1
+
+                self._size = index * self.chunk_size + len(data)
+            else:
+                self._file_object_position = stored_size
+                self._size = ChunkedEncryptedFile.get_size_from_stored_size(
+                    chunk_size=self.chunk_size, stored_size=stored_size
+                )
+
+        return self._size
+
+    def _set_size(self, size):
+        self._size = size
+
+    size = property(_get_size, _set_size)
+
+    def _write_chunk(self, data, final):
+        if not self._header_written:
+            self.file_object.write(self.header)
+            self._header_written = True
+
+        cipher = self._get_cipher(index=self._write_chunk_index, final=final)
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext=bytes(data))
+        self.file_object.write(ciphertext)
+        self.file_object.write(tag)
+        self._write_chunk_index += 1
+
+    def close(self):
+        if self._closed:
+            return
+
+        if 'w' in self.mode:
+            # The remaining buffered data, even if empty, is always written
+            # as the last chunk.
+            self._write_chunk(data=self._write_buffer, final=True)
+            self._write_buffer = bytearray()
+
+        self.file_object.close()
+        self._closed = True
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def flush(self):
+        return self.file_object.flush()
+
+    def read(self, size=-1):
+        if size is None:
+            size = -1
+
+        result = bytearray()
+
+        while size < 0 or len(result) < size:
+            index, offset = divmod(self.position, self.chunk_size)
+            data, final = self._get_chunk(index=index)
+
+            if size < 0:
+                part = data[offset:]
+            else:
+                part = data[offset:offset + size - len(result)]
+
+            result.extend(part)
+            self.position += len(part)
+
+            if final and offset + len(part) >= len(data):
+                break
+
+        if self.binary_mode:
+            return bytes(result)
+        else:
+            return force_text(s=bytes(result))
+
+    def readable(self):
+        return 'r' in self.mode
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError('Invalid whence value: {}'.format(whence))
+
+        if position < 0:
+            raise ValueError('Negative seek position: {}'.format(position))
+
+        self.position = position
+        return self.position
+
+    def seekable(self):
+        return 'r' in self.mode
+
+    def tell(self):
+        return self.position
+
+    def writable(self):
+        return 'w' in self.mode
+
+    def write(self, data):
+        data = force_bytes(s=data)
+
+        self._write_buffer.extend(data)
+
+        # Keep at least one byte buffered to make sure the last chunk
+        # written on close is never empty unless the file is empty.
+        while len(self._write_buffer) > self.chunk_size:
+            self._write_chunk(
+                data=self._write_buffer[:self.chunk_size], final=False
+            )
+            del self._write_buffer[:self.chunk_size]
+
+        self.position += len(data)
+        return len(data)
+
+
 class EncryptedPassthroughStorage(PassthroughStorage):
     def __init__(self, *args, **kwargs):
         password = kwargs.pop('password')
@@ -96,6 +397,21 @@ class EncryptedPassthroughStorage(PassthroughStorage):
         )
         self.position = 0
 
+    def _read_header(self, name):
+        with self._call_backend_method(
+            method_name='open', kwargs={'name': name, 'mode': 'rb'}
+        ) as file_object:
+            return file_object.read(ENCRYPTION_FORMAT_HEADER_SIZE)
+
+    def get_format_version(self, name):
+        """
+        Return the encrypted file format version of a stored file.
+        """
+        if ChunkedEncryptedFile.parse_header(header=self._read_header(name=name)):
+            return ENCRYPTION_FORMAT_VERSION_2
+        else:
+            return ENCRYPTION_FORMAT_VERSION_1
+
     def open(self, name, mode='rb', _direct=False):
         next_kwargs = {'name': name}
         if _direct:
@@ -107,15 +423,37 @@ class EncryptedPassthroughStorage(PassthroughStorage):
             return self._call_backend_method(
                 method_name='open', kwargs=next_kwargs
             )
+        elif 'w' in mode:
+            next_kwargs['mode'] = 'wb'
+            storage_file = self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+            return ChunkedEncryptedFile(
+                file_object=storage_file, key=self.key, mode=mode, name=name
+            )
         else:
             # Mode is always 'rb' when reading the encrypted file
             next_kwargs['mode'] = 'rb+'
             storage_file = self._call_backend_method(
                 method_name='open', kwargs=next_kwargs
             )
-            return BufferedEncryptedFile(
-                file_object=storage_file, key=self.key, mode=mode,
-            )
+
+            header = storage_file.read(ENCRYPTION_FORMAT_HEADER_SIZE)
+            if ChunkedEncryptedFile.parse_header(header=header):
+                return ChunkedEncryptedFile(
+                    file_object=storage_file, header=header, key=self.key,
+                    mode=mode, name=name
+                )
+            else:
+                # Reopen instead of seeking back to support next storages
+                # that are not seekable.
+                storage_file.close()
+                storage_file = self._call_backend_method(
+                    method_name='open', kwargs=next_kwargs
+                )
+                return BufferedEncryptedFile(
+                    file_object=storage_file, key=self.key, mode=mode,
+                )
 
     def save(self, name, content, max_length=None, _direct=False):
         next_kwargs = {'max_length': max_length, 'name': name}
@@ -129,7 +467,6 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                 method_name='save', kwargs=next_kwargs
             )
         else:
-            cipher = AES.new(key=self.key, mode=AES.MODE_CBC)
             if not self._call_backend_method(
                 method_name='exists', kwargs={'name': name}
             ):
@@ -139,28 +476,77 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                     }
                 )
 
-            with self._call_backend_method(
-                method_name='open', kwargs={
-                    'name': name, 'mode': 'wb'
-                }
-            ) as file_object:
-                file_object.write(cipher.iv)
-
+            with self.open(name=name, mode='wb') as file_object:
                 while True:
                     chunk = content.read(ENCRYPTION_FILE_CHUNK_SIZE)
 
-                    try:
-                        chunk = chunk.encode('utf-8')
-                    except AttributeError:
-                        """Already a byte string"""
-
                     if chunk:
-                        chunk = pad(
-                            data_to_pad=chunk, block_size=AES.block_size
-                        )
+                        file_object.write(chunk)
                     else:
                         break
 
-                    file_object.write(cipher.encrypt(chunk))
-
             return name
+
+    def size(self, name):
+        """
+        Return the size of the decrypted file. Format version 2 sizes are
+        calculated from the stored size without decrypting the file.
+        """
+        result = ChunkedEncryptedFile.parse_header(
+            header=self._read_header(name=name)
+        )
+
+        stored_size = self._call_backend_method(
+            method_name='size', kwargs={'name': name}
+        )
+
+        if result:
+            chunk_size, nonce_prefix = result
+            return ChunkedEncryptedFile.get_size_from_stored_size(
+                chunk_size=chunk_size, stored_size=stored_size
+            )
+        else:
+            return stored_size
+
+    def upgrade_format(self, name):
+        """
+        Re-encrypt a file using the latest encrypted file format version.
+        The file is copied to a new name and the original file is left
+        untouched, an interruption never loses data. The caller swaps the
+        references to the new name and deletes the original file. Returns
+        the name of the upgraded copy or None if the file already uses the
+        latest format version.
+        """
+        if self.get_format_version(name=name) == ENCRYPTION_FORMAT_VERSION_2:
+            return None
+
+        file_root, file_ext = os.path.splitext(name)
+
+        while True:
+            new_name = self.get_alternative_name(
+                file_root=file_root, file_ext=file_ext
+            )
+            if not self._call_backend_method(
+                method_name='exists', kwargs={'name': new_name}
+            ):
+                break
+
+        new_name = self._call_backend_method(
+            method_name='save', kwargs={
+                'content': ContentFile(content=''), 'name': new_name
+            }
+        )
+
+        try:
+            with self.open(name=name, mode='rb') as file_object:
+                with self.open(name=new_name, mode='wb') as new_file_object:
+                    shutil.copyfileobj(
+                        fsrc=file_object, fdst=new_file_object
+                    )
+        except Exception:
+            self._call_backend_method(
+                method_name='delete', kwargs={'name': new_name}
+            )
+            raise
+
+        return new_name
@@ -1,4 +1,10 @@
 ENCRYPTION_FILE_CHUNK_SIZE = 64 * 1024  # 64K
+ENCRYPTION_FORMAT_HEADER_STRUCT = '>8sBI8s'
+ENCRYPTION_FORMAT_MAGIC = b'MAYANENC'
+ENCRYPTION_FORMAT_NONCE_PREFIX_SIZE = 8
+ENCRYPTION_FORMAT_TAG_SIZE = 16
+ENCRYPTION_FORMAT_VERSION_1 = 1
+ENCRYPTION_FORMAT_VERSION_2 = 2
 ENCRYPTION_KEY_DERIVATION_ITERATIONS = 100000
 ENCRYPTION_KEY_SIZE = 32
 
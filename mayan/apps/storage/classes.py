@@ -1,9 +1,11 @@
+import hashlib
 import logging
-from io import BytesIO, StringIO
+from io import SEEK_END, BytesIO, StringIO
 
 from django.core.files.base import File
 from django.core.files.storage import Storage
 from django.utils.deconstruct import deconstructible
+from django.utils.encoding import force_bytes
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
@@ -37,26 +39,94 @@ class BufferedFile(File):
         if size is None:
             size = -1
 
-        if size == -1 or size > self.stream_size:
-            while True:
+        while size == -1 or self.stream_size < size:
+            chunk = self._get_file_object_chunk()
+            if chunk:
+                # Append the chunk after the unread data and return to the
+                # read position.
                 position = self.stream.tell()
-                chunk = self._get_file_object_chunk()
-                if chunk:
-                    self.stream_size += len(chunk)
-                    self.stream.write(chunk)
-                    self.stream.seek(position)
-                    if self.stream_size >= size and size != -1:
-                        break
-                else:
-                    break
-
-        if size:
-            read_size = min(size, self.stream_size)
-            self.stream_size -= read_size
-        else:
-            read_size = None
+                self.stream.seek(0, SEEK_END)
+                self.stream.write(chunk)
+                self.stream.seek(position)
+                self.stream_size += len(chunk)
+            else:
+                break
+
+        result = self.stream.read(size)
+        self.stream_size -= len(result)
+
+        if not self.stream_size:
+            # Discard the data already read to keep the buffer from
+            # growing with the size of the file.
+            self.stream.seek(0)
+            self.stream.truncate()
+
+        return result
+
+
+class DigestFile(File):
+    """
+    File proxy that calculates the hash digests and the size of a file and
+    keeps a copy of its first bytes while the file is being read. Used to
+    obtain these values while the file is copied elsewhere, like when it
+    is saved to a storage, without having to read it again afterwards.
+    The values are only available when the file was read from the start to
+    the end.
+    """
+    def __init__(self, file, algorithms=None, buffer_size=0, name=None):
+        super().__init__(file=file, name=name)
+        self.algorithms = algorithms or ()
+        self.buffer = BytesIO()
+        self.buffer_size = buffer_size
+        self.hash_objects = {
+            algorithm: hashlib.new(algorithm) for algorithm in self.algorithms
+        }
+        self.is_complete = False
+        self.position = 0
+        self.read_size = 0
+
+    def get_buffer(self):
+        return self.buffer.getvalue()
+
+    def get_digests(self):
+        """
+        Return a dictionary of the hexadecimal digest of each algorithm.
+        """
+        return {
+            algorithm: hash_object.hexdigest() for algorithm, hash_object in self.hash_objects.items()
+        }
+
+    def read(self, *args, **kwargs):
+        data = self.file.read(*args, **kwargs)
+
+        # Offset of the first byte not yet processed, relative to the data
+        # just read. Data read again after seeking back is skipped and data
+        # after a forward seek leaves a gap that is never processed.
+        offset = self.read_size - self.position
+
+        if offset == 0 and not data:
+            self.is_complete = True
+        elif 0 <= offset < len(data):
+            data_new = force_bytes(s=data[offset:])
+
+            for hash_object in self.hash_objects.values():
+                hash_object.update(data_new)
+
+            if self.buffer.tell() < self.buffer_size:
+                self.buffer.write(
+                    data_new[:self.buffer_size - self.buffer.tell()]
+                )
+
+            self.read_size += len(data_new)
+
+        self.position += len(data)
+
+        return data
 
-        return self.stream.read(read_size)
+    def seek(self, *args, **kwargs):
+        result = self.file.seek(*args, **kwargs)
+        self.position = self.file.tell()
+        return result
 
 
 class DefinedStorage(AppsModuleLoaderMixin):
@@ -8,3 +8,10 @@ class NoMIMETypeMatch(CompressionFileError):
     """
     There is no decompressor registered for the specified MIME type
     """
+
+
+class EncryptedFileError(Exception):
+    """
+    An encrypted file chunk failed authentication or the file was
+    truncated.
+    """
@@ -0,0 +1,101 @@
+from django.apps import apps
+from django.core import management
+from django.db import models, transaction
+from django.utils.translation import ugettext_lazy as _
+
+from ...backends.encryptedstorage import EncryptedPassthroughStorage
+from ...classes import DefinedStorage, PassthroughStorage
+
+
+class Command(management.BaseCommand):
+    help = 'Re-encrypt model files using the latest encrypted file format.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--app', action='store', dest='app_label',
+            help=_('Name of the app to process.'),
+            required=True,
+        )
+        parser.add_argument(
+            '--model', action='store', dest='model_name',
+            help=_('Process a specific model.'),
+            required=True,
+        )
+        parser.add_argument(
+            '--field', action='store', dest='field_name',
+            help=_(
+                'Name of the model file field to process. Defaults to the '
+                'file fields using the storage.'
+            )
+        )
+        parser.add_argument(
+            '--storage_name', action='store', dest='defined_storage_name',
+            help=_('Name of the storage to process.'),
+            required=True,
+        )
+
+    def handle(self, *args, **options):
+        model = apps.get_model(
+            app_label=options['app_label'], model_name=options['model_name']
+        )
+
+        if options['field_name']:
+            field_name_list = (options['field_name'],)
+        else:
+            field_name_list = [
+                field.name for field in model._meta.get_fields()
+                if isinstance(field, models.FileField) and getattr(
+                    field.storage, 'name', None
+                ) == options['defined_storage_name']
+            ]
+
+        if not field_name_list:
+            raise management.CommandError(
+                'Model "{}" has no file fields using storage "{}".'.format(
+                    model._meta.label, options['defined_storage_name']
+                )
+            )
+
+        storage_instance = DefinedStorage.get(
+            name=options['defined_storage_name']
+        ).get_storage_instance()
+
+        # Find the encrypted storage in the passthrough storage chain.
+        while not isinstance(storage_instance, EncryptedPassthroughStorage):
+            if isinstance(storage_instance, PassthroughStorage):
+                storage_instance = storage_instance.next_storage_backend
+            else:
+                raise management.CommandError(
+                    'Storage "{}" does not use encryption.'.format(
+                        options['defined_storage_name']
+                    )
+                )
+
+        manager = model._meta.default_manager
+
+        count = 0
+        for field_name in field_name_list:
+            # Several rows can reference the same stored file.
+            name_list = list(
+                manager.exclude(**{field_name: ''}).order_by().values_list(
+                    field_name, flat=True
+                ).distinct()
+            )
+
+            for name in name_list:
+                new_name = storage_instance.upgrade_format(name=name)
+
+                if new_name:
+                    with transaction.atomic():
+                        manager.filter(**{field_name: name}).update(
+                            **{field_name: new_name}
+                        )
+
+                    # The original file is deleted only after every
+                    # reference points to the upgraded copy.
+                    storage_instance.delete(name=name)
+                    count += 1
+
+        self.stdout.write(
+            msg='{} files upgraded.'.format(count)
+        )
@@ -1,5 +1,11 @@
 from datetime import timedelta
+import errno
+import logging
+import os
+from pathlib import Path
 
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
 from django.db import models
 from django.utils.timezone import now
 
@@ -13,6 +19,8 @@ from .settings import (
     setting_shared_uploaded_file_expiration_interval
 )
 
+logger = logging.getLogger(name=__name__)
+
 
 class DownloadFileManager(models.Manager):
     def stale(self):
@@ -33,6 +41,84 @@ class DownloadFileManager(models.Manager):
 
 
 class SharedUploadedFileManager(models.Manager):
+    def _create_from_path_link(self, path, filename, keep_source):
+        """
+        Place the file in the storage by renaming or hard linking it.
+        Returns None when the storage is not a plain filesystem storage or
+        when the file is in a different filesystem.
+        """
+        instance = self.model(filename=filename)
+        field = instance.file.field
+        storage = field.storage
+
+        if not isinstance(storage, FileSystemStorage) or path.is_symlink():
+            return
+
+        name = storage.get_available_name(
+            name=field.generate_filename(instance=instance, filename=path.name)
+        )
+        target_path = Path(storage.path(name=name))
+        target_path.parent.mkdir(exist_ok=True, parents=True)
+
+        try:
+            if keep_source:
+                os.link(src=path, dst=target_path)
+            else:
+                os.rename(src=path, dst=target_path)
+        except OSError as exception:
+            if exception.errno in (errno.EPERM, errno.EXDEV):
+                logger.debug(
+                    'Unable to link "%s" into the shared storage; %s',
+                    path, exception
+                )
+                return
+            else:
+                raise
+
+        if storage.file_permissions_mode is not None:
+            os.chmod(path=target_path, mode=storage.file_permissions_mode)
+
+        instance.file.name = name
+        instance.save()
+
+        return instance
+
+    def create_from_path(self, path, filename=None, keep_source=False):
+        """
+        Create a shared uploaded file from a local file. If the storage is
+        in the same filesystem the file is renamed, or hard linked when the
+        source is kept, instead of copying its content. Returns None when
+        the file is removed before it could be stored.
+        """
+        path = Path(path)
+        filename = filename or path.name
+        instance = None
+
+        try:
+            instance = self._create_from_path_link(
+                filename=filename, keep_source=keep_source, path=path
+            )
+
+            if not instance:
+                with path.open(mode='rb') as file_object:
+                    instance = self.create(
+                        file=File(file=file_object), filename=filename
+                    )
+
+                if not keep_source:
+                    path.unlink()
+        except FileNotFoundError as exception:
+            if instance:
+                # Removed after its content was copied.
+                return instance
+
+            logger.debug(
+                'File "%s" was removed before it could be stored; %s',
+                path, exception
+            )
+        else:
+            return instance
+
     def stale(self):
         return self.filter(
             datetime__lt=now() - timedelta(
@@ -5,6 +5,8 @@ from django.conf import settings
 TEST_DOWNLOAD_FILE_CONTENT_FILE_NAME = 'test content name'
 
 TEST_CONTENT = 'testcontent'
+TEST_CONTENT_LARGE = bytes(range(256)) * 1024  # 256K, several chunks
+TEST_ENCRYPTION_PASSWORD = 'testpassword'
 TEST_FILE_NAME = 'test_file'
 
 # Filenames
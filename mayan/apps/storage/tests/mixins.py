@@ -3,6 +3,9 @@ import logging
 from pathlib import Path
 import shutil
 
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
 from django.core.files.base import ContentFile
 
 from mayan.apps.acls.classes import ModelPermission
@@ -10,6 +13,7 @@ from mayan.apps.documents.literals import STORAGE_NAME_DOCUMENT_FILES
 from mayan.apps.permissions.tests.mixins import PermissionTestMixin
 from mayan.apps.smart_settings.classes import SettingNamespace
 
+from ..backends.literals import ENCRYPTION_FILE_CHUNK_SIZE
 from ..classes import DefinedStorage
 from ..compressed_files import Archive
 from ..models import DownloadFile, SharedUploadedFile
@@ -126,6 +130,7 @@ class StorageProcessorTestMixin:
         cls.defined_storage = DefinedStorage.get(
             name=STORAGE_NAME_DOCUMENT_FILES
         )
+        cls.document_storage_dotted_path = cls.defined_storage.dotted_path
         cls.document_storage_kwargs = cls.defined_storage.kwargs
 
     def setUp(self):
@@ -137,9 +142,34 @@ class StorageProcessorTestMixin:
     def tearDown(self):
         super().tearDown()
         shutil.rmtree(path=self.temporary_directory, ignore_errors=True)
+        self.defined_storage.dotted_path = self.document_storage_dotted_path
         self.defined_storage.kwargs = self.document_storage_kwargs
 
 
+class EncryptedStorageTestMixin:
+    def _save_test_encrypted_file_format_1(self, storage, name, content):
+        """
+        Save a file using the encrypted file format version 1.
+        """
+        cipher = AES.new(key=storage.key, mode=AES.MODE_CBC)
+        data = [cipher.iv]
+
+        for index in range(0, len(content), ENCRYPTION_FILE_CHUNK_SIZE):
+            data.append(
+                cipher.encrypt(
+                    pad(
+                        data_to_pad=content[index:index + ENCRYPTION_FILE_CHUNK_SIZE],
+                        block_size=AES.block_size
+                    )
+                )
+            )
+
+        return storage.save(
+            name=name, content=ContentFile(content=b''.join(data)),
+            _direct=True
+        )
+
+
 class SharedUploadedFileTestMixin:
     def _create_test_shared_uploaded_file(self, content=None):
         file_content = None
@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest import skip
+from unittest import mock, skip
 
 from django.core.files.base import ContentFile
 from django.utils.encoding import force_bytes
@@ -10,14 +10,38 @@ from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..backends.compressedstorage import ZipCompressedPassthroughStorage
 from ..backends.encryptedstorage import EncryptedPassthroughStorage
+from ..backends.literals import (
+    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_FORMAT_VERSION_1,
+    ENCRYPTION_FORMAT_VERSION_2
+)
+from ..exceptions import EncryptedFileError
 
-from .literals import TEST_CONTENT, TEST_FILE_NAME
+from .literals import (
+    TEST_CONTENT, TEST_CONTENT_LARGE, TEST_ENCRYPTION_PASSWORD,
+    TEST_FILE_NAME
+)
+from .mixins import EncryptedStorageTestMixin
 
 
-class EncryptedPassthroughStorageTestCase(MIMETypeBackendMixin, BaseTestCase):
+class EncryptedPassthroughStorageTestCase(
+    EncryptedStorageTestMixin, MIMETypeBackendMixin, BaseTestCase
+):
     def setUp(self):
         super().setUp()
         self.temporary_directory = mkdtemp()
+        self._test_storage = EncryptedPassthroughStorage(
+            password=TEST_ENCRYPTION_PASSWORD,
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+    def _save_test_file_large(self):
+        return self._test_storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=TEST_CONTENT_LARGE
+            )
+        )
 
     def tearDown(self):
         fs_cleanup(filename=self.temporary_directory)
@@ -48,11 +72,142 @@ class EncryptedPassthroughStorageTestCase(MIMETypeBackendMixin, BaseTestCase):
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(), TEST_CONTENT)
 
-        with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
-            self.assertEqual(file_object.read(1), TEST_CONTENT[0:1])
+    def test_file_empty(self):
+        self._test_storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(content=b'')
+        )
 
-        with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
-            self.assertEqual(file_object.read(999), TEST_CONTENT)
+        self.assertEqual(self._test_storage.size(name=TEST_FILE_NAME), 0)
+
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), b'')
+
+    def test_file_format_version(self):
+        self._save_test_file_large()
+
+        self.assertEqual(
+            self._test_storage.get_format_version(name=TEST_FILE_NAME),
+            ENCRYPTION_FORMAT_VERSION_2
+        )
+
+    def test_file_open_for_writing(self):
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='wb') as file_object:
+            file_object.write(TEST_CONTENT_LARGE[:1000])
+            file_object.write(TEST_CONTENT_LARGE[1000:])
+
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+
+    def test_file_seek(self):
+        self._save_test_file_large()
+
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            file_object.seek(100000)
+            self.assertEqual(
+                file_object.read(100), TEST_CONTENT_LARGE[100000:100100]
+            )
+            self.assertEqual(file_object.tell(), 100100)
+
+            file_object.seek(-100, 1)
+            self.assertEqual(
+                file_object.read(100), TEST_CONTENT_LARGE[100000:100100]
+            )
+
+            file_object.seek(-10, 2)
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE[-10:])
+
+            file_object.seek(0)
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+
+    def test_file_size(self):
+        self._save_test_file_large()
+
+        self.assertEqual(
+            self._test_storage.size(name=TEST_FILE_NAME),
+            len(TEST_CONTENT_LARGE)
+        )
+
+    def test_file_tampered(self):
+        test_file_name = self._save_test_file_large()
+
+        path_file = Path(self.temporary_directory) / test_file_name
+        data = bytearray(path_file.read_bytes())
+        data[-100] ^= 0xff
+        path_file.write_bytes(data)
+
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            file_object.read(10)
+            with self.assertRaises(expected_exception=EncryptedFileError):
+                file_object.read()
+
+    def test_file_truncated(self):
+        test_file_name = self._save_test_file_large()
+
+        path_file = Path(self.temporary_directory) / test_file_name
+        data = path_file.read_bytes()
+        # Remove the last chunk.
+        path_file.write_bytes(data[:-(ENCRYPTION_FILE_CHUNK_SIZE + 16)])
+
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            with self.assertRaises(expected_exception=EncryptedFileError):
+                file_object.read()
+
+    def test_file_format_1_read(self):
+        self._save_test_encrypted_file_format_1(
+            content=TEST_CONTENT_LARGE, name=TEST_FILE_NAME,
+            storage=self._test_storage
+        )
+
+        self.assertEqual(
+            self._test_storage.get_format_version(name=TEST_FILE_NAME),
+            ENCRYPTION_FORMAT_VERSION_1
+        )
+
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+
+    def test_file_format_1_upgrade(self):
+        self._save_test_encrypted_file_format_1(
+            content=TEST_CONTENT_LARGE, name=TEST_FILE_NAME,
+            storage=self._test_storage
+        )
+
+        new_name = self._test_storage.upgrade_format(name=TEST_FILE_NAME)
+
+        self.assertNotEqual(new_name, TEST_FILE_NAME)
+        self.assertEqual(
+            self._test_storage.get_format_version(name=TEST_FILE_NAME),
+            ENCRYPTION_FORMAT_VERSION_1
+        )
+        self.assertEqual(
+            self._test_storage.get_format_version(name=new_name),
+            ENCRYPTION_FORMAT_VERSION_2
+        )
+        self.assertEqual(
+            self._test_storage.upgrade_format(name=new_name), None
+        )
+
+        with self._test_storage.open(name=new_name, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+
+    def test_file_format_1_upgrade_error(self):
+        self._save_test_encrypted_file_format_1(
+            content=TEST_CONTENT_LARGE, name=TEST_FILE_NAME,
+            storage=self._test_storage
+        )
+
+        file_count = len(list(Path(self.temporary_directory).iterdir()))
+
+        with mock.patch('shutil.copyfileobj', side_effect=IOError):
+            with self.assertRaises(expected_exception=IOError):
+                self._test_storage.upgrade_format(name=TEST_FILE_NAME)
+
+        self.assertEqual(
+            len(list(Path(self.temporary_directory).iterdir())), file_count
+        )
+
+        with self._test_storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
 
 
 class ZipCompressedPassthroughStorageTestCase(
@@ -136,3 +291,23 @@ class CombinationPassthroughStorageTestCase(
             )
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(), TEST_CONTENT)
+
+    def test_file_save_and_load_large(self):
+        storage = EncryptedPassthroughStorage(
+            password='testpassword',
+            next_storage_backend='mayan.apps.storage.backends.compressedstorage.ZipCompressedPassthroughStorage',
+            next_storage_backend_arguments={
+                'next_storage_backend_arguments': {
+                    'location': self.temporary_directory,
+                }
+            }
+        )
+
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=TEST_CONTENT_LARGE
+            )
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
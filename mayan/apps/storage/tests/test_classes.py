@@ -0,0 +1,66 @@
+import hashlib
+from io import BytesIO
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import DigestFile
+
+from .literals import TEST_CONTENT_LARGE
+
+
+class DigestFileTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._test_digest_file = DigestFile(
+            algorithms=('md5', 'sha256'), buffer_size=1000,
+            file=BytesIO(initial_bytes=TEST_CONTENT_LARGE)
+        )
+
+    def _read_test_digest_file(self, size=4096):
+        while self._test_digest_file.read(size):
+            """Read the entire file."""
+
+    def test_digests(self):
+        self._read_test_digest_file()
+
+        self.assertTrue(self._test_digest_file.is_complete)
+        self.assertEqual(
+            self._test_digest_file.get_digests(), {
+                'md5': hashlib.md5(TEST_CONTENT_LARGE).hexdigest(),
+                'sha256': hashlib.sha256(TEST_CONTENT_LARGE).hexdigest()
+            }
+        )
+        self.assertEqual(
+            self._test_digest_file.read_size, len(TEST_CONTENT_LARGE)
+        )
+        self.assertEqual(
+            self._test_digest_file.get_buffer(), TEST_CONTENT_LARGE[:1000]
+        )
+
+    def test_chunks(self):
+        data = b''.join(self._test_digest_file.chunks(chunk_size=3000))
+
+        self.assertEqual(data, TEST_CONTENT_LARGE)
+        self.assertTrue(self._test_digest_file.is_complete)
+        self.assertEqual(
+            self._test_digest_file.get_digests()['sha256'],
+            hashlib.sha256(TEST_CONTENT_LARGE).hexdigest()
+        )
+
+    def test_seek_back(self):
+        self._test_digest_file.read(5000)
+        self._test_digest_file.seek(1000)
+        self._read_test_digest_file()
+
+        self.assertTrue(self._test_digest_file.is_complete)
+        self.assertEqual(
+            self._test_digest_file.get_digests()['sha256'],
+            hashlib.sha256(TEST_CONTENT_LARGE).hexdigest()
+        )
+
+    def test_seek_forward(self):
+        self._test_digest_file.read(1000)
+        self._test_digest_file.seek(5000)
+        self._read_test_digest_file()
+
+        self.assertFalse(self._test_digest_file.is_complete)
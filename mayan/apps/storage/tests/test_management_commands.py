@@ -5,7 +5,10 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.storages import storage_document_files
 from mayan.apps.mime_types.tests.mixins import MIMETypeBackendMixin
 
-from .mixins import StorageProcessorTestMixin
+from ..backends.literals import ENCRYPTION_FORMAT_VERSION_2
+
+from .literals import TEST_ENCRYPTION_PASSWORD
+from .mixins import EncryptedStorageTestMixin, StorageProcessorTestMixin
 
 
 class StorageProcessManagementCommandTestCase(
@@ -73,3 +76,61 @@ class StorageProcessManagementCommandTestCase(
             self._test_document.file_latest.checksum,
             self._test_document.file_latest.checksum_update(save=False)
         )
+
+
+class StorageEncryptionUpgradeManagementCommandTestCase(
+    EncryptedStorageTestMixin, StorageProcessorTestMixin,
+    GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def _call_command(self):
+        options = {
+            'app_label': 'documents',
+            'defined_storage_name': storage_document_files.name,
+            'model_name': 'DocumentFile'
+        }
+        management.call_command(
+            command_name='storage_encryption_upgrade', **options
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.defined_storage.dotted_path = 'mayan.apps.storage.backends.encryptedstorage.EncryptedPassthroughStorage'
+        self.defined_storage.kwargs = {
+            'password': TEST_ENCRYPTION_PASSWORD,
+            'next_storage_backend_arguments': {
+                'location': self.document_storage_kwargs['location']
+            }
+        }
+
+        self._upload_test_document()
+
+        self._test_storage = self.defined_storage.get_storage_instance()
+        name = self._test_document.file_latest.file.name
+
+        with self._test_storage.open(name=name, mode='rb') as file_object:
+            content = file_object.read()
+
+        self._test_storage.delete(name=name)
+        self._save_test_encrypted_file_format_1(
+            content=content, name=name, storage=self._test_storage
+        )
+
+    def test_storage_encryption_upgrade_command(self):
+        name = self._test_document.file_latest.file.name
+
+        self._call_command()
+
+        self.assertNotEqual(self._test_document.file_latest.file.name, name)
+        self.assertFalse(self._test_storage.exists(name=name))
+
+        self.assertEqual(
+            self._test_storage.get_format_version(
+                name=self._test_document.file_latest.file.name
+            ), ENCRYPTION_FORMAT_VERSION_2
+        )
+        self.assertEqual(
+            self._test_document.file_latest.checksum,
+            self._test_document.file_latest.checksum_update(save=False)
+        )
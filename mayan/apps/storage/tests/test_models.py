@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from mayan.apps.events.classes import EventModelRegistry
 from mayan.apps.testing.tests.base import BaseTestCase
 
@@ -6,7 +8,9 @@ from ..settings import (
     setting_download_file_expiration_interval,
     setting_shared_uploaded_file_expiration_interval
 )
+from ..utils import fs_cleanup, mkdtemp
 
+from .literals import TEST_CONTENT, TEST_FILE_NAME
 from .mixins import DownloadFileTestMixin, SharedUploadedFileTestMixin
 
 
@@ -50,3 +54,55 @@ class SharedUploadedFileManagerTestCase(
         setting_shared_uploaded_file_expiration_interval.set(value=0)
 
         self.assertEqual(SharedUploadedFile.objects.stale().count(), 1)
+
+    def _create_test_source_file(self):
+        self._test_source_folder = mkdtemp()
+        self._test_source_path = Path(
+            self._test_source_folder, TEST_FILE_NAME
+        )
+        self._test_source_path.write_text(data=TEST_CONTENT)
+
+    def tearDown(self):
+        if hasattr(self, '_test_source_folder'):
+            fs_cleanup(filename=self._test_source_folder)
+        super().tearDown()
+
+    def test_create_from_path(self):
+        self._create_test_source_file()
+
+        shared_uploaded_file = SharedUploadedFile.objects.create_from_path(
+            path=self._test_source_path
+        )
+
+        self.assertFalse(self._test_source_path.exists())
+        self.assertEqual(shared_uploaded_file.filename, TEST_FILE_NAME)
+
+        with shared_uploaded_file.open() as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT.encode())
+
+    def test_create_from_path_missing(self):
+        self._create_test_source_file()
+        self._test_source_path.unlink()
+
+        shared_uploaded_file_count = SharedUploadedFile.objects.count()
+
+        shared_uploaded_file = SharedUploadedFile.objects.create_from_path(
+            path=self._test_source_path
+        )
+
+        self.assertEqual(shared_uploaded_file, None)
+        self.assertEqual(
+            SharedUploadedFile.objects.count(), shared_uploaded_file_count
+        )
+
+    def test_create_from_path_keep_source(self):
+        self._create_test_source_file()
+
+        shared_uploaded_file = SharedUploadedFile.objects.create_from_path(
+            keep_source=True, path=self._test_source_path
+        )
+
+        self.assertTrue(self._test_source_path.exists())
+
+        with shared_uploaded_file.open() as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT.encode())
@@ -1,3 +1,4 @@
+from io import BytesIO
 from pathlib import Path
 import shutil
 
@@ -8,11 +9,36 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.mime_types.tests.mixins import MIMETypeBackendMixin
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..utils import PassthroughStorageProcessor, mkdtemp, patch_files
+from ..utils import (
+    NamedTemporaryFile, PassthroughStorageProcessor, get_file_object_path,
+    mkdtemp, patch_files
+)
 
 from .mixins import StorageProcessorTestMixin
 
 
+class FileObjectPathTestCase(BaseTestCase):
+    def test_local_file_object(self):
+        with NamedTemporaryFile() as file_object:
+            self.assertEqual(
+                get_file_object_path(file_object=file_object),
+                file_object.name
+            )
+
+    def test_local_file_object_reopened(self):
+        with NamedTemporaryFile() as temporary_file_object:
+            with open(file=temporary_file_object.name, mode='rb') as file_object:
+                self.assertEqual(
+                    get_file_object_path(file_object=file_object),
+                    temporary_file_object.name
+                )
+
+    def test_memory_file_object(self):
+        self.assertEqual(
+            get_file_object_path(file_object=BytesIO()), None
+        )
+
+
 class PatchFilesTestCase(BaseTestCase):
     test_replace_text = 'replaced_text'
 
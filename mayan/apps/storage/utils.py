@@ -1,4 +1,5 @@
 import dbm
+import io
 import logging
 import os
 from pathlib import Path
@@ -108,6 +109,39 @@ def fs_cleanup(filename, suppress_exceptions=True):
                 raise
 
 
+def get_file_object_path(file_object):
+    """
+    Return the filesystem path of a file object that reads its content
+    directly from a local file. Returns None for file objects that
+    transform the stored content, like the encrypted or compressed
+    storages, or that are not backed by a local file.
+    """
+    raw_file_object = getattr(file_object, 'file', file_object)
+
+    if isinstance(raw_file_object, (io.BufferedRandom, io.BufferedReader, io.FileIO)):
+        path = getattr(raw_file_object, 'name', None)
+
+        if not isinstance(path, str):
+            # Files opened from a descriptor, like the temporary files,
+            # are named by the descriptor number. Use the name of the
+            # wrapper instead if it is the same file.
+            path = getattr(file_object, 'name', None)
+
+            if not isinstance(path, str) or not os.path.isabs(path):
+                return None
+
+            try:
+                if not os.path.samestat(
+                    os.fstat(raw_file_object.fileno()), os.stat(path)
+                ):
+                    return None
+            except (OSError, ValueError):
+                return None
+
+        if os.path.isabs(path) and os.path.isfile(path):
+            return path
+
+
 def get_storage_subclass(dotted_path):
     """
     Import a storage class and return a subclass that will always return eq
@@ -1,10 +1,91 @@
 import copy
 from urllib.parse import urlsplit, urlunsplit
 
+from django.core.files.base import File
 from django.http import QueryDict
 from django.urls import reverse
 
 
+class FileRangeWrapper:
+    """
+    Wrap a file object to read only a range of its content. Seekable file
+    objects are seeked to the start of the range. The content of the
+    other file objects is read and discarded up to the start of the range.
+    """
+    def __init__(self, file_object, start, length):
+        self.file_object = file_object
+        self.remaining = length
+
+        seekable = getattr(file_object, 'seekable', None)
+
+        if seekable and seekable():
+            file_object.seek(start)
+        else:
+            while start > 0:
+                data = file_object.read(min(start, File.DEFAULT_CHUNK_SIZE))
+                if not data:
+                    break
+                start -= len(data)
+
+    def close(self):
+        self.file_object.close()
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = self.file_object.read(size)
+        self.remaining -= len(data)
+
+        return data
+
+
+def parse_range_header(header, size):
+    """
+    Return the first and last byte positions of a single byte range
+    `Range` header value. Return None for headers that are not supported,
+    like those with multiple ranges, and raise ValueError for ranges
+    that can't be satisfied.
+    """
+    unit, separator, ranges = header.partition('=')
+
+    if unit.strip().lower() != 'bytes' or not separator or ',' in ranges:
+        return None
+
+    first, separator, last = ranges.strip().partition('-')
+
+    if not separator:
+        return None
+
+    try:
+        first = int(first) if first else None
+        last = int(last) if last else None
+    except ValueError:
+        return None
+
+    if first is None:
+        if last is None:
+            return None
+        elif last == 0:
+            raise ValueError('Empty suffix range.')
+
+        # Suffix range, the last bytes of the file.
+        first = max(size - last, 0)
+        last = size - 1
+    elif last is None:
+        last = max(first, size - 1)
+    elif first > last:
+        return None
+
+    if first >= size:
+        raise ValueError('Range start is beyond the end of the file.')
+
+    return first, min(last, size - 1)
+
+
 class URL:
     def __init__(
         self, url=None, netloc=None, path=None, port=None, query_string=None,
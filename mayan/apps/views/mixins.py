@@ -1,11 +1,15 @@
+import os
+
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models.query import QuerySet
-from django.http import Http404, HttpResponseRedirect
+from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.http.response import FileResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.utils.translation import ungettext, ugettext_lazy as _
 from django.views.generic.detail import SingleObjectMixin
 from django.views.generic.edit import ModelFormMixin
@@ -16,9 +20,11 @@ from mayan.apps.common.settings import setting_home_view
 from mayan.apps.databases.utils import check_queryset
 from mayan.apps.mime_types.classes import MIMETypeBackend
 from mayan.apps.permissions import Permission
+from mayan.apps.storage.utils import get_file_object_path
 
 from .exceptions import ActionError
 from .forms import DynamicForm, FormFieldsetMixin
+from .http import FileRangeWrapper, parse_range_header
 from .literals import (
     PK_LIST_SEPARATOR, TEXT_CHOICE_ITEMS, TEXT_CHOICE_LIST,
     TEXT_LIST_AS_ITEMS_PARAMETER, TEXT_LIST_AS_ITEMS_VARIABLE_NAME,
@@ -80,9 +86,29 @@ class DownloadViewMixin:
             'return a file like object.'
         )
 
+    def get_download_etag(self):
+        """
+        Return a value that changes every time the content of the download
+        changes. Used as a strong ETag for conditional and range requests.
+        """
+        return None
+
+    def get_download_file_size(self, file_object):
+        file_path = get_file_object_path(file_object=file_object)
+
+        if file_path:
+            return os.path.getsize(file_path)
+
     def get_download_filename(self):
         return None
 
+    def get_download_last_modified(self):
+        """
+        Return the timestamp, in seconds since the epoch, of the last
+        modification of the download content.
+        """
+        return None
+
     def get_download_mime_type_and_encoding(self, file_object):
         mime_type, encoding = MIMETypeBackend.get_backend_instance().get_mime_type(
             file_object=file_object, mime_type_only=True
@@ -90,12 +116,82 @@ class DownloadViewMixin:
 
         return mime_type, encoding
 
+    def get_download_range(self, etag, last_modified, size):
+        """
+        Return the first and last byte position requested by a valid
+        `Range` header or None to return the entire content.
+        """
+        header = self.request.META.get('HTTP_RANGE')
+
+        if not header or size is None:
+            return None
+
+        if_range = self.request.META.get('HTTP_IF_RANGE')
+
+        if if_range:
+            # Serve the entire content if the range validator is stale.
+            if_range = if_range.strip()
+            if if_range != etag and (not last_modified or if_range != http_date(last_modified)):
+                return None
+
+        return parse_range_header(header=header, size=size)
+
+    def get_download_validators(self):
+        """
+        Return the quoted ETag and the integer last modification timestamp
+        of the download content.
+        """
+        etag = self.get_download_etag()
+        if etag:
+            etag = quote_etag(etag)
+
+        last_modified = self.get_download_last_modified()
+        if last_modified:
+            last_modified = int(last_modified)
+
+        return etag, last_modified
+
+    def is_download_continuation(self, size):
+        """
+        Return True if the request asks for a range that does not start
+        at the first byte of the content. These requests resume or seek
+        within a download already started and must not trigger the
+        download events again.
+        """
+        etag, last_modified = self.get_download_validators()
+
+        try:
+            download_range = self.get_download_range(
+                etag=etag, last_modified=last_modified, size=size
+            )
+        except ValueError:
+            # Unsatisfiable range, no content will be sent.
+            return True
+
+        return bool(download_range) and download_range[0] > 0
+
+    def patch_download_response(self, response, etag, last_modified):
+        if etag:
+            response.headers['ETag'] = etag
+
+        if last_modified:
+            response.headers['Last-Modified'] = http_date(last_modified)
+
     def render_to_response(self, **response_kwargs):
-        response = FileResponse(
-            as_attachment=self.get_as_attachment(),
-            filename=self.get_download_filename(),
-            streaming_content=self.get_download_file_object()
+        etag, last_modified = self.get_download_validators()
+
+        response = get_conditional_response(
+            etag=etag, last_modified=last_modified, request=self.request
         )
+        if response:
+            # Content was not modified, avoid opening the file and
+            # triggering the download events.
+            self.patch_download_response(
+                etag=etag, last_modified=last_modified, response=response
+            )
+            return response
+
+        file_object = self.get_download_file_object()
 
         encoding_map = {
             'bzip2': 'application/x-bzip',
@@ -103,16 +199,58 @@ class DownloadViewMixin:
             'xz': 'application/x-xz'
         }
 
-        if response.file_to_stream:
+        if file_object:
             mime_type, encoding = self.get_download_mime_type_and_encoding(
-                file_object=response.file_to_stream
+                file_object=file_object
             )
             # Encoding isn't set to prevent browsers from automatically
             # uncompressing files.
             mime_type = encoding_map.get(encoding, mime_type)
-            response.headers['Content-Type'] = mime_type or 'application/octet-stream'
+            size = self.get_download_file_size(file_object=file_object)
         else:
-            response.headers['Content-Type'] = 'application/octet-stream'
+            mime_type = None
+            size = None
+
+        try:
+            download_range = self.get_download_range(
+                etag=etag, last_modified=last_modified, size=size
+            )
+        except ValueError:
+            file_object.close()
+            response = HttpResponse(status=416)
+            response.headers['Content-Range'] = 'bytes */{}'.format(size)
+            return response
+
+        if download_range:
+            first, last = download_range
+            length = last - first + 1
+
+            response = FileResponse(
+                as_attachment=self.get_as_attachment(),
+                filename=self.get_download_filename(),
+                status=206, streaming_content=FileRangeWrapper(
+                    file_object=file_object, length=length, start=first
+                )
+            )
+            response.headers['Content-Length'] = length
+            response.headers['Content-Range'] = 'bytes {}-{}/{}'.format(
+                first, last, size
+            )
+        else:
+            response = FileResponse(
+                as_attachment=self.get_as_attachment(),
+                filename=self.get_download_filename(),
+                streaming_content=file_object
+            )
+
+        response.headers['Content-Type'] = mime_type or 'application/octet-stream'
+
+        if size is not None:
+            response.headers['Accept-Ranges'] = 'bytes'
+
+        self.patch_download_response(
+            etag=etag, last_modified=last_modified, response=response
+        )
 
         return response
 
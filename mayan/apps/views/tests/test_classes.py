@@ -1,6 +1,32 @@
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..http import URL
+from ..http import URL, parse_range_header
+
+
+class RangeHeaderTestCase(BaseTestCase):
+    def test_range_closed(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=0-9', size=100), (0, 9)
+        )
+
+    def test_range_multiple(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=0-9,20-29', size=100), None
+        )
+
+    def test_range_open(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=90-', size=100), (90, 99)
+        )
+
+    def test_range_suffix(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=-10', size=100), (90, 99)
+        )
+
+    def test_range_unsatisfiable(self):
+        with self.assertRaises(expected_exception=ValueError):
+            parse_range_header(header='bytes=100-', size=100)
 
 
 class URLTestCase(BaseTestCase):
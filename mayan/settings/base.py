@@ -144,6 +144,8 @@ MIDDLEWARE = (
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'mayan.apps.locales.middleware.locales.UserLocaleProfileMiddleware',
     'mayan.apps.authentication.middleware.impersonate.ImpersonateMiddleware',
+    'mayan.apps.dynamic_search.middleware.search_indexing.SearchIndexingCoalescerMiddleware',
+    'mayan.apps.events.middleware.event_notifications.EventNotificationCoalescerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'stronghold.middleware.LoginRequiredMiddleware',